@@ -15,4 +15,12 @@ except ImportError:  # pragma: no cover
     raise ImportError(f"Unknown jni backend: {BACKEND}") from None
 
 exec(f"del {BACKEND}", globals())
+from ._env   import current_env     ; del _env    # noqa
+from ._cache import ResolutionCache, StringCache ; del _cache  # noqa
+from ._refs  import GlobalRef, WeakGlobalRef, release_refs ; del _refs  # noqa
+from ._buffers import release_buffers, MappedFile, MappedWindow ; del _buffers  # noqa
+from ._tracker import RefTracker, RefSnapshot, RefRecord ; del _tracker  # noqa
+from ._gil     import gil_policy ; del _gil  # noqa
+from ._executor import JVMExecutor ; del _executor  # noqa
+from ._program import Program, Slot ; del _program  # noqa
 del config
@@ -0,0 +1,242 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import threading
+import array as _array
+import struct
+from contextlib import contextmanager
+
+__all__ = ('iter_object_array', 'new_string_array', 'new_object_array',
+           'array_view', 'to_java_array', 'from_java_array')
+
+_ARRAY_KINDS = {
+    # kind: (type name, format, item size)
+    "Z": ("Boolean", "?", 1),
+    "B": ("Byte",    "b", 1),
+    "C": ("Char",    "H", 2),
+    "S": ("Short",   "h", 2),
+    "I": ("Int",     "i", 4),
+    "J": ("Long",    "q", 8),
+    "F": ("Float",   "f", 4),
+    "D": ("Double",  "d", 8)
+}
+
+_ARRAY_FORMATS = {
+    # kind: buffer formats of its items (native, signed or unsigned)
+    "Z": {"?", "B"},
+    "B": {"b", "B", "c"},
+    "C": {"H", "h"},
+    "S": {"h", "H"},
+    "I": {"i", "I"},
+    "J": {"q", "Q"},
+    "F": {"f"},
+    "D": {"d"}
+}
+for _fmt in ("l", "L", "n", "N"):
+    _ARRAY_FORMATS["I" if struct.calcsize(_fmt) == 4 else "J"].add(_fmt)
+del _fmt
+
+_ARRAY_PTYPES = {}  # kind: pointer type of its elements (of the backend)
+
+
+def iter_object_array(self, array, chunk=256, convert=None):
+    """Iterate lazily over the elements of a Java object array.
+
+    The elements are read chunk by chunk, so the number of live local
+    references stays bounded whatever the length of the array.
+    If convert is given, each element is converted by convert(element)
+    (e.g. env.jstring_to_str) inside a local frame per chunk and the
+    converted values (None for null elements) are yielded. Otherwise
+    the elements are yielded as local references valid until the next
+    chunk is read (i.e. for chunk elements): they have to be duplicated
+    (NewLocalRef, NewGlobalRef) to be kept longer. The references of
+    a chunk are deleted before the next one is read, or when the
+    iterator is closed by its thread, e.g.:
+
+        for name in env.iter_object_array(names, convert=env.jstring_to_str):
+            ...
+    """
+    if chunk < 1:
+        raise ValueError("chunk must be positive")
+    owner = threading.get_ident()
+    size = self.GetArrayLength(array)
+    for start in range(0, size, chunk):
+        stop = min(start + chunk, size)
+        if convert is not None:
+            with self.local_frame(stop - start + 16):
+                values = [convert(item) if item else None
+                          for item in (self.GetObjectArrayElement(array, i)
+                                       for i in range(start, stop))]
+            yield from values
+        else:
+            self.EnsureLocalCapacity(stop - start)
+            refs = [self.GetObjectArrayElement(array, i) for i in range(start, stop)]
+            try:
+                yield from refs
+            except BaseException:
+                # Closed early (e.g. abandoned): a collected generator may be
+                # closed by another thread, where the env is not valid.
+                if threading.get_ident() == owner: self.DeleteLocalRefs(refs)
+                raise
+            self.DeleteLocalRefs(refs)
+
+
+def new_string_array(self, strings):
+    """Return a new Java String[] of an iterable of str (or None for
+    null elements).
+
+    The array is filled by a single native loop if the capi extension
+    is available (see JNIEnv.NewStringArray()).
+    """
+    if not isinstance(strings, (list, tuple)):
+        strings = list(strings)
+    return self.NewStringArray(strings)
+
+
+def new_object_array(self, clazz, items, convert=None):
+    """Return a new Java array of clazz elements of an iterable.
+
+    The items are Java references or, if convert is given, they are
+    converted by convert(item) to new local references, deleted once
+    stored (e.g. env.str_to_jstring). The array is filled by a single
+    native loop if the capi extension is available (see
+    JNIEnv.SetObjectArrayElements()).
+    """
+    if not isinstance(items, (list, tuple)):
+        items = list(items)
+    array = self.NewObjectArray(len(items), clazz)
+    try:
+        self.SetObjectArrayElements(array, 0, items, convert)
+    except BaseException:
+        self.DeleteLocalRef(array)
+        raise
+    return array
+
+
+@contextmanager
+def array_view(self, array, kind, mode=0):
+    """Context manager exposing the elements of a Java primitive array
+    as a memoryview (of the format and shape of the array).
+
+    kind is the JNI type of the elements ('Z', 'B', 'C', 'S', 'I', 'J',
+    'F' or 'D'). The elements are obtained (pinned or copied by the JVM)
+    by Get<Type>ArrayElements and released on exit by
+    Release<Type>ArrayElements with mode: 0 or JNI_COMMIT (the content
+    is copied back) or JNI_ABORT (changes are discarded, the view is
+    read-only). The view must not be used after exit.
+    """
+    from . import buffer_at, JNI_COMMIT, JNI_ABORT
+    type_name, fmt, itemsize = _array_kind_info(kind)
+    size  = self.GetArrayLength(array)
+    elems = getattr(self, f"Get{type_name}ArrayElements")(array)
+    release = getattr(self, f"Release{type_name}ArrayElements")
+    try:
+        view = memoryview(buffer_at(elems, size * itemsize)).cast("B").cast(fmt)
+        if mode == JNI_ABORT: view = view.toreadonly()
+        try:
+            yield view
+        finally:
+            view.release()
+    finally:
+        release(array, elems, mode)
+        if mode == JNI_COMMIT: release(array, elems, JNI_ABORT)
+
+
+def _array_kind_info(kind):
+    try:
+        return _ARRAY_KINDS[kind]
+    except KeyError:
+        raise ValueError(f"invalid primitive array kind: {kind!r}") from None
+
+
+def to_java_array(self, buffer, kind, raw=False):
+    """Return a new Java primitive array of kind ('Z', 'B', 'C', 'S',
+    'I', 'J', 'F' or 'D') with a copy of the content of buffer (any
+    C-contiguous object supporting the buffer protocol) made by a single
+    Set<Type>ArrayRegion call.
+
+    The format of buffer has to match kind. If raw is true, untyped
+    byte buffers (e.g. bytes, bytearray) are also accepted, as the
+    native representation of the elements.
+    """
+    from . import buffer_pointer
+    type_name, fmt, itemsize = _array_kind_info(kind)
+    view = memoryview(buffer)
+    size = _region_size(view, kind, itemsize, raw)
+    array = getattr(self, f"New{type_name}Array")(size)
+    if size:
+        getattr(self, f"Set{type_name}ArrayRegion")(
+            array, 0, size, buffer_pointer(view, _array_ptype(kind)))
+    return array
+
+
+def from_java_array(self, array, out=None, kind=None, raw=False):
+    """Copy the content of the Java primitive array into out (any
+    writable C-contiguous object supporting the buffer protocol, large
+    enough) or into a new array.array by a single Get<Type>ArrayRegion
+    call and return it.
+
+    kind ('Z', 'B', 'C', 'S', 'I', 'J', 'F' or 'D') is the JNI type of
+    the elements, queried from the class of the array if not given.
+    The format of out has to match kind, untyped byte buffers are also
+    accepted if raw is true.
+    """
+    from . import buffer_pointer
+    if kind is None: kind = _array_kind_of(self, array)
+    type_name, fmt, itemsize = _array_kind_info(kind)
+    size = self.GetArrayLength(array)
+    if out is None:
+        out = _array.array("B" if fmt == "?" else fmt, bytes(size * itemsize))
+    view = memoryview(out)
+    if view.readonly:
+        raise ValueError("output buffer is read-only")
+    if _region_size(view, kind, itemsize, raw) < size:
+        raise ValueError(f"output buffer is too small for {size} elements")
+    if size:
+        getattr(self, f"Get{type_name}ArrayRegion")(
+            array, 0, size, buffer_pointer(view, _array_ptype(kind)))
+    return out
+
+
+def _array_kind_of(env, array):
+    # The kind of a primitive array is the 2nd char of its class name ("[I").
+    from . import to_bytes
+    clazz = env.GetObjectClass(array)
+    Class = env.GetObjectClass(clazz)
+    getName = env.GetMethodID(Class, b"getName", b"()Ljava/lang/String;")
+    jname = env.CallObjectMethod(clazz, getName)
+    chars = env.GetStringUTFChars(jname)
+    try:
+        name = to_bytes(chars).decode("utf-8")
+    finally:
+        env.ReleaseStringUTFChars(jname, chars)
+        for ref in (jname, Class, clazz): env.DeleteLocalRef(ref)
+    if len(name) != 2 or name[0] != "[" or name[1] not in _ARRAY_KINDS:
+        raise ValueError(f"not a primitive array: {name}")
+    return name[1]
+
+
+def _region_size(view, kind, itemsize, raw=False):
+    if not view.c_contiguous:
+        raise ValueError("buffer is not C-contiguous")
+    fmt = view.format.lstrip("@=")
+    if not ((fmt in _ARRAY_FORMATS[kind] and view.itemsize == itemsize)
+            or (raw and fmt in ("B", "b", "c") and not view.nbytes % itemsize)):
+        raise ValueError(f"buffer of format {view.format!r} does not match "
+                         f"the primitive array kind {kind!r}")
+    return view.nbytes // itemsize
+
+
+def _array_ptype(kind):
+    try:
+        return _ARRAY_PTYPES[kind]
+    except KeyError:
+        from . import (POINTER, jboolean, jbyte, jchar, jshort,
+                       jint, jlong, jfloat, jdouble)
+        _ARRAY_PTYPES.update(Z=POINTER(jboolean), B=POINTER(jbyte),
+                             C=POINTER(jchar),    S=POINTER(jshort),
+                             I=POINTER(jint),     J=POINTER(jlong),
+                             F=POINTER(jfloat),   D=POINTER(jdouble))
+        return _ARRAY_PTYPES[kind]
@@ -0,0 +1,157 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import os
+import mmap
+import threading
+
+__all__ = ('wrap_buffer', 'buffer_view', 'pin_buffer', 'release_buffers',
+           'MappedFile', 'MappedWindow')
+
+_lock      = threading.Lock()
+_pinned    = []  # [(weak global ref of a Java direct buffer, pinned object)]
+_threshold = 16  # number of pinned objects triggering a sweep
+
+
+def wrap_buffer(self, obj):
+    """Return a new Java direct ByteBuffer sharing the memory of obj.
+
+    obj has to support the buffer protocol and be writable and contiguous.
+    Its buffer stays exported (e.g. a bytearray cannot be resized) until
+    the Java buffer has been garbage collected (see jni.release_buffers()).
+    """
+    from . import from_buffer
+    view = memoryview(obj).cast("B")
+    if view.readonly:
+        raise TypeError("wrap_buffer() requires a writable buffer")
+    data = from_buffer(view)  # holds the export of the buffer
+    buffer = self.NewDirectByteBuffer(data, view.nbytes)
+    pin_buffer(self, buffer, data)
+    return buffer
+
+
+def buffer_view(self, buffer):
+    """Return a memoryview of the memory of a Java direct buffer.
+
+    The view holds a global reference to the buffer, so the memory
+    stays valid as long as the view is alive.
+    """
+    from . import buffer_at
+    from ._refs import GlobalRef
+    address = self.GetDirectBufferAddress(buffer)
+    if not address:
+        raise ValueError("not a direct buffer")
+    capacity = self.GetDirectBufferCapacity(buffer)
+    data = buffer_at(address, capacity, owner=GlobalRef(self, buffer))
+    return memoryview(data).cast("B")
+
+
+def pin_buffer(env, buffer, obj):
+    """Keep obj (which exports the memory of the Java direct buffer)
+    alive until the Java buffer has been garbage collected."""
+    global _threshold
+    if len(_pinned) >= _threshold:
+        release_buffers(env)
+        _threshold = max(16, 2 * len(_pinned))
+    weak = env.NewWeakGlobalRef(buffer)
+    with _lock:
+        _pinned.append((weak, obj))
+
+
+def release_buffers(env):
+    """Unpin the Python buffers shared with Java direct buffers (see
+    JNIEnv.wrap_buffer()) which have been garbage collected by the JVM.
+    Returns their number."""
+    with _lock:
+        released = [entry for entry in _pinned if env.IsSameObject(entry[0], None)]
+        if released:
+            ids = {id(entry) for entry in released}
+            _pinned[:] = [entry for entry in _pinned if id(entry) not in ids]
+            env.DeleteWeakGlobalRefs([weak for weak, _ in released])
+    return len(released)
+
+
+class MappedWindow:
+    """Region of a MappedFile shared by Python (view, a memoryview) and
+    Java (buffer, a local reference to a direct ByteBuffer)."""
+
+    __slots__ = ('offset', 'size', 'view', 'buffer')
+
+    def __init__(self, offset, size, view, buffer):
+        self.offset = offset
+        self.size   = size
+        self.view   = view
+        self.buffer = buffer
+
+
+class MappedFile:
+    """File memory-mapped by Python and shared with Java in windows.
+
+    A Java direct buffer cannot exceed 2 GB (MAX_WINDOW bytes), so each
+    window() is a separate mapping of a region of the file, exposed both
+    as a memoryview and as a direct ByteBuffer (read-only, unless write
+    is true). A mapping stays alive as long as its view is alive or its
+    Java buffer has not been garbage collected (see jni.release_buffers()).
+    The file does not need to stay open, e.g.:
+
+        with jni.MappedFile(path) as mfile:
+            for window in mfile.windows(env):
+                ... window.view ... window.buffer ...
+                env.DeleteLocalRef(window.buffer)
+    """
+
+    MAX_WINDOW = 0x7FFFFFFF
+
+    def __init__(self, path, write=False):
+        self.path  = path
+        self.write = write
+        self._file = open(path, "r+b" if write else "rb")
+        self.size  = os.fstat(self._file.fileno()).st_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        self._file.close()
+
+    def window(self, env, offset=0, size=None):
+        """Map the region of size bytes (up to MAX_WINDOW and the end
+        of file by default) at offset and return it as a MappedWindow."""
+        if size is None:
+            size = min(self.size - offset, self.MAX_WINDOW)
+        if not (0 <= offset and 0 < size <= self.MAX_WINDOW
+                and offset + size <= self.size):
+            raise ValueError(f"invalid window of {size} bytes at {offset} "
+                             f"(file size is {self.size})")
+        # The offset of a mapping has to be a multiple of the granularity.
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        # A private (copy-on-write) mapping is writable even for read-only
+        # files, as wrap_buffer() requires. Java only gets a read-only view.
+        mapping = mmap.mmap(self._file.fileno(), offset + size - start,
+                            access=mmap.ACCESS_WRITE if self.write else
+                                   mmap.ACCESS_COPY, offset=start)
+        view = memoryview(mapping)[offset - start:offset - start + size]
+        buffer = env.wrap_buffer(view)
+        if not self.write:
+            view = view.toreadonly()
+            ByteBuffer = env.FindClass(b"java/nio/ByteBuffer")
+            try:
+                asReadOnlyBuffer = env.GetMethodID(ByteBuffer, b"asReadOnlyBuffer",
+                                                   b"()Ljava/nio/ByteBuffer;")
+                # The read-only buffer refers to the wrapping one.
+                rdonly = env.CallObjectMethod(buffer, asReadOnlyBuffer)
+            finally:
+                env.DeleteLocalRefs((buffer, ByteBuffer))
+            buffer = rdonly
+        return MappedWindow(offset, size, view, buffer)
+
+    def windows(self, env, size=1 << 30):
+        """Iterate over consecutive windows (of size bytes) of the file."""
+        for offset in range(0, self.size, size):
+            yield self.window(env, offset, min(size, self.size - offset))
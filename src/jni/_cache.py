@@ -0,0 +1,217 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import threading
+from collections import OrderedDict
+
+__all__ = ('ResolutionCache', 'StringCache')
+
+
+class ResolutionCache:
+    """Cache of resolved classes, method IDs and field IDs.
+
+    Entries are keyed by (class name, member name, signature) and are
+    shared by all threads (and envs) of a JavaVM. Classes are held as
+    global references (pin=True) or as weak global references (pin=False)
+    in which case the entries of a class are dropped (and resolved again)
+    once the class has been unloaded.
+
+    The lookup methods mirror the JNIEnv ones, but take a class name
+    instead of a class reference, e.g.:
+
+        cache = jni.ResolutionCache()
+        String__length = cache.GetMethodID(env, b"java/lang/String",
+                                           b"length", b"()I")
+
+    FindClass() returns a global reference owned by the cache if pin
+    is true, otherwise a new local reference.
+
+    A pinned class cannot be unloaded while it is cached: its entries
+    stay valid until they are dropped with discard(env, class_name) or
+    clear(env) (e.g. before the class loader is released).
+    """
+
+    def __init__(self, pin=True):
+        self.pin = pin
+        self.hits   = 0
+        self.misses = 0
+        self._classes = {}  # class name -> (weak) global ref
+        self._members = {}  # (class name, kind, member name, signature) -> ID
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._classes) + len(self._members)
+
+    def FindClass(self, env, name):
+        if isinstance(name, str): name = name.encode("utf-8")
+        clazz, hit = self._class(env, name)
+        self._count(hit)
+        return clazz
+
+    def GetMethodID(self, env, class_name, name, sig):
+        return self._member(env, "GetMethodID", class_name, name, sig)
+
+    def GetStaticMethodID(self, env, class_name, name, sig):
+        return self._member(env, "GetStaticMethodID", class_name, name, sig)
+
+    def GetFieldID(self, env, class_name, name, sig):
+        return self._member(env, "GetFieldID", class_name, name, sig)
+
+    def GetStaticFieldID(self, env, class_name, name, sig):
+        return self._member(env, "GetStaticFieldID", class_name, name, sig)
+
+    def clear(self, env):
+        """Drop all entries and delete the class references."""
+        with self._lock:
+            classes = list(self._classes.values())
+            self._classes.clear()
+            self._members.clear()
+        delete = env.DeleteGlobalRef if self.pin else env.DeleteWeakGlobalRef
+        for ref in classes:
+            delete(ref)
+
+    def discard(self, env, class_name):
+        """Drop the entries of a class and delete its class reference."""
+        if isinstance(class_name, str): class_name = class_name.encode("utf-8")
+        with self._lock:
+            ref = self._classes.pop(class_name, None)
+            for key in [key for key in self._members if key[0] == class_name]:
+                del self._members[key]
+        if ref is not None:
+            if self.pin:
+                env.DeleteGlobalRef(ref)
+            else:
+                env.DeleteWeakGlobalRef(ref)
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _member(self, env, kind, class_name, name, sig):
+        if isinstance(class_name, str): class_name = class_name.encode("utf-8")
+        if isinstance(name, str): name = name.encode("utf-8")
+        if isinstance(sig,  str): sig  = sig.encode("utf-8")
+        key = (class_name, kind, name, sig)
+        ID = self._members.get(key)
+        if ID is not None:
+            if self.pin:
+                self._count(True)
+                return ID
+            ref = self._classes.get(class_name)
+            if ref is not None and not env.IsSameObject(ref, None):
+                self._count(True)
+                return ID
+            self.discard(env, class_name)  # unloaded: its IDs are invalid
+        self._count(False)
+        clazz, _ = self._class(env, class_name)
+        try:
+            ID = getattr(env, kind)(clazz, name, sig)
+        finally:
+            if not self.pin: env.DeleteLocalRef(clazz)
+        with self._lock:
+            self._members[key] = ID
+        return ID
+
+    def _class(self, env, name):
+        # Returns (class, hit): the cached global reference if pin is true,
+        # otherwise a new local reference.
+        ref = self._classes.get(name)
+        if ref is not None:
+            if self.pin:
+                return ref, True
+            clazz = env.NewLocalRef(ref)
+            if clazz:
+                return clazz, True
+            self.discard(env, name)  # unloaded: its IDs are invalid
+        clazz = env.FindClass(name)
+        if self.pin:
+            ref = env.NewGlobalRef(clazz)
+            env.DeleteLocalRef(clazz)
+        else:
+            ref = env.NewWeakGlobalRef(clazz)
+        with self._lock:
+            cached = self._classes.setdefault(name, ref)
+        if cached is not ref:  # resolved concurrently by another thread
+            if self.pin:
+                env.DeleteGlobalRef(ref)
+            else:
+                env.DeleteWeakGlobalRef(ref)
+        return (cached if self.pin else clazz), False
+
+
+class StringCache:
+    """LRU-bounded table of interned Java strings.
+
+    Python str are mapped to Java strings held as global references,
+    created once and shared by all threads (and envs) of a JavaVM, e.g.:
+
+        strings = jni.StringCache(maxsize=1024)
+        key = strings.get(env, "name")
+
+    get() returns a new local reference to the interned string (to be
+    deleted as any local reference), so the string remains valid for its
+    caller even if the entry is evicted meanwhile by another thread.
+    The least recently used entries are evicted (and their global
+    references deleted) once maxsize is exceeded. clear(env) deletes all
+    entries, e.g. before the JavaVM is destroyed.
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize   = maxsize
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+        self._strings  = OrderedDict()  # str -> global ref
+        self._lock     = threading.Lock()
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __contains__(self, s):
+        return s in self._strings
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, env, s):
+        """Return the interned Java string of s (a new local reference)."""
+        strings = self._strings
+        with self._lock:
+            ref = strings.get(s)
+            if ref is not None:
+                strings.move_to_end(s)
+                self.hits += 1
+                # (taken under the lock: an evicted entry is deleted
+                # only once it cannot be returned anymore)
+                return env.NewLocalRef(ref)
+            self.misses += 1
+        jstr = env.str_to_jstring(s)
+        ref = env.NewGlobalRef(jstr)
+        evicted = []
+        with self._lock:
+            cached = strings.setdefault(s, ref)
+            if cached is not ref:  # interned concurrently by another thread
+                evicted.append(ref)
+                env.DeleteLocalRef(jstr)
+                jstr = env.NewLocalRef(cached)
+            while len(strings) > self.maxsize:
+                evicted.append(strings.popitem(last=False)[1])
+                self.evictions += 1
+        if evicted: env.DeleteGlobalRefs(evicted)
+        return jstr
+
+    def clear(self, env):
+        """Drop all entries and delete their references."""
+        with self._lock:
+            refs = list(self._strings.values())
+            self._strings.clear()
+        if refs: env.DeleteGlobalRefs(refs)
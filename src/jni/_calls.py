@@ -0,0 +1,225 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import array
+
+__all__ = ('CallMethodsA', 'call_many', 'new_many')
+
+# JNI type code: (type name, jvalue member, buffer format)
+_TYPES = {
+    "Z": ("Boolean", "z", "B"),
+    "B": ("Byte",    "b", "b"),
+    "C": ("Char",    "c", "H"),
+    "S": ("Short",   "s", "h"),
+    "I": ("Int",     "i", "i"),
+    "J": ("Long",    "j", "q"),
+    "F": ("Float",   "f", "f"),
+    "D": ("Double",  "d", "d"),
+    "L": ("Object",  "l", None),
+    "V": ("Void",    None, None),
+}
+
+# Buffer format: JNI type code
+_CODES = {"?": "Z", "B": "Z", "b": "B", "H": "C", "h": "S",
+          "i": "I", "q": "J", "f": "F", "d": "D"}
+_CODES["l"] = "I" if array.array("l").itemsize == 4 else "J"
+
+
+def CallMethodsA(self, rtype, clazz, methodID, count, receivers, columns, sig,  # noqa: N802
+                 out=None, done=None):
+    """Python version of the native loop of the capi extension (used
+    when it is not available), see JNIEnv.call_many()."""
+    from . import new_array, jvalue, NULL
+    if len(rtype) != 1 or rtype not in "VZBCSIJFDLN":
+        raise ValueError(f"invalid result type: {rtype!r}")
+    if count < 0:
+        raise ValueError("count must not be negative")
+    if (receivers is None or rtype == "N") and not clazz:
+        raise ValueError("static calls and constructors need a class")
+    if rtype == "N" and receivers is not None:
+        raise ValueError("constructors take no receivers")
+    if len(columns) != len(sig):
+        raise ValueError(f"expected {len(sig)} argument columns, got {len(columns)}")
+    members = []
+    for code, column in zip(sig, columns):
+        if code not in _TYPES or code == "V":
+            raise ValueError(f"invalid argument type: {code!r}")
+        _, member, fmt = _TYPES[code]
+        if fmt is not None: column = memoryview(column).cast("B").cast(fmt)
+        if len(column) < count:
+            raise ValueError(f"argument column {len(members)} is too short")
+        members.append((member, column))
+    if rtype == "N":
+        call = lambda obj, jargs: self.NewObject(clazz, methodID, jargs)
+    else:
+        Type = _TYPES[rtype][0]
+        if receivers is None:
+            method = getattr(self, f"CallStatic{Type}Method")
+            call = lambda obj, jargs: method(clazz, methodID, jargs)
+        elif clazz:
+            method = getattr(self, f"CallNonvirtual{Type}Method")
+            call = lambda obj, jargs: method(obj, clazz, methodID, jargs)
+        else:
+            method = getattr(self, f"Call{Type}Method")
+            call = lambda obj, jargs: method(obj, methodID, jargs)
+    if rtype in "LN" or out is None:
+        results = None
+    else:
+        results = memoryview(out).cast("B").cast(_TYPES[rtype][2])
+    jargs = new_array(jvalue, len(sig)) if sig else None
+    index = 0
+    try:
+        for index in range(count):
+            for k, (member, column) in enumerate(members):
+                value = column[index]
+                setattr(jargs[k], member, NULL if value is None else value)
+            ret = call(None if receivers is None else receivers[index], jargs)
+            if rtype in "LN":
+                if ret:
+                    if out: self.SetObjectArrayElement(out, index, ret)
+                    self.DeleteLocalRef(ret)
+            elif results is not None:
+                results[index] = ord(ret) if isinstance(ret, str) else ret
+        else:
+            index = count
+    finally:
+        if done is not None: done[0] = index
+
+
+def call_many(self, methodID, receivers=None, args=(), ret="V", sig=None,
+              clazz=None, out=None, count=None):
+    """Call a Java method once per receiver (or per row of arguments)
+    in a single native loop (with the capi extension).
+
+    The method is called on each of receivers (a sequence of objects),
+    statically on clazz if there are no receivers, or nonvirtually if
+    both are given. args is a sequence of argument columns, one per
+    parameter of the method, each holding an argument for every call:
+    a buffer (e.g. array.array, memoryview) of a primitive type or a
+    sequence (of references for the object parameters). sig is the
+    string of the JNI type codes of the parameters ('Z', 'B', 'C', 'S',
+    'I', 'J', 'F', 'D' or 'L'), it can be omitted if all the columns are
+    typed buffers. count is the number of calls (by default the length
+    of receivers or of the columns).
+
+    ret is the JNI type code of the result. The primitive results are
+    written to out (a writable buffer of at least count items of the
+    format of ret, a new array.array by default), which is returned. The object results ('L')
+    are stored in out (an Object[], new by default), which is returned,
+    and nothing is returned for 'V', e.g.:
+
+        scores = env.call_many(Model__score, receivers=models,
+                               args=[xs, ys], ret="D")
+
+    The loop stops at the first Java exception, raised with the index of
+    the failing call as its index attribute (the results of the previous
+    calls are in out).
+    """
+    sig, columns, count = _prepare(args, sig, count,
+                                   None if receivers is None else len(receivers))
+    results = out
+    if ret == "V":
+        results = None
+    elif ret == "L":
+        if out is None:
+            Object = self.FindClass(b"java/lang/Object")
+            try:
+                results = self.NewObjectArray(count, Object)
+            finally:
+                self.DeleteLocalRef(Object)
+    elif ret in _TYPES:
+        fmt = _TYPES[ret][2]
+        if out is None:
+            results = array.array(fmt, bytes(count * array.array(fmt).itemsize))
+        else:
+            view = memoryview(out)
+            if view.readonly or _CODES.get(view.format) != ret or len(view) < count:
+                raise ValueError(f"out must be a writable buffer of {count} "
+                                 f"items of type {ret!r}")
+    else:
+        raise ValueError(f"invalid result type: {ret!r}")
+    _call(self, ret, clazz, methodID, count, receivers, columns, sig, results,
+          results if ret == "L" and out is None else None)
+    return None if ret == "V" else results
+
+
+def new_many(self, clazz, methodID, args=(), sig=None, count=None):
+    """Construct count objects of clazz (with the constructor methodID)
+    in a single native loop (with the capi extension) and return them
+    as a new Java array of clazz.
+
+    args, sig and count are as for call_many(), a Java exception is
+    raised with the index of the failing construction as its index
+    attribute.
+    """
+    sig, columns, count = _prepare(args, sig, count, None)
+    results = self.NewObjectArray(count, clazz)
+    _call(self, "N", clazz, methodID, count, None, columns, sig, results, results)
+    return results
+
+
+def _prepare(args, sig, count, nreceivers):
+    # Returns the JNI type codes and the columns (typed memoryviews
+    # or sequences) of the arguments and the number of calls.
+    columns = list(args)
+    if sig is None:
+        codes = []
+        for k, column in enumerate(columns):
+            try:
+                code = _CODES.get(memoryview(column).format)
+            except TypeError:
+                code = None
+            if code is None:
+                raise TypeError(f"cannot infer the type of argument column {k}: "
+                                "pass sig")
+            codes.append(code)
+        sig = "".join(codes)
+    if len(sig) != len(columns):
+        raise ValueError(f"sig has {len(sig)} types for {len(columns)} argument columns")
+    for k, (code, column) in enumerate(zip(sig, columns)):
+        if code == "L":
+            if not hasattr(column, "__len__"): columns[k] = list(column)
+            continue
+        if code not in _TYPES or code == "V":
+            raise ValueError(f"invalid argument type: {code!r}")
+        fmt = _TYPES[code][2]
+        try:
+            view = memoryview(column)
+        except TypeError:
+            view = None
+        if (view is None or not view.c_contiguous
+           or _CODES.get(view.format) != code):
+            view = memoryview(array.array(fmt, column))
+        columns[k] = view.cast("B").cast(fmt)
+    if count is None:
+        if nreceivers is not None:
+            count = nreceivers
+        elif columns:
+            count = len(columns[0])
+        else:
+            raise ValueError("count is required for calls without receivers "
+                             "and arguments")
+    if nreceivers is not None and nreceivers < count:
+        raise ValueError("receivers is too short")
+    for k, column in enumerate(columns):
+        if len(column) < count:
+            raise ValueError(f"argument column {k} is too short")
+    return sig, columns, count
+
+
+def _call(self, rtype, clazz, methodID, count, receivers, columns, sig, out, owned):
+    # owned: the result array created by the caller (deleted on error).
+    from . import new, jint, Throwable
+    done = new(jint)
+    try:
+        self.CallMethodsA(rtype, clazz, methodID, count, receivers, columns, sig,
+                          out, done)
+    except Throwable as exc:
+        exc.index = done[0]
+        if owned: self.DeleteLocalRef(owned)
+        raise
+    except BaseException:
+        if owned: self.DeleteLocalRef(owned)
+        raise
@@ -0,0 +1,130 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import sys
+from contextlib import contextmanager
+
+from ._arrays import _ARRAY_KINDS, _array_kind_of
+
+__all__ = ('critical', 'guard_enter', 'guard_exit')
+
+# JNI functions which may be called inside a critical section.
+_ALLOWED = {
+    "GetPrimitiveArrayCritical", "ReleasePrimitiveArrayCritical",
+    "GetStringCritical",         "ReleaseStringCritical",
+}
+
+_depths   = {}  # id(env) -> depth of the debug critical sections of env
+_wrappers = {}  # JNIEnv class -> wrappers of its guarded methods
+
+
+@contextmanager
+def critical(self, *objects, mode=0, debug=None):
+    """Context manager pinning the contents of Java primitive arrays
+    and strings (GetPrimitiveArrayCritical, GetStringCritical) and
+    exposing them as a tuple of memoryviews (of the format of the arrays,
+    the views of strings are read-only and of UTF-16 code units).
+
+    The contents are released in reverse order on exit with mode (see
+    array_view()). No other JNI function may be called and the thread
+    must not block inside the section. In debug mode (by default if
+    Python runs in development mode, python -X dev) such JNI calls raise
+    RuntimeError instead of risking a JVM deadlock, e.g.:
+
+        with env.critical(xs, ys) as (x, y):
+            for i in range(len(x)): y[i] += a * x[i]
+    """
+    from . import buffer_at, JNI_COMMIT, JNI_ABORT
+    if debug is None: debug = sys.flags.dev_mode
+    # Everything needing JNI calls is done before entering the section.
+    kinds = [_critical_kind_of(self, obj) for obj in objects]
+    sizes = [self.GetStringLength(obj) if kind is None else self.GetArrayLength(obj)
+             for obj, kind in zip(objects, kinds)]
+    pinned = []
+    views  = []
+    if debug: guard_enter(self)
+    try:
+        for obj, kind, size in zip(objects, kinds, sizes):
+            if kind is None:
+                elems = self.GetStringCritical(obj)
+                fmt, itemsize, readonly = "H", 2, True
+            else:
+                elems = self.GetPrimitiveArrayCritical(obj)
+                _, fmt, itemsize = _ARRAY_KINDS[kind]
+                readonly = (mode == JNI_ABORT)
+            if not elems:
+                raise MemoryError("cannot pin the contents of a critical section")
+            pinned.append((obj, kind, elems))
+            view = memoryview(buffer_at(elems, size * itemsize)).cast("B").cast(fmt)
+            views.append(view.toreadonly() if readonly else view)
+        yield tuple(views)
+    finally:
+        for view in views: view.release()
+        try:
+            for obj, kind, elems in reversed(pinned):
+                if kind is None:
+                    self.ReleaseStringCritical(obj, elems)
+                else:
+                    self.ReleasePrimitiveArrayCritical(obj, elems, mode)
+                    if mode == JNI_COMMIT:
+                        self.ReleasePrimitiveArrayCritical(obj, elems, JNI_ABORT)
+        finally:
+            if debug: guard_exit(self)
+
+
+def _critical_kind_of(env, obj):
+    # None for strings, otherwise the kind of the primitive array.
+    String = env.FindClass(b"java/lang/String")
+    try:
+        is_string = env.IsInstanceOf(obj, String)
+    finally:
+        env.DeleteLocalRef(String)
+    return None if is_string else _array_kind_of(env, obj)
+
+
+def _guarded(name):
+    def wrap(method):
+        def guarded(env, *args, **kwargs):
+            raise RuntimeError(f"JNIEnv.{name}() called inside "
+                               "a critical section")
+        guarded.__name__ = guarded.__qualname__ = name
+        return guarded
+    return wrap
+
+
+def _guard_wrappers(cls):
+    try:
+        return _wrappers[cls]
+    except KeyError:
+        pass
+    wrappers = _wrappers[cls] = {}
+    for name in dir(cls):
+        if not name[:1].isupper() or name in _ALLOWED: continue
+        method = getattr(cls, name)
+        if not callable(method) or isinstance(method, type): continue
+        wrappers[name] = _guarded(name)
+    return wrappers
+
+
+def guard_enter(env):
+    """Enter a debug critical section of env: any JNI function (other
+    than the critical ones) called through env until guard_exit(env)
+    raises RuntimeError instead of risking a JVM deadlock. The other
+    envs (and threads) are not affected."""
+    depth = _depths.get(id(env), 0)
+    if not depth:
+        from ._hooks import install
+        install(env, "critical", _guard_wrappers(type(env)))
+    _depths[id(env)] = depth + 1
+
+
+def guard_exit(env):
+    """Exit a debug critical section of env."""
+    depth = _depths.pop(id(env)) - 1
+    if depth:
+        _depths[id(env)] = depth
+    else:
+        from ._hooks import uninstall
+        uninstall(env, "critical")
@@ -0,0 +1,78 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import threading
+
+__all__ = ('current_env',)
+
+_local = threading.local()
+
+
+def _jint(value):
+    # The error codes as 32-bit signed jints (a backend declaring jint
+    # as a C long returns them zero-extended on LP64 platforms).
+    value &= 0xFFFFFFFF
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+class _ThreadEnv:
+    """JNIEnv of the current thread for a given JavaVM."""
+
+    __slots__ = ('jvm', 'jenv', 'owner', 'attached')
+
+    def __init__(self, jvm, version, daemon):
+        from . import (obj, POINTER, JNIEnv, JEnv, JNIException,
+                       JNI_EDETACHED)
+        self.jvm      = jvm
+        self.owner    = threading.get_ident()
+        self.attached = False
+        penv = obj(POINTER(JNIEnv))
+        try:
+            jvm.GetEnv(penv, version)
+        except JNIException as exc:
+            if _jint(exc.getError()) != JNI_EDETACHED: raise
+            if daemon:
+                jvm.AttachCurrentThreadAsDaemon(penv)
+            else:
+                jvm.AttachCurrentThread(penv)
+            self.attached = True
+        self.jenv = JEnv(penv)
+
+    def __del__(self):
+        # The thread-local storage of a thread is cleared by that thread
+        # on its exit, so the thread is still the owner here.
+        if self.attached and threading.get_ident() == self.owner:
+            self.attached = False
+            self.jenv = None
+            try:
+                self.jvm.DetachCurrentThread()
+            except Exception:  # pragma: no cover
+                pass
+
+
+def current_env(jvm, daemon=False, version=None):
+    """Return the JNIEnv of the current thread for jvm.
+
+    The env is obtained once per thread (and jvm) and cached in
+    a thread-local storage. If the current thread is not attached
+    to the jvm, it is attached on first use (as a daemon thread if
+    daemon is true) and detached automatically when it exits.
+    Such a thread should not call jvm.DetachCurrentThread() itself.
+    """
+    try:
+        envs = _local.envs
+    except AttributeError:
+        envs = _local.envs = {}
+    # Keyed by the JavaVM* (a JavaVM may have several wrappers, whose
+    # ids can be reused once they are collected).
+    key = jvm._address
+    try:
+        return envs[key].jenv
+    except KeyError:
+        pass
+    if version is None:
+        from . import JNI_VERSION_1_6 as version
+    entry = envs[key] = _ThreadEnv(jvm, version, daemon)
+    return entry.jenv
@@ -0,0 +1,142 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import os
+import threading
+import queue
+from concurrent.futures import Executor, Future
+
+__all__ = ('JVMExecutor',)
+
+_STOP = object()
+
+
+class JVMExecutor(Executor):
+    """concurrent.futures Executor whose worker threads are attached to
+    a JavaVM when the executor starts and detached when it shuts down.
+
+    submit(fn, *args, **kwargs) runs fn(env, *args, **kwargs) where env
+    is the JNIEnv of the worker. Each worker also has its own
+    ResolutionCache of classes and method/field IDs, returned by the
+    cache property inside a task and cleared when the worker stops, e.g.:
+
+        def length(env, jstr):
+            String__length = executor.cache.GetMethodID(env,
+                                 b"java/lang/String", b"length", b"()I")
+            return env.CallIntMethod(jstr, String__length)
+
+        with jni.JVMExecutor(jvm) as executor:
+            lengths = list(executor.map(length, jstrs))
+
+    Local references created by a task are only valid on its worker:
+    a task should return Python values or global references.
+    """
+
+    def __init__(self, jvm, max_workers=None, daemon=False, version=None,
+                 thread_name_prefix="jni"):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.jvm = jvm
+        self.daemon  = daemon
+        self.version = version
+        self._queue = queue.SimpleQueue()
+        self._local = threading.local()  # env and cache of the workers
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._errors = []
+        ready = threading.Barrier(max_workers + 1)
+        self._threads = [threading.Thread(target=self._worker, args=(ready,),
+                                          name=f"{thread_name_prefix}-{i}",
+                                          daemon=True)
+                         for i in range(max_workers)]
+        for thread in self._threads:
+            thread.start()
+        ready.wait()
+        if self._errors:
+            self.shutdown()
+            raise self._errors[0]
+
+    @property
+    def max_workers(self):
+        return len(self._threads)
+
+    @property
+    def env(self):
+        """JNIEnv of the current worker."""
+        try:
+            return self._local.env
+        except AttributeError:
+            raise RuntimeError("not called from a worker of the executor") from None
+
+    @property
+    def cache(self):
+        """ResolutionCache of the current worker."""
+        try:
+            return self._local.cache
+        except AttributeError:
+            raise RuntimeError("not called from a worker of the executor") from None
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future = Future()
+            self._queue.put((future, fn, args, kwargs))
+        return future
+
+    submit.__doc__ = Executor.submit.__doc__
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+                if cancel_futures:
+                    while True:
+                        try:
+                            job = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        job[0].cancel()
+                for _ in self._threads:
+                    self._queue.put(_STOP)
+        if wait:
+            for thread in self._threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    shutdown.__doc__ = Executor.shutdown.__doc__
+
+    def _worker(self, ready):
+        from . import current_env, ResolutionCache
+        try:
+            env = current_env(self.jvm, daemon=self.daemon, version=self.version)
+        except BaseException as exc:
+            self._errors.append(exc)
+            ready.wait()
+            return
+        local = self._local
+        local.env   = env
+        local.cache = cache = ResolutionCache()
+        ready.wait()
+        get = self._queue.get
+        try:
+            while True:
+                job = get()
+                if job is _STOP: break
+                future, fn, args, kwargs = job
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = fn(env, *args, **kwargs)
+                    except BaseException as exc:
+                        future.set_exception(exc)
+                    else:
+                        future.set_result(result)
+                del job, future, fn, args, kwargs
+        finally:
+            cache.clear(env)
+            del local.env, local.cache
+        # The env is detached when the thread exits (see current_env()).
@@ -0,0 +1,205 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+__all__ = ('LocalFrame', 'local_frame', 'LocalArena', 'local_arena')
+
+_frames = {}  # id(env) -> stack of the active LocalFrames of env
+
+
+class LocalFrame:
+    """Local reference frame of a JNIEnv (see JNIEnv.local_frame())."""
+
+    __slots__ = ('env', 'capacity', 'count', 'kept', '_keep')
+
+    def __init__(self, env, capacity=16):
+        self.env      = env
+        self.capacity = capacity
+        self.count    = 0   # number of local references created in the frame
+        self.kept     = ()  # promoted references (valid after exit)
+        self._keep    = []
+
+    def __enter__(self):
+        env = self.env
+        env.PushLocalFrame(self.capacity)
+        stack = _frames.setdefault(id(env), [])
+        if not stack:
+            from ._hooks import install
+            install(env, "local_frame", _counting_wrappers)
+        stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        env  = self.env
+        keep = self._keep
+        self._keep = []
+        try:
+            if exc_type is not None or not keep:
+                env.PopLocalFrame(None)
+            elif len(keep) == 1:
+                self.kept = (env.PopLocalFrame(keep[0]),)
+            else:
+                # PopLocalFrame() promotes a single reference,
+                # so the references are promoted inside an Object[].
+                env.EnsureLocalCapacity(2)
+                Object = env.FindClass(b"java/lang/Object")
+                array = env.NewObjectArray(len(keep), Object)
+                for i, ref in enumerate(keep):
+                    env.SetObjectArrayElement(array, i, ref)
+                array = env.PopLocalFrame(array)
+                try:
+                    self.kept = tuple(env.GetObjectArrayElement(array, i)
+                                      for i in range(len(keep)))
+                finally:
+                    env.DeleteLocalRef(array)
+        finally:
+            # Until here the references are counted by this frame,
+            # the promoted ones are then counted once by the enclosing one.
+            stack = _frames[id(env)]
+            stack.pop()
+            if not stack:
+                from ._hooks import uninstall
+                del _frames[id(env)]
+                uninstall(env, "local_frame")
+            elif self.kept:
+                stack[-1].ensure(len(self.kept))
+        return False
+
+    @property
+    def result(self):
+        """The (first) promoted reference (valid after exit)."""
+        return self.kept[0] if self.kept else None
+
+    def keep(self, ref):
+        """Promote ref to the enclosing frame on exit.
+
+        The promoted references are available (in the order of keep()
+        calls) as frame.kept after exit. Returns ref.
+        """
+        self._keep.append(ref)
+        return ref
+
+    def ensure(self, count=1):
+        """Declare that count more local references are to be created
+        in the frame by other means than the methods of its env (e.g.
+        by native code). The capacity of the frame grows (it is doubled
+        at least) once it is exceeded."""
+        self._grow(self.count + count)
+        self.count += count
+
+    def _grow(self, needed):
+        if needed > self.capacity:
+            capacity = max(needed, 2 * self.capacity)
+            self.env.EnsureLocalCapacity(capacity - self.count)
+            self.capacity = capacity
+
+
+def _new_local_ref(method):
+    def new_local_ref(env, *args, **kwargs):
+        frame = _frames[id(env)][-1]
+        frame._grow(frame.count + 1)
+        ret = method(env, *args, **kwargs)
+        if ret: frame.count += 1
+        return ret
+    return new_local_ref
+
+
+def _delete_local_refs(method, many):
+    def delete_local_refs(env, refs, *args, **kwargs):
+        frame = _frames[id(env)][-1]
+        if many: refs = list(refs)
+        method(env, refs, *args, **kwargs)
+        deleted = sum(1 for ref in refs if ref) if many else int(bool(refs))
+        frame.count = max(frame.count - deleted, 0)
+    return delete_local_refs
+
+
+def __counting_wrappers():
+    from ._tracker import _NEW_REF_METHODS
+    wrappers = {name: _new_local_ref
+                for name, kind in _NEW_REF_METHODS.items() if kind == "local"}
+    wrappers["DeleteLocalRef"]  = lambda method: _delete_local_refs(method, False)
+    wrappers["DeleteLocalRefs"] = lambda method: _delete_local_refs(method, True)
+    return wrappers
+
+_counting_wrappers = __counting_wrappers()
+del __counting_wrappers
+
+
+def local_frame(self, capacity=16):
+    """Return a context manager of a new local reference frame.
+
+    The frame (of initial capacity) is pushed on enter and popped on
+    exit, deleting all local references created in it, except those
+    passed to frame.keep() which are promoted to the enclosing frame
+    (as frame.kept, frame.result). The local references created and
+    deleted by the methods of env are counted (frame.count) and the
+    capacity of the frame grows automatically when they would exceed it
+    (frame.ensure(count) declares references created by other means),
+    e.g.:
+
+        with env.local_frame(64) as frame:
+            for i in range(size):
+                item = env.GetObjectArrayElement(array, i)
+                ...
+            frame.keep(result)
+        result = frame.result
+    """
+    return LocalFrame(self, capacity)
+
+
+class LocalArena:
+    """Arena of local references of a JNIEnv (see JNIEnv.local_arena())."""
+
+    __slots__ = ('env', '_refs')
+
+    def __init__(self, env):
+        self.env   = env
+        self._refs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.release()
+        return False
+
+    def __len__(self):
+        return len(self._refs)
+
+    def add(self, ref):
+        """Collect ref (to be deleted on exit). Returns ref."""
+        if ref: self._refs.append(ref)
+        return ref
+
+    def keep(self, ref):
+        """Exclude a collected ref from deletion. Returns ref."""
+        refs = self._refs
+        for i in range(len(refs) - 1, -1, -1):
+            if refs[i] == ref:
+                del refs[i]
+                break
+        return ref
+
+    def release(self):
+        """Delete all the collected references (in a single native
+        loop, see JNIEnv.DeleteLocalRefs()) and empty the arena."""
+        refs, self._refs = self._refs, []
+        if refs: self.env.DeleteLocalRefs(refs)
+
+
+def local_arena(self):
+    """Return a context manager of a new local reference arena.
+
+    The references collected by arena.add() are deleted all at once
+    on exit (or by arena.release()), except those passed to arena.keep().
+    Unlike a local frame, the references created in its scope and not
+    collected stay valid, e.g.:
+
+        with env.local_arena() as arena:
+            for i in range(size):
+                item = arena.add(env.GetObjectArrayElement(array, i))
+                if ...: result = arena.keep(item)
+    """
+    return LocalArena(self)
@@ -0,0 +1,57 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+from functools import wraps
+
+__all__ = ('fuse_methods',)
+
+
+def fuse_methods(cls, exclude=(), env=None, unfused=None):
+    """Replace the methods of the JNIEnv class cls having a fused entry
+    point in the capi extension (if available), which runs the JNI
+    function and the exception check in a single native call. The
+    plain methods remain as __wrapped__.
+
+    env(self) returns what the entry points take as the env (the env
+    itself by default). If unfused is given, unfused(self) returns the
+    names of the methods which have to run plainly for the env.
+    Returns the names of the replaced methods."""
+    try:
+        from .capi.jni import fused
+    except ImportError:  # pragma: no cover
+        return []
+    names = [name for name in dir(fused)
+             if not name.startswith("_") and name not in exclude]
+    for name in names:
+        setattr(cls, name, _fused_method(getattr(cls, name),
+                                         getattr(fused, name), env, unfused))
+    return names
+
+
+def _fused_method(method, fused_fun, env, unfused):
+    name = method.__name__
+
+    if env is not None:
+        @wraps(method)
+        def fused_method(self, *args, **kwargs):
+            ret, pending = fused_fun(env(self), *args, **kwargs)
+            if pending: self._handle_JavaException()
+            return ret
+    elif unfused is not None:
+        @wraps(method)
+        def fused_method(self, *args, **kwargs):
+            if name in unfused(self):
+                return method(self, *args, **kwargs)
+            ret, pending = fused_fun(self, *args, **kwargs)
+            if pending: self._handle_JavaException()
+            return ret
+    else:
+        @wraps(method)
+        def fused_method(self, *args, **kwargs):
+            ret, pending = fused_fun(self, *args, **kwargs)
+            if pending: self._handle_JavaException()
+            return ret
+
+    return fused_method
@@ -0,0 +1,41 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+__all__ = ('gil_policy',)
+
+# GIL policy of the JNI functions: True if a function is called while
+# holding the GIL (cheap and non-blocking functions, for which releasing
+# and reacquiring the GIL costs more than the call itself), False (the
+# default for the functions not listed) if the GIL is released during
+# the call (e.g. Call*Method, NewObject: they run Java code).
+#
+# The table is applied by the ctypes backend: it is read when the function
+# table of an env is bound (JEnv()), JNIEnv.gil() overrides it for a block
+# of calls and JNIEnv.gil_call() for a single call. The other backends do
+# not have these methods: cffi releases the GIL during every call of an
+# ABI-mode function and the capi extension has its own built-in handling
+# (only the functions running Java code release the GIL), as do its fused
+# entry points (used by ctypes only where they handle the GIL as the table).
+
+gil_policy = dict.fromkeys((
+    "GetVersion",
+    "ExceptionOccurred", "ExceptionClear", "ExceptionCheck",
+    "PushLocalFrame", "PopLocalFrame", "EnsureLocalCapacity",
+    "NewLocalRef", "DeleteLocalRef",
+    "GetObjectClass", "GetObjectRefType",
+    "IsInstanceOf", "IsSameObject", "IsAssignableFrom",
+    "GetStringLength", "GetStringUTFLength",
+    "GetStringRegion", "GetStringUTFRegion",
+    "GetArrayLength", "GetObjectArrayElement", "SetObjectArrayElement",
+    "GetDirectBufferAddress", "GetDirectBufferCapacity",
+    "FromReflectedMethod", "FromReflectedField",
+) + tuple(f"{prefix}{Type}Field"
+          for prefix in ("Get", "Set", "GetStatic", "SetStatic")
+          for Type in ("Object", "Boolean", "Byte", "Char", "Short",
+                       "Int", "Long", "Float", "Double"))
+  + tuple(f"{prefix}{Type}ArrayRegion"  # copies without any Java code
+          for prefix in ("Get", "Set")
+          for Type in ("Boolean", "Byte", "Char", "Short",
+                       "Int", "Long", "Float", "Double")), True)
@@ -0,0 +1,92 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import threading
+from types import MethodType
+
+__all__ = ('install', 'uninstall')
+
+# Layered wrapping of the JNIEnv methods, of a JNIEnv class (for all envs)
+# or of a single env. The layers of a target are applied in the order of
+# their installation and can be uninstalled in any order: the wrapped
+# methods are rebuilt from the original ones each time. The methods of an
+# env dispatch to those of its class at call time, so the layers of the
+# class (e.g. of a RefTracker) also apply to the calls made through it.
+
+_lock   = threading.RLock()
+_states = {}  # id(target) -> _State
+_MISSING = object()
+
+
+class _State:
+
+    __slots__ = ('target', 'layers', 'saved')
+
+    def __init__(self, target):
+        self.target = target
+        self.layers = {}  # key -> {name: wrap}
+        self.saved  = {}  # name -> (own attribute or _MISSING, original method)
+
+
+def install(target, key, wrappers):
+    """Install a layer (identified by key) of wrappers ({name: wrap},
+    wrap(method) returning a method taking the env as first argument)
+    over the methods of target (a JNIEnv class or a JNIEnv instance).
+    Names of methods which target does not have are ignored."""
+    cls = target if isinstance(target, type) else type(target)
+    wrappers = {name: wrap for name, wrap in wrappers.items() if hasattr(cls, name)}
+    with _lock:
+        state = _states.get(id(target))
+        if state is None:
+            state = _states[id(target)] = _State(target)
+        if key in state.layers:
+            raise RuntimeError(f"layer {key!r} is already installed")
+        state.layers[key] = wrappers
+        _rebuild(state, wrappers)
+
+
+def uninstall(target, key):
+    """Uninstall the layer of key (if installed) from target."""
+    with _lock:
+        state = _states.get(id(target))
+        if state is None or key not in state.layers: return
+        wrappers = state.layers.pop(key)
+        _rebuild(state, wrappers)
+        if not state.layers:
+            del _states[id(target)]
+
+
+def _rebuild(state, names):
+    target = state.target
+    is_class = isinstance(target, type)
+    for name in names:
+        wraps = [layer[name] for layer in state.layers.values() if name in layer]
+        if is_class:
+            if name not in state.saved:
+                state.saved[name] = (target.__dict__.get(name, _MISSING),
+                                     getattr(target, name))
+            own, method = state.saved[name]
+            if not wraps:
+                del state.saved[name]
+                if own is _MISSING:  # inherited (capi)
+                    delattr(target, name)
+                else:
+                    setattr(target, name, own)
+                continue
+        else:
+            if not wraps:
+                vars(target).pop(name, None)
+                continue
+            method = _class_method(name)
+        for wrap in wraps:
+            method = wrap(method)
+        setattr(target, name, method if is_class else MethodType(method, target))
+
+
+def _class_method(name):
+    def method(env, *args, **kwargs):
+        return getattr(type(env), name)(env, *args, **kwargs)
+    method.__name__ = method.__qualname__ = name
+    return method
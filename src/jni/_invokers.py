@@ -0,0 +1,97 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import re
+
+__all__ = ('compile_method',)
+
+_TYPE = r"\[*(?:[ZBCSIJFD]|L[^;]+;)"
+_SIGNATURE = re.compile(rf"\(((?:{_TYPE})*)\)(V|{_TYPE})")
+
+_CALL_KINDS = {
+    # type code: kind of Call<Kind>Method ("L" for objects and arrays)
+    "V": "Void",
+    "Z": "Boolean",
+    "B": "Byte",
+    "C": "Char",
+    "S": "Short",
+    "I": "Int",
+    "J": "Long",
+    "F": "Float",
+    "D": "Double",
+    "L": "Object"
+}
+
+_JVALUE_FIELDS = {
+    # type code: field of jvalue
+    "Z": "z",
+    "B": "b",
+    "C": "c",
+    "S": "s",
+    "I": "i",
+    "J": "j",
+    "F": "f",
+    "D": "d",
+    "L": "l"
+}
+
+
+def compile_method(self, clazz, name, sig, static=False):
+    """Return a callable invoking the Java method name of clazz.
+
+    The signature is parsed and the methodID is resolved once. The
+    callable packs its arguments into a jvalue buffer allocated once
+    and dispatches to the typed Call<Type>Method (CallStatic<Type>Method
+    if static), i.e.: invoker(obj, *args) or invoker(*args) if static.
+    It is bound to this env (and therefore to its thread) and clazz
+    must remain a valid reference as long as it is used.
+    """
+    from . import new_array, jvalue
+    if isinstance(name, str): name = name.encode("utf-8")
+    if isinstance(sig,  str): sig  = sig.encode("utf-8")
+    ret_type, arg_types = _parse_signature(sig.decode("utf-8"))
+    if static:
+        methodID = self.GetStaticMethodID(clazz, name, sig)
+        call = getattr(self, f"CallStatic{_CALL_KINDS[ret_type]}Method")
+    else:
+        methodID = self.GetMethodID(clazz, name, sig)
+        call = getattr(self, f"Call{_CALL_KINDS[ret_type]}Method")
+    nargs = len(arg_types)
+    jargs = new_array(jvalue, nargs) if nargs else None
+    slots = tuple((jargs[i], _JVALUE_FIELDS[arg_type])
+                  for i, arg_type in enumerate(arg_types))
+
+    def arity_error(args):
+        return TypeError(f"{name.decode('utf-8')}{sig.decode('utf-8')} takes "
+                         f"{nargs} argument(s) ({len(args)} given)")
+
+    if static:
+        def invoker(*args, __setattr=setattr):
+            if len(args) != nargs: raise arity_error(args)
+            for (jarg, field), arg in zip(slots, args):
+                __setattr(jarg, field, arg)
+            return call(clazz, methodID, jargs)
+    else:
+        def invoker(this, *args, __setattr=setattr):
+            if len(args) != nargs: raise arity_error(args)
+            for (jarg, field), arg in zip(slots, args):
+                __setattr(jarg, field, arg)
+            return call(this, methodID, jargs)
+
+    invoker.__name__ = invoker.__qualname__ = name.decode("utf-8")
+    invoker.methodID = methodID
+    return invoker
+
+
+def _parse_signature(signature):
+    # -> (return type code, argument type codes), "L" for objects and arrays.
+    match = _SIGNATURE.fullmatch(signature)
+    if not match:
+        from . import JNIException, JNI_EINVAL
+        raise JNIException(JNI_EINVAL, info="jni.method")
+    args, ret = match.groups()
+    return (ret if len(ret) == 1 else "L",
+            tuple(arg if len(arg) == 1 else "L"
+                  for arg in re.findall(_TYPE, args)))
@@ -0,0 +1,347 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+__all__ = ('Program', 'Slot', 'RunProgram')
+
+# Opcodes of the instructions: (opcode, type, dest, *operands), where type
+# is the ord() of the JNI type code of a typed operation (0 otherwise),
+# dest is the slot of the result (-1 for none) and the operands are slots.
+# They have to match the interpreter of the capi extension (jni.c).
+
+OP_FIND_CLASS           = 0   # dest, name
+OP_GET_METHOD_ID        = 1   # dest, clazz, name, sig
+OP_GET_STATIC_METHOD_ID = 2   # dest, clazz, name, sig
+OP_GET_FIELD_ID         = 3   # dest, clazz, name, sig
+OP_GET_STATIC_FIELD_ID  = 4   # dest, clazz, name, sig
+OP_NEW_OBJECT           = 5   # dest, clazz, methodID, *args
+OP_CALL_METHOD          = 6   # dest, obj, methodID, *args
+OP_CALL_STATIC_METHOD   = 7   # dest, clazz, methodID, *args
+OP_GET_FIELD            = 8   # dest, obj, fieldID
+OP_SET_FIELD            = 9   # -1, obj, fieldID, value
+OP_GET_STATIC_FIELD     = 10  # dest, clazz, fieldID
+OP_SET_STATIC_FIELD     = 11  # -1, clazz, fieldID, value
+OP_NEW_STRING_UTF       = 12  # dest, s
+OP_GET_OBJECT_CLASS     = 13  # dest, obj
+OP_DELETE_LOCAL_REF     = 14  # -1, obj
+
+# Slot types: the JNI type codes of the values, 'm' (method ID),
+# 'f' (field ID) and 's' (modified UTF-8 string, bytes).
+
+_TYPE_NAMES = {"Z": "Boolean", "B": "Byte", "C": "Char", "S": "Short",
+               "I": "Int", "J": "Long", "F": "Float", "D": "Double",
+               "L": "Object"}
+
+# Opcodes returning new local references (of type 'L' if typed)
+_REF_RESULTS = {OP_FIND_CLASS, OP_NEW_OBJECT, OP_CALL_METHOD, OP_CALL_STATIC_METHOD,
+                OP_GET_FIELD, OP_GET_STATIC_FIELD, OP_NEW_STRING_UTF,
+                OP_GET_OBJECT_CLASS}
+
+_JVALUE_MEMBERS = {"Z": "z", "B": "b", "C": "c", "S": "s", "I": "i",
+                   "J": "j", "F": "f", "D": "d", "L": "l"}
+
+
+class Slot:
+    """Symbolic value (input, constant or result) of a Program."""
+
+    __slots__ = ('program', 'index', 'type')
+
+    def __init__(self, program, index, type):  # noqa: A002
+        self.program = program
+        self.index   = index
+        self.type    = type
+
+    def __repr__(self):
+        return f"<Slot {self.index}: {self.type}>"
+
+
+class Program:
+    """Recorded sequence of JNIEnv operations, executed in a single native
+    call (with the capi extension).
+
+    The recording methods mirror the JNIEnv ones (FindClass, GetMethodID,
+    NewObject, Set<Type>Field, Call<Type>Method, DeleteLocalRef, ...),
+    but take and return Slots: symbolic values of the inputs (input()),
+    of the constants (const(), or implicitly: bytes/str names and
+    signatures, Python bool/int/float/None arguments as Z/I/D/null) and
+    of the results of the previous operations. output() selects the
+    slots returned by run(env, *inputs), e.g.:
+
+        prog = jni.Program()
+        x = prog.input("I")
+        Point = prog.FindClass(b"java/awt/Point")
+        point = prog.NewObject(Point, prog.GetMethodID(Point, b"<init>", b"()V"))
+        prog.SetIntField(point, prog.GetFieldID(Point, b"x", b"I"), x)
+        desc  = prog.CallObjectMethod(point, prog.GetMethodID(Point,
+                                      b"toString", b"()Ljava/lang/String;"))
+        prog.DeleteLocalRef(point) ; prog.DeleteLocalRef(Point)
+        prog.output(desc)
+        jstr = prog.run(env, 42)
+
+    The references returned by the operations are local references: the
+    temporaries should be deleted by recorded DeleteLocalRef() operations.
+    The execution stops at the first Java exception, raised with the index
+    of the failing operation as its index attribute, and the live local
+    references created by the program are then deleted.
+    """
+
+    def __init__(self):
+        self._types   = []  # type of each slot
+        self._values  = []  # value of each constant slot (None otherwise)
+        self._inputs  = []  # slots of the inputs
+        self._consts  = {}  # (type, value) -> slot, for hashable constants
+        self._code    = []  # instructions
+        self._outputs = ()
+        self._compiled = None
+
+    def __len__(self):
+        return len(self._code)
+
+    def input(self, type="L"):  # noqa: A002
+        """Add an input (of JNI type code type) and return its slot."""
+        slot = self._slot(type)
+        self._inputs.append(slot.index)
+        return slot
+
+    def const(self, value, type):  # noqa: A002
+        """Return the slot of a constant of JNI type code type."""
+        if type == "s" and isinstance(value, str): value = value.encode("utf-8")
+        try:
+            return self._consts[(type, value)]
+        except (KeyError, TypeError):
+            pass
+        slot = self._slot(type)
+        self._values[slot.index] = value
+        try:
+            self._consts[(type, value)] = slot
+        except TypeError:  # pragma: no cover
+            pass
+        return slot
+
+    def output(self, *slots):
+        """Select the slots returned by run()."""
+        self._outputs = tuple(self._operand(slot) for slot in slots)
+        self._compiled = None
+
+    def run(self, env, *inputs):
+        """Execute the program with env and return its output(s): None,
+        the value of the single output or a tuple of the values."""
+        from . import new, jint, Throwable
+        if len(inputs) != len(self._inputs):
+            raise TypeError(f"the program takes {len(self._inputs)} inputs "
+                            f"({len(inputs)} given)")
+        if self._compiled is None:
+            self._compiled = (tuple(self._code), "".join(self._types), self._outputs)
+        code, types, outputs = self._compiled
+        values = list(self._values)
+        for index, value in zip(self._inputs, inputs):
+            values[index] = value
+        done = new(jint)
+        try:
+            results = env.RunProgram(code, types, values, outputs, done)
+        except Throwable as exc:
+            exc.index = done[0]
+            raise
+        return (None if not outputs else
+                results[0] if len(outputs) == 1 else results)
+
+    # Recorded operations
+
+    def FindClass(self, name):  # noqa: N802
+        return self._emit(OP_FIND_CLASS, "L", self._name(name))
+
+    def GetMethodID(self, clazz, name, sig):  # noqa: N802
+        return self._emit(OP_GET_METHOD_ID, "m", self._ref(clazz),
+                          self._name(name), self._name(sig))
+
+    def GetStaticMethodID(self, clazz, name, sig):  # noqa: N802
+        return self._emit(OP_GET_STATIC_METHOD_ID, "m", self._ref(clazz),
+                          self._name(name), self._name(sig))
+
+    def GetFieldID(self, clazz, name, sig):  # noqa: N802
+        return self._emit(OP_GET_FIELD_ID, "f", self._ref(clazz),
+                          self._name(name), self._name(sig))
+
+    def GetStaticFieldID(self, clazz, name, sig):  # noqa: N802
+        return self._emit(OP_GET_STATIC_FIELD_ID, "f", self._ref(clazz),
+                          self._name(name), self._name(sig))
+
+    def NewObject(self, clazz, methodID, *args):  # noqa: N802
+        return self._emit(OP_NEW_OBJECT, "L", self._ref(clazz),
+                          self._id(methodID, "m"), *map(self._arg, args))
+
+    def NewStringUTF(self, s):  # noqa: N802
+        return self._emit(OP_NEW_STRING_UTF, "L", self._name(s))
+
+    def GetObjectClass(self, obj):  # noqa: N802
+        return self._emit(OP_GET_OBJECT_CLASS, "L", self._ref(obj))
+
+    def DeleteLocalRef(self, obj):  # noqa: N802
+        self._emit(OP_DELETE_LOCAL_REF, None, self._ref(obj))
+
+    def _call(self, opcode, type, target, methodID, *args):  # noqa: A002
+        return self._emit(opcode, None if type == "V" else type,
+                          self._ref(target), self._id(methodID, "m"),
+                          *map(self._arg, args), typed=type)
+
+    def _get_field(self, opcode, type, target, fieldID):  # noqa: A002
+        return self._emit(opcode, type, self._ref(target),
+                          self._id(fieldID, "f"), typed=type)
+
+    def _set_field(self, opcode, type, target, fieldID, value):  # noqa: A002
+        value = self._operand(value if isinstance(value, Slot) else
+                              self.const(value, type))
+        self._emit(opcode, None, self._ref(target), self._id(fieldID, "f"),
+                   value, typed=type)
+
+    # Internals
+
+    def _slot(self, type):  # noqa: A002
+        if type not in _JVALUE_MEMBERS and type not in ("m", "f", "s"):
+            raise ValueError(f"invalid slot type: {type!r}")
+        slot = Slot(self, len(self._types), type)
+        self._types.append(type)
+        self._values.append(None)
+        self._compiled = None
+        return slot
+
+    def _emit(self, opcode, type, *operands, typed=None):  # noqa: A002
+        dest = self._slot(type) if type is not None else None
+        self._code.append((opcode, ord(typed) if typed else 0,
+                           -1 if dest is None else dest.index) + operands)
+        self._compiled = None
+        return dest
+
+    def _operand(self, slot):
+        if not isinstance(slot, Slot) or slot.program is not self:
+            raise TypeError(f"expected a slot of this program, got {slot!r}")
+        return slot.index
+
+    def _name(self, name):
+        if isinstance(name, Slot): return self._typed(name, "s")
+        return self.const(name, "s").index
+
+    def _ref(self, obj):
+        if isinstance(obj, Slot): return self._typed(obj, "L")
+        return self.const(obj, "L").index
+
+    def _id(self, ID, type):  # noqa: A002
+        if isinstance(ID, Slot): return self._typed(ID, type)
+        return self.const(ID, type).index
+
+    def _arg(self, value):
+        if isinstance(value, Slot):
+            if value.type not in _JVALUE_MEMBERS:
+                raise TypeError(f"invalid argument slot: {value!r}")
+            return self._operand(value)
+        if isinstance(value, bool):
+            return self.const(value, "Z").index
+        if isinstance(value, int):
+            return self.const(value, "I").index
+        if isinstance(value, float):
+            return self.const(value, "D").index
+        if value is None:
+            return self.const(None, "L").index
+        raise TypeError(f"cannot infer the type of the argument {value!r}: "
+                        "use Program.const()")
+
+    def _typed(self, slot, type):  # noqa: A002
+        if slot.type != type:
+            raise TypeError(f"expected a slot of type {type!r}, got {slot!r}")
+        return self._operand(slot)
+
+
+def __add_typed_operations():
+    # Call<Type>Method, CallStatic<Type>Method, [Get|Set][Static]<Type>Field
+    def add(name, fun):
+        fun.__name__, fun.__qualname__ = name, f"Program.{name}"
+        setattr(Program, name, fun)
+    for code, Type in list(_TYPE_NAMES.items()) + [("V", "Void")]:
+        add(f"Call{Type}Method",
+            lambda self, obj, methodID, *args, __code=code:
+                self._call(OP_CALL_METHOD, __code, obj, methodID, *args))
+        add(f"CallStatic{Type}Method",
+            lambda self, clazz, methodID, *args, __code=code:
+                self._call(OP_CALL_STATIC_METHOD, __code, clazz, methodID, *args))
+        if code == "V": continue
+        add(f"Get{Type}Field",
+            lambda self, obj, fieldID, __code=code:
+                self._get_field(OP_GET_FIELD, __code, obj, fieldID))
+        add(f"Set{Type}Field",
+            lambda self, obj, fieldID, value, __code=code:
+                self._set_field(OP_SET_FIELD, __code, obj, fieldID, value))
+        add(f"GetStatic{Type}Field",
+            lambda self, clazz, fieldID, __code=code:
+                self._get_field(OP_GET_STATIC_FIELD, __code, clazz, fieldID))
+        add(f"SetStatic{Type}Field",
+            lambda self, clazz, fieldID, value, __code=code:
+                self._set_field(OP_SET_STATIC_FIELD, __code, clazz, fieldID, value))
+
+__add_typed_operations()
+del __add_typed_operations
+
+
+def RunProgram(self, code, types, values, outputs, done=None):  # noqa: N802
+    """Python version of the interpreter of the capi extension (used
+    when it is not available), see Program."""
+    from . import new_array, jvalue, NULL, Throwable
+    slots = list(values)
+    live  = set()  # slots of the local references created by the program
+    index = 0
+    try:
+        for index, (opcode, typed, dest, *ops) in enumerate(code):
+            typed = chr(typed) if typed else None
+            if opcode == OP_FIND_CLASS:
+                ret = self.FindClass(slots[ops[0]])
+            elif opcode in (OP_GET_METHOD_ID, OP_GET_STATIC_METHOD_ID,
+                            OP_GET_FIELD_ID, OP_GET_STATIC_FIELD_ID):
+                fun = getattr(self, ("GetMethodID", "GetStaticMethodID",
+                                     "GetFieldID", "GetStaticFieldID")[opcode - 1])
+                ret = fun(slots[ops[0]], slots[ops[1]], slots[ops[2]])
+            elif opcode in (OP_NEW_OBJECT, OP_CALL_METHOD, OP_CALL_STATIC_METHOD):
+                jargs = None
+                if len(ops) > 2:
+                    jargs = new_array(jvalue, len(ops) - 2)
+                    for k, op in enumerate(ops[2:]):
+                        value = slots[op]
+                        setattr(jargs[k], _JVALUE_MEMBERS[types[op]],
+                                NULL if value is None else value)
+                if opcode == OP_NEW_OBJECT:
+                    fun = self.NewObject
+                else:
+                    Type = _TYPE_NAMES.get(typed, "Void")
+                    fun = getattr(self, f"Call{Type}Method" if opcode == OP_CALL_METHOD
+                                        else f"CallStatic{Type}Method")
+                ret = fun(slots[ops[0]], slots[ops[1]], jargs)
+            elif opcode in (OP_GET_FIELD, OP_GET_STATIC_FIELD):
+                Static = "Static" if opcode == OP_GET_STATIC_FIELD else ""
+                fun = getattr(self, f"Get{Static}{_TYPE_NAMES[typed]}Field")
+                ret = fun(slots[ops[0]], slots[ops[1]])
+            elif opcode in (OP_SET_FIELD, OP_SET_STATIC_FIELD):
+                Static = "Static" if opcode == OP_SET_STATIC_FIELD else ""
+                fun = getattr(self, f"Set{Static}{_TYPE_NAMES[typed]}Field")
+                ret = fun(slots[ops[0]], slots[ops[1]], slots[ops[2]])
+            elif opcode == OP_NEW_STRING_UTF:
+                ret = self.NewStringUTF(slots[ops[0]])
+            elif opcode == OP_GET_OBJECT_CLASS:
+                ret = self.GetObjectClass(slots[ops[0]])
+            elif opcode == OP_DELETE_LOCAL_REF:
+                self.DeleteLocalRef(slots[ops[0]])
+                live.discard(ops[0])
+                continue
+            else:
+                raise ValueError(f"invalid opcode: {opcode}")
+            if dest >= 0:
+                slots[dest] = ret
+                if ret and types[dest] == "L": live.add(dest)
+            elif ret and opcode in _REF_RESULTS and typed in (None, "L"):
+                self.DeleteLocalRef(ret)
+        else:
+            index = len(code)
+    except Throwable:
+        self.DeleteLocalRefs([slots[slot] for slot in live])
+        raise
+    finally:
+        if done is not None: done[0] = index
+    return tuple(slots[slot] for slot in outputs)
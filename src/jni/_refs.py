@@ -0,0 +1,80 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+from collections import deque
+
+__all__ = ('GlobalRef', 'WeakGlobalRef', 'release_refs')
+
+
+class GlobalRef:
+    """Owned global reference of a Java object.
+
+    The reference is deleted when the handle is garbage collected,
+    in whatever thread (attached to the JavaVM or not) that happens:
+    the reference is queued and the queued references are deleted
+    in batches (one native call per batch) by the next thread creating
+    a handle or calling jni.release_refs(env), e.g.:
+
+        ref = jni.GlobalRef(env, obj)
+        ... ref.ref ...
+        del ref
+    """
+
+    __slots__ = ('ref',)
+
+    _new    = "NewGlobalRef"
+    _delete = "DeleteGlobalRefs"
+    _queue  = deque()  # references of collected handles (to be deleted)
+
+    def __init__(self, env, obj):
+        release_refs(env)
+        self.ref = getattr(env, self._new)(obj)
+
+    def __del__(self):
+        # deque.append() is atomic, so it is safe in any thread
+        # (and in the garbage collector).
+        ref, self.ref = getattr(self, "ref", None), None
+        if ref: self._queue.append(ref)
+
+    def __bool__(self):
+        return bool(self.ref)
+
+    def delete(self, env):
+        """Delete the reference immediately."""
+        ref, self.ref = self.ref, None
+        if ref: getattr(env, self._delete)((ref,))
+
+
+class WeakGlobalRef(GlobalRef):
+    """Owned weak global reference of a Java object (see GlobalRef)."""
+
+    __slots__ = ()
+
+    _new    = "NewWeakGlobalRef"
+    _delete = "DeleteWeakGlobalRefs"
+    _queue  = deque()
+
+    def get(self, env):
+        """Return a new local reference to the object
+        or NULL (None) if it has been garbage collected."""
+        return env.NewLocalRef(self.ref) if self.ref else None
+
+
+def release_refs(env, batch=1024):
+    """Delete the queued references of collected GlobalRef and
+    WeakGlobalRef handles in env's thread. Returns their number."""
+    count = 0
+    for cls in (GlobalRef, WeakGlobalRef):
+        queue = cls._queue
+        while queue:
+            refs = []
+            try:
+                while len(refs) < batch:
+                    refs.append(queue.popleft())
+            except IndexError:
+                pass
+            getattr(env, cls._delete)(refs)
+            count += len(refs)
+    return count
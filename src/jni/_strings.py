@@ -0,0 +1,46 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import sys
+
+__all__ = ('str_to_jstring', 'jstring_to_str')
+
+_UTF16 = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"  # of jchar strings
+
+
+def str_to_jstring(self, s):
+    """Return a new Java string of s.
+
+    s is encoded to UTF-16 (non-BMP characters as surrogate pairs) once
+    and passed to NewString without any further copy.
+    """
+    from . import buffer_pointer
+    from ._arrays import _array_ptype
+    data = s.encode(_UTF16, "surrogatepass")
+    return self.NewString(buffer_pointer(memoryview(data), _array_ptype("C")),
+                          len(data) // 2)
+
+
+def jstring_to_str(self, string, critical=True):
+    """Return the content of the Java string as str.
+
+    The UTF-16 chars are decoded in place (GetStringCritical) or,
+    if critical is false, after a single copy (GetStringRegion).
+    Surrogate pairs are decoded to non-BMP characters.
+    """
+    from . import buffer_at, buffer_pointer
+    from ._arrays import _array_ptype
+    size = self.GetStringLength(string)
+    if not size: return ""
+    if critical:
+        chars = self.GetStringCritical(string)
+        try:
+            return str(buffer_at(chars, size * 2), _UTF16, "surrogatepass")
+        finally:
+            self.ReleaseStringCritical(string, chars)
+    buf = bytearray(size * 2)
+    self.GetStringRegion(string, 0, size,
+                         buffer_pointer(memoryview(buf), _array_ptype("C")))
+    return buf.decode(_UTF16, "surrogatepass")
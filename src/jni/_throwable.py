@@ -0,0 +1,75 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import threading
+from collections import deque
+
+__all__ = ('ThrowableType',)
+
+
+class _LastSlot:
+    """Holder of the last Java exception of a thread."""
+
+    __slots__ = ('thr', 'orphans')
+
+    def __init__(self, orphans):
+        self.thr     = None
+        self.orphans = orphans
+
+    def __del__(self):
+        # The thread has exited with a pending last exception: its global
+        # reference is released by the next thread handling an exception.
+        thr = self.thr
+        if thr is not None:
+            self.thr = None
+            cause = thr.getCause()
+            if cause: self.orphans.append(cause)
+
+
+class ThrowableType(type):
+    """Metaclass of the backends' Throwable.
+
+    Throwable.last is the last Java exception raised in the current
+    thread. Its cause is a global reference owned by the backend, deleted
+    when the thread handles its next Java exception or clears it
+    (JNIEnv.ExceptionClear()). The references of exited threads are
+    deleted by the next thread doing so.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._local   = threading.local()
+        cls._orphans = deque()
+
+    def __slot(cls):
+        try:
+            return cls._local.slot
+        except AttributeError:
+            slot = cls._local.slot = _LastSlot(cls._orphans)
+            return slot
+
+    @property
+    def last(cls):
+        return cls.__slot().thr
+
+    @last.setter
+    def last(cls, thr):
+        cls.__slot().thr = thr
+
+    def _release(cls):
+        """Reset the last exception of the current thread and return
+        the global references to be deleted (its cause and the orphaned
+        causes of exited threads)."""
+        slot = cls.__slot()
+        thr, slot.thr = slot.thr, None
+        cause = thr.getCause() if thr is not None else None
+        refs = [cause] if cause else []
+        orphans = cls._orphans
+        while orphans:
+            try:
+                refs.append(orphans.popleft())
+            except IndexError:  # pragma: no cover
+                break
+        return refs
@@ -0,0 +1,252 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import sys
+import os
+import threading
+from collections import namedtuple, Counter
+from functools import wraps
+
+__all__ = ('RefTracker', 'RefSnapshot', 'RefRecord')
+
+_pkg_dir = os.path.dirname(os.path.abspath(__file__))
+
+RefRecord = namedtuple("RefRecord", "kind ref site thread")
+RefRecord.__doc__ = """Live reference: kind ('local', 'global' or 'weak'),
+the reference, the Python call site (filename, lineno, function)
+creating it and the ident of the creating thread."""
+
+# JNIEnv methods returning a new reference
+
+_NEW_REF_METHODS = {
+    "NewGlobalRef":     "global",
+    "NewWeakGlobalRef": "weak",
+}
+_NEW_REF_METHODS.update((name, "local") for name in (
+    "DefineClass", "FindClass", "GetSuperclass", "ExceptionOccurred",
+    "NewLocalRef", "AllocObject", "NewObject", "GetObjectClass",
+    "CallObjectMethod", "CallNonvirtualObjectMethod", "CallStaticObjectMethod",
+    "GetObjectField", "GetStaticObjectField", "NewString", "NewStringUTF",
+    "NewObjectArray", "GetObjectArrayElement", "NewStringArray",
+    "NewBooleanArray", "NewByteArray", "NewCharArray", "NewShortArray",
+    "NewIntArray", "NewLongArray", "NewFloatArray", "NewDoubleArray",
+    "NewDirectByteBuffer", "ToReflectedMethod", "ToReflectedField"))
+
+# JNIEnv methods deleting references
+
+_DEL_REF_METHODS = {
+    "DeleteGlobalRef":      ("global", False),
+    "DeleteLocalRef":       ("local",  False),
+    "DeleteWeakGlobalRef":  ("weak",   False),
+    "DeleteGlobalRefs":     ("global", True),
+    "DeleteLocalRefs":      ("local",  True),
+    "DeleteWeakGlobalRefs": ("weak",   True),
+}
+
+
+def _key(kind, ref, thread):
+    # ctypes and capi return addresses as int (a reference passed back
+    # may also be a ctypes jobject, hence .value), cffi pointers are
+    # hashable and compare by address.
+    address = getattr(ref, "value", ref)
+    # Local references are only valid in their thread.
+    return (kind, thread, address) if kind == "local" else (kind, address)
+
+
+def _call_site():
+    # The innermost frame outside of the jni package.
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename.startswith(_pkg_dir):
+        frame = frame.f_back
+    if frame is None:  # pragma: no cover
+        return ("<unknown>", 0, "<unknown>")
+    code = frame.f_code
+    return (code.co_filename, frame.f_lineno, code.co_name)
+
+
+class RefSnapshot:
+    """Live JNI references at a given time (see RefTracker.snapshot())."""
+
+    def __init__(self, records):
+        self.records = records  # {key: RefRecord}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records.values())
+
+    def counts(self):
+        """Return the number of live references by kind."""
+        return dict(Counter(record.kind for record in self))
+
+    def by_site(self, kind=None):
+        """Return the number of live references (of kind)
+        by call site, most frequent first."""
+        return Counter(record.site for record in self
+                       if kind is None or record.kind == kind).most_common()
+
+    def diff(self, older, kind=None):
+        """Return the references (of kind) created since the older
+        snapshot and still alive, grouped as (site, count) pairs,
+        most frequent first."""
+        return Counter(record.site for key, record in self.records.items()
+                       if key not in older.records
+                       and (kind is None or record.kind == kind)).most_common()
+
+
+class RefTracker:
+    """Opt-in accounting of live JNI references by Python call site.
+
+    While started, the JNIEnv methods creating references (NewGlobalRef,
+    NewWeakGlobalRef, NewLocalRef and all the object returning methods)
+    record each returned reference with the Python call site creating it.
+    The records are dropped by the matching Delete*Ref(s)() calls (and by
+    PopLocalFrame() for the local references of the frame). When stopped,
+    the original methods are restored, so there is no overhead, e.g.:
+
+        with jni.RefTracker() as tracker:
+            before = tracker.snapshot()
+            ...
+            for site, count in tracker.snapshot().diff(before, "global"):
+                print(site, count)
+
+    Only one tracker can be started at a time. It tracks the references
+    of all envs (of the backend's JNIEnv class) and all threads.
+    """
+
+    _active = None
+    _start_lock = threading.Lock()
+
+    def __init__(self):
+        self._records = {}
+        self._lock    = threading.Lock()
+        self._local   = threading.local()  # stack of local frames
+
+    @property
+    def started(self):
+        return RefTracker._active is self
+
+    def start(self):
+        from . import JNIEnv
+        from ._hooks import install
+        wrappers = {name: (lambda method, kind=kind: self.__new_ref(method, kind))
+                    for name, kind in _NEW_REF_METHODS.items()}
+        wrappers.update((name, (lambda method, kind=kind, many=many:
+                                self.__del_ref(method, kind, many)))
+                        for name, (kind, many) in _DEL_REF_METHODS.items())
+        wrappers["PushLocalFrame"] = self.__push_frame
+        wrappers["PopLocalFrame"]  = self.__pop_frame
+        wrappers["SetObjectArrayElements"] = self.__set_elements
+        with RefTracker._start_lock:
+            if RefTracker._active is not None:
+                raise RuntimeError("A reference tracker is already started.")
+            install(JNIEnv, RefTracker, wrappers)
+            RefTracker._active = self
+        return self
+
+    def stop(self):
+        from . import JNIEnv
+        from ._hooks import uninstall
+        with RefTracker._start_lock:
+            if not self.started: return
+            uninstall(JNIEnv, RefTracker)
+            RefTracker._active = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.stop()
+        return False
+
+    def snapshot(self):
+        """Return a RefSnapshot of the currently live references."""
+        with self._lock:
+            return RefSnapshot(dict(self._records))
+
+    def clear(self):
+        """Forget all the recorded references."""
+        with self._lock:
+            self._records.clear()
+
+    def __frames(self):
+        try:
+            return self._local.frames
+        except AttributeError:
+            frames = self._local.frames = []
+            return frames
+
+    def __record(self, kind, ref):
+        thread = threading.get_ident()
+        key = _key(kind, ref, thread)
+        with self._lock:
+            self._records[key] = RefRecord(kind, ref, _call_site(), thread)
+        if kind == "local":
+            frames = self.__frames()
+            if frames: frames[-1].append(key)
+
+    def __forget(self, kind, refs):
+        thread = threading.get_ident()
+        with self._lock:
+            for ref in refs:
+                if ref: self._records.pop(_key(kind, ref, thread), None)
+
+    def __new_ref(self, method, kind):
+        record = self.__record
+        @wraps(method)
+        def new_ref(env, *args, **kwargs):
+            ret = method(env, *args, **kwargs)
+            if ret: record(kind, ret)
+            return ret
+        return new_ref
+
+    def __del_ref(self, method, kind, many):
+        forget = self.__forget
+        @wraps(method)
+        def del_ref(env, refs, *args, **kwargs):
+            if many: refs = list(refs)
+            method(env, refs, *args, **kwargs)
+            forget(kind, refs if many else (refs,))
+        return del_ref
+
+    def __push_frame(self, method):
+        frames = self.__frames
+        @wraps(method)
+        def push_frame(env, capacity):
+            ret = method(env, capacity)
+            frames().append([])
+            return ret
+        return push_frame
+
+    def __pop_frame(self, method):
+        frames = self.__frames
+        record = self.__record
+        lock, records = self._lock, self._records
+        @wraps(method)
+        def pop_frame(env, result):
+            ret = method(env, result)
+            stack = frames()
+            if stack:
+                keys = stack.pop()
+                with lock:
+                    for key in keys:
+                        records.pop(key, None)
+            if ret: record("local", ret)
+            return ret
+        return pop_frame
+
+    def __set_elements(self, method):
+        forget = self.__forget
+        @wraps(method)
+        def set_elements(env, array, start, items, convert=None):
+            # The converted items are deleted once stored.
+            if convert is not None:
+                def convert(item, convert=convert):
+                    ret = convert(item)
+                    forget("local", (ret,))
+                    return ret
+            return method(env, array, start, items, convert)
+        return set_elements
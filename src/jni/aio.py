@@ -0,0 +1,65 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+"""asyncio integration: awaitable JNI calls on pre-attached threads."""
+
+import asyncio
+
+__all__ = ('EnvPool',)
+
+
+class EnvPool:
+    """Fixed pool of worker threads attached once to a JavaVM (as daemon
+    threads, AttachCurrentThreadAsDaemon) running JNI work for asyncio
+    coroutines without blocking the event loop, e.g.:
+
+        async with jni.aio.EnvPool(jvm, workers=8) as env_pool:
+            length = await env_pool.call(lambda env, s:
+                                         env.GetStringLength(s), jstr)
+
+    call(fn, *args, **kwargs) runs fn(env, *args, **kwargs) on a worker
+    (env is the JNIEnv of the worker) and returns its result (or raises
+    its exception) in the awaiting coroutine. Local references created
+    by fn are only valid on its worker: fn should return Python values
+    or global references. The workers (a jni.JVMExecutor) are detached
+    when the pool is closed.
+    """
+
+    def __init__(self, jvm, workers=4, version=None, name="jni-aio"):
+        from . import JVMExecutor
+        self.jvm = jvm
+        self.executor = JVMExecutor(jvm, workers, daemon=True, version=version,
+                                    thread_name_prefix=name)
+
+    @property
+    def workers(self):
+        return self.executor.max_workers
+
+    async def call(self, fn, *args, **kwargs):
+        """Run fn(env, *args, **kwargs) on a worker and await its result."""
+        return await asyncio.wrap_future(self.executor.submit(fn, *args, **kwargs))
+
+    def close(self):
+        """Stop the workers (once the pending calls are done) and detach
+        them from the JavaVM."""
+        self.executor.shutdown()
+
+    async def aclose(self):
+        """Close the pool without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.aclose()
+        return False
@@ -3,117 +3,155 @@
 # Licensed under proprietary License
 # Please refer to the accompanying LICENSE file.
 
-import sys
-import platform
+# The capi backend shares the data layer (JNI types, helpers, load(),
+# method(), exceptions) with the ctypes backend. Only JNIEnv and JavaVM
+# are replaced by the C implementation, so a call crosses into native
+# code once instead of going through the ctypes foreign function layer.
+
 import ctypes as ct
 
-if platform.win32_ver()[0]:
-    try:
-        from _ctypes import FreeLibrary as dlclose  # noqa: N813
-    except ImportError:  # pragma: no cover
-        dlclose = lambda handle: 0
-else:
-    from _ctypes import dlclose as dlclose  # noqa: N813
-
-__none = object()
-obj         = lambda ctype, init=__none: ctype() if init is __none else ctype(init)
-
-def defined(varname, __getframe=sys._getframe):
-    frame = __getframe(1)
-    return varname in frame.f_locals or varname in frame.f_globals
-
-def from_oid(oid, __cast=ct.cast, __py_object=ct.py_object):
-    return __cast(oid, __py_object).value if oid else None
-
-from .jni import * ; del jni  # noqa
-
-#
-# Decorator for defining Java native method in Python
-#
-
-def method(signature, **kwargs):
-    ret_type, arg_types = __parse_signature(signature)
-    fun_name = kwargs.get("name", "").encode("utf-8")
-    fun_sign = signature.encode("utf-8")
-    # !!!FunProto = CFUNC(ret_type, POINTER(JNIEnv), jobject, *arg_types)
-
-    def wrapper(fun):
-        native_meth = JNINativeMethod()
-        native_meth.name      = fun_name or fun.__name__.encode("utf-8")
-        native_meth.signature = fun_sign
-        native_meth.fnPtr     = None  # !!!cast(FunProto(fun), jobject) # ct.c_void_p
-        return native_meth
-
-    return wrapper
-
-def __parse_signature(signature):
-
-    if signature[0] != "(":
-        raise JNIException(JNI_EINVAL, info="jni.method")
-
-    args_sig, sep, ret_sig = signature[1:].partition(")")
-    if not sep or not ret_sig:
-        raise JNIException(JNI_EINVAL, info="jni.method")
-
-    sig = ret_sig + args_sig
-
-    arg_types = []
-    while sig:
-
-        dim = 0
-        while sig[dim] == "[": dim += 1
-        sig = sig[dim:]
-
-        ch = sig[0]
-        if ch in "ZBCSIJFD" or (ch == "V" and dim == 0 and not arg_types):
-            sig = sig[1:]
-            if dim == 0:
-                arg_types.append(__native_types[ch])
-            elif dim == 1:
-                arg_types.append(__native_array_types[ch])
-            else:
-                arg_types.append(jobjectArray)
-        elif ch == "L":
-            cname, sig = sig[1:].split(";", 1)
-            if dim == 0:
-                arg_types.append(__object_types.get(cname, jobject))
-            else:
-                arg_types.append(jobjectArray)
-        else:
-            raise JNIException(JNI_EINVAL, info="jni.method")
-
-    return arg_types[0], tuple(arg_types[1:])
-
-
-__native_types = {
-    "V": None,
-    "Z": jboolean,
-    "B": jbyte,
-    "C": jchar,
-    "S": jshort,
-    "I": jint,
-    "J": jlong,
-    "F": jfloat,
-    "D": jdouble
-}
-
-__native_array_types = {
-    "Z": jbooleanArray,
-    "B": jbyteArray,
-    "C": jcharArray,
-    "S": jshortArray,
-    "I": jintArray,
-    "J": jlongArray,
-    "F": jfloatArray,
-    "D": jdoubleArray
-}
-
-__object_types = {
-    "java/lang/String": jstring,
-    "java/lang/Class":  jclass
-}
-
-del sys
-del platform
+from ..ctypes import *  # noqa: F401,F403
+from .jni import JNIEnv as _JNIEnv, JavaVM as _JavaVM ; del jni  # noqa
+
+# The pointer types of JNIEnv and JavaVM remain the ctypes ones
+# (the C types are constructed from such pointers: JEnv(penv), JVM(pjvm)).
+tmap = {"JNIEnv": JNIEnv, "JavaVM": JavaVM}
+
+class JNIEnv(_JNIEnv):
+    # No __slots__: the methods of an env can be wrapped per instance
+    # (local frames, critical sections).
+
+    def _handle_JNIException(self, err, fun_name=None):
+        raise JNIException(err, info=fun_name)
+
+    def _handle_JavaException(self):
+        env = super()
+        jthr = env.ExceptionOccurred()
+        env.ExceptionClear()
+        jexc = env.NewGlobalRef(jthr)
+        env.DeleteLocalRef(jthr)
+        for cause in Throwable._release():
+            env.DeleteGlobalRef(cause)
+        env.ExceptionClear()
+        Throwable.last = thr = Throwable(jexc)
+        raise thr
+
+    # Java exceptions handling
+
+    def ExceptionClear(self):
+        env = super()
+        for cause in Throwable._release():
+            env.DeleteGlobalRef(cause)
+        env.ExceptionClear()
+
+    # Signature-compiled method invokers
+
+    compile_method = tmap["JNIEnv"].compile_method
+
+    # Views over Java primitive arrays
+
+    array_view = tmap["JNIEnv"].array_view
+
+    # Bulk conversions between Python buffers and Java primitive arrays
+
+    to_java_array   = tmap["JNIEnv"].to_java_array
+    from_java_array = tmap["JNIEnv"].from_java_array
+
+    # Fast conversions between Python str and Java strings
+
+    str_to_jstring = tmap["JNIEnv"].str_to_jstring
+    jstring_to_str = tmap["JNIEnv"].jstring_to_str
+
+    # Local reference frames and arenas
+
+    local_frame = tmap["JNIEnv"].local_frame
+    local_arena = tmap["JNIEnv"].local_arena
+
+    # Object arrays
+
+    iter_object_array = tmap["JNIEnv"].iter_object_array
+    new_string_array  = tmap["JNIEnv"].new_string_array
+    new_object_array  = tmap["JNIEnv"].new_object_array
+
+    # Vectorized calls (CallMethodsA is native)
+
+    call_many = tmap["JNIEnv"].call_many
+    new_many  = tmap["JNIEnv"].new_many
+
+    # Direct buffers
+
+    wrap_buffer = tmap["JNIEnv"].wrap_buffer
+    buffer_view = tmap["JNIEnv"].buffer_view
+
+    # Critical sections
+
+    critical = tmap["JNIEnv"].critical
+
+    # Typed pointer results (the C level returns plain addresses)
+
+    def GetStringChars(self, str, isCopy=None, __cast=cast,  # noqa: A002
+                       __ptype=POINTER(jchar)):
+        return __cast(super().GetStringChars(str, isCopy), __ptype)
+
+    def GetStringUTFChars(self, str, isCopy=None, __cast=cast,  # noqa: A002
+                          __ptype=POINTER(ct.c_char)):
+        return __cast(super().GetStringUTFChars(str, isCopy), __ptype)
+
+    def GetStringCritical(self, string, isCopy=None, __cast=cast,
+                          __ptype=POINTER(jchar)):
+        return __cast(super().GetStringCritical(string, isCopy), __ptype)
+
+    def GetBooleanArrayElements(self, array, isCopy=None, __cast=cast,
+                                __ptype=POINTER(jboolean)):
+        return __cast(super().GetBooleanArrayElements(array, isCopy), __ptype)
+
+    def GetByteArrayElements(self, array, isCopy=None, __cast=cast,
+                             __ptype=POINTER(jbyte)):
+        return __cast(super().GetByteArrayElements(array, isCopy), __ptype)
+
+    def GetCharArrayElements(self, array, isCopy=None, __cast=cast,
+                             __ptype=POINTER(jchar)):
+        return __cast(super().GetCharArrayElements(array, isCopy), __ptype)
+
+    def GetShortArrayElements(self, array, isCopy=None, __cast=cast,
+                              __ptype=POINTER(jshort)):
+        return __cast(super().GetShortArrayElements(array, isCopy), __ptype)
+
+    def GetIntArrayElements(self, array, isCopy=None, __cast=cast,
+                            __ptype=POINTER(jint)):
+        return __cast(super().GetIntArrayElements(array, isCopy), __ptype)
+
+    def GetLongArrayElements(self, array, isCopy=None, __cast=cast,
+                             __ptype=POINTER(jlong)):
+        return __cast(super().GetLongArrayElements(array, isCopy), __ptype)
+
+    def GetFloatArrayElements(self, array, isCopy=None, __cast=cast,
+                              __ptype=POINTER(jfloat)):
+        return __cast(super().GetFloatArrayElements(array, isCopy), __ptype)
+
+    def GetDoubleArrayElements(self, array, isCopy=None, __cast=cast,
+                               __ptype=POINTER(jdouble)):
+        return __cast(super().GetDoubleArrayElements(array, isCopy), __ptype)
+
+    def GetDirectBufferAddress(self, buf, __cast=cast,
+                               __ptype=POINTER(ct.c_char)):
+        return __cast(super().GetDirectBufferAddress(buf), __ptype)
+
+
+JEnv = lambda penv: JNIEnv(penv)
+
+class JavaVM(_JavaVM):
+    __slots__ = ()
+
+    def _handle_JNIException(self, err, fun_name=None):
+        raise JNIException(err, info=fun_name)
+
+
+JVM = lambda pjvm: JavaVM(pjvm)
+
+tmap = {JNIEnv: tmap["JNIEnv"], JavaVM: tmap["JavaVM"]}
+POINTER = lambda ctype, __tmap=tmap, __POINTER=POINTER: __POINTER(__tmap.get(ctype, ctype))
+
+del _JNIEnv, _JavaVM
 del ct
-del dlclose
+del tmap
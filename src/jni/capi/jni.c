@@ -4,1264 +4,2239 @@
 // Please refer to the accompanying LICENSE file.
 
 #include <Python.h>
-#include <structmember.h>
 
 #include "java/jdk/include/jni.h"
 
-#define member_size(type, member) sizeof(((type *)0)->member)
-
 static const char __name__[] = "jni";
-static const char __doc__[]  = "";
 
-typedef struct {
-    PyObject_HEAD
-    char this[0];
-} _CData_Object;
+//------------ Converters ------------//
 
-PyTypeObject _CData_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "CData",
-    .tp_basicsize = sizeof(_CData_Object),
-    .tp_flags     = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
-};
+// Argument converters for PyArg_Parse*() "O&" format units. They accept
+// the same objects as the ctypes backend: None, ints, ctypes instances
+// (scalars, pointers, arrays, structures, byref()) and cffi cdata.
 
-//------------ JNI Types -------------//
-
-//----- jint -----//
+static PyObject* ctypes_c_void_p = NULL;
+static PyObject* ctypes_cast     = NULL;
+static PyObject* cffi_CDataBase  = NULL;
 
 typedef struct {
     PyObject_HEAD
-    jint value;
-} jint_Object;
+    PyObject* c_type;
+    char*     c_data;
+} cffi_CData_Object;  // layout of the _cffi_backend cdata objects
 
-static int jint_init(jint_Object* self, PyObject* args)
+static int is_cffi_cdata(PyObject* obj)
 {
-    jint value = 0;
-    if ( ! PyArg_ParseTuple(args, "|l", &value) )
-        return -1;
-    self->value = value;
-    return 0;
+    if ( cffi_CDataBase == NULL )
+    {
+        PyObject* cffi_backend = PyImport_ImportModule("_cffi_backend");
+        if ( cffi_backend != NULL )
+        {
+            cffi_CDataBase = PyObject_GetAttrString(cffi_backend, "_CDataBase");
+            Py_DECREF(cffi_backend);
+        }
+        if ( cffi_CDataBase == NULL )
+        {
+            PyErr_Clear();
+            cffi_CDataBase = Py_None;
+            Py_INCREF(cffi_CDataBase);
+        }
+    }
+    return ( cffi_CDataBase != Py_None &&
+             PyObject_TypeCheck(obj, (PyTypeObject*)cffi_CDataBase) );
 }
 
-static int jint_bool(jint_Object* self)
+static int ctypes_address(PyObject* obj, void** addr)
 {
-    return !!self->value;
+    PyObject* ptr;
+    if ( ctypes_cast == NULL )
+    {
+        PyObject* ctypes = PyImport_ImportModule("ctypes");
+        if ( ctypes == NULL )
+            return 0;
+        ctypes_c_void_p = PyObject_GetAttrString(ctypes, "c_void_p");
+        ctypes_cast     = PyObject_GetAttrString(ctypes, "cast");
+        Py_DECREF(ctypes);
+        if ( ctypes_c_void_p == NULL || ctypes_cast == NULL )
+        {
+            Py_CLEAR(ctypes_c_void_p);
+            Py_CLEAR(ctypes_cast);
+            return 0;
+        }
+    }
+    ptr = PyObject_CallFunctionObjArgs(ctypes_cast, obj, ctypes_c_void_p, NULL);
+    if ( ptr == NULL )
+    {
+        PyErr_Format(PyExc_TypeError, "expected a pointer compatible object, got '%.200s'",
+                     Py_TYPE(obj)->tp_name);
+        return 0;
+    }
+    PyObject* value = PyObject_GetAttrString(ptr, "value");
+    Py_DECREF(ptr);
+    if ( value == NULL )
+        return 0;
+    *addr = (value == Py_None) ? NULL : PyLong_AsVoidPtr(value);
+    Py_DECREF(value);
+    return ! PyErr_Occurred();
+}
+
+static int buffer_address(PyObject* obj, void** addr, int deref_level)
+{
+    // deref_level: 1 - pointer (and pointer-like) scalars are passed by value,
+    //              2 - only pointers to pointers are passed by value,
+    //              otherwise the address of the buffer is passed.
+    Py_buffer view;
+    const char* fmt;
+    int deref;
+    if ( PyObject_GetBuffer(obj, &view, PyBUF_FULL_RO) < 0 )
+    {
+        PyErr_Clear();
+        return ctypes_address(obj, addr);
+    }
+    fmt = view.format ? view.format : "B";
+    while ( *fmt && strchr("@=<>!", *fmt) ) ++fmt;
+    if ( view.ndim != 0 )
+        deref = 0;
+    else if ( deref_level == 1 )
+        deref = (fmt[0] == '&' || strcmp(fmt, "P") == 0 ||
+                 strcmp(fmt, "z") == 0 || strcmp(fmt, "Z") == 0);
+    else if ( deref_level == 2 )
+        deref = (fmt[0] == '&' && fmt[1] == '&');
+    else
+        deref = 0;
+    *addr = deref ? *(void**)view.buf : view.buf;
+    PyBuffer_Release(&view);
+    return 1;
 }
 
-static PyNumberMethods jint_as_number = {
-    .nb_bool = (inquiry)jint_bool,
-};
-
-static PyMemberDef jint_members[] =
+static int as_pointer(PyObject* obj, void* result)
 {
-    {"value", T_LONG, offsetof(jint_Object, value)},
-    {NULL}
-};
-
-PyTypeObject jint_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jint",
-    .tp_basicsize = sizeof(jint_Object),
-    .tp_itemsize  = member_size(jint_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jint_as_number,
-    .tp_members   = jint_members,
-    .tp_init      = (initproc)jint_init,
-    .tp_new       = PyType_GenericNew,
-};
+    void** addr = (void**)result;
+    if ( obj == Py_None )
+        *addr = NULL;
+    else if ( PyLong_Check(obj) )
+    {
+        *addr = PyLong_AsVoidPtr(obj);
+        if ( *addr == NULL && PyErr_Occurred() )
+            return 0;
+    }
+    else if ( is_cffi_cdata(obj) )
+        // pointers keep their value, arrays/structs their address in c_data
+        *addr = (void*)((cffi_CData_Object*)obj)->c_data;
+    else
+        return buffer_address(obj, addr, 1);
+    return 1;
+}
 
-//----- jlong ----//
+static int as_address(PyObject* obj, void* result)
+{
+    // For the 'out' pointer-to-pointer arguments (penv, vm).
+    void** addr = (void**)result;
+    if ( obj == Py_None )
+        *addr = NULL;
+    else if ( PyLong_Check(obj) )
+    {
+        *addr = PyLong_AsVoidPtr(obj);
+        if ( *addr == NULL && PyErr_Occurred() )
+            return 0;
+    }
+    else
+        return buffer_address(obj, addr, 2);
+    return 1;
+}
 
-typedef struct {
-    PyObject_HEAD
-    jlong value;
-} jlong_Object;
+#define as_jobject as_pointer
 
-static int jlong_init(jlong_Object* self, PyObject* args)
+static int as_jboolean(PyObject* obj, void* result)
 {
-    jlong value = 0;
-    if ( ! PyArg_ParseTuple(args, "|L", &value) )
-        return -1;
-    self->value = value;
-    return 0;
+    unsigned long value = PyLong_AsUnsignedLongMask(obj);
+    if ( value == (unsigned long)-1 && PyErr_Occurred() )
+        return 0;
+    *(jboolean*)result = (jboolean)value;
+    return 1;
 }
 
-static int jlong_bool(jlong_Object* self)
+static int as_jbyte(PyObject* obj, void* result)
 {
-    return !!self->value;
+    unsigned long value = PyLong_AsUnsignedLongMask(obj);
+    if ( value == (unsigned long)-1 && PyErr_Occurred() )
+        return 0;
+    *(jbyte*)result = (jbyte)value;
+    return 1;
 }
 
-static PyNumberMethods jlong_as_number = {
-    .nb_bool = (inquiry)jlong_bool,
-};
-
-static PyMemberDef jlong_members[] =
+static int as_jchar(PyObject* obj, void* result)
 {
-    {"value", T_LONGLONG, offsetof(jlong_Object, value)},
-    {NULL}
-};
-
-PyTypeObject jlong_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jlong",
-    .tp_basicsize = sizeof(jlong_Object),
-    .tp_itemsize  = member_size(jlong_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jlong_as_number,
-    .tp_members   = jlong_members,
-    .tp_init      = (initproc)jlong_init,
-    .tp_new       = PyType_GenericNew,
-};
-
-//----- jbyte ----//
-
-typedef struct {
-    PyObject_HEAD
-    jbyte value;
-} jbyte_Object;
+    unsigned long value;
+    if ( PyUnicode_Check(obj) )
+    {
+        if ( PyUnicode_GetLength(obj) != 1 )
+        {
+            PyErr_SetString(PyExc_TypeError, "one character unicode string expected");
+            return 0;
+        }
+        value = (unsigned long)PyUnicode_ReadChar(obj, 0);
+    }
+    else
+    {
+        value = PyLong_AsUnsignedLongMask(obj);
+        if ( value == (unsigned long)-1 && PyErr_Occurred() )
+            return 0;
+    }
+    *(jchar*)result = (jchar)value;
+    return 1;
+}
 
-static int jbyte_init(jbyte_Object* self, PyObject* args)
+static int as_jshort(PyObject* obj, void* result)
 {
-    jbyte value = 0;
-    if ( ! PyArg_ParseTuple(args, "|b", &value) )
-        return -1;
-    self->value = value;
-    return 0;
+    unsigned long value = PyLong_AsUnsignedLongMask(obj);
+    if ( value == (unsigned long)-1 && PyErr_Occurred() )
+        return 0;
+    *(jshort*)result = (jshort)value;
+    return 1;
 }
 
-static int jbyte_bool(jbyte_Object* self)
+static int as_jint(PyObject* obj, void* result)
 {
-    return !!self->value;
+    unsigned long value = PyLong_AsUnsignedLongMask(obj);
+    if ( value == (unsigned long)-1 && PyErr_Occurred() )
+        return 0;
+    *(jint*)result = (jint)value;
+    return 1;
 }
 
-static PyNumberMethods jbyte_as_number = {
-    .nb_bool = (inquiry)jbyte_bool,
-};
-
-static PyMemberDef jbyte_members[] =
+static int as_jlong(PyObject* obj, void* result)
 {
-    {"value", T_BYTE, offsetof(jbyte_Object, value)},
-    {NULL}
-};
-
-PyTypeObject jbyte_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jbyte",
-    .tp_basicsize = sizeof(jbyte_Object),
-    .tp_itemsize  = member_size(jbyte_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jbyte_as_number,
-    .tp_members   = jbyte_members,
-    .tp_init      = (initproc)jbyte_init,
-    .tp_new       = PyType_GenericNew,
-};
-
-//--- jboolean ---//
-
-typedef struct {
-    PyObject_HEAD
-    jboolean value;
-} jboolean_Object;
+    unsigned long long value = PyLong_AsUnsignedLongLongMask(obj);
+    if ( value == (unsigned long long)-1 && PyErr_Occurred() )
+        return 0;
+    *(jlong*)result = (jlong)value;
+    return 1;
+}
 
-static int jboolean_init(jboolean_Object* self, PyObject* args)
+static int as_jfloat(PyObject* obj, void* result)
 {
-    unsigned char value = 0;
-    if ( ! PyArg_ParseTuple(args, "|b", &value) )
-        return -1;
-    self->value = value;
-    return 0;
+    double value = PyFloat_AsDouble(obj);
+    if ( value == -1.0 && PyErr_Occurred() )
+        return 0;
+    *(jfloat*)result = (jfloat)value;
+    return 1;
 }
 
-static int jboolean_bool(jboolean_Object* self)
+static int as_jdouble(PyObject* obj, void* result)
 {
-    return !!self->value;
+    double value = PyFloat_AsDouble(obj);
+    if ( value == -1.0 && PyErr_Occurred() )
+        return 0;
+    *(jdouble*)result = (jdouble)value;
+    return 1;
 }
 
-static PyNumberMethods jboolean_as_number = {
-    .nb_bool = (inquiry)jboolean_bool,
-};
+#define as_jsize as_jint
 
-static PyMemberDef jboolean_members[] =
+// Result converters. Objects, IDs and addresses are returned as ints
+// (or None for NULL), as ct.c_void_p results are in the ctypes backend.
+
+static PyObject* pointer_result(const void* ptr)
 {
-    {"value", T_BOOL, offsetof(jboolean_Object, value)},
-    {NULL}
-};
+    if ( ptr == NULL ) Py_RETURN_NONE;
+    return PyLong_FromVoidPtr((void*)ptr);
+}
 
-PyTypeObject jboolean_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jboolean",
-    .tp_basicsize = sizeof(jboolean_Object),
-    .tp_itemsize  = member_size(jboolean_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jboolean_as_number,
-    .tp_members   = jboolean_members,
-    .tp_init      = (initproc)jboolean_init,
-    .tp_new       = PyType_GenericNew,
-};
+#define jobject_result(value)  pointer_result((const void*)(value))
+#define jboolean_result(value) PyBool_FromLong((long)(value))
+#define jbyte_result(value)    PyLong_FromLong((long)(value))
+#define jchar_result(value)    PyUnicode_FromOrdinal((int)(value))
+#define jshort_result(value)   PyLong_FromLong((long)(value))
+#define jint_result(value)     PyLong_FromLong((long)(value))
+#define jlong_result(value)    PyLong_FromLongLong((long long)(value))
+#define jfloat_result(value)   PyFloat_FromDouble((double)(value))
+#define jdouble_result(value)  PyFloat_FromDouble((double)(value))
 
-//----- jchar ----//
+//-------------- JNIEnv --------------//
 
 typedef struct {
     PyObject_HEAD
-    jchar value;
-} jchar_Object;
+    JNIEnv* jenv;
+} JNIEnv_Object;
 
-static int jchar_init(jchar_Object* self, PyObject* args)
+static int JNIEnv_init(JNIEnv_Object* self, PyObject* args)
 {
-    int value = 0;
-    if ( ! PyArg_ParseTuple(args, "|C", &value) )
+    // JNIEnv(penv)
+    void* penv = NULL;
+    if ( ! PyArg_ParseTuple(args, "O&", as_pointer, &penv) )
         return -1;
-    self->value = value;
+    if ( penv == NULL )
+    {
+        PyErr_SetString(PyExc_ValueError, "NULL pointer access");
+        return -1;
+    }
+    self->jenv = (JNIEnv*)penv;
     return 0;
 }
 
-static int jchar_bool(jchar_Object* self)
-{
-    return !!self->value;
-}
-
-static PyNumberMethods jchar_as_number = {
-    .nb_bool = (inquiry)jchar_bool,
-};
+// Both handlers are looked up on the instance, so the Python level
+// JNIEnv subclass decides about the exception objects to be raised.
 
-static PyObject* jchar_value_get(jchar_Object* self)
+static PyObject* _handle_JNIException(PyObject* self, jint err, const char* fun_name)
 {
-    return PyUnicode_FromWideChar((const wchar_t*)&self->value, 1);
+    PyObject* result = PyObject_CallMethod(self, "_handle_JNIException", "is",
+                                           (int)err, fun_name);
+    Py_XDECREF(result);
+    if ( ! PyErr_Occurred() )
+        PyErr_Format(PyExc_SystemError, "%s: JNI error %d", fun_name, (int)err);
+    return NULL;
 }
 
-static int jchar_value_set(jchar_Object* self, PyObject* val)
+static PyObject* _handle_JavaException(PyObject* self)
 {
-    wchar_t value = 0;
-    if ( PyUnicode_AsWideChar(val, &value, 1) == -1 )
-        return -1;
-    if ( PyUnicode_GetLength(val) != 1 )
-    {
-        PyErr_SetString(PyExc_TypeError,
-                        "one unicode character expected, not str");
-        return -1;
-    }
-    self->value = value;
-    return 0;
+    PyObject* result = PyObject_CallMethod(self, "_handle_JavaException", NULL);
+    Py_XDECREF(result);
+    if ( ! PyErr_Occurred() )
+        PyErr_SetString(PyExc_SystemError, "unhandled Java exception");
+    return NULL;
 }
 
-static PyGetSetDef jchar_getsets[] =
-{
-    {"value", (getter)jchar_value_get, (setter)jchar_value_set},
-    {NULL}
-};
+#define JNIENV_METHOD(name) \
+    static PyObject* JNIEnv_##name(JNIEnv_Object* self, PyObject* args, PyObject* kwargs)
 
-PyTypeObject jchar_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jchar",
-    .tp_basicsize = sizeof(jchar_Object),
-    .tp_itemsize  = member_size(jchar_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jchar_as_number,
-    .tp_getset    = jchar_getsets,
-    .tp_init      = (initproc)jchar_init,
-    .tp_new       = PyType_GenericNew,
-};
+#define PARSE_ARGS(fmt, ...) \
+    if ( ! PyArg_ParseTupleAndKeywords(args, kwargs, fmt, kwlist, __VA_ARGS__) ) return NULL
 
-//---- jshort ----//
+#define CHECK_EXCEPTION() \
+    if ( (*jenv)->ExceptionCheck(jenv) ) return _handle_JavaException((PyObject*)self)
 
-typedef struct {
-    PyObject_HEAD
-    jshort value;
-} jshort_Object;
+#define CHECK_EXCEPTION_IF(cond) \
+    if ( (cond) && (*jenv)->ExceptionCheck(jenv) ) return _handle_JavaException((PyObject*)self)
 
-static int jshort_init(jshort_Object* self, PyObject* args)
-{
-    short value = 0;
-    if ( ! PyArg_ParseTuple(args, "|h", &value) )
-        return -1;
-    self->value = value;
-    return 0;
-}
+#define CHECK_JNI_ERROR(fun_name) \
+    if ( ret != 0 ) return _handle_JNIException((PyObject*)self, ret, fun_name)
+
+// Java version
 
-static int jshort_bool(jshort_Object* self)
+static PyObject* JNIEnv_GetVersion(JNIEnv_Object* self, PyObject* Py_UNUSED(ignored))
 {
-    return !!self->value;
+    JNIEnv* jenv = self->jenv;
+    jint ret = (*jenv)->GetVersion(jenv);
+    CHECK_EXCEPTION();
+    return jint_result(ret);
 }
 
-static PyNumberMethods jshort_as_number = {
-    .nb_bool = (inquiry)jshort_bool,
-};
+// Java class handling
 
-static PyMemberDef jshort_members[] =
+JNIENV_METHOD(DefineClass)
 {
-    {"value", T_SHORT, offsetof(jshort_Object, value)},
-    {NULL}
-};
-
-PyTypeObject jshort_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jshort",
-    .tp_basicsize = sizeof(jshort_Object),
-    .tp_itemsize  = member_size(jshort_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jshort_as_number,
-    .tp_members   = jshort_members,
-    .tp_init      = (initproc)jshort_init,
-    .tp_new       = PyType_GenericNew,
-};
-
-//---- jfloat ----//
-
-typedef struct {
-    PyObject_HEAD
-    jfloat value;
-} jfloat_Object;
+    static char* kwlist[] = {"name", "loader", "buf", "blen", NULL};
+    JNIEnv* jenv = self->jenv;
+    const char* name; jobject loader; const jbyte* buf; jsize blen;
+    PARSE_ARGS("O&O&O&O&", as_pointer, &name, as_jobject, &loader,
+                           as_pointer, &buf, as_jsize, &blen);
+    jclass ret = (*jenv)->DefineClass(jenv, name, loader, buf, blen);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
 
-static int jfloat_init(jfloat_Object* self, PyObject* args)
+JNIENV_METHOD(FindClass)
 {
-    float value = 0;
-    if ( ! PyArg_ParseTuple(args, "|f", &value) )
-        return -1;
-    self->value = value;
-    return 0;
+    static char* kwlist[] = {"name", NULL};
+    JNIEnv* jenv = self->jenv;
+    const char* name; jclass ret;
+    PARSE_ARGS("O&", as_pointer, &name);
+    Py_BEGIN_ALLOW_THREADS
+    ret = (*jenv)->FindClass(jenv, name);
+    Py_END_ALLOW_THREADS
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
 }
 
-static int jfloat_bool(jfloat_Object* self)
+JNIENV_METHOD(GetSuperclass)
 {
-    return !!self->value;
+    static char* kwlist[] = {"sub", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass sub;
+    PARSE_ARGS("O&", as_jobject, &sub);
+    jclass ret = (*jenv)->GetSuperclass(jenv, sub);
+    CHECK_EXCEPTION();
+    return jobject_result(ret);
 }
 
-static PyNumberMethods jfloat_as_number = {
-    .nb_bool = (inquiry)jfloat_bool,
-};
-
-static PyMemberDef jfloat_members[] =
+JNIENV_METHOD(IsAssignableFrom)
 {
-    {"value", T_FLOAT, offsetof(jfloat_Object, value)},
-    {NULL}
-};
-
-PyTypeObject jfloat_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jfloat",
-    .tp_basicsize = sizeof(jfloat_Object),
-    .tp_itemsize  = member_size(jfloat_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jfloat_as_number,
-    .tp_members   = jfloat_members,
-    .tp_init      = (initproc)jfloat_init,
-    .tp_new       = PyType_GenericNew,
-};
-
-//---- jdouble ---//
+    static char* kwlist[] = {"sub", "sup", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass sub, sup;
+    PARSE_ARGS("O&O&", as_jobject, &sub, as_jobject, &sup);
+    return jboolean_result((*jenv)->IsAssignableFrom(jenv, sub, sup));
+}
 
-typedef struct {
-    PyObject_HEAD
-    jdouble value;
-} jdouble_Object;
+// Java exceptions handling
 
-static int jdouble_init(jdouble_Object* self, PyObject* args)
+JNIENV_METHOD(Throw)
 {
-    double value = 0;
-    if ( ! PyArg_ParseTuple(args, "|d", &value) )
-        return -1;
-    self->value = value;
-    return 0;
+    static char* kwlist[] = {"obj", NULL};
+    JNIEnv* jenv = self->jenv;
+    jthrowable obj;
+    PARSE_ARGS("O&", as_jobject, &obj);
+    jint ret = (*jenv)->Throw(jenv, obj);
+    CHECK_JNI_ERROR("Throw");
+    Py_RETURN_NONE;
 }
 
-static int jdouble_bool(jdouble_Object* self)
+JNIENV_METHOD(ThrowNew)
 {
-    return !!self->value;
+    static char* kwlist[] = {"clazz", "msg", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz; const char* msg;
+    PARSE_ARGS("O&O&", as_jobject, &clazz, as_pointer, &msg);
+    jint ret = (*jenv)->ThrowNew(jenv, clazz, msg);
+    CHECK_JNI_ERROR("ThrowNew");
+    Py_RETURN_NONE;
 }
 
-static PyNumberMethods jdouble_as_number = {
-    .nb_bool = (inquiry)jdouble_bool,
-};
-
-static PyMemberDef jdouble_members[] =
+static PyObject* JNIEnv_ExceptionOccurred(JNIEnv_Object* self, PyObject* Py_UNUSED(ignored))
 {
-    {"value", T_DOUBLE, offsetof(jdouble_Object, value)},
-    {NULL}
-};
-
-PyTypeObject jdouble_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jdouble",
-    .tp_basicsize = sizeof(jdouble_Object),
-    .tp_itemsize  = member_size(jdouble_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jdouble_as_number,
-    .tp_members   = jdouble_members,
-    .tp_init      = (initproc)jdouble_init,
-    .tp_new       = PyType_GenericNew,
-};
-
-//----- jsize ----//
-
-#define jsize_Type jint_Type
-
-//---- jobject ---//
-
-typedef struct {
-    PyObject_HEAD
-    jobject value;
-} jobject_Object;
+    JNIEnv* jenv = self->jenv;
+    return jobject_result((*jenv)->ExceptionOccurred(jenv));
+}
 
-static int jobject_init(jobject_Object* self, PyObject* args)
+static PyObject* JNIEnv_ExceptionDescribe(JNIEnv_Object* self, PyObject* Py_UNUSED(ignored))
 {
-    PyObject* object = Py_None;
-    if ( ! PyArg_ParseTuple(args, "|O", &object) )
-        return -1;
-    Py_ssize_t value = 0;
-    if ( object != Py_None &&
-         ! PyArg_ParseTuple(args, "|n", &value) )
-        return -1;
-    self->value = (jobject)value;
-    return 0;
+    JNIEnv* jenv = self->jenv;
+    (*jenv)->ExceptionDescribe(jenv);
+    Py_RETURN_NONE;
 }
 
-static int jobject_bool(jobject_Object* self)
+static PyObject* JNIEnv_ExceptionClear(JNIEnv_Object* self, PyObject* Py_UNUSED(ignored))
 {
-    return !!self->value;
+    JNIEnv* jenv = self->jenv;
+    (*jenv)->ExceptionClear(jenv);
+    Py_RETURN_NONE;
 }
 
-static PyNumberMethods jobject_as_number = {
-    .nb_bool = (inquiry)jobject_bool,
-};
-
-static PyObject* jobject_value_get(jobject_Object* self)
+JNIENV_METHOD(FatalError)
 {
-    if ( self->value == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyLong_FromVoidPtr((void*)self->value);
+    static char* kwlist[] = {"msg", NULL};
+    JNIEnv* jenv = self->jenv;
+    const char* msg;
+    PARSE_ARGS("O&", as_pointer, &msg);
+    (*jenv)->FatalError(jenv, msg);
+    Py_RETURN_NONE;
 }
 
-static int jobject_value_set(jobject_Object* self, PyObject* val)
+static PyObject* JNIEnv_ExceptionCheck(JNIEnv_Object* self, PyObject* Py_UNUSED(ignored))
 {
-    int not_None = (val != Py_None);
-    void* value = not_None ? PyLong_AsVoidPtr(val) : NULL;
-    if ( not_None && value == NULL )
-        return -1;
-    self->value = (jobject)value;
-    return 0;
+    JNIEnv* jenv = self->jenv;
+    return jboolean_result((*jenv)->ExceptionCheck(jenv));
 }
 
-static PyGetSetDef jobject_getsets[] =
+// JVM Call frame
+
+JNIENV_METHOD(PushLocalFrame)
 {
-    {"value", (getter)jobject_value_get, (setter)jobject_value_set},
-    {NULL}
-};
+    static char* kwlist[] = {"capacity", NULL};
+    JNIEnv* jenv = self->jenv;
+    jint capacity;
+    PARSE_ARGS("O&", as_jint, &capacity);
+    jint ret = (*jenv)->PushLocalFrame(jenv, capacity);
+    CHECK_EXCEPTION_IF(ret != 0);
+    return jint_result(ret);
+}
 
-PyTypeObject jobject_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jobject",
-    .tp_basicsize = sizeof(jobject_Object),
-    .tp_itemsize  = member_size(jobject_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jobject_as_number,
-    .tp_getset    = jobject_getsets,
-    .tp_init      = (initproc)jobject_init,
-    .tp_new       = PyType_GenericNew,
-};
+JNIENV_METHOD(PopLocalFrame)
+{
+    static char* kwlist[] = {"result", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject result;
+    PARSE_ARGS("O&", as_jobject, &result);
+    return jobject_result((*jenv)->PopLocalFrame(jenv, result));
+}
 
-//-- jclass ... --//
-
-#define jclass_Type        jobject_Type
-#define jthrowable_Type    jobject_Type
-#define jstring_Type       jobject_Type
-#define jarray_Type        jobject_Type
-#define jbooleanArray_Type jarray_Type
-#define jbyteArray_Type    jarray_Type
-#define jcharArray_Type    jarray_Type
-#define jshortArray_Type   jarray_Type
-#define jintArray_Type     jarray_Type
-#define jlongArray_Type    jarray_Type
-#define jfloatArray_Type   jarray_Type
-#define jdoubleArray_Type  jarray_Type
-#define jobjectArray_Type  jarray_Type
-#define jweak_Type         jobject_Type
-
-//---- jvalue ----//
+// Java references handling
 
-typedef struct {
-    PyObject_HEAD
-    jvalue this;
-} jvalue_Object;
+JNIENV_METHOD(NewGlobalRef)
+{
+    static char* kwlist[] = {"lobj", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject lobj;
+    PARSE_ARGS("O&", as_jobject, &lobj);
+    jobject ret = (*jenv)->NewGlobalRef(jenv, lobj);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
 
-static PyObject* jvalue_z_get(jvalue_Object* self)
+JNIENV_METHOD(DeleteGlobalRef)
 {
-    return PyLong_FromLong((long)self->this.z);
+    static char* kwlist[] = {"gref", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject gref;
+    PARSE_ARGS("O&", as_jobject, &gref);
+    if ( gref ) (*jenv)->DeleteGlobalRef(jenv, gref);
+    Py_RETURN_NONE;
 }
 
-static int jvalue_z_set(jvalue_Object* self, PyObject* val)
+JNIENV_METHOD(NewLocalRef)
 {
-    if ( PyObject_TypeCheck(val, &jboolean_Type) )
-        self->this.z = ((jboolean_Object*)val)->value;
-    else
-    {
-        long value = PyLong_AsLong(val);
-        if ( value == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.z = (jboolean)value;
-    }
-    return 0;
+    static char* kwlist[] = {"ref", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject ref;
+    PARSE_ARGS("O&", as_jobject, &ref);
+    jobject ret = (*jenv)->NewLocalRef(jenv, ref);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
 }
 
-static PyObject* jvalue_b_get(jvalue_Object* self)
+JNIENV_METHOD(DeleteLocalRef)
 {
-    return PyLong_FromLong((long)self->this.b);
+    static char* kwlist[] = {"obj", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj;
+    PARSE_ARGS("O&", as_jobject, &obj);
+    if ( obj ) (*jenv)->DeleteLocalRef(jenv, obj);
+    Py_RETURN_NONE;
 }
 
-static int jvalue_b_set(jvalue_Object* self, PyObject* val)
+JNIENV_METHOD(NewWeakGlobalRef)
 {
-    if ( PyObject_TypeCheck(val, &jbyte_Type) )
-        self->this.b = ((jbyte_Object*)val)->value;
-    else
-    {
-        long value = PyLong_AsLong(val);
-        if ( value == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.b = (jbyte)value;
-    }
-    return 0;
+    static char* kwlist[] = {"obj", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj;
+    PARSE_ARGS("O&", as_jobject, &obj);
+    jweak ret = (*jenv)->NewWeakGlobalRef(jenv, obj);
+    CHECK_EXCEPTION();
+    return jobject_result(ret);
 }
 
-static PyObject* jvalue_c_get(jvalue_Object* self)
+JNIENV_METHOD(DeleteWeakGlobalRef)
 {
-    return PyUnicode_FromWideChar((const wchar_t*)&self->this.c, 1);
+    static char* kwlist[] = {"ref", NULL};
+    JNIEnv* jenv = self->jenv;
+    jweak ref;
+    PARSE_ARGS("O&", as_jobject, &ref);
+    (*jenv)->DeleteWeakGlobalRef(jenv, ref);
+    Py_RETURN_NONE;
 }
 
-static int jvalue_c_set(jvalue_Object* self, PyObject* val)
+// Deletes the references of refs (a sequence or an iterable) in a single
+// native loop. Returns the number of deleted (non-NULL) references or -1.
+static Py_ssize_t delete_refs(JNIEnv* jenv, PyObject* refs,
+                              void (JNICALL *delete_ref)(JNIEnv*, jobject))
 {
-    if ( PyObject_TypeCheck(val, &jchar_Type) )
-        self->this.c = ((jchar_Object*)val)->value;
-    else
+    PyObject* seq = PySequence_Fast(refs, "refs must be an iterable");
+    if ( seq == NULL )
+        return -1;
+    Py_ssize_t size  = PySequence_Fast_GET_SIZE(seq);
+    PyObject** items = PySequence_Fast_ITEMS(seq);
+    Py_ssize_t count = 0;
+    for ( Py_ssize_t i = 0; i < size; ++i )
     {
-        wchar_t value = 0;
-        if ( PyUnicode_AsWideChar(val, &value, 1) == -1 )
-            return -1;
-        if ( PyUnicode_GetLength(val) != 1 )
+        jobject ref;
+        if ( ! as_jobject(items[i], &ref) )
         {
-            PyErr_SetString(PyExc_TypeError,
-                            "one unicode character expected, not str");
+            Py_DECREF(seq);
             return -1;
         }
-        self->this.c = (jchar)value;
+        if ( ref )
+        {
+            delete_ref(jenv, ref);
+            ++count;
+        }
     }
-    return 0;
+    Py_DECREF(seq);
+    return count;
 }
 
-static PyObject* jvalue_s_get(jvalue_Object* self)
-{
-    return PyLong_FromLong((long)self->this.s);
+#define JNIENV_DELETE_REFS(name, JNIFun)                                            \
+JNIENV_METHOD(name)                                                                 \
+{                                                                                   \
+    static char* kwlist[] = {"refs", NULL};                                         \
+    JNIEnv* jenv = self->jenv;                                                      \
+    PyObject* refs;                                                                 \
+    PARSE_ARGS("O", &refs);                                                         \
+    if ( delete_refs(jenv, refs, (*jenv)->JNIFun) < 0 ) return NULL;                \
+    Py_RETURN_NONE;                                                                 \
 }
 
-static int jvalue_s_set(jvalue_Object* self, PyObject* val)
-{
-    if ( PyObject_TypeCheck(val, &jshort_Type) )
-        self->this.s = ((jshort_Object*)val)->value;
-    else
-    {
-        long value = PyLong_AsLong(val);
-        if ( value == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.s = (jshort)value;
-    }
-    return 0;
-}
+JNIENV_DELETE_REFS(DeleteGlobalRefs,     DeleteGlobalRef)
+JNIENV_DELETE_REFS(DeleteLocalRefs,      DeleteLocalRef)
+JNIENV_DELETE_REFS(DeleteWeakGlobalRefs, DeleteWeakGlobalRef)
 
-static PyObject* jvalue_i_get(jvalue_Object* self)
+JNIENV_METHOD(EnsureLocalCapacity)
 {
-    return PyLong_FromLong((long)self->this.i);
+    static char* kwlist[] = {"capacity", NULL};
+    JNIEnv* jenv = self->jenv;
+    jint capacity;
+    PARSE_ARGS("O&", as_jint, &capacity);
+    jint ret = (*jenv)->EnsureLocalCapacity(jenv, capacity);
+    CHECK_EXCEPTION();
+    return jint_result(ret);
 }
 
-static int jvalue_i_set(jvalue_Object* self, PyObject* val)
-{
-    if ( PyObject_TypeCheck(val, &jint_Type) )
-        self->this.i = ((jint_Object*)val)->value;
-    else
-    {
-        long value = PyLong_AsLong(val);
-        if ( value == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.i = (jint)value;
-    }
-    return 0;
-}
+// Java objects handling
 
-static PyObject* jvalue_j_get(jvalue_Object* self)
+JNIENV_METHOD(AllocObject)
 {
-    return PyLong_FromLongLong((PY_LONG_LONG)self->this.j);
+    static char* kwlist[] = {"clazz", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz;
+    PARSE_ARGS("O&", as_jobject, &clazz);
+    jobject ret = (*jenv)->AllocObject(jenv, clazz);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
 }
 
-static int jvalue_j_set(jvalue_Object* self, PyObject* val)
-{
-    if ( PyObject_TypeCheck(val, &jlong_Type) )
-        self->this.j = ((jlong_Object*)val)->value;
-    else
-    {
-        PY_LONG_LONG value = PyLong_AsLongLong(val);
-        if ( value == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.j = (jlong)value;
-    }
-    return 0;
+JNIENV_METHOD(NewObject)
+{
+    static char* kwlist[] = {"clazz", "methodID", "args", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz; jmethodID methodID; const jvalue* jargs = NULL; jobject ret;
+    PARSE_ARGS("O&O&|O&", as_jobject, &clazz, as_pointer, &methodID, as_pointer, &jargs);
+    Py_BEGIN_ALLOW_THREADS
+    ret = (*jenv)->NewObjectA(jenv, clazz, methodID, jargs);
+    Py_END_ALLOW_THREADS
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
+
+JNIENV_METHOD(GetObjectClass)
+{
+    static char* kwlist[] = {"obj", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj;
+    PARSE_ARGS("O&", as_jobject, &obj);
+    jclass ret = (*jenv)->GetObjectClass(jenv, obj);
+    CHECK_EXCEPTION();
+    return jobject_result(ret);
+}
+
+JNIENV_METHOD(GetObjectRefType)
+{
+    // New in JNI 1.6
+    static char* kwlist[] = {"obj", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj;
+    PARSE_ARGS("O&", as_jobject, &obj);
+    jobjectRefType ret = (*jenv)->GetObjectRefType(jenv, obj);
+    CHECK_EXCEPTION();
+    return jint_result(ret);
+}
+
+JNIENV_METHOD(IsInstanceOf)
+{
+    static char* kwlist[] = {"obj", "clazz", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj; jclass clazz;
+    PARSE_ARGS("O&O&", as_jobject, &obj, as_jobject, &clazz);
+    return jboolean_result((*jenv)->IsInstanceOf(jenv, obj, clazz));
+}
+
+JNIENV_METHOD(IsSameObject)
+{
+    static char* kwlist[] = {"obj1", "obj2", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj1, obj2;
+    PARSE_ARGS("O&O&", as_jobject, &obj1, as_jobject, &obj2);
+    return jboolean_result((*jenv)->IsSameObject(jenv, obj1, obj2));
+}
+
+// Call Java instance method
+
+JNIENV_METHOD(GetMethodID)
+{
+    static char* kwlist[] = {"clazz", "name", "sig", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz; const char* name; const char* sig;
+    PARSE_ARGS("O&O&O&", as_jobject, &clazz, as_pointer, &name, as_pointer, &sig);
+    jmethodID ret = (*jenv)->GetMethodID(jenv, clazz, name, sig);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
+
+#define JNIENV_CALL_METHOD(Type, jtype)                                             \
+JNIENV_METHOD(Call##Type##Method)                                                   \
+{                                                                                   \
+    static char* kwlist[] = {"obj", "methodID", "args", NULL};                      \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jobject obj; jmethodID methodID; const jvalue* jargs = NULL; jtype ret;         \
+    PARSE_ARGS("O&O&|O&", as_jobject, &obj, as_pointer, &methodID,                  \
+                          as_pointer, &jargs);                                      \
+    Py_BEGIN_ALLOW_THREADS                                                          \
+    ret = (*jenv)->Call##Type##MethodA(jenv, obj, methodID, jargs);                 \
+    Py_END_ALLOW_THREADS                                                            \
+    CHECK_EXCEPTION();                                                              \
+    return jtype##_result(ret);                                                     \
+}
+
+JNIENV_CALL_METHOD(Object,  jobject)
+JNIENV_CALL_METHOD(Boolean, jboolean)
+JNIENV_CALL_METHOD(Byte,    jbyte)
+JNIENV_CALL_METHOD(Char,    jchar)
+JNIENV_CALL_METHOD(Short,   jshort)
+JNIENV_CALL_METHOD(Int,     jint)
+JNIENV_CALL_METHOD(Long,    jlong)
+JNIENV_CALL_METHOD(Float,   jfloat)
+JNIENV_CALL_METHOD(Double,  jdouble)
+
+JNIENV_METHOD(CallVoidMethod)
+{
+    static char* kwlist[] = {"obj", "methodID", "args", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj; jmethodID methodID; const jvalue* jargs = NULL;
+    PARSE_ARGS("O&O&|O&", as_jobject, &obj, as_pointer, &methodID, as_pointer, &jargs);
+    Py_BEGIN_ALLOW_THREADS
+    (*jenv)->CallVoidMethodA(jenv, obj, methodID, jargs);
+    Py_END_ALLOW_THREADS
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static PyObject* jvalue_f_get(jvalue_Object* self)
-{
-    return PyFloat_FromDouble((double)self->this.f);
+// ... nonvirtually
+
+#define JNIENV_CALL_NONVIRTUAL_METHOD(Type, jtype)                                  \
+JNIENV_METHOD(CallNonvirtual##Type##Method)                                         \
+{                                                                                   \
+    static char* kwlist[] = {"obj", "clazz", "methodID", "args", NULL};             \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jobject obj; jclass clazz; jmethodID methodID; const jvalue* jargs = NULL;      \
+    jtype ret;                                                                      \
+    PARSE_ARGS("O&O&O&|O&", as_jobject, &obj, as_jobject, &clazz,                   \
+                            as_pointer, &methodID, as_pointer, &jargs);             \
+    Py_BEGIN_ALLOW_THREADS                                                          \
+    ret = (*jenv)->CallNonvirtual##Type##MethodA(jenv, obj, clazz, methodID, jargs);\
+    Py_END_ALLOW_THREADS                                                            \
+    CHECK_EXCEPTION();                                                              \
+    return jtype##_result(ret);                                                     \
+}
+
+JNIENV_CALL_NONVIRTUAL_METHOD(Object,  jobject)
+JNIENV_CALL_NONVIRTUAL_METHOD(Boolean, jboolean)
+JNIENV_CALL_NONVIRTUAL_METHOD(Byte,    jbyte)
+JNIENV_CALL_NONVIRTUAL_METHOD(Char,    jchar)
+JNIENV_CALL_NONVIRTUAL_METHOD(Short,   jshort)
+JNIENV_CALL_NONVIRTUAL_METHOD(Int,     jint)
+JNIENV_CALL_NONVIRTUAL_METHOD(Long,    jlong)
+JNIENV_CALL_NONVIRTUAL_METHOD(Float,   jfloat)
+JNIENV_CALL_NONVIRTUAL_METHOD(Double,  jdouble)
+
+JNIENV_METHOD(CallNonvirtualVoidMethod)
+{
+    static char* kwlist[] = {"obj", "clazz", "methodID", "args", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj; jclass clazz; jmethodID methodID; const jvalue* jargs = NULL;
+    PARSE_ARGS("O&O&O&|O&", as_jobject, &obj, as_jobject, &clazz,
+                            as_pointer, &methodID, as_pointer, &jargs);
+    Py_BEGIN_ALLOW_THREADS
+    (*jenv)->CallNonvirtualVoidMethodA(jenv, obj, clazz, methodID, jargs);
+    Py_END_ALLOW_THREADS
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static int jvalue_f_set(jvalue_Object* self, PyObject* val)
-{
-    if ( PyObject_TypeCheck(val, &jfloat_Type) )
-        self->this.f = ((jfloat_Object*)val)->value;
-    else
-    {
-        double value = PyFloat_AsDouble(val);
-        if ( value == -1.0 && PyErr_Occurred() )
-            return -1;
-        self->this.f = (jfloat)value;
-    }
-    return 0;
+// Getting/Setting Java instance fields
+
+JNIENV_METHOD(GetFieldID)
+{
+    static char* kwlist[] = {"clazz", "name", "sig", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz; const char* name; const char* sig;
+    PARSE_ARGS("O&O&O&", as_jobject, &clazz, as_pointer, &name, as_pointer, &sig);
+    jfieldID ret = (*jenv)->GetFieldID(jenv, clazz, name, sig);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
+
+#define JNIENV_FIELD(Type, jtype)                                                   \
+JNIENV_METHOD(Get##Type##Field)                                                     \
+{                                                                                   \
+    static char* kwlist[] = {"obj", "fieldID", NULL};                               \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jobject obj; jfieldID fieldID;                                                  \
+    PARSE_ARGS("O&O&", as_jobject, &obj, as_pointer, &fieldID);                     \
+    jtype ret = (*jenv)->Get##Type##Field(jenv, obj, fieldID);                      \
+    CHECK_EXCEPTION();                                                              \
+    return jtype##_result(ret);                                                     \
+}                                                                                   \
+                                                                                    \
+JNIENV_METHOD(Set##Type##Field)                                                     \
+{                                                                                   \
+    static char* kwlist[] = {"obj", "fieldID", "value", NULL};                      \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jobject obj; jfieldID fieldID; jtype value;                                     \
+    PARSE_ARGS("O&O&O&", as_jobject, &obj, as_pointer, &fieldID,                    \
+                         as_##jtype, &value);                                       \
+    (*jenv)->Set##Type##Field(jenv, obj, fieldID, value);                           \
+    CHECK_EXCEPTION();                                                              \
+    Py_RETURN_NONE;                                                                 \
+}
+
+JNIENV_FIELD(Object,  jobject)
+JNIENV_FIELD(Boolean, jboolean)
+JNIENV_FIELD(Byte,    jbyte)
+JNIENV_FIELD(Char,    jchar)
+JNIENV_FIELD(Short,   jshort)
+JNIENV_FIELD(Int,     jint)
+JNIENV_FIELD(Long,    jlong)
+JNIENV_FIELD(Float,   jfloat)
+JNIENV_FIELD(Double,  jdouble)
+
+// Call Java static method
+
+JNIENV_METHOD(GetStaticMethodID)
+{
+    static char* kwlist[] = {"clazz", "name", "sig", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz; const char* name; const char* sig;
+    PARSE_ARGS("O&O&O&", as_jobject, &clazz, as_pointer, &name, as_pointer, &sig);
+    jmethodID ret = (*jenv)->GetStaticMethodID(jenv, clazz, name, sig);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
+
+#define JNIENV_CALL_STATIC_METHOD(Type, jtype)                                      \
+JNIENV_METHOD(CallStatic##Type##Method)                                             \
+{                                                                                   \
+    static char* kwlist[] = {"clazz", "methodID", "args", NULL};                    \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jclass clazz; jmethodID methodID; const jvalue* jargs = NULL; jtype ret;        \
+    PARSE_ARGS("O&O&|O&", as_jobject, &clazz, as_pointer, &methodID,                \
+                          as_pointer, &jargs);                                      \
+    Py_BEGIN_ALLOW_THREADS                                                          \
+    ret = (*jenv)->CallStatic##Type##MethodA(jenv, clazz, methodID, jargs);         \
+    Py_END_ALLOW_THREADS                                                            \
+    CHECK_EXCEPTION();                                                              \
+    return jtype##_result(ret);                                                     \
+}
+
+JNIENV_CALL_STATIC_METHOD(Object,  jobject)
+JNIENV_CALL_STATIC_METHOD(Boolean, jboolean)
+JNIENV_CALL_STATIC_METHOD(Byte,    jbyte)
+JNIENV_CALL_STATIC_METHOD(Char,    jchar)
+JNIENV_CALL_STATIC_METHOD(Short,   jshort)
+JNIENV_CALL_STATIC_METHOD(Int,     jint)
+JNIENV_CALL_STATIC_METHOD(Long,    jlong)
+JNIENV_CALL_STATIC_METHOD(Float,   jfloat)
+JNIENV_CALL_STATIC_METHOD(Double,  jdouble)
+
+JNIENV_METHOD(CallStaticVoidMethod)
+{
+    static char* kwlist[] = {"clazz", "methodID", "args", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz; jmethodID methodID; const jvalue* jargs = NULL;
+    PARSE_ARGS("O&O&|O&", as_jobject, &clazz, as_pointer, &methodID, as_pointer, &jargs);
+    Py_BEGIN_ALLOW_THREADS
+    (*jenv)->CallStaticVoidMethodA(jenv, clazz, methodID, jargs);
+    Py_END_ALLOW_THREADS
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static PyObject* jvalue_d_get(jvalue_Object* self)
-{
-    return PyFloat_FromDouble((double)self->this.d);
-}
+// Vectorized calls: a method (or a constructor, rtype 'N') called count
+// times, the i-th time on receivers[i] (statically on clazz if receivers
+// is None, nonvirtually if both are given) with the i-th items of the
+// argument columns. sig has one JNI type code per column: a primitive
+// column is a contiguous buffer of items of its type, an object column
+// ('L') a sequence of references. The primitive results are stored in
+// out (a buffer of count items of rtype), the object results ('L', 'N')
+// in out (an Object[]; their local references are deleted once stored),
+// unless out is NULL. The arguments are converted first, then the loop
+// runs without the GIL and stops at the first Java exception; *done
+// (unless NULL) is set to the number of completed calls.
+// Returns 0, or -1 on a Python error.
 
-static int jvalue_d_set(jvalue_Object* self, PyObject* val)
+static Py_ssize_t jtype_size(int code)
 {
-    if ( PyObject_TypeCheck(val, &jdouble_Type) )
-        self->this.d = ((jdouble_Object*)val)->value;
-    else
+    switch ( code )
     {
-        double value = PyFloat_AsDouble(val);
-        if ( value == -1.0 && PyErr_Occurred() )
-            return -1;
-        self->this.d = (jdouble)value;
+    case 'Z': return sizeof(jboolean);
+    case 'B': return sizeof(jbyte);
+    case 'C': return sizeof(jchar);
+    case 'S': return sizeof(jshort);
+    case 'I': return sizeof(jint);
+    case 'J': return sizeof(jlong);
+    case 'F': return sizeof(jfloat);
+    case 'D': return sizeof(jdouble);
+    default:  return 0;
     }
-    return 0;
 }
 
-static PyObject* jvalue_l_get(jvalue_Object* self)
-{
-    if ( self->this.l == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyLong_FromVoidPtr((void*)self->this.l);
-}
+#define CALL_METHOD_A(Type)                                                         \
+    ( objs == NULL                                                                  \
+    ? (*jenv)->CallStatic##Type##MethodA(jenv, clazz, methodID, row)                \
+    : clazz != NULL                                                                 \
+    ? (*jenv)->CallNonvirtual##Type##MethodA(jenv, objs[i], clazz, methodID, row)   \
+    : (*jenv)->Call##Type##MethodA(jenv, objs[i], methodID, row) )
+
+#define CALL_LOOP_CASE(code, Type, jtype)                                           \
+    case code:                                                                      \
+    {                                                                               \
+        jtype ret = CALL_METHOD_A(Type);                                            \
+        if ( out != NULL ) ((jtype*)out)[i] = ret;                                  \
+        break;                                                                      \
+    }
 
-static int jvalue_l_set(jvalue_Object* self, PyObject* val)
+static jsize call_loop(JNIEnv* jenv, int rtype, jclass clazz, jmethodID methodID,
+                       jsize count, const jobject* objs,
+                       const jvalue* jargs, Py_ssize_t nargs, void* out)
 {
-    if ( PyObject_TypeCheck(val, &jobject_Type) )
-        self->this.l = ((jobject_Object*)val)->value;
-    else
+    jsize i;
+    for ( i = 0; i < count; ++i )
     {
-        int not_None = (val != Py_None);
-        void* value = not_None ? PyLong_AsVoidPtr(val) : NULL;
-        if ( not_None && value == NULL )
-            return -1;
-        self->this.l = (jobject)value;
+        const jvalue* row = (jargs != NULL) ? jargs + (size_t)i * nargs : NULL;
+        switch ( rtype )
+        {
+        CALL_LOOP_CASE('Z', Boolean, jboolean)
+        CALL_LOOP_CASE('B', Byte,    jbyte)
+        CALL_LOOP_CASE('C', Char,    jchar)
+        CALL_LOOP_CASE('S', Short,   jshort)
+        CALL_LOOP_CASE('I', Int,     jint)
+        CALL_LOOP_CASE('J', Long,    jlong)
+        CALL_LOOP_CASE('F', Float,   jfloat)
+        CALL_LOOP_CASE('D', Double,  jdouble)
+        case 'V':
+            CALL_METHOD_A(Void);
+            break;
+        case 'L':
+        case 'N':
+        {
+            jobject ret = (rtype == 'N') ? (*jenv)->NewObjectA(jenv, clazz, methodID, row)
+                                         : CALL_METHOD_A(Object);
+            if ( ret != NULL )
+            {
+                if ( out != NULL )
+                    (*jenv)->SetObjectArrayElement(jenv, (jobjectArray)out, i, ret);
+                (*jenv)->DeleteLocalRef(jenv, ret);
+            }
+            break;
+        }
+        }
+        if ( (*jenv)->ExceptionCheck(jenv) )
+            break;
     }
-    return 0;
+    return i;
 }
 
-static PyGetSetDef jvalue_getsets[] =
-{
-    {"z", (getter)jvalue_z_get, (setter)jvalue_z_set},
-    {"b", (getter)jvalue_b_get, (setter)jvalue_b_set},
-    {"c", (getter)jvalue_c_get, (setter)jvalue_c_set},
-    {"s", (getter)jvalue_s_get, (setter)jvalue_s_set},
-    {"i", (getter)jvalue_i_get, (setter)jvalue_i_set},
-    {"j", (getter)jvalue_j_get, (setter)jvalue_j_set},
-    {"f", (getter)jvalue_f_get, (setter)jvalue_f_set},
-    {"d", (getter)jvalue_d_get, (setter)jvalue_d_set},
-    {"l", (getter)jvalue_l_get, (setter)jvalue_l_set},
-    {NULL}
-};
-
-PyTypeObject jvalue_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jvalue",
-    .tp_basicsize = sizeof(jvalue_Object),
-    .tp_itemsize  = member_size(jvalue_Object, this),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_getset    = jvalue_getsets,
-    .tp_new       = PyType_GenericNew,
-};
-
-//--- jfieldID ---//
-
-typedef struct {
-    PyObject_HEAD
-    jfieldID value;
-} jfieldID_Object;
-
-static int jfieldID_init(jfieldID_Object* self, PyObject* args)
+static int call_methods(JNIEnv* jenv, int rtype, jclass clazz, jmethodID methodID,
+                        jsize count, PyObject* receivers, PyObject* columns,
+                        const char* sig, void* out, jint* done)
 {
-    PyObject* object = Py_None;
-    if ( ! PyArg_ParseTuple(args, "|O", &object) )
+    Py_ssize_t nargs = (Py_ssize_t)strlen(sig);
+    jvalue*   jargs = NULL;
+    jobject*  objs  = NULL;
+    PyObject* cols  = NULL;
+    PyObject* seq   = NULL;
+    int result = -1;
+    if ( done != NULL ) *done = 0;
+    if ( rtype == 0 || strchr("VZBCSIJFDLN", rtype) == NULL )
+    {
+        PyErr_Format(PyExc_ValueError, "invalid result type: '%c'", rtype);
         return -1;
-    Py_ssize_t value = 0;
-    if ( object != Py_None &&
-         ! PyArg_ParseTuple(args, "|n", &value) )
+    }
+    if ( count < 0 )
+    {
+        PyErr_SetString(PyExc_ValueError, "count must not be negative");
         return -1;
-    self->value = (jfieldID)value;
-    return 0;
+    }
+    if ( (receivers == Py_None || rtype == 'N') && clazz == NULL )
+    {
+        PyErr_SetString(PyExc_ValueError, "static calls and constructors need a class");
+        return -1;
+    }
+    if ( rtype == 'N' && receivers != Py_None )
+    {
+        PyErr_SetString(PyExc_ValueError, "constructors take no receivers");
+        return -1;
+    }
+    if ( (cols = PySequence_Fast(columns, "columns must be a sequence")) == NULL )
+        return -1;
+    if ( PySequence_Fast_GET_SIZE(cols) != nargs )
+    {
+        PyErr_Format(PyExc_ValueError, "expected %zd argument columns, got %zd",
+                     nargs, PySequence_Fast_GET_SIZE(cols));
+        goto done;
+    }
+    if ( count == 0 )
+    {
+        result = 0;
+        goto done;
+    }
+    if ( nargs != 0 &&
+         (jargs = PyMem_Calloc((size_t)count * nargs, sizeof(jvalue))) == NULL )
+    {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for ( Py_ssize_t k = 0; k < nargs; ++k )
+    {
+        PyObject* col = PySequence_Fast_GET_ITEM(cols, k);
+        if ( sig[k] == 'L' )
+        {
+            if ( (seq = PySequence_Fast(col, "object columns must be sequences")) == NULL )
+                goto done;
+            if ( PySequence_Fast_GET_SIZE(seq) < count )
+            {
+                PyErr_Format(PyExc_ValueError, "argument column %zd is too short", k);
+                goto done;
+            }
+            for ( jsize i = 0; i < count; ++i )
+                if ( ! as_jobject(PySequence_Fast_GET_ITEM(seq, i),
+                                  &jargs[(size_t)i * nargs + k].l) ) goto done;
+            Py_CLEAR(seq);
+        }
+        else
+        {
+            Py_ssize_t size = jtype_size(sig[k]);
+            Py_buffer view;
+            if ( size == 0 )
+            {
+                PyErr_Format(PyExc_ValueError, "invalid argument type: '%c'", sig[k]);
+                goto done;
+            }
+            if ( PyObject_GetBuffer(col, &view, PyBUF_C_CONTIGUOUS) < 0 )
+                goto done;
+            if ( view.itemsize != size || view.len / size < count )
+            {
+                PyErr_Format(PyExc_ValueError, "argument column %zd: expected %zd "
+                             "items of %zd bytes", k, (Py_ssize_t)count, size);
+                PyBuffer_Release(&view);
+                goto done;
+            }
+            // All the members of jvalue are at its start.
+            for ( jsize i = 0; i < count; ++i )
+                memcpy(&jargs[(size_t)i * nargs + k], (const char*)view.buf + i * size,
+                       (size_t)size);
+            PyBuffer_Release(&view);
+        }
+    }
+    if ( receivers != Py_None )
+    {
+        if ( (seq = PySequence_Fast(receivers, "receivers must be a sequence")) == NULL )
+            goto done;
+        if ( PySequence_Fast_GET_SIZE(seq) < count )
+        {
+            PyErr_SetString(PyExc_ValueError, "receivers is too short");
+            goto done;
+        }
+        if ( (objs = PyMem_Malloc((size_t)count * sizeof(jobject))) == NULL )
+        {
+            PyErr_NoMemory();
+            goto done;
+        }
+        for ( jsize i = 0; i < count; ++i )
+            if ( ! as_jobject(PySequence_Fast_GET_ITEM(seq, i), &objs[i]) ) goto done;
+        Py_CLEAR(seq);
+    }
+    jsize ncalls;
+    Py_BEGIN_ALLOW_THREADS
+    ncalls = call_loop(jenv, rtype, clazz, methodID, count, objs, jargs, nargs, out);
+    Py_END_ALLOW_THREADS
+    if ( done != NULL ) *done = ncalls;
+    result = 0;
+done:
+    Py_XDECREF(seq);
+    Py_DECREF(cols);
+    PyMem_Free(objs);
+    PyMem_Free(jargs);
+    return result;
 }
 
-static int jfieldID_bool(jfieldID_Object* self)
-{
-    return !!self->value;
+JNIENV_METHOD(CallMethodsA)
+{
+    static char* kwlist[] = {"rtype", "clazz", "methodID", "count", "receivers",
+                             "columns", "sig", "out", "done", NULL};
+    JNIEnv* jenv = self->jenv;
+    int rtype; jclass clazz; jmethodID methodID; jsize count;
+    PyObject* receivers; PyObject* columns; const char* sig;
+    void* out = NULL; jint* done = NULL;
+    PARSE_ARGS("CO&O&O&OOs|O&O&", &rtype, as_jobject, &clazz, as_pointer, &methodID,
+                                  as_jsize, &count, &receivers, &columns, &sig,
+                                  as_pointer, &out, as_pointer, &done);
+    if ( call_methods(jenv, rtype, clazz, methodID, count, receivers, columns,
+                      sig, out, done) < 0 ) return NULL;
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static PyNumberMethods jfieldID_as_number = {
-    .nb_bool = (inquiry)jfieldID_bool,
+// Recorded programs (see jni.Program): a sequence of instructions
+// (opcode, type, dest, *operands) working on slots (jvalues) of the types
+// (JNI type codes, 'm' - method ID, 'f' - field ID, 's' - bytes, modified
+// UTF-8) initialized from values (None for the computed slots). After the
+// conversion of the values, the program runs without the GIL and stops
+// at the first Java exception (the local references it created are then
+// deleted); *done (unless NULL) is set to the number of completed
+// instructions. Returns the tuple of the values of the output slots,
+// or NULL on a Python error.
+
+enum {
+    OP_FIND_CLASS, OP_GET_METHOD_ID, OP_GET_STATIC_METHOD_ID,
+    OP_GET_FIELD_ID, OP_GET_STATIC_FIELD_ID, OP_NEW_OBJECT,
+    OP_CALL_METHOD, OP_CALL_STATIC_METHOD, OP_GET_FIELD, OP_SET_FIELD,
+    OP_GET_STATIC_FIELD, OP_SET_STATIC_FIELD, OP_NEW_STRING_UTF,
+    OP_GET_OBJECT_CLASS, OP_DELETE_LOCAL_REF, OP_COUNT
 };
 
-static PyObject* jfieldID_value_get(jfieldID_Object* self)
-{
-    if ( self->value == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyLong_FromVoidPtr((void*)self->value);
+#define VALUE_TYPES "ZBCSIJFDL"
+
+// Slot types of the result (NULL: none, "*": the type of the instruction)
+// and of the operands ("*": any number of values, "=": a value of the type
+// of the instruction), and the types of the instruction (NULL: untyped).
+static const struct { const char* dest; const char* ops; const char* types; }
+program_sigs[OP_COUNT] = {
+    [OP_FIND_CLASS]           = {"L",  "s",   NULL},
+    [OP_GET_METHOD_ID]        = {"m",  "Lss", NULL},
+    [OP_GET_STATIC_METHOD_ID] = {"m",  "Lss", NULL},
+    [OP_GET_FIELD_ID]         = {"f",  "Lss", NULL},
+    [OP_GET_STATIC_FIELD_ID]  = {"f",  "Lss", NULL},
+    [OP_NEW_OBJECT]           = {"L",  "Lm*", NULL},
+    [OP_CALL_METHOD]          = {"*",  "Lm*", VALUE_TYPES "V"},
+    [OP_CALL_STATIC_METHOD]   = {"*",  "Lm*", VALUE_TYPES "V"},
+    [OP_GET_FIELD]            = {"*",  "Lf",  VALUE_TYPES},
+    [OP_SET_FIELD]            = {NULL, "Lf=", VALUE_TYPES},
+    [OP_GET_STATIC_FIELD]     = {"*",  "Lf",  VALUE_TYPES},
+    [OP_SET_STATIC_FIELD]     = {NULL, "Lf=", VALUE_TYPES},
+    [OP_NEW_STRING_UTF]       = {"L",  "s",   NULL},
+    [OP_GET_OBJECT_CLASS]     = {"L",  "L",   NULL},
+    [OP_DELETE_LOCAL_REF]     = {NULL, "L",   NULL},
+};
+
+typedef struct {
+    int op, type, dest;
+    Py_ssize_t nops;
+    const jint* ops;
+} program_instr;
+
+static int check_instr(const program_instr* in, const char* types, Py_ssize_t* maxargs)
+{
+    const char* dest = program_sigs[in->op].dest;
+    const char* sig  = program_sigs[in->op].ops;
+    const char* typs = program_sigs[in->op].types;
+    if ( typs != NULL ? (in->type == 0 || strchr(typs, in->type) == NULL) : in->type != 0 )
+        return 0;
+    if ( in->dest >= 0 )
+    {
+        if ( dest == NULL ) return 0;
+        int expected = (*dest == '*') ? in->type : *dest;
+        if ( expected == 'V' || types[in->dest] != expected ) return 0;
+    }
+    Py_ssize_t k = 0;
+    for ( ; *sig; ++sig )
+    {
+        if ( *sig == '*' )
+        {
+            for ( ; k < in->nops; ++k )
+                if ( strchr(VALUE_TYPES, types[in->ops[k]]) == NULL ) return 0;
+            if ( in->nops - 2 > *maxargs ) *maxargs = in->nops - 2;
+            break;
+        }
+        if ( k >= in->nops ) return 0;
+        if ( types[in->ops[k++]] != (*sig == '=' ? in->type : *sig) ) return 0;
+    }
+    return k == in->nops;
 }
 
-static int jfieldID_value_set(jfieldID_Object* self, PyObject* val)
+static int parse_program(PyObject* code, const char* types, Py_ssize_t nslots,
+                         program_instr** instrs, jint** operands,
+                         Py_ssize_t* ninstrs, Py_ssize_t* maxargs)
 {
-    int not_None = (val != Py_None);
-    void* value = not_None ? PyLong_AsVoidPtr(val) : NULL;
-    if ( not_None && value == NULL )
+    PyObject* seq = PySequence_Fast(code, "code must be a sequence");
+    if ( seq == NULL )
         return -1;
-    self->value = (jfieldID)value;
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(seq), total = 0, i;
+    for ( i = 0; i < n; ++i )
+    {
+        PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+        if ( ! PyTuple_Check(item) || PyTuple_GET_SIZE(item) < 3 ) goto invalid;
+        total += PyTuple_GET_SIZE(item) - 3;
+    }
+    *ninstrs  = n;
+    *maxargs  = 0;
+    *instrs   = PyMem_Calloc(n ? (size_t)n : 1, sizeof(program_instr));
+    *operands = PyMem_Calloc(total ? (size_t)total : 1, sizeof(jint));
+    if ( *instrs == NULL || *operands == NULL )
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+    jint* ops = *operands;
+    for ( i = 0; i < n; ++i )
+    {
+        PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+        program_instr* in = &(*instrs)[i];
+        long fields[3];
+        for ( int k = 0; k < 3; ++k )
+            if ( (fields[k] = PyLong_AsLong(PyTuple_GET_ITEM(item, k))) == -1 &&
+                 PyErr_Occurred() ) goto error;
+        in->op   = (int)fields[0];
+        in->type = (int)fields[1];
+        in->dest = (int)fields[2];
+        in->nops = PyTuple_GET_SIZE(item) - 3;
+        in->ops  = ops;
+        for ( Py_ssize_t k = 0; k < in->nops; ++k )
+        {
+            long slot = PyLong_AsLong(PyTuple_GET_ITEM(item, k + 3));
+            if ( slot == -1 && PyErr_Occurred() ) goto error;
+            if ( slot < 0 || slot >= nslots ) goto invalid;
+            ops[k] = (jint)slot;
+        }
+        ops += in->nops;
+        // The slot types are checked, so a program cannot misuse the slots.
+        if ( in->op < 0 || in->op >= OP_COUNT ||
+             in->dest < -1 || in->dest >= nslots ||
+             ! check_instr(in, types, maxargs) ) goto invalid;
+    }
+    Py_DECREF(seq);
     return 0;
+invalid:
+    PyErr_Format(PyExc_ValueError, "invalid instruction %zd", i);
+error:
+    Py_DECREF(seq);
+    return -1;
+}
+
+#define PROGRAM_TYPED_CASES(CASE)                                                   \
+    CASE('Z', Boolean, z) CASE('B', Byte,  b) CASE('C', Char,   c)                  \
+    CASE('S', Short,   s) CASE('I', Int,   i) CASE('J', Long,   j)                  \
+    CASE('F', Float,   f) CASE('D', Double, d)
+
+#define PROGRAM_CALL_CASE(code, Type, member)                                       \
+    case code:                                                                      \
+        dest->member = is_static                                                    \
+            ? (*jenv)->CallStatic##Type##MethodA(jenv, target, methodID, jargs)     \
+            : (*jenv)->Call##Type##MethodA(jenv, target, methodID, jargs);          \
+        break;
+
+#define PROGRAM_GET_FIELD_CASE(code, Type, member)                                  \
+    case code:                                                                      \
+        dest->member = is_static                                                    \
+            ? (*jenv)->GetStatic##Type##Field(jenv, target, fieldID)                \
+            : (*jenv)->Get##Type##Field(jenv, target, fieldID);                     \
+        break;
+
+#define PROGRAM_SET_FIELD_CASE(code, Type, member)                                  \
+    case code:                                                                      \
+        if ( is_static )                                                            \
+            (*jenv)->SetStatic##Type##Field(jenv, target, fieldID, value.member);   \
+        else                                                                        \
+            (*jenv)->Set##Type##Field(jenv, target, fieldID, value.member);         \
+        break;
+
+static Py_ssize_t program_loop(JNIEnv* jenv, const program_instr* instrs,
+                               Py_ssize_t ninstrs, jvalue* slots, char* live,
+                               Py_ssize_t nslots, jvalue* jargs)
+{
+    Py_ssize_t i;
+    for ( i = 0; i < ninstrs; ++i )
+    {
+        const program_instr* in = &instrs[i];
+        const jint* ops = in->ops;
+        jvalue scratch;
+        jvalue* dest = (in->dest >= 0) ? &slots[in->dest] : &scratch;
+        int is_ref = 0, is_static = 0;
+        jobject ref = NULL;  // new local reference
+        switch ( in->op )
+        {
+        case OP_FIND_CLASS:
+            ref = (*jenv)->FindClass(jenv, (const char*)slots[ops[0]].l);
+            is_ref = 1;
+            break;
+        case OP_GET_METHOD_ID:
+        case OP_GET_STATIC_METHOD_ID:
+        case OP_GET_FIELD_ID:
+        case OP_GET_STATIC_FIELD_ID:
+        {
+            jclass clazz = slots[ops[0]].l;
+            const char* name = (const char*)slots[ops[1]].l;
+            const char* sig  = (const char*)slots[ops[2]].l;
+            switch ( in->op )
+            {
+            case OP_GET_METHOD_ID:
+                dest->l = (jobject)(*jenv)->GetMethodID(jenv, clazz, name, sig); break;
+            case OP_GET_STATIC_METHOD_ID:
+                dest->l = (jobject)(*jenv)->GetStaticMethodID(jenv, clazz, name, sig); break;
+            case OP_GET_FIELD_ID:
+                dest->l = (jobject)(*jenv)->GetFieldID(jenv, clazz, name, sig); break;
+            default:
+                dest->l = (jobject)(*jenv)->GetStaticFieldID(jenv, clazz, name, sig); break;
+            }
+            break;
+        }
+        case OP_NEW_OBJECT:
+        case OP_CALL_STATIC_METHOD:
+            is_static = 1;
+            // fall through
+        case OP_CALL_METHOD:
+        {
+            jobject target = slots[ops[0]].l;
+            jmethodID methodID = (jmethodID)slots[ops[1]].l;
+            for ( Py_ssize_t k = 2; k < in->nops; ++k )
+                jargs[k - 2] = slots[ops[k]];
+            if ( in->op == OP_NEW_OBJECT )
+            {
+                ref = (*jenv)->NewObjectA(jenv, target, methodID, jargs);
+                is_ref = 1;
+                break;
+            }
+            switch ( in->type )
+            {
+            PROGRAM_TYPED_CASES(PROGRAM_CALL_CASE)
+            case 'L':
+                ref = is_static ? (*jenv)->CallStaticObjectMethodA(jenv, target, methodID, jargs)
+                                : (*jenv)->CallObjectMethodA(jenv, target, methodID, jargs);
+                is_ref = 1;
+                break;
+            default:  // 'V'
+                if ( is_static )
+                    (*jenv)->CallStaticVoidMethodA(jenv, target, methodID, jargs);
+                else
+                    (*jenv)->CallVoidMethodA(jenv, target, methodID, jargs);
+                break;
+            }
+            break;
+        }
+        case OP_GET_STATIC_FIELD:
+            is_static = 1;
+            // fall through
+        case OP_GET_FIELD:
+        {
+            jobject target = slots[ops[0]].l;
+            jfieldID fieldID = (jfieldID)slots[ops[1]].l;
+            switch ( in->type )
+            {
+            PROGRAM_TYPED_CASES(PROGRAM_GET_FIELD_CASE)
+            default:  // 'L'
+                ref = is_static ? (*jenv)->GetStaticObjectField(jenv, target, fieldID)
+                                : (*jenv)->GetObjectField(jenv, target, fieldID);
+                is_ref = 1;
+                break;
+            }
+            break;
+        }
+        case OP_SET_STATIC_FIELD:
+            is_static = 1;
+            // fall through
+        case OP_SET_FIELD:
+        {
+            jobject target = slots[ops[0]].l;
+            jfieldID fieldID = (jfieldID)slots[ops[1]].l;
+            jvalue value = slots[ops[2]];
+            switch ( in->type )
+            {
+            PROGRAM_TYPED_CASES(PROGRAM_SET_FIELD_CASE)
+            default:  // 'L'
+                if ( is_static )
+                    (*jenv)->SetStaticObjectField(jenv, target, fieldID, value.l);
+                else
+                    (*jenv)->SetObjectField(jenv, target, fieldID, value.l);
+                break;
+            }
+            break;
+        }
+        case OP_NEW_STRING_UTF:
+            ref = (*jenv)->NewStringUTF(jenv, (const char*)slots[ops[0]].l);
+            is_ref = 1;
+            break;
+        case OP_GET_OBJECT_CLASS:
+            ref = (*jenv)->GetObjectClass(jenv, slots[ops[0]].l);
+            is_ref = 1;
+            break;
+        case OP_DELETE_LOCAL_REF:
+            (*jenv)->DeleteLocalRef(jenv, slots[ops[0]].l);
+            live[ops[0]] = 0;
+            break;
+        }
+        if ( is_ref )
+        {
+            if ( in->dest >= 0 )
+            {
+                dest->l = ref;
+                live[in->dest] = (ref != NULL);
+            }
+            else if ( ref != NULL )
+                (*jenv)->DeleteLocalRef(jenv, ref);
+        }
+        if ( (*jenv)->ExceptionCheck(jenv) )
+            break;
+    }
+    if ( i < ninstrs )
+    {
+        for ( Py_ssize_t slot = 0; slot < nslots; ++slot )
+            if ( live[slot] ) (*jenv)->DeleteLocalRef(jenv, slots[slot].l);
+    }
+    return i;
 }
 
-static PyGetSetDef jfieldID_getsets[] =
-{
-    {"value", (getter)jfieldID_value_get, (setter)jfieldID_value_set},
-    {NULL}
-};
-
-PyTypeObject jfieldID_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jfieldID",
-    .tp_basicsize = sizeof(jfieldID_Object),
-    .tp_itemsize  = member_size(jfieldID_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jfieldID_as_number,
-    .tp_getset    = jfieldID_getsets,
-    .tp_init      = (initproc)jfieldID_init,
-    .tp_new       = PyType_GenericNew,
-};
-
-//--- jmethodID --//
-
-typedef struct {
-    PyObject_HEAD
-    jmethodID value;
-} jmethodID_Object;
-
-static int jmethodID_init(jmethodID_Object* self, PyObject* args)
+static PyObject* slot_result(const jvalue* slot, int type, PyObject* value)
 {
-    PyObject* object = Py_None;
-    if ( ! PyArg_ParseTuple(args, "|O", &object) )
-        return -1;
-    Py_ssize_t value = 0;
-    if ( object != Py_None &&
-         ! PyArg_ParseTuple(args, "|n", &value) )
-        return -1;
-    self->value = (jmethodID)value;
-    return 0;
+    switch ( type )
+    {
+    case 'Z': return jboolean_result(slot->z);
+    case 'B': return jbyte_result(slot->b);
+    case 'C': return jchar_result(slot->c);
+    case 'S': return jshort_result(slot->s);
+    case 'I': return jint_result(slot->i);
+    case 'J': return jlong_result(slot->j);
+    case 'F': return jfloat_result(slot->f);
+    case 'D': return jdouble_result(slot->d);
+    case 's': Py_INCREF(value); return value;
+    default:  return pointer_result((const void*)slot->l);
+    }
 }
 
-static int jmethodID_bool(jmethodID_Object* self)
+static PyObject* run_program(JNIEnv* jenv, PyObject* code, const char* types,
+                             PyObject* values, PyObject* outputs, jint* done)
 {
-    return !!self->value;
+    Py_ssize_t nslots = (Py_ssize_t)strlen(types);
+    program_instr* instrs = NULL;
+    jint*     operands = NULL;
+    jvalue*   slots = NULL;
+    jvalue*   jargs = NULL;
+    char*     live  = NULL;
+    PyObject* vals  = NULL;
+    PyObject* outs  = NULL;
+    PyObject* result = NULL;
+    Py_ssize_t ninstrs, maxargs;
+    if ( done != NULL ) *done = 0;
+    // A tuple keeps the values (and the bytes of the 's' slots) alive.
+    if ( (vals = PySequence_Tuple(values)) == NULL )
+        return NULL;
+    if ( PyTuple_GET_SIZE(vals) != nslots )
+    {
+        PyErr_Format(PyExc_ValueError, "expected %zd values, got %zd",
+                     nslots, PyTuple_GET_SIZE(vals));
+        goto done;
+    }
+    if ( (outs = PySequence_Fast(outputs, "outputs must be a sequence")) == NULL )
+        goto done;
+    for ( Py_ssize_t k = 0; k < PySequence_Fast_GET_SIZE(outs); ++k )
+    {
+        Py_ssize_t slot = PyLong_AsSsize_t(PySequence_Fast_GET_ITEM(outs, k));
+        if ( slot == -1 && PyErr_Occurred() ) goto done;
+        if ( slot < 0 || slot >= nslots )
+        {
+            PyErr_Format(PyExc_ValueError, "invalid output slot %zd", slot);
+            goto done;
+        }
+    }
+    if ( parse_program(code, types, nslots, &instrs, &operands,
+                       &ninstrs, &maxargs) < 0 ) goto done;
+    slots = PyMem_Calloc(nslots ? (size_t)nslots : 1, sizeof(jvalue));
+    live  = PyMem_Calloc(nslots ? (size_t)nslots : 1, sizeof(char));
+    jargs = PyMem_Calloc(maxargs ? (size_t)maxargs : 1, sizeof(jvalue));
+    if ( slots == NULL || live == NULL || jargs == NULL )
+    {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for ( Py_ssize_t slot = 0; slot < nslots; ++slot )
+    {
+        PyObject* value = PyTuple_GET_ITEM(vals, slot);
+        jvalue* jval = &slots[slot];
+        int ok;
+        if ( value == Py_None ) continue;
+        switch ( types[slot] )
+        {
+        case 'Z': ok = as_jboolean(value, &jval->z); break;
+        case 'B': ok = as_jbyte(value,    &jval->b); break;
+        case 'C': ok = as_jchar(value,    &jval->c); break;
+        case 'S': ok = as_jshort(value,   &jval->s); break;
+        case 'I': ok = as_jint(value,     &jval->i); break;
+        case 'J': ok = as_jlong(value,    &jval->j); break;
+        case 'F': ok = as_jfloat(value,   &jval->f); break;
+        case 'D': ok = as_jdouble(value,  &jval->d); break;
+        case 'L': case 'm': case 'f':
+            ok = as_pointer(value, &jval->l); break;
+        case 's':
+            if ( (ok = PyBytes_Check(value)) )
+                jval->l = (jobject)PyBytes_AS_STRING(value);
+            else
+                PyErr_Format(PyExc_TypeError, "slot %zd: expected bytes, got %.200s",
+                             slot, Py_TYPE(value)->tp_name);
+            break;
+        default:
+            PyErr_Format(PyExc_ValueError, "invalid slot type: '%c'", types[slot]);
+            ok = 0;
+        }
+        if ( ! ok ) goto done;
+    }
+    Py_ssize_t ncompleted;
+    Py_BEGIN_ALLOW_THREADS
+    ncompleted = program_loop(jenv, instrs, ninstrs, slots, live, nslots, jargs);
+    Py_END_ALLOW_THREADS
+    if ( done != NULL ) *done = (jint)ncompleted;
+    if ( (result = PyTuple_New(PySequence_Fast_GET_SIZE(outs))) == NULL )
+        goto done;
+    for ( Py_ssize_t k = 0; k < PySequence_Fast_GET_SIZE(outs); ++k )
+    {
+        Py_ssize_t slot = PyLong_AsSsize_t(PySequence_Fast_GET_ITEM(outs, k));
+        PyObject* value = slot_result(&slots[slot], types[slot],
+                                      PyTuple_GET_ITEM(vals, slot));
+        if ( value == NULL )
+        {
+            Py_CLEAR(result);
+            goto done;
+        }
+        PyTuple_SET_ITEM(result, k, value);
+    }
+done:
+    Py_XDECREF(outs);
+    Py_DECREF(vals);
+    PyMem_Free(jargs);
+    PyMem_Free(live);
+    PyMem_Free(slots);
+    PyMem_Free(operands);
+    PyMem_Free(instrs);
+    return result;
 }
 
-static PyNumberMethods jmethodID_as_number = {
-    .nb_bool = (inquiry)jmethodID_bool,
-};
-
-static PyObject* jmethodID_value_get(jmethodID_Object* self)
+JNIENV_METHOD(RunProgram)
 {
-    if ( self->value == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyLong_FromVoidPtr((void*)self->value);
+    static char* kwlist[] = {"code", "types", "values", "outputs", "done", NULL};
+    JNIEnv* jenv = self->jenv;
+    PyObject* code; const char* types; PyObject* values; PyObject* outputs;
+    jint* done = NULL;
+    PARSE_ARGS("OsOO|O&", &code, &types, &values, &outputs, as_pointer, &done);
+    PyObject* ret = run_program(jenv, code, types, values, outputs, done);
+    if ( ret == NULL ) return NULL;
+    if ( (*jenv)->ExceptionCheck(jenv) )
+    {
+        Py_DECREF(ret);
+        return _handle_JavaException((PyObject*)self);
+    }
+    return ret;
+}
+
+// Getting/Setting Java static fields
+
+JNIENV_METHOD(GetStaticFieldID)
+{
+    static char* kwlist[] = {"clazz", "name", "sig", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz; const char* name; const char* sig;
+    PARSE_ARGS("O&O&O&", as_jobject, &clazz, as_pointer, &name, as_pointer, &sig);
+    jfieldID ret = (*jenv)->GetStaticFieldID(jenv, clazz, name, sig);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
+
+#define JNIENV_STATIC_FIELD(Type, jtype)                                            \
+JNIENV_METHOD(GetStatic##Type##Field)                                               \
+{                                                                                   \
+    static char* kwlist[] = {"clazz", "fieldID", NULL};                             \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jclass clazz; jfieldID fieldID;                                                 \
+    PARSE_ARGS("O&O&", as_jobject, &clazz, as_pointer, &fieldID);                   \
+    jtype ret = (*jenv)->GetStatic##Type##Field(jenv, clazz, fieldID);              \
+    CHECK_EXCEPTION();                                                              \
+    return jtype##_result(ret);                                                     \
+}                                                                                   \
+                                                                                    \
+JNIENV_METHOD(SetStatic##Type##Field)                                               \
+{                                                                                   \
+    static char* kwlist[] = {"clazz", "fieldID", "value", NULL};                    \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jclass clazz; jfieldID fieldID; jtype value;                                    \
+    PARSE_ARGS("O&O&O&", as_jobject, &clazz, as_pointer, &fieldID,                  \
+                         as_##jtype, &value);                                       \
+    (*jenv)->SetStatic##Type##Field(jenv, clazz, fieldID, value);                   \
+    CHECK_EXCEPTION();                                                              \
+    Py_RETURN_NONE;                                                                 \
+}
+
+JNIENV_STATIC_FIELD(Object,  jobject)
+JNIENV_STATIC_FIELD(Boolean, jboolean)
+JNIENV_STATIC_FIELD(Byte,    jbyte)
+JNIENV_STATIC_FIELD(Char,    jchar)
+JNIENV_STATIC_FIELD(Short,   jshort)
+JNIENV_STATIC_FIELD(Int,     jint)
+JNIENV_STATIC_FIELD(Long,    jlong)
+JNIENV_STATIC_FIELD(Float,   jfloat)
+JNIENV_STATIC_FIELD(Double,  jdouble)
+
+// Java strings handling
+
+JNIENV_METHOD(NewString)
+{
+    static char* kwlist[] = {"unicode", "slen", NULL};
+    JNIEnv* jenv = self->jenv;
+    PyObject* unicode; PyObject* encoded = NULL; const jchar* chars; jsize slen;
+    PARSE_ARGS("OO&", &unicode, as_jsize, &slen);
+    if ( PyUnicode_Check(unicode) )
+    {
+#if PY_LITTLE_ENDIAN
+        encoded = PyUnicode_AsEncodedString(unicode, "utf-16-le", "surrogatepass");
+#else
+        encoded = PyUnicode_AsEncodedString(unicode, "utf-16-be", "surrogatepass");
+#endif
+        if ( encoded == NULL )
+            return NULL;
+        chars = (const jchar*)PyBytes_AS_STRING(encoded);
+    }
+    else if ( ! as_pointer(unicode, &chars) )
+        return NULL;
+    jstring ret = (*jenv)->NewString(jenv, chars, slen);
+    Py_XDECREF(encoded);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
 }
 
-static int jmethodID_value_set(jmethodID_Object* self, PyObject* val)
+JNIENV_METHOD(GetStringLength)
 {
-    int not_None = (val != Py_None);
-    void* value = not_None ? PyLong_AsVoidPtr(val) : NULL;
-    if ( not_None && value == NULL )
-        return -1;
-    self->value = (jmethodID)value;
-    return 0;
+    static char* kwlist[] = {"str", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring str;
+    PARSE_ARGS("O&", as_jobject, &str);
+    jsize ret = (*jenv)->GetStringLength(jenv, str);
+    CHECK_EXCEPTION();
+    return jint_result(ret);
 }
 
-static PyGetSetDef jmethodID_getsets[] =
+JNIENV_METHOD(GetStringChars)
 {
-    {"value", (getter)jmethodID_value_get, (setter)jmethodID_value_set},
-    {NULL}
-};
-
-PyTypeObject jmethodID_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "jmethodID",
-    .tp_basicsize = sizeof(jmethodID_Object),
-    .tp_itemsize  = member_size(jmethodID_Object, value),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_as_number = &jmethodID_as_number,
-    .tp_getset    = jmethodID_getsets,
-    .tp_init      = (initproc)jmethodID_init,
-    .tp_new       = PyType_GenericNew,
-};
-
-//-- jobjectRefType --//
-
-#define jobjectRefType_Type PyLong_Type
-
-//----------- null constant ----------//
-
-//NULL   = obj(jobject, 0)
-//isNULL = lambda jobj: not bool(jobj)
-
-//---- JNI Native Method Interface ---//
-
-// used in RegisterNatives to describe native method name,
-// signature, and function pointer.
-
-typedef struct {
-    PyObject_HEAD
-    JNINativeMethod this;
-} JNINativeMethod_Object;
+    static char* kwlist[] = {"str", "isCopy", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring str; jboolean* isCopy = NULL;
+    PARSE_ARGS("O&|O&", as_jobject, &str, as_pointer, &isCopy);
+    const jchar* ret = (*jenv)->GetStringChars(jenv, str, isCopy);
+    CHECK_EXCEPTION_IF(! ret);
+    return pointer_result(ret);
+}
 
-static PyObject* JNINativeMethod_name_get(JNINativeMethod_Object* self)
+JNIENV_METHOD(ReleaseStringChars)
 {
-    if ( self->this.name == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyBytes_FromString(self->this.name);
+    static char* kwlist[] = {"str", "chars", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring str; const jchar* chars;
+    PARSE_ARGS("O&O&", as_jobject, &str, as_pointer, &chars);
+    (*jenv)->ReleaseStringChars(jenv, str, chars);
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static int JNINativeMethod_name_set(JNINativeMethod_Object* self, PyObject* val)
+JNIENV_METHOD(NewStringUTF)
 {
-    int not_None = (val != Py_None);
-    char* name = not_None ? PyBytes_AsString(val) : NULL;
-    if ( not_None && name == NULL )
-        return -1;
-    self->this.name = name;
-    return 0;
+    static char* kwlist[] = {"utf", NULL};
+    JNIEnv* jenv = self->jenv;
+    const char* utf;
+    PARSE_ARGS("O&", as_pointer, &utf);
+    jstring ret = (*jenv)->NewStringUTF(jenv, utf);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
 }
 
-static PyObject* JNINativeMethod_signature_get(JNINativeMethod_Object* self)
+JNIENV_METHOD(GetStringUTFLength)
 {
-    if ( self->this.signature == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyBytes_FromString(self->this.signature);
+    static char* kwlist[] = {"str", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring str;
+    PARSE_ARGS("O&", as_jobject, &str);
+    jsize ret = (*jenv)->GetStringUTFLength(jenv, str);
+    CHECK_EXCEPTION();
+    return jint_result(ret);
 }
 
-static int JNINativeMethod_signature_set(JNINativeMethod_Object* self, PyObject* val)
+JNIENV_METHOD(GetStringUTFChars)
 {
-    int not_None = (val != Py_None);
-    char* signature = not_None ? PyBytes_AsString(val) : NULL;
-    if ( not_None && signature == NULL )
-        return -1;
-    self->this.signature = signature;
-    return 0;
+    static char* kwlist[] = {"str", "isCopy", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring str; jboolean* isCopy = NULL;
+    PARSE_ARGS("O&|O&", as_jobject, &str, as_pointer, &isCopy);
+    const char* ret = (*jenv)->GetStringUTFChars(jenv, str, isCopy);
+    CHECK_EXCEPTION_IF(! ret);
+    return pointer_result(ret);
 }
 
-static PyObject* JNINativeMethod_fnPtr_get(JNINativeMethod_Object* self)
+JNIENV_METHOD(ReleaseStringUTFChars)
 {
-    if ( self->this.fnPtr == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyLong_FromVoidPtr((void*)self->this.fnPtr);
+    static char* kwlist[] = {"str", "chars", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring str; const char* chars;
+    PARSE_ARGS("O&O&", as_jobject, &str, as_pointer, &chars);
+    (*jenv)->ReleaseStringUTFChars(jenv, str, chars);
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static int JNINativeMethod_fnPtr_set(JNINativeMethod_Object* self, PyObject* val)
+JNIENV_METHOD(GetStringRegion)
 {
-    if ( PyObject_TypeCheck(val, &jobject_Type) )
-        self->this.fnPtr = ((jobject_Object*)val)->value;
-    else
-    {
-        int not_None = (val != Py_None);
-        void* value = not_None ? PyLong_AsVoidPtr(val) : NULL;
-        if ( not_None && value == NULL )
-            return -1;
-        self->this.fnPtr = (void*)value;
-    }
-    return 0;
+    static char* kwlist[] = {"str", "start", "len", "buf", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring str; jsize start, len; jchar* buf;
+    PARSE_ARGS("O&O&O&O&", as_jobject, &str, as_jsize, &start, as_jsize, &len,
+                           as_pointer, &buf);
+    (*jenv)->GetStringRegion(jenv, str, start, len, buf);
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static PyGetSetDef JNINativeMethod_getsets[] =
+JNIENV_METHOD(GetStringUTFRegion)
 {
-    {"name",      (getter)JNINativeMethod_name_get,
-                  (setter)JNINativeMethod_name_set},
-    {"signature", (getter)JNINativeMethod_signature_get,
-                  (setter)JNINativeMethod_signature_set},
-    {"fnPtr",     (getter)JNINativeMethod_fnPtr_get,
-                  (setter)JNINativeMethod_fnPtr_set},
-    {NULL}
-};
-
-PyTypeObject JNINativeMethod_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "JNINativeMethod",
-    .tp_basicsize = sizeof(JNINativeMethod_Object),
-    .tp_itemsize  = member_size(JNINativeMethod_Object, this),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_getset    = JNINativeMethod_getsets,
-    .tp_new       = PyType_GenericNew,
-};
-
-//----- JNI Invocation Interface -----//
-
-//------ JavaVMOption ------//
+    static char* kwlist[] = {"str", "start", "len", "buf", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring str; jsize start, len; char* buf;
+    PARSE_ARGS("O&O&O&O&", as_jobject, &str, as_jsize, &start, as_jsize, &len,
+                           as_pointer, &buf);
+    (*jenv)->GetStringUTFRegion(jenv, str, start, len, buf);
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
+}
 
-typedef struct {
-    PyObject_HEAD
-    JavaVMOption this;
-} JavaVMOption_Object;
+// ... in a critical manner
 
-static PyObject* JavaVMOption_optionString_get(JavaVMOption_Object* self)
+JNIENV_METHOD(GetStringCritical)
 {
-    if ( self->this.optionString == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyBytes_FromString(self->this.optionString);
+    static char* kwlist[] = {"string", "isCopy", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring string; jboolean* isCopy = NULL;
+    PARSE_ARGS("O&|O&", as_jobject, &string, as_pointer, &isCopy);
+    const jchar* ret = (*jenv)->GetStringCritical(jenv, string, isCopy);
+    CHECK_EXCEPTION_IF(! ret);
+    return pointer_result(ret);
 }
 
-static int JavaVMOption_optionString_set(JavaVMOption_Object* self, PyObject* val)
+JNIENV_METHOD(ReleaseStringCritical)
 {
-    int not_None = (val != Py_None);
-    char* optionString = not_None ? PyBytes_AsString(val) : NULL;
-    if ( not_None && optionString == NULL )
-        return -1;
-    self->this.optionString = optionString;
-    return 0;
+    static char* kwlist[] = {"string", "cstring", NULL};
+    JNIEnv* jenv = self->jenv;
+    jstring string; const jchar* cstring;
+    PARSE_ARGS("O&O&", as_jobject, &string, as_pointer, &cstring);
+    (*jenv)->ReleaseStringCritical(jenv, string, cstring);
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static PyObject* JavaVMOption_extraInfo_get(JavaVMOption_Object* self)
-{
-    if ( self->this.extraInfo == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyLong_FromVoidPtr((void*)self->this.extraInfo);
-}
+// Java arrays handling
 
-static int JavaVMOption_extraInfo_set(JavaVMOption_Object* self, PyObject* val)
+JNIENV_METHOD(GetArrayLength)
 {
-    if ( PyObject_TypeCheck(val, &jobject_Type) )
-        self->this.extraInfo = ((jobject_Object*)val)->value;
-    else
-    {
-        int not_None = (val != Py_None);
-        void* value = not_None ? PyLong_AsVoidPtr(val) : NULL;
-        if ( not_None && value == NULL )
-            return -1;
-        self->this.extraInfo = (void*)value;
-    }
-    return 0;
+    static char* kwlist[] = {"array", NULL};
+    JNIEnv* jenv = self->jenv;
+    jarray array;
+    PARSE_ARGS("O&", as_jobject, &array);
+    jsize ret = (*jenv)->GetArrayLength(jenv, array);
+    CHECK_EXCEPTION();
+    return jint_result(ret);
 }
 
-static PyGetSetDef JavaVMOption_getsets[] =
+JNIENV_METHOD(NewObjectArray)
 {
-    {"optionString", (getter)JavaVMOption_optionString_get,
-                     (setter)JavaVMOption_optionString_set},
-    {"extraInfo",    (getter)JavaVMOption_extraInfo_get,
-                     (setter)JavaVMOption_extraInfo_set},
-    {NULL}
-};
-
-PyTypeObject JavaVMOption_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "JavaVMOption",
-    .tp_basicsize = sizeof(JavaVMOption_Object),
-    .tp_itemsize  = member_size(JavaVMOption_Object, this),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_getset    = JavaVMOption_getsets,
-    .tp_new       = PyType_GenericNew,
-};
-
-//----- JavaVMInitArgs -----//
-
-typedef struct {
-    PyObject_HEAD
-    JavaVMInitArgs this;
-} JavaVMInitArgs_Object;
+    static char* kwlist[] = {"size", "clazz", "init", NULL};
+    JNIEnv* jenv = self->jenv;
+    jsize size; jclass clazz; jobject init = NULL;
+    PARSE_ARGS("O&O&|O&", as_jsize, &size, as_jobject, &clazz, as_jobject, &init);
+    jobjectArray ret = (*jenv)->NewObjectArray(jenv, size, clazz, init);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
 
-static PyObject* JavaVMInitArgs_version_get(JavaVMInitArgs_Object* self)
+JNIENV_METHOD(GetObjectArrayElement)
 {
-    return PyLong_FromLong((long)self->this.version);
+    static char* kwlist[] = {"array", "index", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobjectArray array; jsize index;
+    PARSE_ARGS("O&O&", as_jobject, &array, as_jsize, &index);
+    jobject ret = (*jenv)->GetObjectArrayElement(jenv, array, index);
+    CHECK_EXCEPTION();
+    return jobject_result(ret);
 }
 
-static int JavaVMInitArgs_version_set(JavaVMInitArgs_Object* self, PyObject* val)
+// Fills array[start:] with the items of a sequence (or an iterable),
+// converted by convert (if not NULL) to new local references, which are
+// deleted once stored. The loop stops at the first pending Java exception.
+// Returns 0, or -1 on a Python error.
+static int fill_object_array(JNIEnv* jenv, jobjectArray array, jsize start,
+                             PyObject* items, PyObject* convert)
 {
-    if ( PyObject_TypeCheck(val, &jint_Type) )
-        self->this.version = ((jint_Object*)val)->value;
-    else
+    PyObject* seq = PySequence_Fast(items, "items must be an iterable");
+    if ( seq == NULL )
+        return -1;
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+    for ( Py_ssize_t i = 0; i < size; ++i )
     {
-        long version = PyLong_AsLong(val);
-        if ( version == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.version = (jint)version;
+        PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+        PyObject* conv = NULL;
+        if ( convert != NULL )
+        {
+            if ( (conv = PyObject_CallOneArg(convert, item)) == NULL )
+                goto error;
+            item = conv;
+        }
+        jobject value;
+        if ( ! as_jobject(item, &value) )
+        {
+            Py_XDECREF(conv);
+            goto error;
+        }
+        (*jenv)->SetObjectArrayElement(jenv, array, start + (jsize)i, value);
+        if ( conv != NULL )
+        {
+            if ( value ) (*jenv)->DeleteLocalRef(jenv, value);
+            Py_DECREF(conv);
+        }
+        if ( (*jenv)->ExceptionCheck(jenv) )
+            break;
     }
+    Py_DECREF(seq);
     return 0;
+error:
+    Py_DECREF(seq);
+    return -1;
 }
 
-static PyObject* JavaVMInitArgs_nOptions_get(JavaVMInitArgs_Object* self)
-{
-    return PyLong_FromLong((long)self->this.nOptions);
-}
-
-static int JavaVMInitArgs_nOptions_set(JavaVMInitArgs_Object* self, PyObject* val)
+// Returns a new java.lang.String[] of a sequence of str (or None).
+// Returns NULL (with a pending Java exception or a Python error).
+static jobjectArray new_string_array(JNIEnv* jenv, PyObject* strings)
 {
-    if ( PyObject_TypeCheck(val, &jint_Type) )
-        self->this.nOptions = ((jint_Object*)val)->value;
-    else
+    PyObject* seq = PySequence_Fast(strings, "strings must be an iterable");
+    if ( seq == NULL )
+        return NULL;
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+    jobjectArray array = NULL;
+    jclass String = (*jenv)->FindClass(jenv, "java/lang/String");
+    if ( String == NULL )
+        goto done;
+    array = (*jenv)->NewObjectArray(jenv, (jsize)size, String, NULL);
+    (*jenv)->DeleteLocalRef(jenv, String);
+    if ( array == NULL )
+        goto done;
+    for ( Py_ssize_t i = 0; i < size; ++i )
     {
-        long nOptions = PyLong_AsLong(val);
-        if ( nOptions == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.nOptions = (jint)nOptions;
+        PyObject* item = PySequence_Fast_GET_ITEM(seq, i);
+        jstring value;
+        if ( item == Py_None )
+            continue;
+        if ( ! PyUnicode_Check(item) )
+        {
+            PyErr_Format(PyExc_TypeError, "expected str or None, got %.200s",
+                         Py_TYPE(item)->tp_name);
+            goto error;
+        }
+        Py_ssize_t length = PyUnicode_GET_LENGTH(item);
+        if ( PyUnicode_IS_ASCII(item) &&
+             strlen((const char*)PyUnicode_DATA(item)) == (size_t)length )
+        {
+            // ASCII without NUL is also (modified) UTF-8.
+            value = (*jenv)->NewStringUTF(jenv, (const char*)PyUnicode_DATA(item));
+        }
+        else
+        {
+            PyObject* data = PyUnicode_AsEncodedString(item,
+                                 PY_LITTLE_ENDIAN ? "utf-16-le" : "utf-16-be",
+                                 "surrogatepass");
+            if ( data == NULL )
+                goto error;
+            value = (*jenv)->NewString(jenv, (const jchar*)PyBytes_AS_STRING(data),
+                                       (jsize)(PyBytes_GET_SIZE(data) / sizeof(jchar)));
+            Py_DECREF(data);
+        }
+        if ( value == NULL )
+            goto error;
+        (*jenv)->SetObjectArrayElement(jenv, array, (jsize)i, value);
+        (*jenv)->DeleteLocalRef(jenv, value);
     }
-    return 0;
+    goto done;
+error:
+    (*jenv)->DeleteLocalRef(jenv, array);
+    array = NULL;
+done:
+    Py_DECREF(seq);
+    return array;
+}
+
+JNIENV_METHOD(SetObjectArrayElement)
+{
+    static char* kwlist[] = {"array", "index", "value", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobjectArray array; jsize index; jobject value;
+    PARSE_ARGS("O&O&O&", as_jobject, &array, as_jsize, &index, as_jobject, &value);
+    (*jenv)->SetObjectArrayElement(jenv, array, index, value);
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static PyObject* JavaVMInitArgs_options_get(JavaVMInitArgs_Object* self)
+JNIENV_METHOD(SetObjectArrayElements)
 {
-    if ( self->this.options == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyLong_FromVoidPtr((void*)self->this.options);
+    static char* kwlist[] = {"array", "start", "items", "convert", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobjectArray array; jsize start; PyObject* items; PyObject* convert = Py_None;
+    PARSE_ARGS("O&O&O|O", as_jobject, &array, as_jsize, &start, &items, &convert);
+    if ( fill_object_array(jenv, array, start, items,
+                           convert != Py_None ? convert : NULL) < 0 ) return NULL;
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static int JavaVMInitArgs_options_set(JavaVMInitArgs_Object* self, PyObject* val)
-{
-    if ( PyObject_TypeCheck(val, &jobject_Type) )
-        self->this.options = (JavaVMOption*)((jobject_Object*)val)->value;
-    else
-    {
-        int not_None = (val != Py_None);
-        void* value = not_None ? PyLong_AsVoidPtr(val) : NULL;
-        if ( not_None && value == NULL )
-            return -1;
-        self->this.options = (JavaVMOption*)value;
-    }
-    return 0;
+JNIENV_METHOD(NewStringArray)
+{
+    static char* kwlist[] = {"strings", NULL};
+    JNIEnv* jenv = self->jenv;
+    PyObject* strings;
+    PARSE_ARGS("O", &strings);
+    jobjectArray ret = new_string_array(jenv, strings);
+    if ( ret == NULL && PyErr_Occurred() ) return NULL;
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
+}
+
+#define JNIENV_ARRAY(Type, jtype)                                                   \
+JNIENV_METHOD(New##Type##Array)                                                     \
+{                                                                                   \
+    static char* kwlist[] = {"size", NULL};                                         \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jsize size;                                                                     \
+    PARSE_ARGS("O&", as_jsize, &size);                                              \
+    jtype##Array ret = (*jenv)->New##Type##Array(jenv, size);                       \
+    CHECK_EXCEPTION_IF(! ret);                                                      \
+    return jobject_result(ret);                                                     \
+}                                                                                   \
+                                                                                    \
+JNIENV_METHOD(Get##Type##ArrayElements)                                             \
+{                                                                                   \
+    static char* kwlist[] = {"array", "isCopy", NULL};                              \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jtype##Array array; jboolean* isCopy = NULL;                                    \
+    PARSE_ARGS("O&|O&", as_jobject, &array, as_pointer, &isCopy);                   \
+    jtype* ret = (*jenv)->Get##Type##ArrayElements(jenv, array, isCopy);            \
+    CHECK_EXCEPTION_IF(! ret);                                                      \
+    return pointer_result(ret);                                                     \
+}                                                                                   \
+                                                                                    \
+JNIENV_METHOD(Release##Type##ArrayElements)                                         \
+{                                                                                   \
+    static char* kwlist[] = {"array", "elems", "mode", NULL};                       \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jtype##Array array; jtype* elems; jint mode = 0;                                \
+    PARSE_ARGS("O&O&|O&", as_jobject, &array, as_pointer, &elems, as_jint, &mode);  \
+    (*jenv)->Release##Type##ArrayElements(jenv, array, elems, mode);                \
+    CHECK_EXCEPTION();                                                              \
+    Py_RETURN_NONE;                                                                 \
+}                                                                                   \
+                                                                                    \
+JNIENV_METHOD(Get##Type##ArrayRegion)                                               \
+{                                                                                   \
+    static char* kwlist[] = {"array", "start", "size", "buf", NULL};                \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jtype##Array array; jsize start, size; jtype* buf;                              \
+    PARSE_ARGS("O&O&O&O&", as_jobject, &array, as_jsize, &start, as_jsize, &size,   \
+                           as_pointer, &buf);                                       \
+    (*jenv)->Get##Type##ArrayRegion(jenv, array, start, size, buf);                 \
+    CHECK_EXCEPTION();                                                              \
+    Py_RETURN_NONE;                                                                 \
+}                                                                                   \
+                                                                                    \
+JNIENV_METHOD(Set##Type##ArrayRegion)                                               \
+{                                                                                   \
+    static char* kwlist[] = {"array", "start", "size", "buf", NULL};                \
+    JNIEnv* jenv = self->jenv;                                                      \
+    jtype##Array array; jsize start, size; const jtype* buf;                        \
+    PARSE_ARGS("O&O&O&O&", as_jobject, &array, as_jsize, &start, as_jsize, &size,   \
+                           as_pointer, &buf);                                       \
+    (*jenv)->Set##Type##ArrayRegion(jenv, array, start, size, buf);                 \
+    CHECK_EXCEPTION();                                                              \
+    Py_RETURN_NONE;                                                                 \
+}
+
+JNIENV_ARRAY(Boolean, jboolean)
+JNIENV_ARRAY(Byte,    jbyte)
+JNIENV_ARRAY(Char,    jchar)
+JNIENV_ARRAY(Short,   jshort)
+JNIENV_ARRAY(Int,     jint)
+JNIENV_ARRAY(Long,    jlong)
+JNIENV_ARRAY(Float,   jfloat)
+JNIENV_ARRAY(Double,  jdouble)
+
+// ... in a critical manner
+
+JNIENV_METHOD(GetPrimitiveArrayCritical)
+{
+    static char* kwlist[] = {"array", "isCopy", NULL};
+    JNIEnv* jenv = self->jenv;
+    jarray array; jboolean* isCopy = NULL;
+    PARSE_ARGS("O&|O&", as_jobject, &array, as_pointer, &isCopy);
+    void* ret = (*jenv)->GetPrimitiveArrayCritical(jenv, array, isCopy);
+    CHECK_EXCEPTION();
+    return pointer_result(ret);
+}
+
+JNIENV_METHOD(ReleasePrimitiveArrayCritical)
+{
+    static char* kwlist[] = {"array", "carray", "mode", NULL};
+    JNIEnv* jenv = self->jenv;
+    jarray array; void* carray; jint mode = 0;
+    PARSE_ARGS("O&O&|O&", as_jobject, &array, as_pointer, &carray, as_jint, &mode);
+    (*jenv)->ReleasePrimitiveArrayCritical(jenv, array, carray, mode);
+    CHECK_EXCEPTION();
+    Py_RETURN_NONE;
 }
 
-static PyObject* JavaVMInitArgs_ignoreUnrecognized_get(JavaVMInitArgs_Object* self)
-{
-    return PyLong_FromLong((long)self->this.ignoreUnrecognized);
-}
+// Java native methods handling
 
-static int JavaVMInitArgs_ignoreUnrecognized_set(JavaVMInitArgs_Object* self, PyObject* val)
+JNIENV_METHOD(RegisterNatives)
 {
-    if ( PyObject_TypeCheck(val, &jboolean_Type) )
-        self->this.ignoreUnrecognized = ((jboolean_Object*)val)->value;
-    else
-    {
-        long value = PyLong_AsLong(val);
-        if ( value == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.ignoreUnrecognized = (jboolean)value;
-    }
-    return 0;
+    static char* kwlist[] = {"clazz", "methods", "nMethods", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz; const JNINativeMethod* methods; jint nMethods;
+    PARSE_ARGS("O&O&O&", as_jobject, &clazz, as_pointer, &methods, as_jint, &nMethods);
+    // Required due to bug in jvm:
+    // https://bugs.java.com/bugdatabase/view_bug.do?bug_id=6493522
+    (*jenv)->GetMethodID(jenv, clazz, "notify", "()V");
+    jint ret = (*jenv)->RegisterNatives(jenv, clazz, methods, nMethods);
+    CHECK_EXCEPTION_IF(ret != 0);
+    return jint_result(ret);
 }
 
-static PyGetSetDef JavaVMInitArgs_getsets[] =
+JNIENV_METHOD(UnregisterNatives)
 {
-    {"version",            (getter)JavaVMInitArgs_version_get,
-                           (setter)JavaVMInitArgs_version_set},
-    {"nOptions",           (getter)JavaVMInitArgs_nOptions_get,
-                           (setter)JavaVMInitArgs_nOptions_set},
-    {"options",            (getter)JavaVMInitArgs_options_get,
-                           (setter)JavaVMInitArgs_options_set},
-    {"ignoreUnrecognized", (getter)JavaVMInitArgs_ignoreUnrecognized_get,
-                           (setter)JavaVMInitArgs_ignoreUnrecognized_set},
-    {NULL}
-};
-
-PyTypeObject JavaVMInitArgs_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "JavaVMInitArgs",
-    .tp_basicsize = sizeof(JavaVMInitArgs_Object),/* tp_basicsize */
-    .tp_itemsize  = member_size(JavaVMInitArgs_Object, this),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_getset    = JavaVMInitArgs_getsets,
-    .tp_new       = PyType_GenericNew,
-};
-
-//---- JavaVMAttachArgs ----//
+    static char* kwlist[] = {"clazz", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass clazz;
+    PARSE_ARGS("O&", as_jobject, &clazz);
+    jint ret = (*jenv)->UnregisterNatives(jenv, clazz);
+    CHECK_EXCEPTION_IF(ret != 0);
+    return jint_result(ret);
+}
 
-typedef struct {
-    PyObject_HEAD
-    JavaVMAttachArgs this;
-} JavaVMAttachArgs_Object;
+// Java object monitoring
 
-static PyObject* JavaVMAttachArgs_version_get(JavaVMAttachArgs_Object* self)
+JNIENV_METHOD(MonitorEnter)
 {
-    return PyLong_FromLong((long)self->this.version);
+    static char* kwlist[] = {"obj", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj; jint ret;
+    PARSE_ARGS("O&", as_jobject, &obj);
+    Py_BEGIN_ALLOW_THREADS
+    ret = (*jenv)->MonitorEnter(jenv, obj);
+    Py_END_ALLOW_THREADS
+    CHECK_EXCEPTION_IF(ret != 0);
+    return jint_result(ret);
 }
 
-static int JavaVMAttachArgs_version_set(JavaVMAttachArgs_Object* self, PyObject* val)
+JNIENV_METHOD(MonitorExit)
 {
-    if ( PyObject_TypeCheck(val, &jint_Type) )
-        self->this.version = ((jint_Object*)val)->value;
-    else
-    {
-        long version = PyLong_AsLong(val);
-        if ( version == -1 && PyErr_Occurred() )
-            return -1;
-        self->this.version = (jint)version;
-    }
-    return 0;
+    static char* kwlist[] = {"obj", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject obj;
+    PARSE_ARGS("O&", as_jobject, &obj);
+    jint ret = (*jenv)->MonitorExit(jenv, obj);
+    CHECK_EXCEPTION_IF(ret != 0);
+    return jint_result(ret);
 }
 
-static PyObject* JavaVMAttachArgs_name_get(JavaVMAttachArgs_Object* self)
+// Java direct buffer handling
+
+JNIENV_METHOD(NewDirectByteBuffer)
 {
-    if ( self->this.name == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyBytes_FromString(self->this.name);
+    static char* kwlist[] = {"address", "capacity", NULL};
+    JNIEnv* jenv = self->jenv;
+    void* address; jlong capacity;
+    PARSE_ARGS("O&O&", as_pointer, &address, as_jlong, &capacity);
+    jobject ret = (*jenv)->NewDirectByteBuffer(jenv, address, capacity);
+    CHECK_EXCEPTION_IF(! ret);
+    return jobject_result(ret);
 }
 
-static int JavaVMAttachArgs_name_set(JavaVMAttachArgs_Object* self, PyObject* val)
+JNIENV_METHOD(GetDirectBufferAddress)
 {
-    int not_None = (val != Py_None);
-    char* name = not_None ? PyBytes_AsString(val) : NULL;
-    if ( not_None && name == NULL )
-        return -1;
-    self->this.name = name;
-    return 0;
+    static char* kwlist[] = {"buf", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject buf;
+    PARSE_ARGS("O&", as_jobject, &buf);
+    void* ret = (*jenv)->GetDirectBufferAddress(jenv, buf);
+    CHECK_EXCEPTION_IF(! ret);
+    return pointer_result(ret);
 }
 
-static PyObject* JavaVMAttachArgs_group_get(JavaVMAttachArgs_Object* self)
+JNIENV_METHOD(GetDirectBufferCapacity)
 {
-    if ( self->this.group == NULL )
-        Py_RETURN_NONE;
-    else
-        return PyLong_FromVoidPtr((void*)self->this.group);
+    static char* kwlist[] = {"buf", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject buf;
+    PARSE_ARGS("O&", as_jobject, &buf);
+    jlong ret = (*jenv)->GetDirectBufferCapacity(jenv, buf);
+    CHECK_EXCEPTION();
+    return jlong_result(ret);
 }
 
-static int JavaVMAttachArgs_group_set(JavaVMAttachArgs_Object* self, PyObject* val)
+// Java reflection support
+
+JNIENV_METHOD(FromReflectedMethod)
 {
-    if ( PyObject_TypeCheck(val, &jobject_Type) )
-        self->this.group = ((jobject_Object*)val)->value;
-    else
-    {
-        int not_None = (val != Py_None);
-        void* group = not_None ? PyLong_AsVoidPtr(val) : NULL;
-        if ( not_None && group == NULL )
-            return -1;
-        self->this.group = (jobject)group;
-    }
-    return 0;
+    static char* kwlist[] = {"method", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject method;
+    PARSE_ARGS("O&", as_jobject, &method);
+    jmethodID ret = (*jenv)->FromReflectedMethod(jenv, method);
+    CHECK_EXCEPTION();
+    return jobject_result(ret);
 }
 
-static PyGetSetDef JavaVMAttachArgs_getsets[] =
+JNIENV_METHOD(FromReflectedField)
 {
-    {"version", (getter)JavaVMAttachArgs_version_get,
-                (setter)JavaVMAttachArgs_version_set},
-    {"name",    (getter)JavaVMAttachArgs_name_get,
-                (setter)JavaVMAttachArgs_name_set},
-    {"group",   (getter)JavaVMAttachArgs_group_get,
-                (setter)JavaVMAttachArgs_group_set},
-    {NULL}
-};
-
-PyTypeObject JavaVMAttachArgs_Type = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name      = "JavaVMAttachArgs",
-    .tp_basicsize = sizeof(JavaVMAttachArgs_Object),
-    .tp_itemsize  = member_size(JavaVMAttachArgs_Object, this),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
-    .tp_getset    = JavaVMAttachArgs_getsets,
-    .tp_new       = PyType_GenericNew,
-};
-
-//-------------- JNIEnv --------------//
-
-typedef struct {
-    PyObject_HEAD
-    JNIEnv this; // JNIEnv* jenv; ???
-} JNIEnv_Object;
+    static char* kwlist[] = {"field", NULL};
+    JNIEnv* jenv = self->jenv;
+    jobject field;
+    PARSE_ARGS("O&", as_jobject, &field);
+    jfieldID ret = (*jenv)->FromReflectedField(jenv, field);
+    CHECK_EXCEPTION();
+    return jobject_result(ret);
+}
 
-static PyObject* _handle_JNIException(jint err)
+JNIENV_METHOD(ToReflectedMethod)
 {
-    //import sys
-    //fun_name = sys._getframe(1).f_code.co_name
-    //raise JNIException(err, info=fun_name)
-    return NULL;
+    static char* kwlist[] = {"cls", "methodID", "isStatic", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass cls; jmethodID methodID; jboolean isStatic;
+    PARSE_ARGS("O&O&O&", as_jobject, &cls, as_pointer, &methodID, as_jboolean, &isStatic);
+    jobject ret = (*jenv)->ToReflectedMethod(jenv, cls, methodID, isStatic);
+    CHECK_EXCEPTION();
+    return jobject_result(ret);
 }
 
-static PyObject* _handle_JavaException(JNIEnv_Object* self)
-{
-    //fun = self.functions[0]
-    //jthr = fun.ExceptionOccurred(self)
-    //fun.ExceptionClear(self)
-    //jexc = fun.NewGlobalRef(self, jthr)
-    //fun.DeleteLocalRef(self, jthr)
-    //if Throwable.last:
-    //    cause = Throwable.last.getCause()
-    //    if cause: fun.DeleteGlobalRef(self, cause)
-    //    Throwable.last = None
-    //fun.ExceptionClear(self)
-    //Throwable.last = thr = Throwable(jexc)#!!!, fname)
-    //raise thr
-    return NULL;
+JNIENV_METHOD(ToReflectedField)
+{
+    static char* kwlist[] = {"cls", "fieldID", "isStatic", NULL};
+    JNIEnv* jenv = self->jenv;
+    jclass cls; jfieldID fieldID; jboolean isStatic;
+    PARSE_ARGS("O&O&O&", as_jobject, &cls, as_pointer, &fieldID, as_jboolean, &isStatic);
+    jobject ret = (*jenv)->ToReflectedField(jenv, cls, fieldID, isStatic);
+    CHECK_EXCEPTION();
+    return jobject_result(ret);
 }
 
-// Java version
+// Java VM Interface
 
-static PyObject* GetVersion(JNIEnv_Object* self)
+JNIENV_METHOD(GetJavaVM)
 {
-    JNIEnv jenv = self->this;
-    jint ret = jenv->GetVersion(&jenv);
-    return PyLong_FromLong((long)ret);
+    static char* kwlist[] = {"vm", NULL};
+    JNIEnv* jenv = self->jenv;
+    void* vm;
+    PARSE_ARGS("O&", as_address, &vm);
+    jint ret = (*jenv)->GetJavaVM(jenv, (JavaVM**)vm);
+    CHECK_JNI_ERROR("GetJavaVM");
+    Py_RETURN_NONE;
 }
 
-// JNIEnv* env; 
-// return env->functions->CallObjectMethodA(env, obj, mid, val); 
-//
-// jstring v = (*jenv)->CallObjectMethodA(jenv, objectRef, method->mid, jArgs);
+#define JNIENV_ENTRY(name) \
+    {#name, (PyCFunction)(void(*)(void))JNIEnv_##name, METH_VARARGS | METH_KEYWORDS, NULL}
+#define JNIENV_NOARGS_ENTRY(name) \
+    {#name, (PyCFunction)JNIEnv_##name, METH_NOARGS, NULL}
+
+#define JNIENV_TYPED_ENTRIES(Type)                        \
+    JNIENV_ENTRY(Call##Type##Method),                     \
+    JNIENV_ENTRY(CallNonvirtual##Type##Method),           \
+    JNIENV_ENTRY(CallStatic##Type##Method),               \
+    JNIENV_ENTRY(Get##Type##Field),                       \
+    JNIENV_ENTRY(Set##Type##Field),                       \
+    JNIENV_ENTRY(GetStatic##Type##Field),                 \
+    JNIENV_ENTRY(SetStatic##Type##Field)
 
-//PyObject* JMethod_is_param_mutable(JPy_JMethod* self, PyObject* args)
-//{
-//    int index;
-//    int value;
-//    if (!PyArg_ParseTuple(args, "i:is_param_mutable", &index)) {
-//        return NULL;
-//    }
-//    JMethod_CHECK_PARAMETER_INDEX(self, index);
-//    value = self->paramDescriptors[index].isMutable;
-//    return PyBool_FromLong(value);
-//}
+#define JNIENV_ARRAY_ENTRIES(Type)                        \
+    JNIENV_ENTRY(New##Type##Array),                       \
+    JNIENV_ENTRY(Get##Type##ArrayElements),               \
+    JNIENV_ENTRY(Release##Type##ArrayElements),           \
+    JNIENV_ENTRY(Get##Type##ArrayRegion),                 \
+    JNIENV_ENTRY(Set##Type##ArrayRegion)
 
 static PyMethodDef JNIEnv_methods[] = {
-    {"GetVersion",    (PyCFunction)GetVersion, METH_NOARGS, NULL},
-//    {"get_param_type",    (PyCFunction)JNIEnv_get_param_type,    METH_VARARGS, "Gets the type of the parameter given by index"},
+    // Java version
+    JNIENV_NOARGS_ENTRY(GetVersion),
+    // Java class handling
+    JNIENV_ENTRY(DefineClass),
+    JNIENV_ENTRY(FindClass),
+    JNIENV_ENTRY(GetSuperclass),
+    JNIENV_ENTRY(IsAssignableFrom),
+    // Java exceptions handling
+    JNIENV_ENTRY(Throw),
+    JNIENV_ENTRY(ThrowNew),
+    JNIENV_NOARGS_ENTRY(ExceptionOccurred),
+    JNIENV_NOARGS_ENTRY(ExceptionDescribe),
+    JNIENV_NOARGS_ENTRY(ExceptionClear),
+    JNIENV_ENTRY(FatalError),
+    JNIENV_NOARGS_ENTRY(ExceptionCheck),
+    // JVM Call frame
+    JNIENV_ENTRY(PushLocalFrame),
+    JNIENV_ENTRY(PopLocalFrame),
+    // Java references handling
+    JNIENV_ENTRY(NewGlobalRef),
+    JNIENV_ENTRY(DeleteGlobalRef),
+    JNIENV_ENTRY(NewLocalRef),
+    JNIENV_ENTRY(DeleteLocalRef),
+    JNIENV_ENTRY(NewWeakGlobalRef),
+    JNIENV_ENTRY(DeleteWeakGlobalRef),
+    JNIENV_ENTRY(DeleteGlobalRefs),
+    JNIENV_ENTRY(DeleteLocalRefs),
+    JNIENV_ENTRY(DeleteWeakGlobalRefs),
+    JNIENV_ENTRY(EnsureLocalCapacity),
+    // Java objects handling
+    JNIENV_ENTRY(AllocObject),
+    JNIENV_ENTRY(NewObject),
+    JNIENV_ENTRY(GetObjectClass),
+    JNIENV_ENTRY(GetObjectRefType),
+    JNIENV_ENTRY(IsInstanceOf),
+    JNIENV_ENTRY(IsSameObject),
+    // Java methods and fields
+    JNIENV_ENTRY(GetMethodID),
+    JNIENV_ENTRY(GetFieldID),
+    JNIENV_ENTRY(GetStaticMethodID),
+    JNIENV_ENTRY(GetStaticFieldID),
+    JNIENV_TYPED_ENTRIES(Object),
+    JNIENV_TYPED_ENTRIES(Boolean),
+    JNIENV_TYPED_ENTRIES(Byte),
+    JNIENV_TYPED_ENTRIES(Char),
+    JNIENV_TYPED_ENTRIES(Short),
+    JNIENV_TYPED_ENTRIES(Int),
+    JNIENV_TYPED_ENTRIES(Long),
+    JNIENV_TYPED_ENTRIES(Float),
+    JNIENV_TYPED_ENTRIES(Double),
+    JNIENV_ENTRY(CallVoidMethod),
+    JNIENV_ENTRY(CallNonvirtualVoidMethod),
+    JNIENV_ENTRY(CallStaticVoidMethod),
+    JNIENV_ENTRY(CallMethodsA),
+    JNIENV_ENTRY(RunProgram),
+    // Java strings handling
+    JNIENV_ENTRY(NewString),
+    JNIENV_ENTRY(GetStringLength),
+    JNIENV_ENTRY(GetStringChars),
+    JNIENV_ENTRY(ReleaseStringChars),
+    JNIENV_ENTRY(NewStringUTF),
+    JNIENV_ENTRY(GetStringUTFLength),
+    JNIENV_ENTRY(GetStringUTFChars),
+    JNIENV_ENTRY(ReleaseStringUTFChars),
+    JNIENV_ENTRY(GetStringRegion),
+    JNIENV_ENTRY(GetStringUTFRegion),
+    JNIENV_ENTRY(GetStringCritical),
+    JNIENV_ENTRY(ReleaseStringCritical),
+    // Java arrays handling
+    JNIENV_ENTRY(GetArrayLength),
+    JNIENV_ENTRY(NewObjectArray),
+    JNIENV_ENTRY(GetObjectArrayElement),
+    JNIENV_ENTRY(SetObjectArrayElement),
+    JNIENV_ENTRY(SetObjectArrayElements),
+    JNIENV_ENTRY(NewStringArray),
+    JNIENV_ARRAY_ENTRIES(Boolean),
+    JNIENV_ARRAY_ENTRIES(Byte),
+    JNIENV_ARRAY_ENTRIES(Char),
+    JNIENV_ARRAY_ENTRIES(Short),
+    JNIENV_ARRAY_ENTRIES(Int),
+    JNIENV_ARRAY_ENTRIES(Long),
+    JNIENV_ARRAY_ENTRIES(Float),
+    JNIENV_ARRAY_ENTRIES(Double),
+    JNIENV_ENTRY(GetPrimitiveArrayCritical),
+    JNIENV_ENTRY(ReleasePrimitiveArrayCritical),
+    // Java native methods handling
+    JNIENV_ENTRY(RegisterNatives),
+    JNIENV_ENTRY(UnregisterNatives),
+    // Java object monitoring
+    JNIENV_ENTRY(MonitorEnter),
+    JNIENV_ENTRY(MonitorExit),
+    // Java direct buffer handling
+    JNIENV_ENTRY(NewDirectByteBuffer),
+    JNIENV_ENTRY(GetDirectBufferAddress),
+    JNIENV_ENTRY(GetDirectBufferCapacity),
+    // Java reflection support
+    JNIENV_ENTRY(FromReflectedMethod),
+    JNIENV_ENTRY(FromReflectedField),
+    JNIENV_ENTRY(ToReflectedMethod),
+    JNIENV_ENTRY(ToReflectedField),
+    // Java VM Interface
+    JNIENV_ENTRY(GetJavaVM),
     {NULL}
 };
 
@@ -1269,107 +2244,119 @@ PyTypeObject JNIEnv_Type = {
     PyVarObject_HEAD_INIT(NULL, 0)
     .tp_name      = "JNIEnv",
     .tp_basicsize = sizeof(JNIEnv_Object),
-    .tp_itemsize  = member_size(JNIEnv_Object, this),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
+    .tp_flags     = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
     .tp_methods   = JNIEnv_methods,
+    .tp_init      = (initproc)JNIEnv_init,
+    .tp_new       = PyType_GenericNew,
 };
 
 //-------------- JavaVM --------------//
 
 typedef struct {
     PyObject_HEAD
-    JavaVM this; // JavaVM* jvm; ???
+    JavaVM* jvm;
 } JavaVM_Object;
 
-/*
-def AttachCurrentThread(self, penv, args=None):
-    fun = self.functions[0]
-    ret = fun.AttachCurrentThread(self, penv, args)
-    if ret != JNI_OK: self._handle_JNIException(ret)
-
-def AttachCurrentThreadAsDaemon(self, penv, args=None):
-    fun = self.functions[0]
-    ret = fun.AttachCurrentThreadAsDaemon(self, penv, args)
-    if ret != JNI_OK: self._handle_JNIException(ret)
-
-def GetEnv(self, penv, version):
-    fun = self.functions[0]
-    ret = fun.GetEnv(self, penv, version)
-    if ret != JNI_OK: self._handle_JNIException(ret)
-
-	JavaVM* s_JavaVM = NULL;
-	JNIEnv* env;
-	jint res = s_JavaVM->functions->AttachCurrentThread(s_JavaVM, (void**) &env, NULL);
-	if (res != JNI_OK)
-		JP_RAISE_RUNTIME_ERROR("Unable to attach to thread");
+static int JavaVM_init(JavaVM_Object* self, PyObject* args)
+{
+    // JavaVM(pjvm)
+    void* pjvm = NULL;
+    if ( ! PyArg_ParseTuple(args, "O&", as_pointer, &pjvm) )
+        return -1;
+    if ( pjvm == NULL )
+    {
+        PyErr_SetString(PyExc_ValueError, "NULL pointer access");
+        return -1;
+    }
+    self->jvm = (JavaVM*)pjvm;
+    return 0;
+}
 
-*/
+#define JAVAVM_METHOD(name) \
+    static PyObject* JavaVM_##name(JavaVM_Object* self, PyObject* args, PyObject* kwargs)
 
-static PyObject* DestroyJavaVM(JavaVM_Object* self)
+static PyObject* JavaVM_DestroyJavaVM(JavaVM_Object* self, PyObject* Py_UNUSED(ignored))
 {
-    // jint (JNICALL *DestroyJavaVM)(JavaVM *vm);
-    JavaVM* jvm = &self->this;
-    jint ret = (*jvm)->DestroyJavaVM(jvm);
-    if ( ret != JNI_OK ) return _handle_JNIException(ret);
+    JavaVM* jvm = self->jvm;
+    jint ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = (*jvm)->DestroyJavaVM(jvm);
+    Py_END_ALLOW_THREADS
+    if ( ret != JNI_OK ) return _handle_JNIException((PyObject*)self, ret, "DestroyJavaVM");
     Py_RETURN_NONE;
 }
 
-static PyObject* AttachCurrentThread(JavaVM_Object* self, PyObject* args)
+JAVAVM_METHOD(AttachCurrentThread)
 {
-    // jint (JNICALL *AttachCurrentThread)(JavaVM *vm, void **penv, void *args);
-    PyObject* penv;
-    if ( ! PyArg_ParseTuple(args, "O", &penv) )
-        return NULL;
-    JavaVM* jvm = &self->this;
-    JNIEnv* jenv;
-    jint ret = (*jvm)->AttachCurrentThread(jvm, (void**)&jenv, NULL);
-    if ( ret != JNI_OK ) return _handle_JNIException(ret);
+    static char* kwlist[] = {"penv", "args", NULL};
+    JavaVM* jvm = self->jvm;
+    void* penv; void* attach_args = NULL; jint ret;
+    PARSE_ARGS("O&|O&", as_address, &penv, as_pointer, &attach_args);
+    Py_BEGIN_ALLOW_THREADS
+    ret = (*jvm)->AttachCurrentThread(jvm, (void**)penv, attach_args);
+    Py_END_ALLOW_THREADS
+    if ( ret != JNI_OK ) return _handle_JNIException((PyObject*)self, ret, "AttachCurrentThread");
     Py_RETURN_NONE;
 }
 
-static PyObject* AttachCurrentThreadAsDaemon(JavaVM_Object* self, PyObject* args)
+JAVAVM_METHOD(AttachCurrentThreadAsDaemon)
 {
-    //jint (JNICALL *AttachCurrentThreadAsDaemon)(JavaVM *vm, void **penv, void *args);
-    PyObject* penv;
-    if ( ! PyArg_ParseTuple(args, "O", &penv) )
-        return NULL;
-    JavaVM* jvm = &self->this;
-    JNIEnv* jenv;
-    jint ret = (*jvm)->AttachCurrentThreadAsDaemon(jvm, (void**)&jenv, NULL);
-    if ( ret != JNI_OK ) return _handle_JNIException(ret);
+    static char* kwlist[] = {"penv", "args", NULL};
+    JavaVM* jvm = self->jvm;
+    void* penv; void* attach_args = NULL; jint ret;
+    PARSE_ARGS("O&|O&", as_address, &penv, as_pointer, &attach_args);
+    Py_BEGIN_ALLOW_THREADS
+    ret = (*jvm)->AttachCurrentThreadAsDaemon(jvm, (void**)penv, attach_args);
+    Py_END_ALLOW_THREADS
+    if ( ret != JNI_OK ) return _handle_JNIException((PyObject*)self, ret,
+                                                     "AttachCurrentThreadAsDaemon");
     Py_RETURN_NONE;
 }
 
-static PyObject* DetachCurrentThread(JavaVM_Object* self)
+static PyObject* JavaVM_DetachCurrentThread(JavaVM_Object* self, PyObject* Py_UNUSED(ignored))
 {
-    // jint (JNICALL *DetachCurrentThread)(JavaVM *vm);
-    JavaVM* jvm = &self->this;
-    jint ret = (*jvm)->DetachCurrentThread(jvm);
-    if ( ret != JNI_OK ) return _handle_JNIException(ret);
+    JavaVM* jvm = self->jvm;
+    jint ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = (*jvm)->DetachCurrentThread(jvm);
+    Py_END_ALLOW_THREADS
+    if ( ret != JNI_OK ) return _handle_JNIException((PyObject*)self, ret, "DetachCurrentThread");
     Py_RETURN_NONE;
 }
 
-static PyObject* GetEnv(JavaVM_Object* self, PyObject* args)
+JAVAVM_METHOD(GetEnv)
 {
-    // jint (JNICALL *GetEnv)(JavaVM *vm, void **penv, jint version);
-    PyObject* penv;
-    long version;
-    if ( ! PyArg_ParseTuple(args, "Ol", &penv, &version) )
-        return NULL;
-  //JNIEnv* jenv = ((JNIEnv*)penv)->this;
-    JavaVM* jvm = &self->this;
-    JNIEnv* jenv;
-    jint ret = (*jvm)->GetEnv(jvm, (void **)&jenv, (jint)version);
-    return PyLong_FromLong((long)ret);
+    static char* kwlist[] = {"penv", "version", NULL};
+    JavaVM* jvm = self->jvm;
+    void* penv; jint version;
+    PARSE_ARGS("O&O&", as_address, &penv, as_jint, &version);
+    jint ret = (*jvm)->GetEnv(jvm, (void**)penv, version);
+    if ( ret != JNI_OK ) return _handle_JNIException((PyObject*)self, ret, "GetEnv");
+    Py_RETURN_NONE;
 }
 
+#define JAVAVM_ENTRY(name) \
+    {#name, (PyCFunction)(void(*)(void))JavaVM_##name, METH_VARARGS | METH_KEYWORDS, NULL}
+#define JAVAVM_NOARGS_ENTRY(name) \
+    {#name, (PyCFunction)JavaVM_##name, METH_NOARGS, NULL}
+
 static PyMethodDef JavaVM_methods[] = {
-    {"DestroyJavaVM",               (PyCFunction)DestroyJavaVM,               METH_NOARGS},
-    {"AttachCurrentThread",         (PyCFunction)AttachCurrentThread,         METH_VARARGS},
-    {"AttachCurrentThreadAsDaemon", (PyCFunction)AttachCurrentThreadAsDaemon, METH_VARARGS},
-    {"DetachCurrentThread",         (PyCFunction)DetachCurrentThread,         METH_NOARGS},
-    {"GetEnv",                      (PyCFunction)GetEnv,                      METH_VARARGS},
+    JAVAVM_NOARGS_ENTRY(DestroyJavaVM),
+    JAVAVM_ENTRY(AttachCurrentThread),
+    JAVAVM_ENTRY(AttachCurrentThreadAsDaemon),
+    JAVAVM_NOARGS_ENTRY(DetachCurrentThread),
+    JAVAVM_ENTRY(GetEnv),
+    {NULL}
+};
+
+static PyObject* JavaVM_get_address(JavaVM_Object* self, void* Py_UNUSED(closure))
+{
+    // The JavaVM* (several objects may wrap the same JavaVM).
+    return PyLong_FromVoidPtr(self->jvm);
+}
+
+static PyGetSetDef JavaVM_getset[] = {
+    {"_address", (getter)JavaVM_get_address, NULL, NULL, NULL},
     {NULL}
 };
 
@@ -1377,94 +2364,420 @@ PyTypeObject JavaVM_Type = {
     PyVarObject_HEAD_INIT(NULL, 0)
     .tp_name      = "JavaVM",
     .tp_basicsize = sizeof(JavaVM_Object),
-    .tp_itemsize  = member_size(JavaVM_Object, this),
-    .tp_flags     = Py_TPFLAGS_DEFAULT,
-    .tp_base      = &_CData_Type,
+    .tp_flags     = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
     .tp_methods   = JavaVM_methods,
+    .tp_getset    = JavaVM_getset,
+    .tp_init      = (initproc)JavaVM_init,
+    .tp_new       = PyType_GenericNew,
 };
 
-//------------------------------------//
+//-------------- fused ---------------//
 
-static PyObject* POINTER(PyObject* self, PyObject* cls)
-{
-    PyObject* result = NULL;
-    PyTypeObject* type;
-    char* name;
+// Fused entry points: the JNI function and the exception check in one
+// native call. They take the env (ctypes JNIEnv, cffi JNIEnv* or capi
+// JNIEnv) as the first argument, followed by the arguments of the JNIEnv
+// method of the same name, and return (value, pending_exception). They are
+// used by the ctypes and cffi backends when this extension is available.
 
-    // if ( ! PyType_Check(cls) )
-    if ( PyObject_IsInstance(cls, (PyObject*)&PyType_Type) <= 0 ||
-         PyType_IsSubtype((PyTypeObject*)cls, (PyTypeObject*)&_CData_Type) <= 0 )
+static int as_jenv(PyObject* obj, void* result)
+{
+    if ( PyObject_TypeCheck(obj, &JNIEnv_Type) )
     {
-        PyErr_SetString(PyExc_TypeError, "must be a jni type");
-        return NULL;
+        *(JNIEnv**)result = ((JNIEnv_Object*)obj)->jenv;
+        return 1;
     }
-
-    type = (PyTypeObject*)cls;
-    name = PyMem_Malloc(strlen(type->tp_name) + 3 + 1);
-    if ( name == NULL )
-        return PyErr_NoMemory();
-    sprintf(name, "LP_%s", type->tp_name);
-/* !!!
-    result = PyObject_CallFunction((PyObject*)Py_TYPE(&PyCPointer_Type),
-                                   "s(O){sO}", name, &PyCPointer_Type, "_type_", cls);
-    PyMem_Free(name);
-!!! */
-    if ( result == NULL )
-        return NULL;
-    return result;
-}
-
-static PyObject* pointer(PyObject* self, PyObject* obj)
-{
-    PyObject* result;
-    PyObject* type;
-    type = POINTER(NULL, (PyObject*)Py_TYPE(obj));
-    if ( type == NULL )
-        return NULL;
-    result = PyObject_CallFunctionObjArgs(type, obj, NULL);
-    Py_DECREF(type);
-    return result;
-}
-
-static PyObject* addressof(PyObject* self, PyObject* obj)
-{
-    if ( PyObject_IsInstance(obj, (PyObject*)&_CData_Type) <= 0 )
+    if ( ! as_pointer(obj, result) )
+        return 0;
+    if ( *(JNIEnv**)result == NULL )
     {
-        PyErr_SetString(PyExc_TypeError, "must be a jni type");
-        return NULL;
+        PyErr_SetString(PyExc_ValueError, "NULL pointer access");
+        return 0;
     }
-
-    return PyLong_FromVoidPtr((void*)&((_CData_Object*)obj)->this);
+    return 1;
 }
 
-static PyObject* size_of(PyObject* self, PyObject* obj_or_type)
+static PyObject* fused_result(JNIEnv* jenv, PyObject* value)
 {
-    if ( PyObject_IsInstance(obj_or_type, (PyObject*)&_CData_Type) > 0 )
-        return PyLong_FromSsize_t((Py_ssize_t)Py_TYPE(obj_or_type)->tp_itemsize);
-    else if ( PyObject_IsInstance(obj_or_type, (PyObject*)&PyType_Type) > 0 &&
-              PyType_IsSubtype((PyTypeObject*)obj_or_type, (PyTypeObject*)&_CData_Type) > 0 )
-        return PyLong_FromSsize_t((Py_ssize_t)((PyTypeObject*)obj_or_type)->tp_itemsize);
-    else
-    {
-        PyErr_SetString(PyExc_TypeError, "this type has no size");
+    if ( value == NULL )
         return NULL;
-    }
-}
-
-static PyMethodDef module_functions[] = {
-    {"POINTER",   (PyCFunction)POINTER,   METH_O},
-    {"pointer",   (PyCFunction)pointer,   METH_O},
-    {"addressof", (PyCFunction)addressof, METH_O},
-    {"sizeof",    (PyCFunction)size_of,   METH_O},
+    return Py_BuildValue("(NN)", value, PyBool_FromLong((*jenv)->ExceptionCheck(jenv)));
+}
+
+#define FUSED_FUNCTION(name) \
+    static PyObject* fused_##name(PyObject* module, PyObject* args, PyObject* kwargs)
+
+#define FUSED_CALL_METHODS(Type, jtype)                                             \
+FUSED_FUNCTION(Call##Type##Method)                                                  \
+{                                                                                   \
+    static char* kwlist[] = {"env", "obj", "methodID", "args", NULL};               \
+    JNIEnv* jenv; jobject obj; jmethodID methodID; const jvalue* jargs = NULL;      \
+    jtype ret;                                                                      \
+    PARSE_ARGS("O&O&O&|O&", as_jenv, &jenv, as_jobject, &obj,                       \
+                            as_pointer, &methodID, as_pointer, &jargs);             \
+    Py_BEGIN_ALLOW_THREADS                                                          \
+    ret = (*jenv)->Call##Type##MethodA(jenv, obj, methodID, jargs);                 \
+    Py_END_ALLOW_THREADS                                                            \
+    return fused_result(jenv, jtype##_result(ret));                                 \
+}                                                                                   \
+                                                                                    \
+FUSED_FUNCTION(CallNonvirtual##Type##Method)                                        \
+{                                                                                   \
+    static char* kwlist[] = {"env", "obj", "clazz", "methodID", "args", NULL};      \
+    JNIEnv* jenv; jobject obj; jclass clazz; jmethodID methodID;                    \
+    const jvalue* jargs = NULL; jtype ret;                                          \
+    PARSE_ARGS("O&O&O&O&|O&", as_jenv, &jenv, as_jobject, &obj, as_jobject, &clazz, \
+                              as_pointer, &methodID, as_pointer, &jargs);           \
+    Py_BEGIN_ALLOW_THREADS                                                          \
+    ret = (*jenv)->CallNonvirtual##Type##MethodA(jenv, obj, clazz, methodID, jargs);\
+    Py_END_ALLOW_THREADS                                                            \
+    return fused_result(jenv, jtype##_result(ret));                                 \
+}                                                                                   \
+                                                                                    \
+FUSED_FUNCTION(CallStatic##Type##Method)                                            \
+{                                                                                   \
+    static char* kwlist[] = {"env", "clazz", "methodID", "args", NULL};             \
+    JNIEnv* jenv; jclass clazz; jmethodID methodID; const jvalue* jargs = NULL;     \
+    jtype ret;                                                                      \
+    PARSE_ARGS("O&O&O&|O&", as_jenv, &jenv, as_jobject, &clazz,                     \
+                            as_pointer, &methodID, as_pointer, &jargs);             \
+    Py_BEGIN_ALLOW_THREADS                                                          \
+    ret = (*jenv)->CallStatic##Type##MethodA(jenv, clazz, methodID, jargs);         \
+    Py_END_ALLOW_THREADS                                                            \
+    return fused_result(jenv, jtype##_result(ret));                                 \
+}
+
+FUSED_CALL_METHODS(Object,  jobject)
+FUSED_CALL_METHODS(Boolean, jboolean)
+FUSED_CALL_METHODS(Byte,    jbyte)
+FUSED_CALL_METHODS(Char,    jchar)
+FUSED_CALL_METHODS(Short,   jshort)
+FUSED_CALL_METHODS(Int,     jint)
+FUSED_CALL_METHODS(Long,    jlong)
+FUSED_CALL_METHODS(Float,   jfloat)
+FUSED_CALL_METHODS(Double,  jdouble)
+
+FUSED_FUNCTION(CallVoidMethod)
+{
+    static char* kwlist[] = {"env", "obj", "methodID", "args", NULL};
+    JNIEnv* jenv; jobject obj; jmethodID methodID; const jvalue* jargs = NULL;
+    PARSE_ARGS("O&O&O&|O&", as_jenv, &jenv, as_jobject, &obj,
+                            as_pointer, &methodID, as_pointer, &jargs);
+    Py_BEGIN_ALLOW_THREADS
+    (*jenv)->CallVoidMethodA(jenv, obj, methodID, jargs);
+    Py_END_ALLOW_THREADS
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));
+}
+
+FUSED_FUNCTION(CallNonvirtualVoidMethod)
+{
+    static char* kwlist[] = {"env", "obj", "clazz", "methodID", "args", NULL};
+    JNIEnv* jenv; jobject obj; jclass clazz; jmethodID methodID; const jvalue* jargs = NULL;
+    PARSE_ARGS("O&O&O&O&|O&", as_jenv, &jenv, as_jobject, &obj, as_jobject, &clazz,
+                              as_pointer, &methodID, as_pointer, &jargs);
+    Py_BEGIN_ALLOW_THREADS
+    (*jenv)->CallNonvirtualVoidMethodA(jenv, obj, clazz, methodID, jargs);
+    Py_END_ALLOW_THREADS
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));
+}
+
+FUSED_FUNCTION(CallStaticVoidMethod)
+{
+    static char* kwlist[] = {"env", "clazz", "methodID", "args", NULL};
+    JNIEnv* jenv; jclass clazz; jmethodID methodID; const jvalue* jargs = NULL;
+    PARSE_ARGS("O&O&O&|O&", as_jenv, &jenv, as_jobject, &clazz,
+                            as_pointer, &methodID, as_pointer, &jargs);
+    Py_BEGIN_ALLOW_THREADS
+    (*jenv)->CallStaticVoidMethodA(jenv, clazz, methodID, jargs);
+    Py_END_ALLOW_THREADS
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));
+}
+
+FUSED_FUNCTION(CallMethodsA)
+{
+    static char* kwlist[] = {"env", "rtype", "clazz", "methodID", "count", "receivers",
+                             "columns", "sig", "out", "done", NULL};
+    JNIEnv* jenv; int rtype; jclass clazz; jmethodID methodID; jsize count;
+    PyObject* receivers; PyObject* columns; const char* sig;
+    void* out = NULL; jint* done = NULL;
+    PARSE_ARGS("O&CO&O&O&OOs|O&O&", as_jenv, &jenv, &rtype, as_jobject, &clazz,
+                                    as_pointer, &methodID, as_jsize, &count,
+                                    &receivers, &columns, &sig,
+                                    as_pointer, &out, as_pointer, &done);
+    if ( call_methods(jenv, rtype, clazz, methodID, count, receivers, columns,
+                      sig, out, done) < 0 ) return NULL;
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));
+}
+
+FUSED_FUNCTION(RunProgram)
+{
+    static char* kwlist[] = {"env", "code", "types", "values", "outputs", "done", NULL};
+    JNIEnv* jenv; PyObject* code; const char* types; PyObject* values;
+    PyObject* outputs; jint* done = NULL;
+    PARSE_ARGS("O&OsOO|O&", as_jenv, &jenv, &code, &types, &values, &outputs,
+                            as_pointer, &done);
+    return fused_result(jenv, run_program(jenv, code, types, values, outputs, done));
+}
+
+#define FUSED_FIELDS(Type, jtype)                                                   \
+FUSED_FUNCTION(Get##Type##Field)                                                    \
+{                                                                                   \
+    static char* kwlist[] = {"env", "obj", "fieldID", NULL};                        \
+    JNIEnv* jenv; jobject obj; jfieldID fieldID;                                    \
+    PARSE_ARGS("O&O&O&", as_jenv, &jenv, as_jobject, &obj, as_pointer, &fieldID);   \
+    jtype ret = (*jenv)->Get##Type##Field(jenv, obj, fieldID);                      \
+    return fused_result(jenv, jtype##_result(ret));                                 \
+}                                                                                   \
+                                                                                    \
+FUSED_FUNCTION(Set##Type##Field)                                                    \
+{                                                                                   \
+    static char* kwlist[] = {"env", "obj", "fieldID", "value", NULL};               \
+    JNIEnv* jenv; jobject obj; jfieldID fieldID; jtype value;                       \
+    PARSE_ARGS("O&O&O&O&", as_jenv, &jenv, as_jobject, &obj, as_pointer, &fieldID,  \
+                           as_##jtype, &value);                                     \
+    (*jenv)->Set##Type##Field(jenv, obj, fieldID, value);                           \
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));                       \
+}                                                                                   \
+                                                                                    \
+FUSED_FUNCTION(GetStatic##Type##Field)                                              \
+{                                                                                   \
+    static char* kwlist[] = {"env", "clazz", "fieldID", NULL};                      \
+    JNIEnv* jenv; jclass clazz; jfieldID fieldID;                                   \
+    PARSE_ARGS("O&O&O&", as_jenv, &jenv, as_jobject, &clazz, as_pointer, &fieldID); \
+    jtype ret = (*jenv)->GetStatic##Type##Field(jenv, clazz, fieldID);              \
+    return fused_result(jenv, jtype##_result(ret));                                 \
+}                                                                                   \
+                                                                                    \
+FUSED_FUNCTION(SetStatic##Type##Field)                                              \
+{                                                                                   \
+    static char* kwlist[] = {"env", "clazz", "fieldID", "value", NULL};             \
+    JNIEnv* jenv; jclass clazz; jfieldID fieldID; jtype value;                      \
+    PARSE_ARGS("O&O&O&O&", as_jenv, &jenv, as_jobject, &clazz,                      \
+                           as_pointer, &fieldID, as_##jtype, &value);               \
+    (*jenv)->SetStatic##Type##Field(jenv, clazz, fieldID, value);                   \
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));                       \
+}
+
+FUSED_FIELDS(Object,  jobject)
+FUSED_FIELDS(Boolean, jboolean)
+FUSED_FIELDS(Byte,    jbyte)
+FUSED_FIELDS(Char,    jchar)
+FUSED_FIELDS(Short,   jshort)
+FUSED_FIELDS(Int,     jint)
+FUSED_FIELDS(Long,    jlong)
+FUSED_FIELDS(Float,   jfloat)
+FUSED_FIELDS(Double,  jdouble)
+
+FUSED_FUNCTION(GetObjectClass)
+{
+    static char* kwlist[] = {"env", "obj", NULL};
+    JNIEnv* jenv; jobject obj;
+    PARSE_ARGS("O&O&", as_jenv, &jenv, as_jobject, &obj);
+    jclass ret = (*jenv)->GetObjectClass(jenv, obj);
+    return fused_result(jenv, jobject_result(ret));
+}
+
+FUSED_FUNCTION(GetStringLength)
+{
+    static char* kwlist[] = {"env", "str", NULL};
+    JNIEnv* jenv; jstring str;
+    PARSE_ARGS("O&O&", as_jenv, &jenv, as_jobject, &str);
+    jsize ret = (*jenv)->GetStringLength(jenv, str);
+    return fused_result(jenv, jint_result(ret));
+}
+
+FUSED_FUNCTION(GetStringUTFLength)
+{
+    static char* kwlist[] = {"env", "str", NULL};
+    JNIEnv* jenv; jstring str;
+    PARSE_ARGS("O&O&", as_jenv, &jenv, as_jobject, &str);
+    jsize ret = (*jenv)->GetStringUTFLength(jenv, str);
+    return fused_result(jenv, jint_result(ret));
+}
+
+FUSED_FUNCTION(GetStringRegion)
+{
+    static char* kwlist[] = {"env", "str", "start", "len", "buf", NULL};
+    JNIEnv* jenv; jstring str; jsize start, len; jchar* buf;
+    PARSE_ARGS("O&O&O&O&O&", as_jenv, &jenv, as_jobject, &str,
+                             as_jsize, &start, as_jsize, &len, as_pointer, &buf);
+    (*jenv)->GetStringRegion(jenv, str, start, len, buf);
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));
+}
+
+FUSED_FUNCTION(GetStringUTFRegion)
+{
+    static char* kwlist[] = {"env", "str", "start", "len", "buf", NULL};
+    JNIEnv* jenv; jstring str; jsize start, len; char* buf;
+    PARSE_ARGS("O&O&O&O&O&", as_jenv, &jenv, as_jobject, &str,
+                             as_jsize, &start, as_jsize, &len, as_pointer, &buf);
+    (*jenv)->GetStringUTFRegion(jenv, str, start, len, buf);
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));
+}
+
+FUSED_FUNCTION(GetArrayLength)
+{
+    static char* kwlist[] = {"env", "array", NULL};
+    JNIEnv* jenv; jarray array;
+    PARSE_ARGS("O&O&", as_jenv, &jenv, as_jobject, &array);
+    jsize ret = (*jenv)->GetArrayLength(jenv, array);
+    return fused_result(jenv, jint_result(ret));
+}
+
+FUSED_FUNCTION(GetObjectArrayElement)
+{
+    static char* kwlist[] = {"env", "array", "index", NULL};
+    JNIEnv* jenv; jobjectArray array; jsize index;
+    PARSE_ARGS("O&O&O&", as_jenv, &jenv, as_jobject, &array, as_jsize, &index);
+    jobject ret = (*jenv)->GetObjectArrayElement(jenv, array, index);
+    return fused_result(jenv, jobject_result(ret));
+}
+
+FUSED_FUNCTION(SetObjectArrayElement)
+{
+    static char* kwlist[] = {"env", "array", "index", "value", NULL};
+    JNIEnv* jenv; jobjectArray array; jsize index; jobject value;
+    PARSE_ARGS("O&O&O&O&", as_jenv, &jenv, as_jobject, &array, as_jsize, &index,
+                           as_jobject, &value);
+    (*jenv)->SetObjectArrayElement(jenv, array, index, value);
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));
+}
+
+FUSED_FUNCTION(SetObjectArrayElements)
+{
+    static char* kwlist[] = {"env", "array", "start", "items", "convert", NULL};
+    JNIEnv* jenv; jobjectArray array; jsize start; PyObject* items; PyObject* convert = Py_None;
+    PARSE_ARGS("O&O&O&O|O", as_jenv, &jenv, as_jobject, &array, as_jsize, &start,
+                            &items, &convert);
+    if ( fill_object_array(jenv, array, start, items,
+                           convert != Py_None ? convert : NULL) < 0 ) return NULL;
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));
+}
+
+FUSED_FUNCTION(NewStringArray)
+{
+    static char* kwlist[] = {"env", "strings", NULL};
+    JNIEnv* jenv; PyObject* strings;
+    PARSE_ARGS("O&O", as_jenv, &jenv, &strings);
+    jobjectArray ret = new_string_array(jenv, strings);
+    if ( ret == NULL && PyErr_Occurred() ) return NULL;
+    return fused_result(jenv, jobject_result(ret));
+}
+
+#define FUSED_DELETE_REFS(name, JNIFun)                                             \
+FUSED_FUNCTION(name)                                                                \
+{                                                                                   \
+    static char* kwlist[] = {"env", "refs", NULL};                                  \
+    JNIEnv* jenv; PyObject* refs;                                                   \
+    PARSE_ARGS("O&O", as_jenv, &jenv, &refs);                                       \
+    if ( delete_refs(jenv, refs, (*jenv)->JNIFun) < 0 ) return NULL;                \
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));                       \
+}
+
+FUSED_DELETE_REFS(DeleteGlobalRefs,     DeleteGlobalRef)
+FUSED_DELETE_REFS(DeleteLocalRefs,      DeleteLocalRef)
+FUSED_DELETE_REFS(DeleteWeakGlobalRefs, DeleteWeakGlobalRef)
+
+#define FUSED_ARRAY_REGIONS(Type, jtype)                                            \
+FUSED_FUNCTION(Get##Type##ArrayRegion)                                              \
+{                                                                                   \
+    static char* kwlist[] = {"env", "array", "start", "size", "buf", NULL};         \
+    JNIEnv* jenv; jtype##Array array; jsize start, size; jtype* buf;                \
+    PARSE_ARGS("O&O&O&O&O&", as_jenv, &jenv, as_jobject, &array,                    \
+                             as_jsize, &start, as_jsize, &size, as_pointer, &buf);  \
+    (*jenv)->Get##Type##ArrayRegion(jenv, array, start, size, buf);                 \
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));                       \
+}                                                                                   \
+                                                                                    \
+FUSED_FUNCTION(Set##Type##ArrayRegion)                                              \
+{                                                                                   \
+    static char* kwlist[] = {"env", "array", "start", "size", "buf", NULL};         \
+    JNIEnv* jenv; jtype##Array array; jsize start, size; const jtype* buf;          \
+    PARSE_ARGS("O&O&O&O&O&", as_jenv, &jenv, as_jobject, &array,                    \
+                             as_jsize, &start, as_jsize, &size, as_pointer, &buf);  \
+    (*jenv)->Set##Type##ArrayRegion(jenv, array, start, size, buf);                 \
+    return fused_result(jenv, (Py_INCREF(Py_None), Py_None));                       \
+}
+
+FUSED_ARRAY_REGIONS(Boolean, jboolean)
+FUSED_ARRAY_REGIONS(Byte,    jbyte)
+FUSED_ARRAY_REGIONS(Char,    jchar)
+FUSED_ARRAY_REGIONS(Short,   jshort)
+FUSED_ARRAY_REGIONS(Int,     jint)
+FUSED_ARRAY_REGIONS(Long,    jlong)
+FUSED_ARRAY_REGIONS(Float,   jfloat)
+FUSED_ARRAY_REGIONS(Double,  jdouble)
+
+#define FUSED_ENTRY(name) \
+    {#name, (PyCFunction)(void(*)(void))fused_##name, METH_VARARGS | METH_KEYWORDS, NULL}
+
+#define FUSED_TYPED_ENTRIES(Type)                         \
+    FUSED_ENTRY(Call##Type##Method),                      \
+    FUSED_ENTRY(CallNonvirtual##Type##Method),            \
+    FUSED_ENTRY(CallStatic##Type##Method),                \
+    FUSED_ENTRY(Get##Type##Field),                        \
+    FUSED_ENTRY(Set##Type##Field),                        \
+    FUSED_ENTRY(GetStatic##Type##Field),                  \
+    FUSED_ENTRY(SetStatic##Type##Field)
+
+#define FUSED_ARRAY_ENTRIES(Type)                         \
+    FUSED_ENTRY(Get##Type##ArrayRegion),                  \
+    FUSED_ENTRY(Set##Type##ArrayRegion)
+
+static PyMethodDef fused_functions[] = {
+    FUSED_TYPED_ENTRIES(Object),
+    FUSED_TYPED_ENTRIES(Boolean),
+    FUSED_TYPED_ENTRIES(Byte),
+    FUSED_TYPED_ENTRIES(Char),
+    FUSED_TYPED_ENTRIES(Short),
+    FUSED_TYPED_ENTRIES(Int),
+    FUSED_TYPED_ENTRIES(Long),
+    FUSED_TYPED_ENTRIES(Float),
+    FUSED_TYPED_ENTRIES(Double),
+    FUSED_ENTRY(CallVoidMethod),
+    FUSED_ENTRY(CallNonvirtualVoidMethod),
+    FUSED_ENTRY(CallStaticVoidMethod),
+    FUSED_ENTRY(CallMethodsA),
+    FUSED_ENTRY(RunProgram),
+    FUSED_ENTRY(GetObjectClass),
+    FUSED_ENTRY(GetStringLength),
+    FUSED_ENTRY(GetStringUTFLength),
+    FUSED_ENTRY(GetStringRegion),
+    FUSED_ENTRY(GetStringUTFRegion),
+    FUSED_ENTRY(GetArrayLength),
+    FUSED_ENTRY(GetObjectArrayElement),
+    FUSED_ENTRY(SetObjectArrayElement),
+    FUSED_ENTRY(SetObjectArrayElements),
+    FUSED_ENTRY(NewStringArray),
+    FUSED_ENTRY(DeleteGlobalRefs),
+    FUSED_ENTRY(DeleteLocalRefs),
+    FUSED_ENTRY(DeleteWeakGlobalRefs),
+    FUSED_ARRAY_ENTRIES(Boolean),
+    FUSED_ARRAY_ENTRIES(Byte),
+    FUSED_ARRAY_ENTRIES(Char),
+    FUSED_ARRAY_ENTRIES(Short),
+    FUSED_ARRAY_ENTRIES(Int),
+    FUSED_ARRAY_ENTRIES(Long),
+    FUSED_ARRAY_ENTRIES(Float),
+    FUSED_ARRAY_ENTRIES(Double),
     {NULL}
 };
 
+static struct PyModuleDef fused_module_def = {
+    PyModuleDef_HEAD_INIT,
+    "jni.capi.jni.fused", /* m_name    */
+    NULL,                 /* m_doc     */
+    -1,                   /* m_size    */
+    fused_functions,      /* m_methods */
+};
+
+//------------------------------------//
+
 static struct PyModuleDef module_def = {
     PyModuleDef_HEAD_INIT,
     __name__,          /* m_name     */
     NULL,              /* m_doc      */
     -1,                /* m_size     */
-    module_functions,  /* m_methods  */
+    NULL,              /* m_methods  */
     NULL,              /* m_reload   */
     NULL,              /* m_traverse */
     NULL,              /* m_clear    */
@@ -1473,24 +2786,6 @@ static struct PyModuleDef module_def = {
 
 //------------------------------------//
 
-static int traverse_GC(PyObject* self, visitproc visit, void* arg)
-{
-    return 0;
-}
-
-static int clear_GC(PyObject* self)
-{
-    return 0;
-}
-
-static void dealloc_GC(PyObject* self)
-{
-    PyObject_GC_UnTrack(self);
-    PyObject_GC_Del(self);
-}
-
-//------------------------------------//
-
 #define MODINIT_FUNC(name) PyInit_##name(void)
 
 PyMODINIT_FUNC MODINIT_FUNC(jni)
@@ -1501,141 +2796,22 @@ PyMODINIT_FUNC MODINIT_FUNC(jni)
     if ( module == NULL )
         return NULL;
 
-    /* JNI Types */
-
-    if ( PyType_Ready(&jint_Type)  < 0 ||
-         PyType_Ready(&jlong_Type) < 0 ||
-         PyType_Ready(&jbyte_Type) < 0 ||
-         PyType_Ready(&jboolean_Type) < 0 ||
-         PyType_Ready(&jchar_Type) < 0 ||
-         PyType_Ready(&jshort_Type) < 0 ||
-         PyType_Ready(&jfloat_Type) < 0 ||
-         PyType_Ready(&jdouble_Type) < 0 ||
-         PyType_Ready(&jobject_Type) < 0 ||
-         PyType_Ready(&jvalue_Type) < 0 ||
-         PyType_Ready(&jfieldID_Type) < 0 ||
-         PyType_Ready(&jmethodID_Type) < 0 ||
-         PyType_Ready(&JNINativeMethod_Type) < 0 ||
-         PyType_Ready(&JNIEnv_Type) < 0 ||
-         PyType_Ready(&JavaVMOption_Type) < 0 ||
-         PyType_Ready(&JavaVMInitArgs_Type) < 0 ||
-         PyType_Ready(&JavaVMAttachArgs_Type) < 0 ||
+    if ( PyType_Ready(&JNIEnv_Type) < 0 ||
          PyType_Ready(&JavaVM_Type) < 0 )
         return NULL;
 
-    Py_INCREF(&jint_Type);
-    PyModule_AddObject(module, "jint",  (PyObject*)&jint_Type);
-    Py_INCREF(&jlong_Type);
-    PyModule_AddObject(module, "jlong", (PyObject*)&jlong_Type);
-    Py_INCREF(&jbyte_Type);
-    PyModule_AddObject(module, "jbyte", (PyObject*)&jbyte_Type);
-
-    Py_INCREF(&jboolean_Type);
-    PyModule_AddObject(module, "jboolean", (PyObject*)&jboolean_Type);
-    Py_INCREF(&jchar_Type);
-    PyModule_AddObject(module, "jchar",    (PyObject*)&jchar_Type);
-    Py_INCREF(&jshort_Type);
-    PyModule_AddObject(module, "jshort",   (PyObject*)&jshort_Type);
-    Py_INCREF(&jfloat_Type);
-    PyModule_AddObject(module, "jfloat",   (PyObject*)&jfloat_Type);
-    Py_INCREF(&jdouble_Type);
-    PyModule_AddObject(module, "jdouble",  (PyObject*)&jdouble_Type);
-    Py_INCREF(&jsize_Type);
-    PyModule_AddObject(module, "jsize",    (PyObject*)&jsize_Type);
-
-    Py_INCREF(&jobject_Type);
-    PyModule_AddObject(module, "jobject",       (PyObject*)&jobject_Type);
-    Py_INCREF(&jclass_Type);
-    PyModule_AddObject(module, "jclass",        (PyObject*)&jclass_Type);
-    Py_INCREF(&jthrowable_Type);
-    PyModule_AddObject(module, "jthrowable",    (PyObject*)&jthrowable_Type);
-    Py_INCREF(&jstring_Type);
-    PyModule_AddObject(module, "jstring",       (PyObject*)&jstring_Type);
-    Py_INCREF(&jarray_Type);
-    PyModule_AddObject(module, "jarray",        (PyObject*)&jarray_Type);
-    Py_INCREF(&jbooleanArray_Type);
-    PyModule_AddObject(module, "jbooleanArray", (PyObject*)&jbooleanArray_Type);
-    Py_INCREF(&jbyteArray_Type);
-    PyModule_AddObject(module, "jbyteArray",    (PyObject*)&jbyteArray_Type);
-    Py_INCREF(&jcharArray_Type);
-    PyModule_AddObject(module, "jcharArray",    (PyObject*)&jcharArray_Type);
-    Py_INCREF(&jshortArray_Type);
-    PyModule_AddObject(module, "jshortArray",   (PyObject*)&jshortArray_Type);
-    Py_INCREF(&jintArray_Type);
-    PyModule_AddObject(module, "jintArray",     (PyObject*)&jintArray_Type);
-    Py_INCREF(&jlongArray_Type);
-    PyModule_AddObject(module, "jlongArray",    (PyObject*)&jlongArray_Type);
-    Py_INCREF(&jfloatArray_Type);
-    PyModule_AddObject(module, "jfloatArray",   (PyObject*)&jfloatArray_Type);
-    Py_INCREF(&jdoubleArray_Type);
-    PyModule_AddObject(module, "jdoubleArray",  (PyObject*)&jdoubleArray_Type);
-    Py_INCREF(&jobjectArray_Type);
-    PyModule_AddObject(module, "jobjectArray",  (PyObject*)&jobjectArray_Type);
-    Py_INCREF(&jweak_Type);
-    PyModule_AddObject(module, "jweak",         (PyObject*)&jweak_Type);
-
-    Py_INCREF(&jvalue_Type);
-    PyModule_AddObject(module, "jvalue", (PyObject*)&jvalue_Type);
-
-    Py_INCREF(&jfieldID_Type);
-    PyModule_AddObject(module, "jfieldID",  (PyObject*)&jfieldID_Type);
-
-    Py_INCREF(&jmethodID_Type);
-    PyModule_AddObject(module, "jmethodID", (PyObject*)&jmethodID_Type);
-
-    /* Return values from jobjectRefType */
-    Py_INCREF(&jobjectRefType_Type);
-    PyModule_AddObject(module, "jobjectRefType", (PyObject*)&jobjectRefType_Type);
-    PyModule_AddIntConstant(module, "JNIInvalidRefType",    JNIInvalidRefType);
-    PyModule_AddIntConstant(module, "JNILocalRefType",      JNILocalRefType);
-    PyModule_AddIntConstant(module, "JNIGlobalRefType",     JNIGlobalRefType);
-    PyModule_AddIntConstant(module, "JNIWeakGlobalRefType", JNIWeakGlobalRefType);
-
-    /* jboolean constants */
-    PyModule_AddIntConstant(module, "JNI_FALSE", JNI_FALSE);
-    PyModule_AddIntConstant(module, "JNI_TRUE",  JNI_TRUE);
-
-    /* null constant */
-    PyModule_AddObject(module, "NULL",
-                       (PyObject*)PyObject_New(jobject_Object, &jobject_Type));
-
-    /* possible return values for JNI functions. */
-    PyModule_AddIntConstant(module, "JNI_OK",        JNI_OK);
-    PyModule_AddIntConstant(module, "JNI_ERR",       JNI_ERR);
-    PyModule_AddIntConstant(module, "JNI_EDETACHED", JNI_EDETACHED);
-    PyModule_AddIntConstant(module, "JNI_EVERSION",  JNI_EVERSION);
-    PyModule_AddIntConstant(module, "JNI_ENOMEM",    JNI_ENOMEM);
-    PyModule_AddIntConstant(module, "JNI_EEXIST",    JNI_EEXIST);
-    PyModule_AddIntConstant(module, "JNI_EINVAL",    JNI_EINVAL);
-
-    /* used in ReleaseScalarArrayElements */
-    PyModule_AddIntConstant(module, "JNI_COMMIT", JNI_COMMIT);
-    PyModule_AddIntConstant(module, "JNI_ABORT",  JNI_ABORT);
-
-    /* JNI Native Method Interface. */
-
-    /* used in RegisterNatives to describe native method name,
-       signature, and function pointer. */
-    Py_INCREF(&JNINativeMethod_Type);
-    PyModule_AddObject(module, "JNINativeMethod", (PyObject*)&JNINativeMethod_Type);
-
-    /* JNI Invocation Interface. */
-
-    Py_INCREF(&JavaVMOption_Type);
-    PyModule_AddObject(module, "JavaVMOption", (PyObject*)&JavaVMOption_Type);
-
-    Py_INCREF(&JavaVMInitArgs_Type);
-    PyModule_AddObject(module, "JavaVMInitArgs", (PyObject*)&JavaVMInitArgs_Type);
-
-    Py_INCREF(&JavaVMAttachArgs_Type);
-    PyModule_AddObject(module, "JavaVMAttachArgs", (PyObject*)&JavaVMAttachArgs_Type);
-
     Py_INCREF(&JNIEnv_Type);
     PyModule_AddObject(module, "JNIEnv", (PyObject*)&JNIEnv_Type);
 
     Py_INCREF(&JavaVM_Type);
     PyModule_AddObject(module, "JavaVM", (PyObject*)&JavaVM_Type);
 
+    /* Fused call + exception check entry points. */
+    PyObject* fused = PyModule_Create(&fused_module_def);
+    if ( fused == NULL )
+        return NULL;
+    PyModule_AddObject(module, "fused", fused);
+
     /* These will be VM-specific. */
     #ifdef JDK1_2
       PyModule_AddIntConstant(module, "JDK1_2", 1);
@@ -40,6 +40,7 @@ as_cstr     = lambda obj,                __ffi=ffi: __ffi.cast("char*", __ffi.fr
 to_bytes    = lambda obj, size=-1,       __ffi=ffi: __ffi.string(obj, size) if size >= 0 else __ffi.string(obj)
 to_unicode  = to_bytes
 from_buffer = lambda data,               __ffi=ffi: __ffi.from_buffer(data)
+buffer_pointer = lambda view, ptype,   __ffi=ffi: __ffi.from_buffer(__ffi.getctype(ptype.item, "[]"), view)
 
 _itself_or_NULL = lambda arg, __NULL=ffi.NULL: __NULL if arg is None else arg         # noqa: N816
 _byref_or_NULL  = lambda arg, __NULL=ffi.NULL: __NULL if arg is None else byref(arg)  # noqa: N816
@@ -64,6 +65,12 @@ def defined(varname, __getframe=sys._getframe):
 def from_oid(oid, __cast=ct.cast, __py_object=ct.py_object):
     return __cast(oid, __py_object).value if oid else None
 
+def buffer_at(ptr, size, owner=None, __ffi=ffi):
+    # The size bytes at ptr, valid as long as owner (if any) is alive.
+    ptr = __ffi.cast("char*", ptr)
+    if owner is not None: ptr = __ffi.gc(ptr, lambda _, owner=owner: None)
+    return __ffi.buffer(ptr, size)
+
 
 #
 # JNI Types
@@ -176,10 +183,8 @@ class JNIEnv:
         fun.ExceptionClear(env)
         jexc = fun.NewGlobalRef(env, jthr)
         fun.DeleteLocalRef(env, jthr)
-        if Throwable.last:
-            cause = Throwable.last.getCause()
-            if cause: fun.DeleteGlobalRef(env, cause)
-            Throwable.last = None
+        for cause in Throwable._release():
+            fun.DeleteGlobalRef(env, cause)
         fun.ExceptionClear(env)
         Throwable.last = thr = Throwable(jexc)  # !!!, fname)
         raise thr
@@ -202,7 +207,7 @@ class JNIEnv:
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def FindClass(self, name):  # (GIL ?)
+    def FindClass(self, name):
         env = self.__env
         fun = env[0]
         ret = fun.FindClass(env, name)
@@ -248,10 +253,8 @@ class JNIEnv:
     def ExceptionClear(self):
         env = self.__env
         fun = env[0]
-        if Throwable.last:
-            cause = Throwable.last.getCause()
-            if cause: fun.DeleteGlobalRef(env, cause)
-            Throwable.last = None
+        for cause in Throwable._release():
+            fun.DeleteGlobalRef(env, cause)
         fun.ExceptionClear(env)
 
     def FatalError(self, msg):
@@ -276,7 +279,7 @@ class JNIEnv:
     def PopLocalFrame(self, result):
         env = self.__env
         fun = env[0]
-        return fun.PopLocalFrame(env, result)
+        return fun.PopLocalFrame(env, _itself_or_NULL(result))
 
     # Java references handling
 
@@ -316,6 +319,24 @@ class JNIEnv:
         fun = env[0]
         fun.DeleteWeakGlobalRef(env, ref)
 
+    def DeleteGlobalRefs(self, refs):
+        env = self.__env
+        fun = env[0]
+        for ref in refs:
+            if ref: fun.DeleteGlobalRef(env, ref)
+
+    def DeleteLocalRefs(self, refs):
+        env = self.__env
+        fun = env[0]
+        for ref in refs:
+            if ref: fun.DeleteLocalRef(env, ref)
+
+    def DeleteWeakGlobalRefs(self, refs):
+        env = self.__env
+        fun = env[0]
+        for ref in refs:
+            if ref: fun.DeleteWeakGlobalRef(env, ref)
+
     def EnsureLocalCapacity(self, capacity):
         env = self.__env
         fun = env[0]
@@ -332,7 +353,7 @@ class JNIEnv:
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def NewObject(self, clazz, methodID, args=None):  # (GIL ?)
+    def NewObject(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.NewObjectA(env, clazz, methodID, _itself_or_NULL(args))
@@ -362,7 +383,7 @@ class JNIEnv:
     def IsSameObject(self, obj1, obj2):
         env = self.__env
         fun = env[0]
-        return bool(fun.IsSameObject(env, obj1, obj2))
+        return bool(fun.IsSameObject(env, _itself_or_NULL(obj1), _itself_or_NULL(obj2)))
 
     # Call Java instance method
 
@@ -373,70 +394,70 @@ class JNIEnv:
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallObjectMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallObjectMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallObjectMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallBooleanMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallBooleanMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallBooleanMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return bool(ret)
 
-    def CallByteMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallByteMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallByteMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallCharMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallCharMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallCharMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallShortMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallShortMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallShortMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallIntMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallIntMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallIntMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallLongMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallLongMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallLongMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallFloatMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallFloatMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallFloatMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallDoubleMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallDoubleMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallDoubleMethodA(env, obj, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallVoidMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallVoidMethod(self, obj, methodID, args=None):
         env = self.__env
         fun = env[0]
         fun.CallVoidMethodA(env, obj, methodID, _itself_or_NULL(args))
@@ -650,70 +671,70 @@ class JNIEnv:
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticObjectMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticObjectMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticObjectMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticBooleanMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticBooleanMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticBooleanMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return bool(ret)
 
-    def CallStaticByteMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticByteMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticByteMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticCharMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticCharMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticCharMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticShortMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticShortMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticShortMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticIntMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticIntMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticIntMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticLongMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticLongMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticLongMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticFloatMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticFloatMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticFloatMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticDoubleMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticDoubleMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         ret = fun.CallStaticDoubleMethodA(env, clazz, methodID, _itself_or_NULL(args))
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticVoidMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticVoidMethod(self, clazz, methodID, args=None):
         env = self.__env
         fun = env[0]
         fun.CallStaticVoidMethodA(env, clazz, methodID, _itself_or_NULL(args))
@@ -959,6 +980,33 @@ class JNIEnv:
         fun.SetObjectArrayElement(env, array, index, _itself_or_NULL(value))
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
+    def SetObjectArrayElements(self, array, start, items, convert=None):
+        env = self.__env
+        fun = env[0]
+        for index, value in enumerate(items, start):
+            if convert is not None: value = convert(value)
+            fun.SetObjectArrayElement(env, array, index, _itself_or_NULL(value))
+            if convert is not None and value: fun.DeleteLocalRef(env, value)
+            if fun.ExceptionCheck(env): self._handle_JavaException()
+
+    def NewStringArray(self, strings):
+        def to_jstring(s):
+            if s is None: return None
+            if not isinstance(s, str):
+                raise TypeError(f"expected str or None, got {type(s).__name__}")
+            return self.str_to_jstring(s)
+        String = self.FindClass(b"java/lang/String")
+        try:
+            ret = self.NewObjectArray(len(strings), String)
+        finally:
+            self.DeleteLocalRef(String)
+        try:
+            self.SetObjectArrayElements(ret, 0, strings, to_jstring)
+        except BaseException:
+            self.DeleteLocalRef(ret)
+            raise
+        return ret
+
     def NewBooleanArray(self, size):
         env = self.__env
         fun = env[0]
@@ -1268,10 +1316,12 @@ class JNIEnv:
 
     # Java direct buffer handling
 
-    def NewDirectByteBuffer(self, address, capacity):
+    def NewDirectByteBuffer(self, address, capacity, __CData=ffi.CData):
         env = self.__env
         fun = env[0]
-        ret = fun.NewDirectByteBuffer(env, from_buffer(address), capacity)
+        # address is a pointer (see from_buffer()) or a Python buffer.
+        if not isinstance(address, __CData): address = from_buffer(address)
+        ret = fun.NewDirectByteBuffer(env, address, capacity)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
@@ -1342,10 +1392,16 @@ def JEnv(penv):
 
 class JavaVM:
 
+    @property
+    def _address(self, __ffi=ffi):
+        # The JavaVM* (JVM() returns a new object for each call).
+        return int(__ffi.cast("uintptr_t", self.__jvm))
+
     def _handle_JNIException(self, err):
         import sys
         fun_name = sys._getframe(1).f_code.co_name
-        raise JNIException(err, info=fun_name)
+        # jint is declared as a C long, the error codes are 32-bit.
+        raise JNIException(int(cast(err, "int32_t")), info=fun_name)
 
     def DestroyJavaVM(self):
         jvm = self.__jvm
@@ -1421,9 +1477,9 @@ JNI_VERSION_21  = ffi.integer_const("JNI_VERSION_21")
 
 # eof jni.h
 
-class Throwable(Exception):  # noqa: N818
+from .._throwable import ThrowableType
 
-    last = None
+class Throwable(Exception, metaclass=ThrowableType):  # noqa: N818
 
     def __init__(self, cause=NULL, info=NULL):  # noqa: D107
         self._cause = cast(cause, jthrowable)
@@ -1436,6 +1492,8 @@ class Throwable(Exception):  # noqa: N818
     def getInfo(self):
         return self._info
 
+del ThrowableType
+
 class JNIException(SystemError):
 
     reason = {
@@ -1584,9 +1642,126 @@ __object_types = {
     "java/lang/Class":  jclass
 }
 
+#
+# Signature-compiled method invokers
+#
+
+from .._invokers import compile_method
+
+JNIEnv.compile_method = compile_method
+del compile_method
+
+#
+# Views over Java primitive arrays
+#
+
+from .._arrays import array_view
+
+JNIEnv.array_view = array_view
+del array_view
+
+#
+# Bulk conversions between Python buffers and Java primitive arrays
+#
+
+from .._arrays import to_java_array, from_java_array
+
+JNIEnv.to_java_array   = to_java_array
+JNIEnv.from_java_array = from_java_array
+del to_java_array, from_java_array
+
+#
+# Fast conversions between Python str and Java strings
+#
+
+from .._strings import str_to_jstring, jstring_to_str
+
+JNIEnv.str_to_jstring = str_to_jstring
+JNIEnv.jstring_to_str = jstring_to_str
+del str_to_jstring, jstring_to_str
+
+#
+# Local reference frames and arenas
+#
+
+from .._frame import local_frame, local_arena
+
+JNIEnv.local_frame = local_frame
+JNIEnv.local_arena = local_arena
+del local_frame, local_arena
+
+#
+# Object arrays
+#
+
+from .._arrays import iter_object_array, new_string_array, new_object_array
+
+JNIEnv.iter_object_array = iter_object_array
+JNIEnv.new_string_array  = new_string_array
+JNIEnv.new_object_array  = new_object_array
+del iter_object_array, new_string_array, new_object_array
+
+#
+# Vectorized calls
+#
+
+from .._calls import CallMethodsA, call_many, new_many
+
+JNIEnv.CallMethodsA = CallMethodsA
+JNIEnv.call_many    = call_many
+JNIEnv.new_many     = new_many
+del CallMethodsA, call_many, new_many
+
+#
+# Recorded programs
+#
+
+from .._program import RunProgram
+
+JNIEnv.RunProgram = RunProgram
+del RunProgram
+
+#
+# Direct buffers
+#
+
+from .._buffers import wrap_buffer, buffer_view
+
+JNIEnv.wrap_buffer = wrap_buffer
+JNIEnv.buffer_view = buffer_view
+del wrap_buffer, buffer_view
+
+#
+# Critical sections
+#
+
+from .._critical import critical
+
+JNIEnv.critical = critical
+del critical
+
 del sys
 del platform
 del ct
 del ffi
 del tmap
 del dlclose
+
+#
+# Fused call + exception check
+#
+# If the capi extension is available, the hot JNIEnv methods run the JNI
+# function and the exception check in a single native call instead of two
+# cffi calls. Methods returning Java objects are left as they are (their
+# results would have to be cast back to cdata). The plain cffi methods
+# remain as __wrapped__.
+#
+
+from operator import attrgetter as __attrgetter
+from .._fused import fuse_methods as __fuse_methods
+
+__fuse_methods(JNIEnv, env=__attrgetter("_JNIEnv__env"), exclude=(
+               "CallObjectMethod", "CallNonvirtualObjectMethod", "CallStaticObjectMethod",
+               "GetObjectField", "GetStaticObjectField", "GetObjectClass",
+               "GetObjectArrayElement", "NewStringArray", "RunProgram"))
+del __attrgetter, __fuse_methods
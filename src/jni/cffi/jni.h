@@ -60,7 +60,7 @@ typedef int64_t         jlong;  /* jdk/win32/jni_md.h: __int64 */
 typedef signed char     jbyte;  /* jdk/win32/jni_md.h */
 
 typedef unsigned char   jboolean;
-typedef wchar_t         jchar;  /* jdk/jni.h: unsigned short */
+typedef char16_t        jchar;  /* jdk/jni.h: unsigned short */
 typedef short           jshort;
 typedef float           jfloat;
 typedef double          jdouble;
@@ -3,9 +3,9 @@ import _cffi_backend
 
 ffi = _cffi_backend.FFI('jni',
     _version = 0x2601,
-    _types = b'\x00\x00\xD2\x0D\x00\x03\xBA\x03\x00\x03\xD5\x03\x00\x01\x9D\x03\x00\x00\x00\x0F\x00\x02\x2F\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x02\xD1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\xBF\x03\x00\x00\x00\x0F\x00\x02\xD1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\xC2\x03\x00\x00\x01\x0F\x00\x02\xD1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x03\x95\x03\x00\x00\x00\x0F\x00\x02\xD1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x04\x12\x03\x00\x00\x00\x0F\x00\x02\xD1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x02\xD1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x02\xD1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x02\x35\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x02\xD7\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x00\x0F\x00\x02\xD7\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x02\xD7\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x02\xD7\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x02\xD7\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x02\xD7\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x02\xD7\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x02\x3B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x01\xCD\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x01\xCD\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x00\x0F\x00\x01\xCD\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x01\xCD\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x01\xCD\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x01\xCD\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x01\xCD\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x01\xCD\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x03\x94\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\xA2\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\xAA\x03\x00\x00\x09\x01\x00\x00\xA1\x03\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\xA0\x11\x00\x00\x1E\x03\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x03\xB8\x03\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\xAA\x11\x00\x00\xA6\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\xAA\x11\x00\x00\xA6\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\xAA\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\xA0\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\x73\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\x79\x03\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\xA1\x0D\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x02\x88\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x02\xE9\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x00\x0F\x00\x02\xE9\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x02\xE9\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x02\xE9\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x02\xE9\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x02\xE9\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x02\xE9\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x02\x96\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x02\xEF\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x00\x0F\x00\x02\xEF\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x02\xEF\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x02\xEF\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x02\xEF\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x02\xEF\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x02\xEF\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\x0D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x0D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\xD2\x11\x00\x00\xD2\x11\x00\x00\x00\x0F\x00\x00\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\xD2\x11\x00\x00\xD2\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\xD2\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\xD2\x11\x00\x00\x02\x11\x00\x02\xEF\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x09\x01\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x04\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x04\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x1E\x11\x00\x00\x17\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x03\x01\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x03\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x00\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x01\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\x1E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x1E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\xAA\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\xD2\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\xD2\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x02\xD1\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x02\xD7\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x01\xCD\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\xA2\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x03\x79\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\x2F\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\xD1\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\x35\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\xD7\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\x3B\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x01\xCD\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x00\xA2\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x00\xA1\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\xE9\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\xE9\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\xEF\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x01\x7E\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x01\x9D\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x03\x01\x03\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x01\xD1\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x02\x88\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x02\x96\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x0E\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x0D\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x17\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x05\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x03\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x04\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x10\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x1E\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x02\xB2\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x01\xD1\x11\x00\x00\x00\x0F\x00\x02\xB2\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x01\xD1\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x03\x01\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x0D\x11\x00\x00\x00\x0F\x00\x03\x01\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x03\x01\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x03\x01\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x03\x01\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x01\x0F\x00\x03\x01\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x18\x11\x00\x00\x00\x0F\x00\x03\x01\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x1E\x11\x00\x00\x00\x0F\x00\x00\x00\x09\x00\x00\x04\x09\x00\x00\x05\x09\x00\x03\x77\x03\x00\x00\x06\x09\x00\x00\x00\x03\x00\x00\x02\x01\x00\x00\x05\x03\x00\x00\x0A\x03\x00\x00\x0F\x03\x00\x00\x14\x03\x00\x00\x1A\x03\x00\x00\x20\x03\x00\x00\x26\x03\x00\x00\x2D\x03\x00\x00\x34\x03\x00\x00\x39\x03\x00\x00\x3E\x03\x00\x00\x43\x03\x00\x00\x49\x03\x00\x00\x4F\x03\x00\x00\x55\x03\x00\x00\x5C\x03\x00\x00\x63\x03\x00\x00\x68\x03\x00\x00\x6C\x03\x00\x00\x71\x03\x00\x00\x76\x03\x00\x00\x7C\x03\x00\x00\x82\x03\x00\x00\x88\x03\x00\x00\x8F\x03\x00\x00\x96\x03\x00\x00\x00\x0B\x00\x00\x0B\x09\x00\x00\x9A\x03\x00\x00\xA9\x03\x00\x00\xAC\x03\x00\x00\xB1\x03\x00\x00\xBA\x03\x00\x00\xBD\x03\x00\x00\xC1\x03\x00\x00\xC5\x03\x00\x00\xC9\x03\x00\x00\xCF\x03\x00\x00\xD4\x03\x00\x00\xD9\x03\x00\x00\xDE\x03\x00\x00\xE4\x03\x00\x00\xEA\x03\x00\x00\xF0\x03\x00\x00\xF7\x03\x00\x01\x01\x03\x00\x01\x06\x03\x00\x01\x0B\x03\x00\x01\x10\x03\x00\x01\x16\x03\x00\x01\x1C\x03\x00\x01\x22\x03\x00\x01\x29\x03\x00\x01\x30\x03\x00\x01\x35\x03\x00\x01\x3A\x03\x00\x01\x3F\x03\x00\x01\x45\x03\x00\x01\x4B\x03\x00\x01\x51\x03\x00\x01\x58\x03\x00\x00\x01\x09\x00\x03\xB9\x03\x00\x00\x02\x09\x00\x03\xBB\x03\x00\x00\x03\x09\x00\x00\x07\x09\x00\x01\x5F\x03\x00\x01\x63\x03\x00\x00\x08\x09\x00\x01\x69\x03\x00\x01\x6D\x03\x00\x00\x09\x09\x00\x01\x73\x03\x00\x01\x76\x03\x00\x01\x7A\x03\x00\x01\x81\x03\x00\x01\x85\x03\x00\x01\x8B\x03\x00\x01\x8F\x03\x00\x01\x94\x03\x00\x01\x99\x03\x00\x01\x9F\x03\x00\x01\xA4\x03\x00\x01\xAA\x03\x00\x01\xB0\x03\x00\x01\xB6\x03\x00\x01\xBC\x03\x00\x01\xC3\x03\x00\x01\xCA\x03\x00\x01\xCF\x03\x00\x00\x0A\x09\x00\x01\xD4\x03\x00\x01\xD9\x03\x00\x01\xDC\x03\x00\x01\xE0\x03\x00\x01\xE5\x03\x00\x01\xEA\x03\x00\x01\xF0\x03\x00\x01\xF6\x03\x00\x01\xFB\x03\x00\x02\x01\x03\x00\x02\x08\x03\x00\x02\x0F\x03\x00\x02\x13\x03\x00\x02\x1C\x03\x00\x02\x1F\x03\x00\x02\x23\x03\x00\x02\x27\x03\x00\x02\x2C\x03\x00\x02\x32\x03\x00\x02\x38\x03\x00\x02\x3E\x03\x00\x02\x44\x03\x00\x02\x4B\x03\x00\x02\x52\x03\x00\x02\x59\x03\x00\x02\x60\x03\x00\x02\x67\x03\x00\x02\x6E\x03\x00\x02\x75\x03\x00\x02\x7C\x03\x00\x02\x83\x03\x00\x02\x8A\x03\x00\x02\x91\x03\x00\x02\x98\x03\x00\x02\x9F\x03\x00\x02\xA6\x03\x00\x02\xAD\x03\x00\x02\xB4\x03\x00\x02\xBB\x03\x00\x02\xC1\x03\x00\x02\xC7\x03\x00\x02\xCD\x03\x00\x02\xD3\x03\x00\x02\xD9\x03\x00\x02\xDF\x03\x00\x02\xE5\x03\x00\x02\xEB\x03\x00\x02\xF1\x03\x00\x02\xF7\x03\x00\x02\xFD\x03\x00\x03\x03\x03\x00\x03\x08\x03\x00\x03\x0E\x03\x00\x03\x14\x03\x00\x03\x1A\x03\x00\x03\x21\x03\x00\x03\x28\x03\x00\x03\x2E\x03\x00\x03\x34\x03\x00\x03\x3A\x03\x00\x00\x00\x01\x00\x03\x3F\x03\x00\x03\x44\x03\x00\x03\x49\x03\x00\x03\x4E\x03\x00\x03\x53\x03\x00\x03\x59\x03\x00\x03\x5F\x03\x00\x03\x65\x03\x00\x03\x6C\x03',
-    _globals = (b'\xFF\xFF\xFF\x1FJDK1_2',1,b'\xFF\xFF\xFF\x1FJDK1_4',1,b'\xFF\xFF\xFF\x0BJNIGlobalRefType',2,b'\xFF\xFF\xFF\x0BJNIInvalidRefType',0,b'\xFF\xFF\xFF\x0BJNILocalRefType',1,b'\xFF\xFF\xFF\x0BJNIWeakGlobalRefType',3,b'\xFF\xFF\xFF\x1FJNI_ABORT',2,b'\xFF\xFF\xFF\x1FJNI_COMMIT',1,b'\x00\x00\xA4\x23JNI_CreateJavaVM',0,b'\xFF\xFF\xFF\x1FJNI_EDETACHED',-2,b'\xFF\xFF\xFF\x1FJNI_EEXIST',-5,b'\xFF\xFF\xFF\x1FJNI_EINVAL',-6,b'\xFF\xFF\xFF\x1FJNI_ENOMEM',-4,b'\xFF\xFF\xFF\x1FJNI_ERR',-1,b'\xFF\xFF\xFF\x1FJNI_EVERSION',-3,b'\xFF\xFF\xFF\x1FJNI_FALSE',0,b'\x00\x00\x9F\x23JNI_GetCreatedJavaVMs',0,b'\x00\x00\xFE\x23JNI_GetDefaultJavaVMInitArgs',0,b'\xFF\xFF\xFF\x1FJNI_OK',0,b'\x00\x00\xB6\x23JNI_OnLoad',0,b'\x00\x02\x18\x23JNI_OnUnload',0,b'\xFF\xFF\xFF\x1FJNI_TRUE',1,b'\xFF\xFF\xFF\x1FJNI_VERSION_10',655360,b'\xFF\xFF\xFF\x1FJNI_VERSION_19',1245184,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_1',65537,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_2',65538,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_4',65540,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_6',65542,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_8',65544,b'\xFF\xFF\xFF\x1FJNI_VERSION_20',1310720,b'\xFF\xFF\xFF\x1FJNI_VERSION_21',1376256,b'\xFF\xFF\xFF\x1FJNI_VERSION_9',589824,b'\xFF\xFF\xFF\x1F_JAVASOFT_JNI_H_',1),
-    _struct_unions = ((b'\x00\x00\x03\x73\x00\x00\x00\x02$JNINativeMethod',b'\x00\x02\x49\x11name',b'\x00\x02\x49\x11signature',b'\x00\x00\x1E\x11fnPtr'),(b'\x00\x00\x03\xB7\x00\x00\x00\x02JNIEnv_',b'\x00\x03\xBA\x11functions'),(b'\x00\x00\x03\xB9\x00\x00\x00\x02JNIInvokeInterface_',b'\x00\x00\x1E\x11reserved0',b'\x00\x00\x1E\x11reserved1',b'\x00\x00\x1E\x11reserved2',b'\x00\x03\x97\x11DestroyJavaVM',b'\x00\x03\x99\x11AttachCurrentThread',b'\x00\x03\x97\x11DetachCurrentThread',b'\x00\x03\x98\x11GetEnv',b'\x00\x03\x99\x11AttachCurrentThreadAsDaemon'),(b'\x00\x00\x03\xBB\x00\x00\x00\x02JNINativeInterface_',b'\x00\x00\x1E\x11reserved0',b'\x00\x00\x1E\x11reserved1',b'\x00\x00\x1E\x11reserved2',b'\x00\x00\x1E\x11reserved3',b'\x00\x03\x9A\x11GetVersion',b'\x00\x03\xC5\x11DefineClass',b'\x00\x03\xC4\x11FindClass',b'\x00\x03\xC0\x11FromReflectedMethod',b'\x00\x03\xBD\x11FromReflectedField',b'\x00\x03\xCE\x11ToReflectedMethod',b'\x00\x03\xC8\x11GetSuperclass',b'\x00\x03\xDD\x11IsAssignableFrom',b'\x00\x03\xCB\x11ToReflectedField',b'\x00\x03\x9D\x11Throw',b'\x00\x03\x9F\x11ThrowNew',b'\x00\x03\xC3\x11ExceptionOccurred',b'\x00\x03\xE3\x11ExceptionDescribe',b'\x00\x03\xE3\x11ExceptionClear',b'\x00\x03\xE4\x11FatalError',b'\x00\x03\x9B\x11PushLocalFrame',b'\x00\x03\xC8\x11PopLocalFrame',b'\x00\x03\xC8\x11NewGlobalRef',b'\x00\x03\xE5\x11DeleteGlobalRef',b'\x00\x03\xE5\x11DeleteLocalRef',b'\x00\x03\xDD\x11IsSameObject',b'\x00\x03\xC8\x11NewLocalRef',b'\x00\x03\x9B\x11EnsureLocalCapacity',b'\x00\x03\xC8\x11AllocObject',b'\x00\x03\xCC\x11NewObject',b'\x00\x03\xCF\x11NewObjectV',b'\x00\x03\xCD\x11NewObjectA',b'\x00\x03\xC8\x11GetObjectClass',b'\x00\x03\xDD\x11IsInstanceOf',b'\x00\x03\xC1\x11GetMethodID',b'\x00\x03\xCC\x11CallObjectMethod',b'\x00\x03\xCF\x11CallObjectMethodV',b'\x00\x03\xCD\x11CallObjectMethodA',b'\x00\x03\xDA\x11CallBooleanMethod',b'\x00\x03\xDC\x11CallBooleanMethodV',b'\x00\x03\xDB\x11CallBooleanMethodA',b'\x00\x03\xB1\x11CallByteMethod',b'\x00\x03\xB3\x11CallByteMethodV',b'\x00\x03\xB2\x11CallByteMethodA',b'\x00\x04\x16\x11CallCharMethod',b'\x00\x04\x18\x11CallCharMethodV',b'\x00\x04\x17\x11CallCharMethodA',b'\x00\x03\xA9\x11CallShortMethod',b'\x00\x03\xAB\x11CallShortMethodV',b'\x00\x03\xAA\x11CallShortMethodA',b'\x00\x03\xA1\x11CallIntMethod',b'\x00\x03\xA3\x11CallIntMethodV',b'\x00\x03\xA2\x11CallIntMethodA',b'\x00\x03\x8D\x11CallLongMethod',b'\x00\x03\x8F\x11CallLongMethodV',b'\x00\x03\x8E\x11CallLongMethodA',b'\x00\x03\x84\x11CallFloatMethod',b'\x00\x03\x86\x11CallFloatMethodV',b'\x00\x03\x85\x11CallFloatMethodA',b'\x00\x03\x7C\x11CallDoubleMethod',b'\x00\x03\x7E\x11CallDoubleMethodV',b'\x00\x03\x7D\x11CallDoubleMethodA',b'\x00\x04\x08\x11CallVoidMethod',b'\x00\x04\x0A\x11CallVoidMethodV',b'\x00\x04\x09\x11CallVoidMethodA',b'\x00\x03\xD0\x11CallNonvirtualObjectMethod',b'\x00\x03\xD2\x11CallNonvirtualObjectMethodV',b'\x00\x03\xD1\x11CallNonvirtualObjectMethodA',b'\x00\x03\xDE\x11CallNonvirtualBooleanMethod',b'\x00\x03\xE0\x11CallNonvirtualBooleanMethodV',b'\x00\x03\xDF\x11CallNonvirtualBooleanMethodA',b'\x00\x03\xB4\x11CallNonvirtualByteMethod',b'\x00\x03\xB6\x11CallNonvirtualByteMethodV',b'\x00\x03\xB5\x11CallNonvirtualByteMethodA',b'\x00\x04\x19\x11CallNonvirtualCharMethod',b'\x00\x04\x1B\x11CallNonvirtualCharMethodV',b'\x00\x04\x1A\x11CallNonvirtualCharMethodA',b'\x00\x03\xAC\x11CallNonvirtualShortMethod',b'\x00\x03\xAE\x11CallNonvirtualShortMethodV',b'\x00\x03\xAD\x11CallNonvirtualShortMethodA',b'\x00\x03\xA4\x11CallNonvirtualIntMethod',b'\x00\x03\xA6\x11CallNonvirtualIntMethodV',b'\x00\x03\xA5\x11CallNonvirtualIntMethodA',b'\x00\x03\x90\x11CallNonvirtualLongMethod',b'\x00\x03\x92\x11CallNonvirtualLongMethodV',b'\x00\x03\x91\x11CallNonvirtualLongMethodA',b'\x00\x03\x87\x11CallNonvirtualFloatMethod',b'\x00\x03\x89\x11CallNonvirtualFloatMethodV',b'\x00\x03\x88\x11CallNonvirtualFloatMethodA',b'\x00\x03\x7F\x11CallNonvirtualDoubleMethod',b'\x00\x03\x81\x11CallNonvirtualDoubleMethodV',b'\x00\x03\x80\x11CallNonvirtualDoubleMethodA',b'\x00\x04\x0B\x11CallNonvirtualVoidMethod',b'\x00\x04\x0D\x11CallNonvirtualVoidMethodV',b'\x00\x04\x0C\x11CallNonvirtualVoidMethodA',b'\x00\x03\xBE\x11GetFieldID',b'\x00\x03\xCA\x11GetObjectField',b'\x00\x03\xD9\x11GetBooleanField',b'\x00\x03\xB0\x11GetByteField',b'\x00\x04\x15\x11GetCharField',b'\x00\x03\xA8\x11GetShortField',b'\x00\x03\xA0\x11GetIntField',b'\x00\x03\x8C\x11GetLongField',b'\x00\x03\x83\x11GetFloatField',b'\x00\x03\x7B\x11GetDoubleField',b'\x00\x04\x05\x11SetObjectField',b'\x00\x04\x06\x11SetBooleanField',b'\x00\x04\x04\x11SetByteField',b'\x00\x04\x07\x11SetCharField',b'\x00\x04\x03\x11SetShortField',b'\x00\x04\x02\x11SetIntField',b'\x00\x04\x01\x11SetLongField',b'\x00\x04\x00\x11SetFloatField',b'\x00\x03\xFF\x11SetDoubleField',b'\x00\x03\xC1\x11GetStaticMethodID',b'\x00\x03\xCC\x11CallStaticObjectMethod',b'\x00\x03\xCF\x11CallStaticObjectMethodV',b'\x00\x03\xCD\x11CallStaticObjectMethodA',b'\x00\x03\xDA\x11CallStaticBooleanMethod',b'\x00\x03\xDC\x11CallStaticBooleanMethodV',b'\x00\x03\xDB\x11CallStaticBooleanMethodA',b'\x00\x03\xB1\x11CallStaticByteMethod',b'\x00\x03\xB3\x11CallStaticByteMethodV',b'\x00\x03\xB2\x11CallStaticByteMethodA',b'\x00\x04\x16\x11CallStaticCharMethod',b'\x00\x04\x18\x11CallStaticCharMethodV',b'\x00\x04\x17\x11CallStaticCharMethodA',b'\x00\x03\xA9\x11CallStaticShortMethod',b'\x00\x03\xAB\x11CallStaticShortMethodV',b'\x00\x03\xAA\x11CallStaticShortMethodA',b'\x00\x03\xA1\x11CallStaticIntMethod',b'\x00\x03\xA3\x11CallStaticIntMethodV',b'\x00\x03\xA2\x11CallStaticIntMethodA',b'\x00\x03\x8D\x11CallStaticLongMethod',b'\x00\x03\x8F\x11CallStaticLongMethodV',b'\x00\x03\x8E\x11CallStaticLongMethodA',b'\x00\x03\x84\x11CallStaticFloatMethod',b'\x00\x03\x86\x11CallStaticFloatMethodV',b'\x00\x03\x85\x11CallStaticFloatMethodA',b'\x00\x03\x7C\x11CallStaticDoubleMethod',b'\x00\x03\x7E\x11CallStaticDoubleMethodV',b'\x00\x03\x7D\x11CallStaticDoubleMethodA',b'\x00\x04\x08\x11CallStaticVoidMethod',b'\x00\x04\x0A\x11CallStaticVoidMethodV',b'\x00\x04\x09\x11CallStaticVoidMethodA',b'\x00\x03\xBE\x11GetStaticFieldID',b'\x00\x03\xCA\x11GetStaticObjectField',b'\x00\x03\xD9\x11GetStaticBooleanField',b'\x00\x03\xB0\x11GetStaticByteField',b'\x00\x04\x15\x11GetStaticCharField',b'\x00\x03\xA8\x11GetStaticShortField',b'\x00\x03\xA0\x11GetStaticIntField',b'\x00\x03\x8C\x11GetStaticLongField',b'\x00\x03\x83\x11GetStaticFloatField',b'\x00\x03\x7B\x11GetStaticDoubleField',b'\x00\x04\x05\x11SetStaticObjectField',b'\x00\x04\x06\x11SetStaticBooleanField',b'\x00\x04\x04\x11SetStaticByteField',b'\x00\x04\x07\x11SetStaticCharField',b'\x00\x04\x03\x11SetStaticShortField',b'\x00\x04\x02\x11SetStaticIntField',b'\x00\x04\x01\x11SetStaticLongField',b'\x00\x04\x00\x11SetStaticFloatField',b'\x00\x03\xFF\x11SetStaticDoubleField',b'\x00\x03\xD4\x11NewString',b'\x00\x03\x9D\x11GetStringLength',b'\x00\x04\x14\x11GetStringChars',b'\x00\x04\x11\x11ReleaseStringChars',b'\x00\x03\xC4\x11NewStringUTF',b'\x00\x03\x9D\x11GetStringUTFLength',b'\x00\x03\x78\x11GetStringUTFChars',b'\x00\x03\xE6\x11ReleaseStringUTFChars',b'\x00\x03\x9D\x11GetArrayLength',b'\x00\x03\xC7\x11NewObjectArray',b'\x00\x03\xC9\x11GetObjectArrayElement',b'\x00\x03\xFC\x11SetObjectArrayElement',b'\x00\x03\xC6\x11NewBooleanArray',b'\x00\x03\xC6\x11NewByteArray',b'\x00\x03\xC6\x11NewCharArray',b'\x00\x03\xC6\x11NewShortArray',b'\x00\x03\xC6\x11NewIntArray',b'\x00\x03\xC6\x11NewLongArray',b'\x00\x03\xC6\x11NewFloatArray',b'\x00\x03\xC6\x11NewDoubleArray',b'\x00\x03\xD6\x11GetBooleanArrayElements',b'\x00\x03\xAF\x11GetByteArrayElements',b'\x00\x04\x13\x11GetCharArrayElements',b'\x00\x03\xA7\x11GetShortArrayElements',b'\x00\x03\x96\x11GetIntArrayElements',b'\x00\x03\x8A\x11GetLongArrayElements',b'\x00\x03\x82\x11GetFloatArrayElements',b'\x00\x03\x7A\x11GetDoubleArrayElements',b'\x00\x04\x0E\x11ReleaseBooleanArrayElements',b'\x00\x03\xFE\x11ReleaseByteArrayElements',b'\x00\x04\x10\x11ReleaseCharArrayElements',b'\x00\x03\xFD\x11ReleaseShortArrayElements',b'\x00\x03\xEA\x11ReleaseIntArrayElements',b'\x00\x03\xE9\x11ReleaseLongArrayElements',b'\x00\x03\xE8\x11ReleaseFloatArrayElements',b'\x00\x03\xE7\x11ReleaseDoubleArrayElements',b'\x00\x03\xF8\x11GetBooleanArrayRegion',b'\x00\x03\xF6\x11GetByteArrayRegion',b'\x00\x03\xFA\x11GetCharArrayRegion',b'\x00\x03\xF4\x11GetShortArrayRegion',b'\x00\x03\xF2\x11GetIntArrayRegion',b'\x00\x03\xF0\x11GetLongArrayRegion',b'\x00\x03\xEE\x11GetFloatArrayRegion',b'\x00\x03\xEC\x11GetDoubleArrayRegion',b'\x00\x03\xF9\x11SetBooleanArrayRegion',b'\x00\x03\xF7\x11SetByteArrayRegion',b'\x00\x03\xFB\x11SetCharArrayRegion',b'\x00\x03\xF5\x11SetShortArrayRegion',b'\x00\x03\xF3\x11SetIntArrayRegion',b'\x00\x03\xF1\x11SetLongArrayRegion',b'\x00\x03\xEF\x11SetFloatArrayRegion',b'\x00\x03\xED\x11SetDoubleArrayRegion',b'\x00\x03\x9E\x11RegisterNatives',b'\x00\x03\x9D\x11UnregisterNatives',b'\x00\x03\x9D\x11MonitorEnter',b'\x00\x03\x9D\x11MonitorExit',b'\x00\x03\x9C\x11GetJavaVM',b'\x00\x03\xFA\x11GetStringRegion',b'\x00\x03\xEB\x11GetStringUTFRegion',b'\x00\x03\xE2\x11GetPrimitiveArrayCritical',b'\x00\x04\x0F\x11ReleasePrimitiveArrayCritical',b'\x00\x04\x14\x11GetStringCritical',b'\x00\x04\x11\x11ReleaseStringCritical',b'\x00\x03\xC8\x11NewWeakGlobalRef',b'\x00\x03\xE5\x11DeleteWeakGlobalRef',b'\x00\x03\xD7\x11ExceptionCheck',b'\x00\x03\xD3\x11NewDirectByteBuffer',b'\x00\x03\xE1\x11GetDirectBufferAddress',b'\x00\x03\x8B\x11GetDirectBufferCapacity',b'\x00\x03\x93\x11GetObjectRefType',b'\x00\x03\xC8\x11GetModule',b'\x00\x03\xD8\x11IsVirtualThread'),(b'\x00\x00\x03\x74\x00\x00\x00\x02JavaVMAttachArgs',b'\x00\x00\xA1\x11version',b'\x00\x02\x49\x11name',b'\x00\x00\x02\x11group'),(b'\x00\x00\x03\x75\x00\x00\x00\x02JavaVMInitArgs',b'\x00\x00\xA1\x11version',b'\x00\x00\xA1\x11nOptions',b'\x00\x03\x76\x11options',b'\x00\x01\x9D\x11ignoreUnrecognized'),(b'\x00\x00\x03\x77\x00\x00\x00\x02JavaVMOption',b'\x00\x02\x49\x11optionString',b'\x00\x00\x1E\x11extraInfo'),(b'\x00\x00\x03\xBC\x00\x00\x00\x02JavaVM_',b'\x00\x03\xB8\x11functions'),(b'\x00\x00\x03\xBF\x00\x00\x00\x10_jfieldID',),(b'\x00\x00\x03\xC2\x00\x00\x00\x10_jmethodID',),(b'\x00\x00\x03\xD5\x00\x00\x00\x10_jobject',),(b'\x00\x00\x03\x95\x00\x00\x00\x03jvalue',b'\x00\x01\x9D\x11z',b'\x00\x02\xEF\x11b',b'\x00\x03\x01\x11c',b'\x00\x02\xE9\x11s',b'\x00\x00\xA1\x11i',b'\x00\x01\xCD\x11j',b'\x00\x02\xD7\x11f',b'\x00\x02\xD1\x11d',b'\x00\x00\x02\x11l')),
-    _enums = (b'\x00\x00\x03\x94\x00\x00\x00\x16_jobjectType\x00JNIInvalidRefType,JNILocalRefType,JNIGlobalRefType,JNIWeakGlobalRefType',),
-    _typenames = (b'\x00\x00\x03\xBAJNIEnv',b'\x00\x00\x03\x73JNINativeMethod',b'\x00\x00\x03\xB8JavaVM',b'\x00\x00\x03\x74JavaVMAttachArgs',b'\x00\x00\x03\x75JavaVMInitArgs',b'\x00\x00\x03\x77JavaVMOption',b'\x00\x00\x00\x02jarray',b'\x00\x00\x01\x9Djboolean',b'\x00\x00\x00\x02jbooleanArray',b'\x00\x00\x02\xEFjbyte',b'\x00\x00\x00\x02jbyteArray',b'\x00\x00\x03\x01jchar',b'\x00\x00\x00\x02jcharArray',b'\x00\x00\x00\x02jclass',b'\x00\x00\x02\xD1jdouble',b'\x00\x00\x00\x02jdoubleArray',b'\x00\x00\x00\x0DjfieldID',b'\x00\x00\x02\xD7jfloat',b'\x00\x00\x00\x02jfloatArray',b'\x00\x00\x00\xA1jint',b'\x00\x00\x00\x02jintArray',b'\x00\x00\x01\xCDjlong',b'\x00\x00\x00\x02jlongArray',b'\x00\x00\x00\x12jmethodID',b'\x00\x00\x00\x02jobject',b'\x00\x00\x00\x02jobjectArray',b'\x00\x00\x03\x94jobjectRefType',b'\x00\x00\x02\xE9jshort',b'\x00\x00\x00\x02jshortArray',b'\x00\x00\x00\xA1jsize',b'\x00\x00\x00\x02jstring',b'\x00\x00\x00\x02jthrowable',b'\x00\x00\x03\x95jvalue',b'\x00\x00\x00\x02jweak',b'\x00\x00\x00\x1Eva_list'),
+    _types = b'\x00\x01\x06\x0D\x00\x03\xC3\x03\x00\x03\xDE\x03\x00\x01\xD6\x03\x00\x00\x00\x0F\x00\x02\x63\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x01\xB7\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x03\x10\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\xC8\x03\x00\x00\x00\x0F\x00\x03\x10\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\xCB\x03\x00\x00\x01\x0F\x00\x03\x10\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x03\x9E\x03\x00\x00\x00\x0F\x00\x03\x10\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x04\x1B\x03\x00\x00\x00\x0F\x00\x03\x10\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x10\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x10\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x02\x6E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x03\x16\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x00\x0F\x00\x03\x16\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x16\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x16\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x03\x16\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x16\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x16\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x02\x74\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x03\x1C\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x00\x0F\x00\x03\x1C\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x1C\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x1C\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x03\x1C\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x1C\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x1C\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x02\x7A\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x02\x06\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x02\x06\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x00\x0F\x00\x02\x06\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x02\x06\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x02\x06\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x02\x06\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x02\x06\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x02\x06\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x03\x9D\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\xDE\x03\x00\x00\x09\x01\x00\x00\xD5\x03\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\xD4\x11\x00\x00\x23\x03\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x03\xC1\x03\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\xDE\x11\x00\x00\xDA\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\xDE\x11\x00\x00\xDA\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\xDE\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\xD4\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\x73\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\x82\x03\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\xD5\x0D\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x02\xD5\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x03\x2E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x00\x0F\x00\x03\x2E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x2E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x2E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x03\x2E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x2E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x2E\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x02\xE3\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x03\x34\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x00\x0F\x00\x03\x34\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x34\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x34\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x03\x34\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x03\x34\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x03\x34\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x12\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x01\x06\x11\x00\x01\x06\x11\x00\x00\x00\x0F\x00\x00\x17\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x17\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x01\x06\x11\x00\x01\x06\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x01\x06\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x01\x06\x11\x00\x00\x02\x11\x00\x03\x34\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x03\x10\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x09\x01\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x04\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x04\x01\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\x02\x0D\x00\x00\x01\x11\x00\x00\x23\x11\x00\x00\x17\x01\x00\x00\x00\x0F\x00\x00\x03\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x00\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x01\xD6\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x00\x23\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x00\x23\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\xDE\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x01\x06\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x01\x06\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\x10\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x01\xB7\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\x16\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x03\x1C\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x02\x06\x03\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\xD6\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x03\x82\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\x63\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x01\xB7\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\x6E\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x03\x16\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\x74\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x03\x1C\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\x7A\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x02\x06\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x00\xD6\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x00\xD5\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x03\x2E\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x03\x2E\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x03\x34\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x01\xB2\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x00\x03\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x09\x01\x00\x01\xD6\x03\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x09\x01\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x02\xD5\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x02\xE3\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x32\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x0E\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x0D\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x17\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x05\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x03\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x02\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x12\x11\x00\x00\x04\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x01\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x1D\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x02\x11\x00\x00\x17\x11\x00\x00\x23\x11\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x03\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x04\x1B\x0D\x00\x00\x01\x11\x00\x00\x02\x11\x00\x00\x23\x11\x00\x00\x09\x01\x00\x00\x00\x0F\x00\x00\x00\x09\x00\x00\x04\x09\x00\x00\x05\x09\x00\x03\x77\x03\x00\x00\x06\x09\x00\x00\x00\x03\x00\x00\x05\x03\x00\x00\x0A\x03\x00\x00\x0F\x03\x00\x00\x14\x03\x00\x00\x19\x03\x00\x00\x1F\x03\x00\x00\x25\x03\x00\x00\x2B\x03\x00\x00\x32\x03\x00\x00\x02\x01\x00\x00\x39\x03\x00\x00\x3E\x03\x00\x00\x43\x03\x00\x00\x48\x03\x00\x00\x4E\x03\x00\x00\x54\x03\x00\x00\x5A\x03\x00\x00\x61\x03\x00\x00\x68\x03\x00\x00\x6D\x03\x00\x00\x72\x03\x00\x00\x77\x03\x00\x00\x7D\x03\x00\x00\x83\x03\x00\x00\x89\x03\x00\x00\x90\x03\x00\x00\x97\x03\x00\x00\x9C\x03\x00\x00\xA0\x03\x00\x00\xA5\x03\x00\x00\xAA\x03\x00\x00\xB0\x03\x00\x00\xB6\x03\x00\x00\xBC\x03\x00\x00\xC3\x03\x00\x00\xCA\x03\x00\x00\x00\x0B\x00\x00\x0B\x09\x00\x00\xCE\x03\x00\x00\xDD\x03\x00\x00\xE0\x03\x00\x00\xE5\x03\x00\x00\xEE\x03\x00\x00\xF1\x03\x00\x00\xF5\x03\x00\x00\xF9\x03\x00\x00\xFD\x03\x00\x01\x03\x03\x00\x01\x08\x03\x00\x01\x0D\x03\x00\x01\x12\x03\x00\x01\x18\x03\x00\x01\x1E\x03\x00\x01\x24\x03\x00\x01\x2B\x03\x00\x01\x35\x03\x00\x01\x3A\x03\x00\x01\x3F\x03\x00\x01\x44\x03\x00\x01\x4A\x03\x00\x01\x50\x03\x00\x01\x56\x03\x00\x01\x5D\x03\x00\x01\x64\x03\x00\x01\x69\x03\x00\x01\x6E\x03\x00\x01\x73\x03\x00\x01\x79\x03\x00\x01\x7F\x03\x00\x01\x85\x03\x00\x01\x8C\x03\x00\x00\x01\x09\x00\x03\xC2\x03\x00\x00\x02\x09\x00\x03\xC4\x03\x00\x00\x03\x09\x00\x00\x07\x09\x00\x01\x93\x03\x00\x01\x97\x03\x00\x00\x08\x09\x00\x01\x9D\x03\x00\x01\xA1\x03\x00\x00\x09\x09\x00\x01\xA7\x03\x00\x01\xAA\x03\x00\x01\xAE\x03\x00\x01\xB5\x03\x00\x01\xBA\x03\x00\x01\xBE\x03\x00\x01\xC4\x03\x00\x01\xC8\x03\x00\x01\xCD\x03\x00\x01\xD2\x03\x00\x01\xD8\x03\x00\x01\xDD\x03\x00\x01\xE3\x03\x00\x01\xE9\x03\x00\x01\xEF\x03\x00\x01\xF5\x03\x00\x01\xFC\x03\x00\x02\x03\x03\x00\x00\x0A\x09\x00\x02\x08\x03\x00\x02\x0D\x03\x00\x02\x10\x03\x00\x02\x14\x03\x00\x02\x19\x03\x00\x02\x1E\x03\x00\x02\x24\x03\x00\x02\x2A\x03\x00\x02\x2F\x03\x00\x02\x35\x03\x00\x02\x3C\x03\x00\x02\x43\x03\x00\x02\x47\x03\x00\x02\x50\x03\x00\x02\x53\x03\x00\x02\x57\x03\x00\x02\x5B\x03\x00\x02\x60\x03\x00\x02\x66\x03\x00\x02\x6B\x03\x00\x02\x71\x03\x00\x02\x77\x03\x00\x02\x7D\x03\x00\x02\x83\x03\x00\x02\x8A\x03\x00\x02\x91\x03\x00\x02\x98\x03\x00\x02\x9F\x03\x00\x02\xA6\x03\x00\x02\xAD\x03\x00\x02\xB4\x03\x00\x02\xBB\x03\x00\x02\xC2\x03\x00\x02\xC9\x03\x00\x02\xD0\x03\x00\x02\xD7\x03\x00\x02\xDE\x03\x00\x02\xE5\x03\x00\x02\xEC\x03\x00\x02\xF3\x03\x00\x02\xFA\x03\x00\x03\x00\x03\x00\x03\x06\x03\x00\x03\x0C\x03\x00\x03\x12\x03\x00\x03\x18\x03\x00\x03\x1E\x03\x00\x03\x24\x03\x00\x03\x2A\x03\x00\x03\x30\x03\x00\x03\x36\x03\x00\x03\x3C\x03\x00\x03\x42\x03\x00\x03\x47\x03\x00\x03\x4D\x03\x00\x03\x53\x03\x00\x03\x59\x03\x00\x03\x60\x03\x00\x03\x67\x03\x00\x03\x6D\x03\x00\x00\x00\x01',
+    _globals = (b'\xFF\xFF\xFF\x1FJDK1_2',1,b'\xFF\xFF\xFF\x1FJDK1_4',1,b'\xFF\xFF\xFF\x0BJNIGlobalRefType',2,b'\xFF\xFF\xFF\x0BJNIInvalidRefType',0,b'\xFF\xFF\xFF\x0BJNILocalRefType',1,b'\xFF\xFF\xFF\x0BJNIWeakGlobalRefType',3,b'\xFF\xFF\xFF\x1FJNI_ABORT',2,b'\xFF\xFF\xFF\x1FJNI_COMMIT',1,b'\x00\x00\xD8\x23JNI_CreateJavaVM',0,b'\xFF\xFF\xFF\x1FJNI_EDETACHED',-2,b'\xFF\xFF\xFF\x1FJNI_EEXIST',-5,b'\xFF\xFF\xFF\x1FJNI_EINVAL',-6,b'\xFF\xFF\xFF\x1FJNI_ENOMEM',-4,b'\xFF\xFF\xFF\x1FJNI_ERR',-1,b'\xFF\xFF\xFF\x1FJNI_EVERSION',-3,b'\xFF\xFF\xFF\x1FJNI_FALSE',0,b'\x00\x00\xD3\x23JNI_GetCreatedJavaVMs',0,b'\x00\x01\x32\x23JNI_GetDefaultJavaVMInitArgs',0,b'\xFF\xFF\xFF\x1FJNI_OK',0,b'\x00\x00\xEA\x23JNI_OnLoad',0,b'\x00\x02\x4C\x23JNI_OnUnload',0,b'\xFF\xFF\xFF\x1FJNI_TRUE',1,b'\xFF\xFF\xFF\x1FJNI_VERSION_10',655360,b'\xFF\xFF\xFF\x1FJNI_VERSION_19',1245184,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_1',65537,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_2',65538,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_4',65540,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_6',65542,b'\xFF\xFF\xFF\x1FJNI_VERSION_1_8',65544,b'\xFF\xFF\xFF\x1FJNI_VERSION_20',1310720,b'\xFF\xFF\xFF\x1FJNI_VERSION_21',1376256,b'\xFF\xFF\xFF\x1FJNI_VERSION_9',589824,b'\xFF\xFF\xFF\x1F_JAVASOFT_JNI_H_',1),
+    _struct_unions = ((b'\x00\x00\x03\x73\x00\x00\x00\x02$JNINativeMethod',b'\x00\x02\x88\x11name',b'\x00\x02\x88\x11signature',b'\x00\x00\x23\x11fnPtr'),(b'\x00\x00\x03\xC0\x00\x00\x00\x02JNIEnv_',b'\x00\x03\xC3\x11functions'),(b'\x00\x00\x03\xC2\x00\x00\x00\x02JNIInvokeInterface_',b'\x00\x00\x23\x11reserved0',b'\x00\x00\x23\x11reserved1',b'\x00\x00\x23\x11reserved2',b'\x00\x03\xA0\x11DestroyJavaVM',b'\x00\x03\xA2\x11AttachCurrentThread',b'\x00\x03\xA0\x11DetachCurrentThread',b'\x00\x03\xA1\x11GetEnv',b'\x00\x03\xA2\x11AttachCurrentThreadAsDaemon'),(b'\x00\x00\x03\xC4\x00\x00\x00\x02JNINativeInterface_',b'\x00\x00\x23\x11reserved0',b'\x00\x00\x23\x11reserved1',b'\x00\x00\x23\x11reserved2',b'\x00\x00\x23\x11reserved3',b'\x00\x03\xA3\x11GetVersion',b'\x00\x03\xCE\x11DefineClass',b'\x00\x03\xCD\x11FindClass',b'\x00\x03\xC9\x11FromReflectedMethod',b'\x00\x03\xC6\x11FromReflectedField',b'\x00\x03\xD8\x11ToReflectedMethod',b'\x00\x03\xD2\x11GetSuperclass',b'\x00\x03\xE6\x11IsAssignableFrom',b'\x00\x03\xD5\x11ToReflectedField',b'\x00\x03\xA6\x11Throw',b'\x00\x03\xA8\x11ThrowNew',b'\x00\x03\xCC\x11ExceptionOccurred',b'\x00\x03\xEC\x11ExceptionDescribe',b'\x00\x03\xEC\x11ExceptionClear',b'\x00\x03\xED\x11FatalError',b'\x00\x03\xA4\x11PushLocalFrame',b'\x00\x03\xD2\x11PopLocalFrame',b'\x00\x03\xD2\x11NewGlobalRef',b'\x00\x03\xEE\x11DeleteGlobalRef',b'\x00\x03\xEE\x11DeleteLocalRef',b'\x00\x03\xE6\x11IsSameObject',b'\x00\x03\xD2\x11NewLocalRef',b'\x00\x03\xA4\x11EnsureLocalCapacity',b'\x00\x03\xD2\x11AllocObject',b'\x00\x03\xD6\x11NewObject',b'\x00\x03\xD9\x11NewObjectV',b'\x00\x03\xD7\x11NewObjectA',b'\x00\x03\xD2\x11GetObjectClass',b'\x00\x03\xE6\x11IsInstanceOf',b'\x00\x03\xCA\x11GetMethodID',b'\x00\x03\xD6\x11CallObjectMethod',b'\x00\x03\xD9\x11CallObjectMethodV',b'\x00\x03\xD7\x11CallObjectMethodA',b'\x00\x03\xE3\x11CallBooleanMethod',b'\x00\x03\xE5\x11CallBooleanMethodV',b'\x00\x03\xE4\x11CallBooleanMethodA',b'\x00\x03\xBA\x11CallByteMethod',b'\x00\x03\xBC\x11CallByteMethodV',b'\x00\x03\xBB\x11CallByteMethodA',b'\x00\x03\x7C\x11CallCharMethod',b'\x00\x03\x7E\x11CallCharMethodV',b'\x00\x03\x7D\x11CallCharMethodA',b'\x00\x03\xB2\x11CallShortMethod',b'\x00\x03\xB4\x11CallShortMethodV',b'\x00\x03\xB3\x11CallShortMethodA',b'\x00\x03\xAA\x11CallIntMethod',b'\x00\x03\xAC\x11CallIntMethodV',b'\x00\x03\xAB\x11CallIntMethodA',b'\x00\x03\x96\x11CallLongMethod',b'\x00\x03\x98\x11CallLongMethodV',b'\x00\x03\x97\x11CallLongMethodA',b'\x00\x03\x8D\x11CallFloatMethod',b'\x00\x03\x8F\x11CallFloatMethodV',b'\x00\x03\x8E\x11CallFloatMethodA',b'\x00\x03\x85\x11CallDoubleMethod',b'\x00\x03\x87\x11CallDoubleMethodV',b'\x00\x03\x86\x11CallDoubleMethodA',b'\x00\x04\x13\x11CallVoidMethod',b'\x00\x04\x15\x11CallVoidMethodV',b'\x00\x04\x14\x11CallVoidMethodA',b'\x00\x03\xDA\x11CallNonvirtualObjectMethod',b'\x00\x03\xDC\x11CallNonvirtualObjectMethodV',b'\x00\x03\xDB\x11CallNonvirtualObjectMethodA',b'\x00\x03\xE7\x11CallNonvirtualBooleanMethod',b'\x00\x03\xE9\x11CallNonvirtualBooleanMethodV',b'\x00\x03\xE8\x11CallNonvirtualBooleanMethodA',b'\x00\x03\xBD\x11CallNonvirtualByteMethod',b'\x00\x03\xBF\x11CallNonvirtualByteMethodV',b'\x00\x03\xBE\x11CallNonvirtualByteMethodA',b'\x00\x03\x7F\x11CallNonvirtualCharMethod',b'\x00\x03\x81\x11CallNonvirtualCharMethodV',b'\x00\x03\x80\x11CallNonvirtualCharMethodA',b'\x00\x03\xB5\x11CallNonvirtualShortMethod',b'\x00\x03\xB7\x11CallNonvirtualShortMethodV',b'\x00\x03\xB6\x11CallNonvirtualShortMethodA',b'\x00\x03\xAD\x11CallNonvirtualIntMethod',b'\x00\x03\xAF\x11CallNonvirtualIntMethodV',b'\x00\x03\xAE\x11CallNonvirtualIntMethodA',b'\x00\x03\x99\x11CallNonvirtualLongMethod',b'\x00\x03\x9B\x11CallNonvirtualLongMethodV',b'\x00\x03\x9A\x11CallNonvirtualLongMethodA',b'\x00\x03\x90\x11CallNonvirtualFloatMethod',b'\x00\x03\x92\x11CallNonvirtualFloatMethodV',b'\x00\x03\x91\x11CallNonvirtualFloatMethodA',b'\x00\x03\x88\x11CallNonvirtualDoubleMethod',b'\x00\x03\x8A\x11CallNonvirtualDoubleMethodV',b'\x00\x03\x89\x11CallNonvirtualDoubleMethodA',b'\x00\x04\x16\x11CallNonvirtualVoidMethod',b'\x00\x04\x18\x11CallNonvirtualVoidMethodV',b'\x00\x04\x17\x11CallNonvirtualVoidMethodA',b'\x00\x03\xC7\x11GetFieldID',b'\x00\x03\xD4\x11GetObjectField',b'\x00\x03\xE2\x11GetBooleanField',b'\x00\x03\xB9\x11GetByteField',b'\x00\x03\x7B\x11GetCharField',b'\x00\x03\xB1\x11GetShortField',b'\x00\x03\xA9\x11GetIntField',b'\x00\x03\x95\x11GetLongField',b'\x00\x03\x8C\x11GetFloatField',b'\x00\x03\x84\x11GetDoubleField',b'\x00\x04\x11\x11SetObjectField',b'\x00\x04\x12\x11SetBooleanField',b'\x00\x04\x10\x11SetByteField',b'\x00\x04\x0A\x11SetCharField',b'\x00\x04\x0F\x11SetShortField',b'\x00\x04\x0E\x11SetIntField',b'\x00\x04\x0D\x11SetLongField',b'\x00\x04\x0C\x11SetFloatField',b'\x00\x04\x0B\x11SetDoubleField',b'\x00\x03\xCA\x11GetStaticMethodID',b'\x00\x03\xD6\x11CallStaticObjectMethod',b'\x00\x03\xD9\x11CallStaticObjectMethodV',b'\x00\x03\xD7\x11CallStaticObjectMethodA',b'\x00\x03\xE3\x11CallStaticBooleanMethod',b'\x00\x03\xE5\x11CallStaticBooleanMethodV',b'\x00\x03\xE4\x11CallStaticBooleanMethodA',b'\x00\x03\xBA\x11CallStaticByteMethod',b'\x00\x03\xBC\x11CallStaticByteMethodV',b'\x00\x03\xBB\x11CallStaticByteMethodA',b'\x00\x03\x7C\x11CallStaticCharMethod',b'\x00\x03\x7E\x11CallStaticCharMethodV',b'\x00\x03\x7D\x11CallStaticCharMethodA',b'\x00\x03\xB2\x11CallStaticShortMethod',b'\x00\x03\xB4\x11CallStaticShortMethodV',b'\x00\x03\xB3\x11CallStaticShortMethodA',b'\x00\x03\xAA\x11CallStaticIntMethod',b'\x00\x03\xAC\x11CallStaticIntMethodV',b'\x00\x03\xAB\x11CallStaticIntMethodA',b'\x00\x03\x96\x11CallStaticLongMethod',b'\x00\x03\x98\x11CallStaticLongMethodV',b'\x00\x03\x97\x11CallStaticLongMethodA',b'\x00\x03\x8D\x11CallStaticFloatMethod',b'\x00\x03\x8F\x11CallStaticFloatMethodV',b'\x00\x03\x8E\x11CallStaticFloatMethodA',b'\x00\x03\x85\x11CallStaticDoubleMethod',b'\x00\x03\x87\x11CallStaticDoubleMethodV',b'\x00\x03\x86\x11CallStaticDoubleMethodA',b'\x00\x04\x13\x11CallStaticVoidMethod',b'\x00\x04\x15\x11CallStaticVoidMethodV',b'\x00\x04\x14\x11CallStaticVoidMethodA',b'\x00\x03\xC7\x11GetStaticFieldID',b'\x00\x03\xD4\x11GetStaticObjectField',b'\x00\x03\xE2\x11GetStaticBooleanField',b'\x00\x03\xB9\x11GetStaticByteField',b'\x00\x03\x7B\x11GetStaticCharField',b'\x00\x03\xB1\x11GetStaticShortField',b'\x00\x03\xA9\x11GetStaticIntField',b'\x00\x03\x95\x11GetStaticLongField',b'\x00\x03\x8C\x11GetStaticFloatField',b'\x00\x03\x84\x11GetStaticDoubleField',b'\x00\x04\x11\x11SetStaticObjectField',b'\x00\x04\x12\x11SetStaticBooleanField',b'\x00\x04\x10\x11SetStaticByteField',b'\x00\x04\x0A\x11SetStaticCharField',b'\x00\x04\x0F\x11SetStaticShortField',b'\x00\x04\x0E\x11SetStaticIntField',b'\x00\x04\x0D\x11SetStaticLongField',b'\x00\x04\x0C\x11SetStaticFloatField',b'\x00\x04\x0B\x11SetStaticDoubleField',b'\x00\x03\xCF\x11NewString',b'\x00\x03\xA6\x11GetStringLength',b'\x00\x03\x7A\x11GetStringChars',b'\x00\x03\xF1\x11ReleaseStringChars',b'\x00\x03\xCD\x11NewStringUTF',b'\x00\x03\xA6\x11GetStringUTFLength',b'\x00\x03\x78\x11GetStringUTFChars',b'\x00\x03\xEF\x11ReleaseStringUTFChars',b'\x00\x03\xA6\x11GetArrayLength',b'\x00\x03\xD1\x11NewObjectArray',b'\x00\x03\xD3\x11GetObjectArrayElement',b'\x00\x04\x07\x11SetObjectArrayElement',b'\x00\x03\xD0\x11NewBooleanArray',b'\x00\x03\xD0\x11NewByteArray',b'\x00\x03\xD0\x11NewCharArray',b'\x00\x03\xD0\x11NewShortArray',b'\x00\x03\xD0\x11NewIntArray',b'\x00\x03\xD0\x11NewLongArray',b'\x00\x03\xD0\x11NewFloatArray',b'\x00\x03\xD0\x11NewDoubleArray',b'\x00\x03\xDF\x11GetBooleanArrayElements',b'\x00\x03\xB8\x11GetByteArrayElements',b'\x00\x03\x79\x11GetCharArrayElements',b'\x00\x03\xB0\x11GetShortArrayElements',b'\x00\x03\x9F\x11GetIntArrayElements',b'\x00\x03\x93\x11GetLongArrayElements',b'\x00\x03\x8B\x11GetFloatArrayElements',b'\x00\x03\x83\x11GetDoubleArrayElements',b'\x00\x04\x19\x11ReleaseBooleanArrayElements',b'\x00\x04\x09\x11ReleaseByteArrayElements',b'\x00\x03\xF0\x11ReleaseCharArrayElements',b'\x00\x04\x08\x11ReleaseShortArrayElements',b'\x00\x03\xF5\x11ReleaseIntArrayElements',b'\x00\x03\xF4\x11ReleaseLongArrayElements',b'\x00\x03\xF3\x11ReleaseFloatArrayElements',b'\x00\x03\xF2\x11ReleaseDoubleArrayElements',b'\x00\x04\x05\x11GetBooleanArrayRegion',b'\x00\x04\x03\x11GetByteArrayRegion',b'\x00\x03\xF7\x11GetCharArrayRegion',b'\x00\x04\x01\x11GetShortArrayRegion',b'\x00\x03\xFF\x11GetIntArrayRegion',b'\x00\x03\xFD\x11GetLongArrayRegion',b'\x00\x03\xFB\x11GetFloatArrayRegion',b'\x00\x03\xF9\x11GetDoubleArrayRegion',b'\x00\x04\x06\x11SetBooleanArrayRegion',b'\x00\x04\x04\x11SetByteArrayRegion',b'\x00\x03\xF8\x11SetCharArrayRegion',b'\x00\x04\x02\x11SetShortArrayRegion',b'\x00\x04\x00\x11SetIntArrayRegion',b'\x00\x03\xFE\x11SetLongArrayRegion',b'\x00\x03\xFC\x11SetFloatArrayRegion',b'\x00\x03\xFA\x11SetDoubleArrayRegion',b'\x00\x03\xA7\x11RegisterNatives',b'\x00\x03\xA6\x11UnregisterNatives',b'\x00\x03\xA6\x11MonitorEnter',b'\x00\x03\xA6\x11MonitorExit',b'\x00\x03\xA5\x11GetJavaVM',b'\x00\x03\xF7\x11GetStringRegion',b'\x00\x03\xF6\x11GetStringUTFRegion',b'\x00\x03\xEB\x11GetPrimitiveArrayCritical',b'\x00\x04\x1A\x11ReleasePrimitiveArrayCritical',b'\x00\x03\x7A\x11GetStringCritical',b'\x00\x03\xF1\x11ReleaseStringCritical',b'\x00\x03\xD2\x11NewWeakGlobalRef',b'\x00\x03\xEE\x11DeleteWeakGlobalRef',b'\x00\x03\xE0\x11ExceptionCheck',b'\x00\x03\xDD\x11NewDirectByteBuffer',b'\x00\x03\xEA\x11GetDirectBufferAddress',b'\x00\x03\x94\x11GetDirectBufferCapacity',b'\x00\x03\x9C\x11GetObjectRefType',b'\x00\x03\xD2\x11GetModule',b'\x00\x03\xE1\x11IsVirtualThread'),(b'\x00\x00\x03\x74\x00\x00\x00\x02JavaVMAttachArgs',b'\x00\x00\xD5\x11version',b'\x00\x02\x88\x11name',b'\x00\x00\x02\x11group'),(b'\x00\x00\x03\x75\x00\x00\x00\x02JavaVMInitArgs',b'\x00\x00\xD5\x11version',b'\x00\x00\xD5\x11nOptions',b'\x00\x03\x76\x11options',b'\x00\x01\xD6\x11ignoreUnrecognized'),(b'\x00\x00\x03\x77\x00\x00\x00\x02JavaVMOption',b'\x00\x02\x88\x11optionString',b'\x00\x00\x23\x11extraInfo'),(b'\x00\x00\x03\xC5\x00\x00\x00\x02JavaVM_',b'\x00\x03\xC1\x11functions'),(b'\x00\x00\x03\xC8\x00\x00\x00\x10_jfieldID',),(b'\x00\x00\x03\xCB\x00\x00\x00\x10_jmethodID',),(b'\x00\x00\x03\xDE\x00\x00\x00\x10_jobject',),(b'\x00\x00\x03\x9E\x00\x00\x00\x03jvalue',b'\x00\x01\xD6\x11z',b'\x00\x03\x34\x11b',b'\x00\x03\x10\x11c',b'\x00\x03\x2E\x11s',b'\x00\x00\xD5\x11i',b'\x00\x02\x06\x11j',b'\x00\x03\x1C\x11f',b'\x00\x03\x16\x11d',b'\x00\x00\x02\x11l')),
+    _enums = (b'\x00\x00\x03\x9D\x00\x00\x00\x16_jobjectType\x00JNIInvalidRefType,JNILocalRefType,JNIGlobalRefType,JNIWeakGlobalRefType',),
+    _typenames = (b'\x00\x00\x03\xC3JNIEnv',b'\x00\x00\x03\x73JNINativeMethod',b'\x00\x00\x03\xC1JavaVM',b'\x00\x00\x03\x74JavaVMAttachArgs',b'\x00\x00\x03\x75JavaVMInitArgs',b'\x00\x00\x03\x77JavaVMOption',b'\x00\x00\x00\x02jarray',b'\x00\x00\x01\xD6jboolean',b'\x00\x00\x00\x02jbooleanArray',b'\x00\x00\x03\x34jbyte',b'\x00\x00\x00\x02jbyteArray',b'\x00\x00\x03\x10jchar',b'\x00\x00\x00\x02jcharArray',b'\x00\x00\x00\x02jclass',b'\x00\x00\x03\x16jdouble',b'\x00\x00\x00\x02jdoubleArray',b'\x00\x00\x00\x12jfieldID',b'\x00\x00\x03\x1Cjfloat',b'\x00\x00\x00\x02jfloatArray',b'\x00\x00\x00\xD5jint',b'\x00\x00\x00\x02jintArray',b'\x00\x00\x02\x06jlong',b'\x00\x00\x00\x02jlongArray',b'\x00\x00\x00\x17jmethodID',b'\x00\x00\x00\x02jobject',b'\x00\x00\x00\x02jobjectArray',b'\x00\x00\x03\x9DjobjectRefType',b'\x00\x00\x03\x2Ejshort',b'\x00\x00\x00\x02jshortArray',b'\x00\x00\x00\xD5jsize',b'\x00\x00\x00\x02jstring',b'\x00\x00\x00\x02jthrowable',b'\x00\x00\x03\x9Ejvalue',b'\x00\x00\x00\x02jweak',b'\x00\x00\x00\x23va_list'),
 )
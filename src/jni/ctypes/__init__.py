@@ -7,6 +7,7 @@ import sys
 import os
 import platform
 import ctypes as ct
+from functools import cached_property
 
 if platform.win32_ver()[0]:
     from ctypes  import WinDLL as DLL  # noqa: N814
@@ -28,6 +29,8 @@ from ctypes import sizeof     # noqa: F401
 from ctypes import py_object  # noqa: F401
 from ctypes import memmove    # noqa: F401
 from ctypes import cast
+
+from .._gil import gil_policy as _gil_policy
 __none = object()
 obj         = lambda ctype, init=__none: ctype() if init is __none else ctype(init)
 new         = lambda ctype, init=__none: pointer(ctype() if init is __none else ctype(init))
@@ -35,7 +38,7 @@ new_array   = lambda ctype, size: (ctype * size)()
 new_cstr    = lambda init, __ct=ct: __ct.cast(__ct.create_string_buffer(init), __ct.c_char_p)
 as_cstr     = lambda obj,  __ct=ct: __ct.c_char_p(obj)
 to_bytes    = lambda obj, size=-1, __ct=ct: __ct.string_at(obj, size=size)
-to_unicode  = lambda obj, size=-1, __ct=ct: __ct.wstring_at(obj, size=size)
+to_unicode  = lambda obj, size=-1: __to_unicode(obj, size)
 from_buffer = lambda data, __ct=ct: __ct.cast((__ct.c_char * 0).from_buffer(data), __ct.POINTER(__ct.c_char))
 
 def defined(varname, __getframe=sys._getframe):
@@ -45,9 +48,37 @@ def defined(varname, __getframe=sys._getframe):
 def from_oid(oid, __cast=ct.cast, __py_object=ct.py_object):
     return __cast(oid, __py_object).value if oid else None
 
+def buffer_pointer(view, ptype, __ct=ct):
+    # No copy, except for read-only buffers other than (whole) bytes objects.
+    obj = view.obj
+    if not view.readonly:
+        data = (__ct.c_char * view.nbytes).from_buffer(view)
+    elif type(obj) is bytes and view.nbytes == len(obj):
+        data = __ct.c_char_p(obj)
+    else:
+        data = (__ct.c_char * view.nbytes).from_buffer_copy(view)
+    return __ct.cast(data, ptype)
+
+def buffer_at(ptr, size, owner=None, __ct=ct):
+    # The size bytes at ptr, valid as long as owner (if any) is alive.
+    buf = (__ct.c_char * size).from_address(__ct.cast(ptr, __ct.c_void_p).value)
+    if owner is not None: buf._owner = owner
+    return buf
+
+_utf16 = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"  # of jchar strings
+
+def __to_unicode(obj, size=-1, __ct=ct):
+    # obj points to a jchar string of size jchars (or 0-terminated if size < 0)
+    if size < 0:
+        chars = __ct.cast(obj, __ct.POINTER(jchar))
+        size = 0
+        while chars[size]: size += 1
+    address = __ct.cast(obj, __ct.c_void_p).value
+    return str((__ct.c_char * (size * 2)).from_address(address), _utf16, "surrogatepass")
+
 
 # Notes:
-#   if (GIL ?) should be use: with JHost.ThreadState():
+#   the GIL is released or kept during a JNI call according to jni.gil_policy.
 
 #
 # JNI Types
@@ -58,7 +89,7 @@ jlong    = ct.c_int64
 jbyte    = ct.c_int8
 
 jboolean = ct.c_ubyte
-jchar    = ct.c_wchar
+jchar    = ct.c_uint16  # UTF-16 code unit (not ct.c_wchar: 32 bits on Linux)
 jshort   = ct.c_int16
 jfloat   = ct.c_float
 jdouble  = ct.c_double
@@ -93,6 +124,13 @@ class jvalue(ct.Union):
     ("l", jobject),
 ]
 
+# jvalue.c is a jchar (an UTF-16 code unit), but accepts and returns
+# (as the Char methods) a 1-character str.
+jvalue._c = jvalue.c
+jvalue.c  = property(lambda self: chr(self._c),
+                     lambda self, value: setattr(self, "_c", ord(value)
+                                                 if isinstance(value, str) else value))
+
 
 if platform.system().lower() == "cli":
     _jvalue = jvalue
@@ -179,6 +217,11 @@ class JNINativeInterface_(ct.Structure): pass
 class JNIEnv(ct.Structure):
     _fields_ = [("functions", POINTER(JNINativeInterface_))]
 
+    @cached_property
+    def __fun(self):
+        # Function table of an env which was not obtained by JEnv()
+        return _bind_functions(self.functions[0], _gil_policy)
+
     def _handle_JNIException(self, err):
         import sys
         fun_name = sys._getframe(1).f_code.co_name
@@ -186,15 +229,13 @@ class JNIEnv(ct.Structure):
 
     def _handle_JavaException(self):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         jthr = fun.ExceptionOccurred(env)
         fun.ExceptionClear(env)
         jexc = fun.NewGlobalRef(env, jthr)
         fun.DeleteLocalRef(env, jthr)
-        if Throwable.last:
-            cause = Throwable.last.getCause()
-            if cause: fun.DeleteGlobalRef(env, cause)
-            Throwable.last = None
+        for cause in Throwable._release():
+            fun.DeleteGlobalRef(env, cause)
         fun.ExceptionClear(env)
         Throwable.last = thr = Throwable(jexc)  # !!!, fname)
         raise thr
@@ -203,7 +244,7 @@ class JNIEnv(ct.Structure):
 
     def GetVersion(self):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetVersion(env)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -212,128 +253,144 @@ class JNIEnv(ct.Structure):
 
     def DefineClass(self, name, loader, buf, blen):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.DefineClass(env, name, loader, buf, blen)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def FindClass(self, name):  # (GIL ?)
+    def FindClass(self, name):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.FindClass(env, name)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetSuperclass(self, sub):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetSuperclass(env, sub)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def IsAssignableFrom(self, sub, sup):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         return bool(fun.IsAssignableFrom(env, sub, sup))
 
     # Java exceptions handling
 
     def Throw(self, obj):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.Throw(env, obj)
         if ret != 0: self._handle_JNIException(ret)
 
     def ThrowNew(self, clazz, msg):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.ThrowNew(env, clazz, msg)
         if ret != 0: self._handle_JNIException(ret)
 
     def ExceptionOccurred(self):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         return fun.ExceptionOccurred(env)
 
     def ExceptionDescribe(self):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ExceptionDescribe(env)
 
     def ExceptionClear(self):
         env = self
-        fun = self.functions[0]
-        if Throwable.last:
-            cause = Throwable.last.getCause()
-            if cause: fun.DeleteGlobalRef(env, cause)
-            Throwable.last = None
+        fun = self.__fun
+        for cause in Throwable._release():
+            fun.DeleteGlobalRef(env, cause)
         fun.ExceptionClear(env)
 
     def FatalError(self, msg):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.FatalError(env, msg)
 
     def ExceptionCheck(self):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         return bool(fun.ExceptionCheck(env))
 
     # JVM Call frame
 
     def PushLocalFrame(self, capacity):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.PushLocalFrame(env, capacity)
         if ret != 0 and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def PopLocalFrame(self, result):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         return fun.PopLocalFrame(env, result)
 
     # Java references handling
 
     def NewGlobalRef(self, lobj):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewGlobalRef(env, lobj)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def DeleteGlobalRef(self, gref):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         if gref: fun.DeleteGlobalRef(env, gref)
 
     def NewLocalRef(self, ref):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewLocalRef(env, ref)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def DeleteLocalRef(self, obj):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         if obj: fun.DeleteLocalRef(env, obj)
 
     def NewWeakGlobalRef(self, obj):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewWeakGlobalRef(env, obj)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def DeleteWeakGlobalRef(self, ref):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.DeleteWeakGlobalRef(env, ref)
 
+    def DeleteGlobalRefs(self, refs):
+        env = self
+        fun = self.__fun
+        for ref in refs:
+            if ref: fun.DeleteGlobalRef(env, ref)
+
+    def DeleteLocalRefs(self, refs):
+        env = self
+        fun = self.__fun
+        for ref in refs:
+            if ref: fun.DeleteLocalRef(env, ref)
+
+    def DeleteWeakGlobalRefs(self, refs):
+        env = self
+        fun = self.__fun
+        for ref in refs:
+            if ref: fun.DeleteWeakGlobalRef(env, ref)
+
     def EnsureLocalCapacity(self, capacity):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.EnsureLocalCapacity(env, capacity)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -342,21 +399,21 @@ class JNIEnv(ct.Structure):
 
     def AllocObject(self, clazz):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.AllocObject(env, clazz)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def NewObject(self, clazz, methodID, args=None):  # (GIL ?)
+    def NewObject(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewObjectA(env, clazz, methodID, args)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetObjectClass(self, obj):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetObjectClass(env, obj)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -364,96 +421,96 @@ class JNIEnv(ct.Structure):
     def GetObjectRefType(self, obj):
         # New in JNI 1.6
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetObjectRefType(env, obj)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def IsInstanceOf(self, obj, clazz):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         return bool(fun.IsInstanceOf(env, obj, clazz))
 
     def IsSameObject(self, obj1, obj2):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         return bool(fun.IsSameObject(env, obj1, obj2))
 
     # Call Java instance method
 
     def GetMethodID(self, clazz, name, sig):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetMethodID(env, clazz, name, sig)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallObjectMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallObjectMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallObjectMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallBooleanMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallBooleanMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallBooleanMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return bool(ret)
 
-    def CallByteMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallByteMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallByteMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallCharMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallCharMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallCharMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
-        return ret
+        return chr(ret)
 
-    def CallShortMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallShortMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallShortMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallIntMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallIntMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallIntMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallLongMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallLongMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallLongMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallFloatMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallFloatMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallFloatMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallDoubleMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallDoubleMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallDoubleMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallVoidMethod(self, obj, methodID, args=None):  # (GIL ?)
+    def CallVoidMethod(self, obj, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.CallVoidMethodA(env, obj, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -461,70 +518,70 @@ class JNIEnv(ct.Structure):
 
     def CallNonvirtualObjectMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualObjectMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def CallNonvirtualBooleanMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualBooleanMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return bool(ret)
 
     def CallNonvirtualByteMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualByteMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def CallNonvirtualCharMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualCharMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
-        return ret
+        return chr(ret)
 
     def CallNonvirtualShortMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualShortMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def CallNonvirtualIntMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualIntMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def CallNonvirtualLongMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualLongMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def CallNonvirtualFloatMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualFloatMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def CallNonvirtualDoubleMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallNonvirtualDoubleMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def CallNonvirtualVoidMethod(self, obj, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.CallNonvirtualVoidMethodA(env, obj, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -532,70 +589,70 @@ class JNIEnv(ct.Structure):
 
     def GetFieldID(self, clazz, name, sig):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetFieldID(env, clazz, name, sig)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetObjectField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetObjectField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetBooleanField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetBooleanField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return bool(ret)
 
     def GetByteField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetByteField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetCharField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetCharField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
-        return ret
+        return chr(ret)
 
     def GetShortField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetShortField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetIntField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetIntField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetLongField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetLongField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetFloatField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetFloatField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetDoubleField(self, obj, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetDoubleField(env, obj, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -604,55 +661,56 @@ class JNIEnv(ct.Structure):
 
     def SetObjectField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetObjectField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetBooleanField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetBooleanField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetByteField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetByteField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetCharField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
+        if isinstance(value, str): value = ord(value)
         fun.SetCharField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetShortField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetShortField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetIntField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetIntField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetLongField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetLongField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetFloatField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetFloatField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetDoubleField(self, obj, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetDoubleField(env, obj, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -660,77 +718,77 @@ class JNIEnv(ct.Structure):
 
     def GetStaticMethodID(self, clazz, name, sig):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticMethodID(env, clazz, name, sig)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticObjectMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticObjectMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticObjectMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticBooleanMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticBooleanMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticBooleanMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return bool(ret)
 
-    def CallStaticByteMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticByteMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticByteMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticCharMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticCharMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticCharMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
-        return ret
+        return chr(ret)
 
-    def CallStaticShortMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticShortMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticShortMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticIntMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticIntMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticIntMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticLongMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticLongMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticLongMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticFloatMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticFloatMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticFloatMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticDoubleMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticDoubleMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.CallStaticDoubleMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
-    def CallStaticVoidMethod(self, clazz, methodID, args=None):  # (GIL ?)
+    def CallStaticVoidMethod(self, clazz, methodID, args=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.CallStaticVoidMethodA(env, clazz, methodID, args)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -738,70 +796,70 @@ class JNIEnv(ct.Structure):
 
     def GetStaticFieldID(self, clazz, name, sig):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticFieldID(env, clazz, name, sig)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStaticObjectField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticObjectField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStaticBooleanField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticBooleanField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return bool(ret)
 
     def GetStaticByteField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticByteField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStaticCharField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticCharField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
-        return ret
+        return chr(ret)
 
     def GetStaticShortField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticShortField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStaticIntField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticIntField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStaticLongField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticLongField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStaticFloatField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticFloatField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStaticDoubleField(self, clazz, fieldID):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStaticDoubleField(env, clazz, fieldID)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -810,55 +868,56 @@ class JNIEnv(ct.Structure):
 
     def SetStaticObjectField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetStaticObjectField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetStaticBooleanField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetStaticBooleanField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetStaticByteField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetStaticByteField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetStaticCharField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
+        if isinstance(value, str): value = ord(value)
         fun.SetStaticCharField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetStaticShortField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetStaticShortField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetStaticIntField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetStaticIntField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetStaticLongField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetStaticLongField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetStaticFloatField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetStaticFloatField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetStaticDoubleField(self, clazz, fieldID, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetStaticDoubleField(env, clazz, fieldID, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -866,67 +925,69 @@ class JNIEnv(ct.Structure):
 
     def NewString(self, unicode, slen):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
+        if isinstance(unicode, str):
+            unicode = cast(as_cstr(unicode.encode(_utf16, "surrogatepass")), POINTER(jchar))
         ret = fun.NewString(env, unicode, slen)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStringLength(self, str):  # noqa: A002
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStringLength(env, str)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStringChars(self, str, isCopy=None):  # noqa: A002
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStringChars(env, str, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def ReleaseStringChars(self, str, chars):  # noqa: A002
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseStringChars(env, str, chars)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def NewStringUTF(self, utf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewStringUTF(env, utf)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStringUTFLength(self, str):  # noqa: A002
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStringUTFLength(env, str)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetStringUTFChars(self, str, isCopy=None):  # noqa: A002
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStringUTFChars(env, str, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def ReleaseStringUTFChars(self, str, chars):  # noqa: A002
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseStringUTFChars(env, str, chars)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetStringRegion(self, str, start, len, buf):  # noqa: A002
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetStringRegion(env, str, start, len, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetStringUTFRegion(self, str, start, len, buf):  # noqa: A002
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetStringUTFRegion(env, str, start, len, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -934,14 +995,14 @@ class JNIEnv(ct.Structure):
 
     def GetStringCritical(self, string, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetStringCritical(env, string, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def ReleaseStringCritical(self, string, cstring):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseStringCritical(env, string, cstring)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -949,284 +1010,311 @@ class JNIEnv(ct.Structure):
 
     def GetArrayLength(self, array):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetArrayLength(env, array)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def NewObjectArray(self, size, clazz, init=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewObjectArray(env, size, clazz, init)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetObjectArrayElement(self, array, index):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetObjectArrayElement(env, array, index)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def SetObjectArrayElement(self, array, index, value):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetObjectArrayElement(env, array, index, value)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
+    def SetObjectArrayElements(self, array, start, items, convert=None):
+        env = self
+        fun = self.__fun
+        for index, value in enumerate(items, start):
+            if convert is not None: value = convert(value)
+            fun.SetObjectArrayElement(env, array, index, value)
+            if convert is not None and value: fun.DeleteLocalRef(env, value)
+            if fun.ExceptionCheck(env): self._handle_JavaException()
+
+    def NewStringArray(self, strings):
+        def to_jstring(s):
+            if s is None: return None
+            if not isinstance(s, str):
+                raise TypeError(f"expected str or None, got {type(s).__name__}")
+            return self.str_to_jstring(s)
+        String = self.FindClass(b"java/lang/String")
+        try:
+            ret = self.NewObjectArray(len(strings), String)
+        finally:
+            self.DeleteLocalRef(String)
+        try:
+            self.SetObjectArrayElements(ret, 0, strings, to_jstring)
+        except BaseException:
+            self.DeleteLocalRef(ret)
+            raise
+        return ret
+
     def NewBooleanArray(self, size):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewBooleanArray(env, size)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def NewByteArray(self, size):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewByteArray(env, size)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def NewCharArray(self, size):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewCharArray(env, size)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def NewShortArray(self, size):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewShortArray(env, size)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def NewIntArray(self, size):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewIntArray(env, size)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def NewLongArray(self, size):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewLongArray(env, size)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def NewFloatArray(self, size):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewFloatArray(env, size)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def NewDoubleArray(self, size):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewDoubleArray(env, size)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetBooleanArrayElements(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetBooleanArrayElements(env, array, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetByteArrayElements(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetByteArrayElements(env, array, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetCharArrayElements(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetCharArrayElements(env, array, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetShortArrayElements(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetShortArrayElements(env, array, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetIntArrayElements(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetIntArrayElements(env, array, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetLongArrayElements(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetLongArrayElements(env, array, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetFloatArrayElements(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetFloatArrayElements(env, array, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetDoubleArrayElements(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetDoubleArrayElements(env, array, isCopy)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def ReleaseBooleanArrayElements(self, array, elems, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseBooleanArrayElements(env, array, elems, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def ReleaseByteArrayElements(self, array, elems, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseByteArrayElements(env, array, elems, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def ReleaseCharArrayElements(self, array, elems, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseCharArrayElements(env, array, elems, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def ReleaseShortArrayElements(self, array, elems, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseShortArrayElements(env, array, elems, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def ReleaseIntArrayElements(self, array, elems, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseIntArrayElements(env, array, elems, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def ReleaseLongArrayElements(self, array, elems, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseLongArrayElements(env, array, elems, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def ReleaseFloatArrayElements(self, array, elems, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseFloatArrayElements(env, array, elems, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def ReleaseDoubleArrayElements(self, array, elems, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleaseDoubleArrayElements(env, array, elems, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetBooleanArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetBooleanArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetByteArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetByteArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetCharArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetCharArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetShortArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetShortArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetIntArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetIntArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetLongArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetLongArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetFloatArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetFloatArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def GetDoubleArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.GetDoubleArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetBooleanArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetBooleanArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetByteArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetByteArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetCharArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetCharArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetShortArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetShortArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetIntArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetIntArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetLongArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetLongArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetFloatArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetFloatArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
     def SetDoubleArrayRegion(self, array, start, size, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.SetDoubleArrayRegion(env, array, start, size, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -1234,14 +1322,14 @@ class JNIEnv(ct.Structure):
 
     def GetPrimitiveArrayCritical(self, array, isCopy=None):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetPrimitiveArrayCritical(env, array, isCopy)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def ReleasePrimitiveArrayCritical(self, array, carray, mode=0):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         fun.ReleasePrimitiveArrayCritical(env, array, carray, mode)
         if fun.ExceptionCheck(env): self._handle_JavaException()
 
@@ -1249,7 +1337,7 @@ class JNIEnv(ct.Structure):
 
     def RegisterNatives(self, clazz, methods, nMethods):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         # Required due to bug in jvm:
         # https://bugs.java.com/bugdatabase/view_bug.do?bug_id=6493522
         fun.GetMethodID(env, clazz, b"notify", b"()V")
@@ -1259,7 +1347,7 @@ class JNIEnv(ct.Structure):
 
     def UnregisterNatives(self, clazz):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.UnregisterNatives(env, clazz)
         if ret != 0 and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -1268,14 +1356,14 @@ class JNIEnv(ct.Structure):
 
     def MonitorEnter(self, obj):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.MonitorEnter(env, obj)
         if ret != 0 and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def MonitorExit(self, obj):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.MonitorExit(env, obj)
         if ret != 0 and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -1284,21 +1372,21 @@ class JNIEnv(ct.Structure):
 
     def NewDirectByteBuffer(self, address, capacity):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.NewDirectByteBuffer(env, address, capacity)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetDirectBufferAddress(self, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetDirectBufferAddress(env, buf)
         if not ret and fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def GetDirectBufferCapacity(self, buf):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetDirectBufferCapacity(env, buf)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -1307,28 +1395,28 @@ class JNIEnv(ct.Structure):
 
     def FromReflectedMethod(self, method):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.FromReflectedMethod(env, method)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def FromReflectedField(self, field):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.FromReflectedField(env, field)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def ToReflectedMethod(self, cls, methodID, isStatic):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.ToReflectedMethod(env, cls, methodID, isStatic)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
 
     def ToReflectedField(self, cls, fieldID, isStatic):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.ToReflectedField(env, cls, fieldID, isStatic)
         if fun.ExceptionCheck(env): self._handle_JavaException()
         return ret
@@ -1337,12 +1425,88 @@ class JNIEnv(ct.Structure):
 
     def GetJavaVM(self, vm):
         env = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetJavaVM(env, vm)
         if ret != 0: self._handle_JNIException(ret)
 
 
-JEnv = lambda penv: penv[0]
+def _bind_functions(ftable, policy={}):
+    # Resolves the function pointers of a JNI function table once, so the
+    # methods do not build a new struct proxy and new CFUNCTYPE objects
+    # on every call. The functions marked by the GIL policy are called
+    # while holding the GIL.
+    from types import SimpleNamespace
+    keep = {name for name, keep_gil in policy.items() if keep_gil}
+    fun = SimpleNamespace(**{name: _bind_function(ftable, name, name in keep)
+                             for name, _ in ftable._fields_
+                             if not name.startswith("reserved")})
+    # The names of the functions keeping the GIL, those of the fused methods
+    # (see below) which cannot be used with the table (their entry point does
+    # not handle the GIL as it does) and the bindings of the overrides.
+    fun._keep    = keep
+    fun._unfused = {method for fun_name, methods in _fused_gil.items()
+                    for method, keep_gil in methods if (fun_name in keep) != keep_gil}
+    fun._bound   = {}  # (name, keep_gil) -> function
+    fun._ftable  = ftable
+    return fun
+
+def _override(fun, keep_gil, names):
+    # Binds the named functions (all if none) of a function table to keep
+    # or to release the GIL, returning what to restore (see _restore()).
+    bound = fun._bound
+    saved = []
+    try:
+        for name in (names or _jni_functions):
+            kept = name in fun._keep
+            if (name, kept) not in bound:
+                if name not in _jni_functions:
+                    raise ValueError(f"unknown JNI function: {name!r}")
+                bound[name, kept] = getattr(fun, name)
+            if (name, keep_gil) not in bound:
+                bound[name, keep_gil] = _bind_function(fun._ftable, name, keep_gil)
+            saved.append((name, kept))
+            _set_keep(fun, name, keep_gil)
+    except BaseException:
+        _restore(fun, saved)
+        raise
+    return saved
+
+def _restore(fun, saved):
+    for name, kept in reversed(saved):
+        _set_keep(fun, name, kept)
+
+def _set_keep(fun, name, keep_gil):
+    setattr(fun, name, fun._bound[name, keep_gil])
+    if keep_gil:
+        fun._keep.add(name)
+    else:
+        fun._keep.discard(name)
+    for method, method_keep_gil in _fused_gil.get(name, ()):
+        if keep_gil != method_keep_gil:
+            fun._unfused.add(method)
+        else:
+            fun._unfused.discard(method)
+
+_fused_gil = {}  # JNI function name -> [(fused method name, keeps the GIL)]
+
+def _bind_function(ftable, name, keep_gil, __ct=ct, __types={}):
+    fun = getattr(ftable, name)
+    if not keep_gil: return fun
+    # Same prototype and calling convention, but with the GIL held
+    # during the call (as for ctypes.PYFUNCTYPE).
+    try:
+        ftype = __types[name]
+    except KeyError:
+        ctype = type(fun)
+        ftype = __types[name] = type(ctype.__name__, (__ct._CFuncPtr,), dict(
+                    _argtypes_=ctype._argtypes_, _restype_=ctype._restype_,
+                    _flags_=ctype._flags_ | __ct._FUNCFLAG_PYTHONAPI))
+    return ftype(__ct.cast(fun, __ct.c_void_p).value)
+
+def JEnv(penv):
+    jenv = penv[0]
+    jenv._JNIEnv__fun = _bind_functions(jenv.functions[0], _gil_policy)
+    return jenv
 
 #
 # JNI Invocation Interface.
@@ -1353,6 +1517,16 @@ class JNIInvokeInterface_(ct.Structure): pass
 class JavaVM(ct.Structure):
     _fields_ = [("functions", POINTER(JNIInvokeInterface_))]
 
+    @cached_property
+    def __fun(self):
+        # Function table of a jvm which was not obtained by JVM()
+        return _bind_functions(self.functions[0])
+
+    @property
+    def _address(self, __addressof=ct.addressof):
+        # The JavaVM* (JVM() returns a new object for each call).
+        return __addressof(self)
+
     def _handle_JNIException(self, err):
         import sys
         fun_name = sys._getframe(1).f_code.co_name
@@ -1360,36 +1534,39 @@ class JavaVM(ct.Structure):
 
     def DestroyJavaVM(self):
         jvm = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.DestroyJavaVM(jvm)
         if ret != JNI_OK: self._handle_JNIException(ret)
 
     def AttachCurrentThread(self, penv, args=None):
         jvm = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.AttachCurrentThread(jvm, penv, args)
         if ret != JNI_OK: self._handle_JNIException(ret)
 
     def AttachCurrentThreadAsDaemon(self, penv, args=None):
         jvm = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.AttachCurrentThreadAsDaemon(jvm, penv, args)
         if ret != JNI_OK: self._handle_JNIException(ret)
 
     def DetachCurrentThread(self):
         jvm = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.DetachCurrentThread(jvm)
         if ret != JNI_OK: self._handle_JNIException(ret)
 
     def GetEnv(self, penv, version):
         jvm = self
-        fun = self.functions[0]
+        fun = self.__fun
         ret = fun.GetEnv(jvm, penv, version)
         if ret != JNI_OK: self._handle_JNIException(ret)
 
 
-JVM = lambda pjvm: pjvm[0]
+def JVM(pjvm):
+    jvm = pjvm[0]
+    jvm._JavaVM__fun = _bind_functions(jvm.functions[0])
+    return jvm
 
 # JNI Native Method Interface.
 
@@ -1704,6 +1881,8 @@ JNINativeInterface_._fields_ = [
     ("GetModule",                     CFUNC(jobject,            POINTER(JNIEnv), jclass)),
 ]
 
+_jni_functions = frozenset(name for name, _ in JNINativeInterface_._fields_
+                           if not name.startswith("reserved"))
 del JNINativeInterface_
 del va_list
 
@@ -1767,9 +1946,9 @@ JNI_VERSION_21  = 0x00150000
 
 # eof jni.h
 
-class Throwable(Exception):  # noqa: N818
+from .._throwable import ThrowableType
 
-    last = None
+class Throwable(Exception, metaclass=ThrowableType):  # noqa: N818
 
     def __init__(self, cause=NULL, info=NULL):  # noqa: D107
         self._cause = cast(cause, jthrowable)
@@ -1782,6 +1961,8 @@ class Throwable(Exception):  # noqa: N818
     def getInfo(self):
         return self._info
 
+del ThrowableType
+
 class JNIException(SystemError):
 
     reason = {
@@ -1912,7 +2093,181 @@ __object_types = {
     "java/lang/Class":  jclass
 }
 
+#
+# Signature-compiled method invokers
+#
+
+from .._invokers import compile_method
+
+JNIEnv.compile_method = compile_method
+del compile_method
+
+#
+# Views over Java primitive arrays
+#
+
+from .._arrays import array_view
+
+JNIEnv.array_view = array_view
+del array_view
+
+#
+# Bulk conversions between Python buffers and Java primitive arrays
+#
+
+from .._arrays import to_java_array, from_java_array
+
+JNIEnv.to_java_array   = to_java_array
+JNIEnv.from_java_array = from_java_array
+del to_java_array, from_java_array
+
+#
+# Fast conversions between Python str and Java strings
+#
+
+from .._strings import str_to_jstring, jstring_to_str
+
+JNIEnv.str_to_jstring = str_to_jstring
+JNIEnv.jstring_to_str = jstring_to_str
+del str_to_jstring, jstring_to_str
+
+#
+# Local reference frames and arenas
+#
+
+from .._frame import local_frame, local_arena
+
+JNIEnv.local_frame = local_frame
+JNIEnv.local_arena = local_arena
+del local_frame, local_arena
+
+#
+# Object arrays
+#
+
+from .._arrays import iter_object_array, new_string_array, new_object_array
+
+JNIEnv.iter_object_array = iter_object_array
+JNIEnv.new_string_array  = new_string_array
+JNIEnv.new_object_array  = new_object_array
+del iter_object_array, new_string_array, new_object_array
+
+#
+# Vectorized calls
+#
+
+from .._calls import CallMethodsA, call_many, new_many
+
+JNIEnv.CallMethodsA = CallMethodsA
+JNIEnv.call_many    = call_many
+JNIEnv.new_many     = new_many
+del CallMethodsA, call_many, new_many
+
+#
+# Recorded programs
+#
+
+from .._program import RunProgram
+
+JNIEnv.RunProgram = RunProgram
+del RunProgram
+
+#
+# Direct buffers
+#
+
+from .._buffers import wrap_buffer, buffer_view
+
+JNIEnv.wrap_buffer = wrap_buffer
+JNIEnv.buffer_view = buffer_view
+del wrap_buffer, buffer_view
+
+#
+# Critical sections
+#
+
+from .._critical import critical
+
+JNIEnv.critical = critical
+del critical
+
+#
+# GIL policy
+#
+
+from contextlib import contextmanager
+
+@contextmanager
+def gil(self, keep, *names):
+    """Context manager overriding the GIL policy (see jni.gil_policy)
+    of the env for a block of calls: the named JNI functions (all if
+    none is named) keep the GIL during the call if keep is true,
+    otherwise they release it, e.g.:
+
+        with env.gil(False, "GetIntArrayRegion"):  # large copies
+            env.GetIntArrayRegion(array, 0, size, buf)
+
+    The methods using the fused entry points of the capi extension (when
+    available) fall back to the plain ctypes calls while their entry point
+    does not handle the GIL as overridden.
+    """
+    fun = self._JNIEnv__fun
+    saved = _override(fun, bool(keep), names)
+    try:
+        yield self
+    finally:
+        _restore(fun, saved)
+
+def gil_call(self, keep, name, *args, __names={}, **kwargs):
+    """Call of the JNIEnv method name with the GIL policy of its JNI
+    function overridden (see gil()) for this call only, e.g.:
+
+        env.gil_call(True, "CallIntMethod", obj, getSize)
+    """
+    try:
+        names = __names[name]
+    except KeyError:
+        names = [fun_name for fun_name in (name, name + "A") if fun_name in _jni_functions]
+        if not names:
+            raise ValueError(f"not a JNI function method: {name!r}") from None
+        __names[name] = names
+    fun = self._JNIEnv__fun
+    saved = _override(fun, bool(keep), names)
+    try:
+        return getattr(self, name)(*args, **kwargs)
+    finally:
+        _restore(fun, saved)
+
+JNIEnv.gil = gil
+JNIEnv.gil_call = gil_call
+del gil, gil_call
+del contextmanager
+
 del sys
 del platform
 del ct
+del cached_property
 del dlclose
+
+#
+# Fused call + exception check
+#
+# If the capi extension is available, the hot JNIEnv methods run the JNI
+# function and the exception check in a single native call instead of two
+# ctypes foreign calls. The plain ctypes methods remain as __wrapped__
+# and are used instead while the GIL policy of the env does not match
+# the GIL handling of the entry point (see jni.gil_policy, JNIEnv.gil()).
+#
+
+from operator import attrgetter as __attrgetter
+from .._fused import fuse_methods as __fuse_methods
+
+__name = __fun_name = None
+for __name in __fuse_methods(JNIEnv, unfused=__attrgetter("_JNIEnv__fun._unfused")):
+    # The entry points running Java code release the GIL, the others
+    # keep it (the loops over several JNI calls are not in the policy).
+    for __fun_name in (__name, __name + "A"):
+        if __fun_name in _jni_functions:
+            _fused_gil.setdefault(__fun_name, []).append(
+                (__name, not __name.startswith("Call")))
+del __name, __fun_name, __attrgetter, __fuse_methods
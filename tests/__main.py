@@ -7,6 +7,7 @@ import unittest
 import sys
 import os
 from pathlib import Path
+import itertools
 import multiprocessing
 import logging
 
@@ -15,6 +16,9 @@ from . import _jvm
 
 log = logging.getLogger(__name__)
 
+# Backends which have to be drop-in replacements for each other.
+backends = ("ctypes", "capi")
+
 
 def test_suite(names=None, omit=()):
     from . import __name__ as pkg_name
@@ -29,10 +33,16 @@ def test_suite(names=None, omit=()):
     return tests
 
 
-def test(jvm_path):
+def test(jvm_path, backend=None):
     argv = sys.argv[1:]
 
-    print(f"Running testsuite using JVM: {jvm_path}\n", file=sys.stderr)
+    if backend is not None:
+        from jni.__config__ import set_config
+        set_config(BACKEND=backend)
+    import jni
+
+    print(f"Running testsuite using JVM: {jvm_path} "
+          f"(backend: {jni.BACKEND})\n", file=sys.stderr)
 
     package = sys.modules[__package__]
     package.jvm = jvm = _jvm.JVM(jvm_path)
@@ -106,8 +116,11 @@ def main(argv=sys.argv[1:]):
     if not jvm_paths:
         raise Exception("jvm.dll not found !")
 
-    with multiprocessing.Pool(len(jvm_paths)) as pool:
-        result = pool.map(test, jvm_paths)
+    # Every backend is expected to pass the same testsuite. A JVM can be
+    # created only once per process, hence a fresh process for each run.
+    runs = list(itertools.product(jvm_paths, backends))
+    with multiprocessing.Pool(len(runs), maxtasksperchild=1) as pool:
+        result = pool.starmap(test, runs, chunksize=1)
 
     return 0 if not any(result) else 1
 
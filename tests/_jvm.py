@@ -83,9 +83,9 @@ class JVM:
             raise JVMException(EStatusCode.EDETACHED,
                                "Unable to use JVM: thread detached from the VM")
         if self._jvm.jnijvm:
-            penv = jni.obj(jni.POINTER(jni.JNIEnv))
-            self._jvm.jnijvm.AttachCurrentThread(penv)
-            return self._jvm, jni.JEnv(penv)
+            # Attached once per thread (and detached when it exits).
+            return self._jvm, jni.current_env(self._jvm.jnijvm,
+                                              version=JVM.JNI_VERSION)
         else:
             return self._jvm, None
 
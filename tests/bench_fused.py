@@ -0,0 +1,65 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+"""Microbenchmark of the fused call + exception check entry points.
+
+Compares the plain JNIEnv methods of the ctypes/cffi backends (the JNI
+function and ExceptionCheck as two foreign calls) with the fused ones
+(a single native call provided by the capi extension).
+
+Usage: python -m tests.bench_fused <jvm library path> [backend] [number]
+"""
+
+import sys
+import timeit
+from functools import partial
+
+
+def main(argv=sys.argv[1:]):
+    jvm_path = argv[0]
+    backend  = argv[1] if len(argv) > 1 else None
+    number   = int(argv[2]) if len(argv) > 2 else 200_000
+
+    if backend is not None:
+        from jni.__config__ import set_config
+        set_config(BACKEND=backend)
+    import jni
+    from . import _jvm
+
+    jvm = _jvm.JVM(jvm_path)
+    _, jenv = jvm.start()
+    try:
+        jstr = jenv.NewStringUTF(b"benchmark")
+        String = jenv.GetObjectClass(jstr)
+        String__length = jenv.GetMethodID(String, b"length", b"()I")
+        Integer = jenv.FindClass(b"java/lang/Integer")
+        Integer__MAX_VALUE = jenv.GetStaticFieldID(Integer, b"MAX_VALUE", b"I")
+        jarr = jenv.NewIntArray(16)
+
+        cases = [
+            ("CallIntMethod",     (jstr, String__length)),
+            ("GetStaticIntField", (Integer, Integer__MAX_VALUE)),
+            ("GetArrayLength",    (jarr,)),
+        ]
+        print(f"backend: {jni.BACKEND}, {number} calls per run (best of 5)\n")
+        print(f"{'method':<20}{'plain [ns]':>12}{'fused [ns]':>12}{'speedup':>10}")
+        for name, args in cases:
+            method = getattr(type(jenv), name)
+            fused  = partial(method, jenv, *args)
+            t_fused = min(timeit.repeat(fused, number=number, repeat=5)) / number * 1e9
+            if not hasattr(method, "__wrapped__"):  # capi or no fused entry point
+                print(f"{name:<20}{'-':>12}{t_fused:>12.1f}{'-':>10}")
+                continue
+            plain  = partial(method.__wrapped__, jenv, *args)
+            t_plain = min(timeit.repeat(plain, number=number, repeat=5)) / number * 1e9
+            print(f"{name:<20}{t_plain:>12.1f}{t_fused:>12.1f}{t_plain / t_fused:>9.2f}x")
+    finally:
+        jvm.shutdown()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+# Copyright (c) 2004 Adam Karpierz
+# Licensed under CC BY-NC-ND 4.0
+# Licensed under proprietary License
+# Please refer to the accompanying LICENSE file.
+
+import unittest
+import importlib
+
+from .__main import backends
+
+
+def public_names(cls):
+    return {name for name in dir(cls) if not name.startswith("_")}
+
+
+class BackendsTestCase(unittest.TestCase):
+    """The capi backend is a drop-in replacement of the ctypes one"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctypes = importlib.import_module("jni.ctypes")
+        try:
+            cls.capi = importlib.import_module("jni.capi")
+        except ImportError as exc:  # pragma: no cover
+            raise unittest.SkipTest(f"capi backend is not built: {exc}")
+
+    def test_module_api(self):
+        ctypes_names = {name for name in vars(self.ctypes) if not name.startswith("_")}
+        capi_names   = {name for name in vars(self.capi)   if not name.startswith("_")}
+        self.assertEqual(ctypes_names - capi_names, set())
+
+    def test_JNIEnv_api(self):
+        # (the GIL policy overrides are ctypes only, see jni.gil_policy)
+        ctypes_names = public_names(self.ctypes.JNIEnv) - {"functions", "gil", "gil_call"}
+        capi_names   = public_names(self.capi.JNIEnv)
+        self.assertEqual(ctypes_names - capi_names, set())
+
+    def test_JavaVM_api(self):
+        ctypes_names = public_names(self.ctypes.JavaVM) - {"functions"}
+        capi_names   = public_names(self.capi.JavaVM)
+        self.assertEqual(ctypes_names - capi_names, set())
+
+    def test_exceptions(self):
+        self.assertIs(self.capi.Throwable,    self.ctypes.Throwable)
+        self.assertIs(self.capi.JNIException, self.ctypes.JNIException)
+
+    def test_pointer_types(self):
+        self.assertIs(self.capi.POINTER(self.capi.JNIEnv),
+                      self.ctypes.POINTER(self.ctypes.JNIEnv))
+        self.assertIs(self.capi.POINTER(self.capi.JavaVM),
+                      self.ctypes.POINTER(self.ctypes.JavaVM))
+        self.assertIs(self.capi.POINTER(self.capi.jint),
+                      self.ctypes.POINTER(self.ctypes.jint))
+
+    def test_fused_methods(self):
+        fused = importlib.import_module("jni.capi.jni").fused
+        for name in ("CallIntMethod", "GetObjectField", "GetArrayLength"):
+            self.assertTrue(hasattr(fused, name))
+            method = getattr(self.ctypes.JNIEnv, name)
+            self.assertTrue(hasattr(method, "__wrapped__"))
+            self.assertEqual(method.__name__, name)
+
+
+class BackendsParityTestCase(unittest.TestCase):
+    """The same JNI calls behave the same on the capi and ctypes backends"""
+
+    @classmethod
+    def setUpClass(cls):
+        import jni
+        from . import jvm
+        if jni.BACKEND not in backends:
+            raise unittest.SkipTest(f"the JavaVM is of the {jni.BACKEND} backend")
+        cls.jvm = jvm
+        cls.ctypes = importlib.import_module("jni.ctypes")
+        try:
+            cls.capi = importlib.import_module("jni.capi")
+        except ImportError as exc:  # pragma: no cover
+            raise unittest.SkipTest(f"capi backend is not built: {exc}")
+
+    def setUp(self):
+        penv = self.ctypes.obj(self.ctypes.POINTER(self.ctypes.JNIEnv))
+        self.jvm._jvm.jnijvm.GetEnv(penv, self.jvm.JNI_VERSION)
+        self.envs = {"ctypes": self.ctypes.JEnv(penv), "capi": self.capi.JEnv(penv)}
+
+    def run_on_both(self, fun):
+        results = {}
+        for backend, jenv in self.envs.items():
+            with self.subTest(backend=backend):
+                results[backend] = fun(jenv)
+        self.assertEqual(results["ctypes"], results["capi"])
+        return results["ctypes"]
+
+    def test_results(self):
+        def calls(jenv):
+            Integer = jenv.FindClass(b"java/lang/Integer")
+            Integer__parseInt = jenv.GetStaticMethodID(Integer, b"parseInt",
+                                                       b"(Ljava/lang/String;)I")
+            Math = jenv.FindClass(b"java/lang/Math")
+            Math__hypot = jenv.GetStaticMethodID(Math, b"hypot", b"(DD)D")
+            jargs = self.ctypes.new_array(self.ctypes.jvalue, 2)
+            jargs[0].d, jargs[1].d = 3.0, 4.0
+            jstr = jenv.str_to_jstring("-1234")
+            jargs_str = self.ctypes.new_array(self.ctypes.jvalue, 1)
+            jargs_str[0].l = jstr
+            results = (jenv.CallStaticIntMethod(Integer, Integer__parseInt, jargs_str),
+                       jenv.CallStaticDoubleMethod(Math, Math__hypot, jargs),
+                       jenv.GetStringLength(jstr), jenv.jstring_to_str(jstr))
+            jenv.DeleteLocalRefs((jstr, Math, Integer))
+            return results
+        self.assertEqual(self.run_on_both(calls), (-1234, 5.0, 5, "-1234"))
+
+    def test_exceptions(self):
+        def calls(jenv):
+            Integer = jenv.FindClass(b"java/lang/Integer")
+            Integer__parseInt = jenv.GetStaticMethodID(Integer, b"parseInt",
+                                                       b"(Ljava/lang/String;)I")
+            NumberFormatException = jenv.FindClass(b"java/lang/NumberFormatException")
+            jstr = jenv.str_to_jstring("x")
+            jargs = self.ctypes.new_array(self.ctypes.jvalue, 1)
+            jargs[0].l = jstr
+            with self.assertRaises(self.ctypes.Throwable) as exc:
+                jenv.CallStaticIntMethod(Integer, Integer__parseInt, jargs)
+            result = (type(exc.exception),
+                      bool(jenv.IsInstanceOf(exc.exception.getCause(),
+                                             NumberFormatException)),
+                      bool(jenv.ExceptionCheck()))
+            jenv.ExceptionClear()
+            jenv.DeleteLocalRefs((jstr, NumberFormatException, Integer))
+            return result
+        self.assertEqual(self.run_on_both(calls), (self.ctypes.Throwable, True, False))
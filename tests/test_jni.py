@@ -128,6 +128,207 @@ class JNITestCase(unittest.TestCase):
                                     jni.JNI_VERSION_20,
                                     jni.JNI_VERSION_21))
 
+    def test_current_env(self):
+        """A thread is attached on first use and detached on exit"""
+
+        import threading
+        import jni
+
+        # The main thread is already attached (and remains attached).
+        jenv = jni.current_env(self.jnijvm)
+        self.assertIs(jni.current_env(self.jnijvm), jenv)
+        self.assertEqual(jenv.GetVersion(), self.jenv.GetVersion())
+        # The env is cached per JavaVM, not per (possibly short-lived) wrapper.
+        ppjvm = jni.new(jni.POINTER(jni.JavaVM))
+        self.jenv.GetJavaVM(ppjvm)
+        self.assertIs(jni.current_env(jni.JVM(ppjvm[0])), jenv)
+        self.assertIs(jni.current_env(jni.JVM(ppjvm[0])), jenv)
+
+        Thread = self.jenv.FindClass(b"java/lang/Thread")
+        Thread__activeCount = self.jenv.GetStaticMethodID(Thread, b"activeCount", b"()I")
+        active_count = self.jenv.CallStaticIntMethod(Thread, Thread__activeCount)
+
+        results = {}
+
+        def worker(daemon):
+            penv = jni.obj(jni.POINTER(jni.JNIEnv))
+            with self.assertRaises(jni.JNIException) as exc:
+                self.jnijvm.GetEnv(penv, self.jvm.JNI_VERSION)
+            results["detached"] = exc.exception.getError() == jni.JNI_EDETACHED
+            jenv = jni.current_env(self.jnijvm, daemon=daemon)
+            results["cached"] = jni.current_env(self.jnijvm) is jenv
+            results["active"] = jenv.CallStaticIntMethod(Thread, Thread__activeCount)
+
+        for daemon in (False, True):
+            results.clear()
+            thread = threading.Thread(target=worker, args=(daemon,))
+            thread.start()
+            thread.join()
+            self.assertTrue(results["detached"])
+            self.assertTrue(results["cached"])
+            self.assertEqual(results["active"], active_count + 1)
+            self.assertEqual(self.jenv.CallStaticIntMethod(Thread, Thread__activeCount),
+                             active_count)
+
+        # Error codes returned zero-extended (jint declared as a C long).
+        from jni._env import _jint
+        self.assertEqual(_jint(jni.JNI_EDETACHED & 0xFFFFFFFF), jni.JNI_EDETACHED)
+        self.assertEqual(_jint(jni.JNI_EDETACHED), jni.JNI_EDETACHED)
+        self.assertEqual(_jint(jni.JNI_OK), jni.JNI_OK)
+
+    def test_aio_env_pool(self):
+        """Coroutines await JNI calls run on pre-attached worker threads"""
+
+        import asyncio
+        import threading
+        import jni
+        import jni.aio
+
+        Thread = self.jenv.FindClass(b"java/lang/Thread")
+        Thread__activeCount = self.jenv.GetStaticMethodID(Thread, b"activeCount", b"()I")
+        active_count = self.jenv.CallStaticIntMethod(Thread, Thread__activeCount)
+
+        def length(env, s):
+            jstr = env.str_to_jstring(s)
+            try:
+                return env.GetStringLength(jstr), threading.get_ident()
+            finally:
+                env.DeleteLocalRef(jstr)
+
+        def find_class(env, name):
+            env.DeleteLocalRef(env.FindClass(name))
+
+        async def main(env_pool):
+            results = await asyncio.gather(*(env_pool.call(length, "x" * n)
+                                             for n in range(100)))
+            self.assertEqual([len_ for len_, _ in results], list(range(100)))
+            self.assertNotIn(threading.get_ident(), {ident for _, ident in results})
+            with self.assertRaises(jni.Throwable):
+                await env_pool.call(find_class, b"no/such/Class")
+            self.assertEqual(await env_pool.call(lambda env: env.CallStaticIntMethod(
+                                                 Thread, Thread__activeCount)),
+                             active_count + 3)
+
+        async def run():
+            async with jni.aio.EnvPool(self.jnijvm, workers=3) as env_pool:
+                self.assertEqual(env_pool.workers, 3)
+                await main(env_pool)
+            with self.assertRaises(RuntimeError):
+                await env_pool.call(length, "")
+
+        asyncio.run(run())
+        self.assertEqual(self.jenv.CallStaticIntMethod(Thread, Thread__activeCount),
+                         active_count)
+        with self.assertRaises(ValueError):
+            jni.aio.EnvPool(self.jnijvm, workers=0)
+
+    def test_jvm_executor(self):
+        """Executor workers are attached at start and detached at shutdown"""
+
+        import threading
+        import jni
+
+        Thread = self.jenv.FindClass(b"java/lang/Thread")
+        Thread__activeCount = self.jenv.GetStaticMethodID(Thread, b"activeCount", b"()I")
+        active_count = self.jenv.CallStaticIntMethod(Thread, Thread__activeCount)
+
+        executor = jni.JVMExecutor(self.jnijvm, max_workers=2)
+
+        def length(env, s):
+            self.assertIs(executor.env, env)
+            String__length = executor.cache.GetMethodID(env, b"java/lang/String",
+                                                        b"length", b"()I")
+            jstr = env.str_to_jstring(s)
+            try:
+                return (env.CallIntMethod(jstr, String__length),
+                        threading.get_ident(), id(executor.cache))
+            finally:
+                env.DeleteLocalRef(jstr)
+
+        with executor:
+            self.assertEqual(executor.max_workers, 2)
+            self.assertEqual(self.jenv.CallStaticIntMethod(Thread, Thread__activeCount),
+                             active_count + 2)
+            results = list(executor.map(length, ["x" * n for n in range(50)]))
+            self.assertEqual([len_ for len_, _, _ in results], list(range(50)))
+            # One env and one cache per worker.
+            caches = {ident: cache for _, ident, cache in results}
+            self.assertNotIn(threading.get_ident(), caches)
+            self.assertEqual(len(set(caches.values())), len(caches))
+            with self.assertRaises(jni.Throwable):
+                executor.submit(lambda env: env.FindClass(b"no/such/Class")).result()
+            with self.assertRaises(RuntimeError):
+                executor.cache
+        self.assertEqual(self.jenv.CallStaticIntMethod(Thread, Thread__activeCount),
+                         active_count)
+        with self.assertRaises(RuntimeError):
+            executor.submit(length, "")
+
+    def test_exceptions_threads(self):
+        """Java exceptions raised concurrently are kept per thread"""
+
+        import threading
+        import jni
+
+        Integer = self.jenv.FindClass(b"java/lang/Integer")
+        Integer__parseInt = self.jenv.GetStaticMethodID(Integer, b"parseInt",
+                                                        b"(Ljava/lang/String;)I")
+        NumberFormatException = self.jenv.FindClass(b"java/lang/NumberFormatException")
+        IllegalArgumentException = self.jenv.FindClass(b"java/lang/IllegalArgumentException")
+        Integer = self.jenv.NewGlobalRef(Integer)
+        NumberFormatException = self.jenv.NewGlobalRef(NumberFormatException)
+
+        # The exception of this thread is not affected by the other threads.
+        jargs = jni.new_array(jni.jvalue, 1)
+        jargs[0].l = jni.NULL
+        with self.assertRaises(jni.Throwable) as exc:
+            self.jenv.CallStaticIntMethod(Integer, Integer__parseInt, jargs)
+        main_exc = exc.exception
+        self.assertIs(jni.Throwable.last, main_exc)
+
+        nthreads, niters = 16, 200
+        barrier = threading.Barrier(nthreads)
+        errors = []
+
+        def worker(n):
+            try:
+                jenv = jni.current_env(self.jnijvm)
+                jstr = jenv.NewStringUTF(f"not a number {n}".encode("utf-8"))
+                jargs = jni.new_array(jni.jvalue, 1)
+                jargs[0].l = jstr
+                self.assertIsNone(jni.Throwable.last)
+                barrier.wait()
+                for _ in range(niters):
+                    with self.assertRaises(jni.Throwable) as exc:
+                        jenv.CallStaticIntMethod(Integer, Integer__parseInt, jargs)
+                    self.assertIs(jni.Throwable.last, exc.exception)
+                    cause = exc.exception.getCause()
+                    self.assertEqual(jenv.GetObjectRefType(cause), jni.JNIGlobalRefType)
+                    self.assertTrue(jenv.IsInstanceOf(cause, NumberFormatException))
+                if n % 2: jenv.ExceptionClear()
+                self.assertIs(jni.Throwable.last, None if n % 2 else exc.exception)
+            except BaseException as exc:  # pragma: no cover
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(nthreads)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertEqual(errors, [])
+
+        self.assertIs(jni.Throwable.last, main_exc)
+        cause = main_exc.getCause()
+        self.assertEqual(self.jenv.GetObjectRefType(cause), jni.JNIGlobalRefType)
+        self.assertTrue(self.jenv.IsInstanceOf(cause, IllegalArgumentException))
+        # The references left by the exited threads (unless already released
+        # by the threads still running) are released here.
+        self.assertLessEqual(len(jni.Throwable._orphans), nthreads // 2)
+        self.jenv.ExceptionClear()
+        self.assertIsNone(jni.Throwable.last)
+        self.assertEqual(len(jni.Throwable._orphans), 0)
+
+        self.jenv.DeleteGlobalRef(NumberFormatException)
+        self.jenv.DeleteGlobalRef(Integer)
+
     def test_classes(self):
 
         import jni
@@ -1193,6 +1394,722 @@ class JNITestCase(unittest.TestCase):
         self.assertEqual(self.jenv.GetStringLength(java_string), len(s))
         self.assertEqual(self.jenv.GetStringUTFLength(java_string), len(s) + 1)
 
+    def test_str_jstring(self):
+        """Python str and Java strings can be converted in both directions"""
+
+        import jni
+
+        for s in ("", "Hello world", "H\xe9llo w\xf6rld \u0105\u20ac",
+                  "\U0001F600 \U0001D11E", "lone \ud800 surrogate", "x" * 100_000):
+            java_string = self.jenv.str_to_jstring(s)
+            self.assertEqual(self.jenv.GetStringLength(java_string),
+                             len(s.encode("utf-16-le", "surrogatepass")) // 2)
+            self.assertEqual(self.jenv.jstring_to_str(java_string), s)
+            self.assertEqual(self.jenv.jstring_to_str(java_string, critical=False), s)
+            self.jenv.DeleteLocalRef(java_string)
+
+        s = "H\xe9llo world"
+        java_string = self.jenv.NewStringUTF(s.encode("utf-8"))
+        self.assertEqual(self.jenv.jstring_to_str(java_string), s)
+        java_string = self.jenv.str_to_jstring(s)
+        self.assertEqual(self.jstring2str(java_string), s)
+        chars = self.jenv.GetStringChars(java_string)
+        try:
+            self.assertEqual(jni.to_unicode(chars, len(s)), s)
+        finally:
+            self.jenv.ReleaseStringChars(java_string, chars)
+
+    def test_local_frame(self):
+        """Local references can be managed by local frames"""
+
+        import jni
+
+        # The capacity grows automatically with the references created.
+        with self.jenv.local_frame() as frame:
+            self.assertEqual(frame.capacity, 16)
+            for i in range(1000):
+                jstr = self.jenv.str_to_jstring(str(i))
+            self.assertEqual((frame.count, frame.capacity), (1000, 1024))
+            self.assertIs(frame.keep(jstr), jstr)
+        self.assertEqual(len(frame.kept), 1)
+        self.assertEqual(self.jenv.GetObjectRefType(frame.result), jni.JNILocalRefType)
+        self.assertEqual(self.jenv.jstring_to_str(frame.result), "999")
+
+        with self.jenv.local_frame(4) as frame:
+            for s in ("a", "bb", "ccc"):
+                frame.keep(self.jenv.str_to_jstring(s))
+            self.jenv.str_to_jstring("not kept")
+        self.assertEqual([self.jenv.jstring_to_str(jstr) for jstr in frame.kept],
+                         ["a", "bb", "ccc"])
+        self.assertEqual(self.jenv.jstring_to_str(frame.result), "a")
+
+        with self.jenv.local_frame(1) as frame:
+            pass
+        self.assertEqual(frame.kept, ())
+        self.assertIsNone(frame.result)
+
+        # Deleted references are no longer counted, nested frames count
+        # their own references, references created otherwise are declared.
+        with self.jenv.local_frame(8) as frame:
+            for i in range(100):
+                self.jenv.DeleteLocalRef(self.jenv.str_to_jstring(str(i)))
+            with self.jenv.local_frame(4) as inner:
+                jstrs = [self.jenv.str_to_jstring(str(i)) for i in range(10)]
+                self.jenv.DeleteLocalRefs(jstrs[:5])
+                self.assertEqual((inner.count, inner.capacity), (5, 16))
+            self.assertEqual((frame.count, frame.capacity), (0, 8))
+            frame.ensure(20)
+            self.assertEqual((frame.count, frame.capacity), (20, 20))
+        self.assertNotIn("NewString", vars(self.jenv))
+
+        # The promoted references are counted once by the enclosing frame.
+        with self.jenv.local_frame(8) as frame:
+            with self.jenv.local_frame(4) as inner:
+                inner.keep(self.jenv.str_to_jstring("one"))
+            self.assertEqual(frame.count, 1)
+            with self.jenv.local_frame(4) as inner:
+                for s in ("a", "bb", "ccc"):
+                    inner.keep(self.jenv.str_to_jstring(s))
+            self.assertEqual(frame.count, 4)
+            self.jenv.DeleteLocalRefs(inner.kept)
+            self.assertEqual(frame.count, 1)
+
+        with self.assertRaises(jni.Throwable):
+            with self.jenv.local_frame(4) as frame:
+                frame.keep(self.jenv.str_to_jstring("discarded"))
+                self.jenv.FindClass(b"java/lang/NonExistent")
+        self.assertEqual(frame.kept, ())
+
+    def test_local_arena(self):
+        """Local references can be collected and deleted at once"""
+
+        import jni
+
+        with jni.RefTracker() as tracker:
+            outside = self.jenv.str_to_jstring("outside")
+            with self.jenv.local_arena() as arena:
+                for i in range(100):
+                    jstr = arena.add(self.jenv.str_to_jstring(str(i)))
+                    if i == 42: kept = arena.keep(jstr)
+                self.assertIsNone(arena.add(None))
+                self.assertEqual(len(arena), 99)
+            self.assertEqual(len(arena), 0)
+            self.assertEqual(len(tracker.snapshot()), 2)
+            self.assertEqual(self.jenv.jstring_to_str(kept), "42")
+            self.assertEqual(self.jenv.jstring_to_str(outside), "outside")
+            self.jenv.DeleteLocalRefs([kept, outside])
+            self.assertEqual(len(tracker.snapshot()), 0)
+
+    def test_iter_object_array(self):
+        """Java object arrays can be iterated in chunks"""
+
+        import jni
+
+        String = self.jenv.FindClass(b"java/lang/String")
+        array = self.jenv.NewObjectArray(1000, String)
+        for i in range(1000):
+            if i == 500: continue
+            jstr = self.jenv.str_to_jstring(str(i))
+            self.jenv.SetObjectArrayElement(array, i, jstr)
+            self.jenv.DeleteLocalRef(jstr)
+
+        with jni.RefTracker() as tracker:
+            items = self.jenv.iter_object_array(array, chunk=64,
+                                                convert=self.jenv.jstring_to_str)
+            self.assertEqual(next(items), "0")
+            self.assertEqual(len(tracker.snapshot()), 0)
+            self.assertEqual(list(items),
+                             [None if i == 500 else str(i) for i in range(1, 1000)])
+
+            count = 0
+            for item in self.jenv.iter_object_array(array, chunk=100):
+                self.assertLessEqual(len(tracker.snapshot()), 100)
+                count += 1
+            self.assertEqual(count, 1000)
+            self.assertEqual(len(tracker.snapshot()), 0)
+
+            # An iterator abandoned early deletes its chunk when closed
+            # by its thread ...
+            items = self.jenv.iter_object_array(array, chunk=100)
+            next(items)
+            self.assertEqual(len(tracker.snapshot()), 100)
+            del items
+            self.assertEqual(len(tracker.snapshot()), 0)
+
+        # ... but not when closed by another thread.
+        import threading
+        with self.jenv.local_frame():
+            items = self.jenv.iter_object_array(array, chunk=100)
+            item = next(items)
+            thread = threading.Thread(target=items.close)
+            thread.start()
+            thread.join()
+            self.assertEqual(self.jenv.GetObjectRefType(item), jni.JNILocalRefType)
+            self.assertEqual(self.jenv.jstring_to_str(item), "0")
+
+        self.assertEqual(list(self.jenv.iter_object_array(
+                              self.jenv.NewObjectArray(0, String))), [])
+        with self.assertRaises(ValueError):
+            next(self.jenv.iter_object_array(array, chunk=0))
+
+    def test_call_many(self):
+        """One method (or constructor) is called over columns of arguments"""
+
+        import array
+        import jni
+
+        jenv = self.jenv
+        Math = jenv.FindClass(b"java/lang/Math")
+        Math__hypot = jenv.GetStaticMethodID(Math, b"hypot", b"(DD)D")
+        xs = array.array("d", [3.0, 5.0, 8.0])
+        ys = array.array("d", [4.0, 12.0, 15.0])
+        self.assertEqual(list(jenv.call_many(Math__hypot, clazz=Math, args=[xs, ys], ret="D")),
+                         [5.0, 13.0, 17.0])
+        out = array.array("d", bytes(8 * 4))
+        self.assertIs(jenv.call_many(Math__hypot, clazz=Math, args=[[3, 5], [4, 12]],
+                                     sig="DD", ret="D", out=out), out)
+        self.assertEqual(list(out), [5.0, 13.0, 0.0, 0.0])
+
+        String = jenv.FindClass(b"java/lang/String")
+        String__charAt = jenv.GetMethodID(String, b"charAt", b"(I)C")
+        String__isEmpty = jenv.GetMethodID(String, b"isEmpty", b"()Z")
+        words = ["alpha", "", "gamma"]
+        jstrs = [jenv.str_to_jstring(word) for word in words]
+        self.assertEqual(bytes(jenv.call_many(String__isEmpty, receivers=jstrs, ret="Z")),
+                         bytes([0, 1, 0]))
+        chars = jenv.call_many(String__charAt, receivers=jstrs[::2],
+                               args=[array.array("i", [1, 4])], ret="C")
+        self.assertEqual([chr(c) for c in chars], ["l", "a"])
+
+        String__valueOf = jenv.GetStaticMethodID(String, b"valueOf", b"(I)Ljava/lang/String;")
+        values = jenv.call_many(String__valueOf, clazz=String, args=[range(-1, 2)],
+                                sig="I", ret="L")
+        self.assertEqual(list(jenv.iter_object_array(values, convert=jenv.jstring_to_str)),
+                         ["-1", "0", "1"])
+
+        Integer = jenv.FindClass(b"java/lang/Integer")
+        Integer__new = jenv.GetMethodID(Integer, b"<init>", b"(I)V")
+        Integer__intValue = jenv.GetMethodID(Integer, b"intValue", b"()I")
+        Integer__parseInt = jenv.GetStaticMethodID(Integer, b"parseInt",
+                                                   b"(Ljava/lang/String;)I")
+        integers = jenv.new_many(Integer, Integer__new, args=[array.array("i", [7, 8, 9])])
+        self.assertEqual(jenv.GetArrayLength(integers), 3)
+        receivers = [jenv.GetObjectArrayElement(integers, i) for i in range(3)]
+        self.assertEqual(list(jenv.call_many(Integer__intValue, receivers=receivers,
+                                             ret="I")), [7, 8, 9])
+
+        # The loop stops at the first Java exception.
+        jnums = [jenv.str_to_jstring(s) for s in ("1", "2", "x", "4")]
+        out = array.array("i", [0] * 4)
+        with self.assertRaises(jni.Throwable) as exc:
+            jenv.call_many(Integer__parseInt, clazz=Integer, args=[jnums], sig="L",
+                           ret="I", out=out)
+        self.assertEqual(exc.exception.index, 2)
+        self.assertEqual(list(out), [1, 2, 0, 0])
+        jenv.ExceptionClear()
+
+        with self.assertRaises(TypeError):
+            jenv.call_many(Integer__parseInt, clazz=Integer, args=[jnums], ret="I")
+        with self.assertRaises(ValueError):
+            jenv.call_many(Math__hypot, clazz=Math, args=[xs, ys[:2]], ret="D")
+        with self.assertRaises(ValueError):
+            jenv.call_many(Math__hypot, clazz=Math, args=[xs, ys], ret="X")
+        with self.assertRaises(ValueError):  # of the item size of doubles
+            jenv.call_many(Math__hypot, clazz=Math, args=[xs, ys], ret="D",
+                           out=array.array("q", bytes(8 * 3)))
+        jenv.DeleteLocalRefs(jstrs + jnums + receivers +
+                             [values, integers, Math, String, Integer])
+
+    def test_program(self):
+        """Recorded JNIEnv operations are run in a single call"""
+
+        import jni
+
+        jenv = self.jenv
+        prog = jni.Program()
+        word = prog.input()
+        x, y = prog.input("D"), prog.input("D")
+        StringBuilder = prog.FindClass(b"java/lang/StringBuilder")
+        builder = prog.NewObject(StringBuilder,
+                                 prog.GetMethodID(StringBuilder, b"<init>",
+                                                  b"(Ljava/lang/String;)V"), word)
+        append = prog.GetMethodID(StringBuilder, b"append",
+                                  b"(I)Ljava/lang/StringBuilder;")
+        prog.DeleteLocalRef(prog.CallObjectMethod(builder, append, 42))
+        text = prog.CallObjectMethod(builder, prog.GetMethodID(StringBuilder,
+                                     b"toString", b"()Ljava/lang/String;"))
+        length = prog.CallIntMethod(builder, prog.GetMethodID(StringBuilder,
+                                                              b"length", b"()I"))
+        prog.DeleteLocalRef(builder)
+        prog.DeleteLocalRef(StringBuilder)
+        Integer = prog.FindClass(b"java/lang/Integer")
+        max_value = prog.GetStaticIntField(Integer,
+                                           prog.GetStaticFieldID(Integer, b"MAX_VALUE", b"I"))
+        Math = prog.FindClass(b"java/lang/Math")
+        hypot = prog.CallStaticDoubleMethod(Math,
+                                            prog.GetStaticMethodID(Math, b"hypot", b"(DD)D"),
+                                            x, y)
+        prog.DeleteLocalRef(Math)
+        prog.DeleteLocalRef(Integer)
+        prog.output(text, length, max_value, hypot)
+        self.assertEqual(len(prog), 20)
+
+        jword = jenv.str_to_jstring("answer=")
+        jtext, size, maximum, distance = prog.run(jenv, jword, 3.0, 4.0)
+        self.assertEqual(jenv.jstring_to_str(jtext), "answer=42")
+        self.assertEqual((size, maximum, distance), (9, 2**31 - 1, 5.0))
+        jenv.DeleteLocalRef(jtext)
+
+        # The program stops at the first Java exception.
+        prog = jni.Program()
+        Integer = prog.FindClass(b"java/lang/Integer")
+        parseInt = prog.GetStaticMethodID(Integer, b"parseInt", b"(Ljava/lang/String;)I")
+        first  = prog.CallStaticIntMethod(Integer, parseInt, prog.input())
+        second = prog.CallStaticIntMethod(Integer, parseInt, prog.input())
+        prog.DeleteLocalRef(Integer)
+        prog.output(first, second)
+        jnums = [jenv.str_to_jstring(s) for s in ("1", "2", "x")]
+        self.assertEqual(prog.run(jenv, jnums[0], jnums[1]), (1, 2))
+        with self.assertRaises(jni.Throwable) as exc:
+            prog.run(jenv, jnums[0], jnums[2])
+        self.assertEqual(exc.exception.index, 3)
+        jenv.ExceptionClear()
+
+        with self.assertRaises(TypeError):
+            prog.run(jenv, jnums[0])
+        with self.assertRaises(TypeError):
+            prog.CallStaticIntMethod(parseInt, Integer)
+        with self.assertRaises(TypeError):
+            jni.Program().DeleteLocalRef(Integer)
+        with self.assertRaises(ValueError):
+            prog.input("X")
+        jenv.DeleteLocalRefs(jnums + [jword])
+
+    def test_new_object_arrays(self):
+        """Java object arrays can be built from Python iterables"""
+
+        import jni
+
+        strings = ["", "key", "żółw", "a\0b", "\U0001F600", None] * 100
+        with jni.RefTracker() as tracker:
+            array = self.jenv.new_string_array(iter(strings))
+            self.assertEqual(len(tracker.snapshot()), 1)
+            self.assertEqual(self.jenv.GetArrayLength(array), len(strings))
+            self.assertEqual(list(self.jenv.iter_object_array(
+                                  array, convert=self.jenv.jstring_to_str)), strings)
+            self.jenv.DeleteLocalRef(array)
+
+            Object = self.jenv.FindClass(b"java/lang/Object")
+            array = self.jenv.new_object_array(Object, range(10),
+                                               lambda i: self.jenv.str_to_jstring(str(i)))
+            self.assertEqual(len(tracker.snapshot()), 2)
+            self.assertEqual(list(self.jenv.iter_object_array(
+                                  array, convert=self.jenv.jstring_to_str)),
+                             [str(i) for i in range(10)])
+            self.jenv.DeleteLocalRef(array)
+
+        with self.assertRaises(TypeError):
+            self.jenv.new_string_array(["ok", 1])
+        with self.assertRaises(ZeroDivisionError):
+            self.jenv.new_object_array(Object, [1, 0], lambda i: 1 // i and None)
+
+        Integer = self.jenv.FindClass(b"java/lang/Integer")
+        array = self.jenv.NewObjectArray(3, Integer)
+        with self.assertRaises(jni.Throwable):  # ArrayStoreException
+            self.jenv.SetObjectArrayElements(array, 1, ["x"], self.jenv.str_to_jstring)
+
+    def test_direct_buffers(self):
+        """Python buffers and Java direct buffers can share memory"""
+
+        import jni
+
+        ByteBuffer = self.jenv.FindClass(b"java/nio/ByteBuffer")
+        ByteBuffer__get = self.jenv.GetMethodID(ByteBuffer, b"get", b"(I)B")
+        ByteBuffer__put = self.jenv.GetMethodID(ByteBuffer, b"put",
+                                                b"(IB)Ljava/nio/ByteBuffer;")
+        ByteBuffer__allocateDirect = self.jenv.GetStaticMethodID(ByteBuffer,
+                                         b"allocateDirect", b"(I)Ljava/nio/ByteBuffer;")
+        System = self.jenv.FindClass(b"java/lang/System")
+        System__gc = self.jenv.GetStaticMethodID(System, b"gc", b"()V")
+
+        def get(jbuf, index):
+            jargs = jni.new_array(jni.jvalue, 1)
+            jargs[0].i = index
+            return self.jenv.CallByteMethod(jbuf, ByteBuffer__get, jargs)
+
+        def put(jbuf, index, value):
+            jargs = jni.new_array(jni.jvalue, 2)
+            jargs[0].i = index
+            jargs[1].b = value
+            self.jenv.DeleteLocalRef(self.jenv.CallObjectMethod(jbuf, ByteBuffer__put, jargs))
+
+        jni.release_buffers(self.jenv)
+        data = bytearray(b"\1\2\3\4")
+        jbuf = self.jenv.wrap_buffer(data)
+        self.assertEqual(self.jenv.GetDirectBufferCapacity(jbuf), 4)
+        self.assertEqual(get(jbuf, 2), 3)
+        put(jbuf, 0, 42)
+        self.assertEqual(data[0], 42)
+        with self.assertRaises(BufferError):
+            data.append(5)  # pinned
+        view = self.jenv.buffer_view(jbuf)
+        view[3] = 7
+        self.assertEqual((data[3], get(jbuf, 3)), (7, 7))
+        del view
+
+        self.jenv.DeleteLocalRef(jbuf)
+        for _ in range(10):
+            jni.release_refs(self.jenv)
+            self.jenv.CallStaticVoidMethod(System, System__gc)
+            if jni.release_buffers(self.jenv): break
+        else:
+            self.fail("the direct buffer has not been collected")
+        data.append(5)  # unpinned
+
+        jargs = jni.new_array(jni.jvalue, 1)
+        jargs[0].i = 16
+        jbuf = self.jenv.CallStaticObjectMethod(ByteBuffer, ByteBuffer__allocateDirect, jargs)
+        view = self.jenv.buffer_view(jbuf)
+        self.jenv.DeleteLocalRef(jbuf)  # the view keeps the buffer alive
+        self.assertEqual(view.nbytes, 16)
+        view[15] = 99
+        self.assertEqual(view[15], 99)
+
+        with self.assertRaises(TypeError):
+            self.jenv.wrap_buffer(b"read-only")
+        with self.assertRaises(ValueError):
+            self.jenv.buffer_view(ByteBuffer)
+
+    def test_mapped_file(self):
+        """Memory-mapped files can be shared in windows"""
+
+        import tempfile
+        import shutil
+        import jni
+
+        ByteBuffer = self.jenv.FindClass(b"java/nio/ByteBuffer")
+        ByteBuffer__get = self.jenv.GetMethodID(ByteBuffer, b"get", b"(I)B")
+        ByteBuffer__put = self.jenv.GetMethodID(ByteBuffer, b"put",
+                                                b"(IB)Ljava/nio/ByteBuffer;")
+        ByteBuffer__isReadOnly = self.jenv.GetMethodID(ByteBuffer, b"isReadOnly", b"()Z")
+
+        def get(jbuf, index):
+            jargs = jni.new_array(jni.jvalue, 1)
+            jargs[0].i = index
+            return self.jenv.CallByteMethod(jbuf, ByteBuffer__get, jargs)
+
+        def put(jbuf, index, value):
+            jargs = jni.new_array(jni.jvalue, 2)
+            jargs[0].i = index
+            jargs[1].b = value
+            self.jenv.DeleteLocalRef(self.jenv.CallObjectMethod(jbuf, ByteBuffer__put, jargs))
+
+        content = bytes(i % 101 for i in range(10000))
+        tmp_dir = tempfile.mkdtemp()
+        # The mappings may outlive the test (until the JVM collects the buffers).
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        path = os.path.join(tmp_dir, "data.bin")
+        with open(path, "wb") as file:
+            file.write(content)
+
+        with jni.MappedFile(path) as mfile:
+            self.assertEqual(mfile.size, len(content))
+            windows = list(mfile.windows(self.jenv, size=4000))
+            self.assertEqual([(w.offset, w.size) for w in windows],
+                             [(0, 4000), (4000, 4000), (8000, 2000)])
+            for window in windows:
+                self.assertTrue(window.view.readonly)
+                self.assertEqual(bytes(window.view),
+                                 content[window.offset:window.offset + window.size])
+                self.assertTrue(self.jenv.CallBooleanMethod(window.buffer,
+                                                            ByteBuffer__isReadOnly))
+                self.assertEqual(self.jenv.GetDirectBufferCapacity(window.buffer),
+                                 window.size)
+                self.assertEqual(get(window.buffer, 1234),
+                                 content[window.offset + 1234])
+            with self.assertRaises(jni.Throwable):  # ReadOnlyBufferException
+                put(windows[0].buffer, 0, 1)
+            with self.assertRaises(ValueError):
+                mfile.window(self.jenv, 9000, 2000)
+            with self.assertRaises(ValueError):
+                mfile.window(self.jenv, 0, mfile.MAX_WINDOW + 1)
+            self.jenv.DeleteLocalRefs([window.buffer for window in windows])
+            del windows, window
+
+        with jni.MappedFile(path, write=True) as mfile:
+            window = mfile.window(self.jenv, 5000)
+            self.assertEqual(window.size, 5000)
+            put(window.buffer, 1, 77)
+            self.assertEqual(window.view[1], 77)
+            self.jenv.DeleteLocalRef(window.buffer)
+            del window
+        with open(path, "rb") as file:
+            self.assertEqual(file.read()[5001], 77)
+
+    def test_critical(self):
+        """Java arrays and strings can be accessed in critical sections"""
+
+        import array
+        import jni
+
+        xs = self.jenv.to_java_array(array.array("d", [1.0, 2.0, 3.0]), "D")
+        ys = self.jenv.to_java_array(array.array("i", [10, 20, 30]), "I")
+        jstr = self.jenv.str_to_jstring("crit\U0001F600")
+
+        with self.jenv.critical(xs, ys, jstr) as (x, y, s):
+            self.assertEqual((x.format, y.format, s.format), ("d", "i", "H"))
+            for i in range(len(x)):
+                y[i] += int(2 * x[i])
+            self.assertTrue(s.readonly)
+            self.assertEqual(s.tobytes().decode("utf-16-le" if sys.byteorder == "little"
+                                                else "utf-16-be", "surrogatepass"),
+                             "crit\U0001F600")
+        self.assertEqual(list(self.jenv.from_java_array(ys)), [12, 24, 36])
+
+        with self.jenv.critical(ys, mode=jni.JNI_ABORT) as (y,):
+            self.assertTrue(y.readonly)
+
+        GetArrayLength = jni.JNIEnv.GetArrayLength
+        with self.assertRaises(RuntimeError):
+            with self.jenv.critical(xs, ys, debug=True) as (x, y):
+                with self.jenv.critical(jstr, debug=True) as (s,):  # nesting is allowed
+                    pass
+                self.jenv.GetArrayLength(xs)
+        self.assertIs(jni.JNIEnv.GetArrayLength, GetArrayLength)
+        self.assertEqual(self.jenv.GetArrayLength(xs), 3)
+
+        # The guard is per env: the JNIEnv class and the other envs
+        # (threads) are not affected, a RefTracker can be started or
+        # stopped inside the section.
+        import threading
+        results = []
+        tracker = jni.RefTracker()
+        gxs = self.jenv.NewGlobalRef(xs)
+        attached, go = threading.Event(), threading.Event()
+
+        def worker():
+            jenv = jni.current_env(self.jnijvm)  # attached outside of the section
+            attached.set()
+            go.wait()
+            results.append(jenv.GetArrayLength(gxs))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        attached.wait()
+        with self.jenv.critical(ys, debug=True):
+            self.assertIs(jni.JNIEnv.GetArrayLength, GetArrayLength)
+            go.set()
+            thread.join()
+            tracker.start()
+        NewGlobalRef = jni.JNIEnv.NewGlobalRef
+        self.assertEqual(results, [3])
+        self.assertEqual(self.jenv.GetArrayLength(xs), 3)
+        with self.jenv.critical(ys, debug=True):
+            tracker.stop()
+        self.assertIsNot(jni.JNIEnv.NewGlobalRef, NewGlobalRef)
+        self.assertEqual(self.jenv.GetArrayLength(xs), 3)
+        self.jenv.DeleteGlobalRef(gxs)
+
+        with self.jenv.critical() as views:
+            self.assertEqual(views, ())
+        with self.assertRaises(ValueError):
+            with self.jenv.critical(self.jenv.FindClass(b"java/lang/Object")):
+                pass
+
+    def test_gil_policy(self):
+        """The GIL policy of JNI functions can be overridden for a block or a call"""
+
+        import array
+        import threading
+        import time
+        import jni
+
+        self.assertTrue(jni.gil_policy["GetArrayLength"])
+        self.assertTrue(jni.gil_policy["GetIntField"])
+        self.assertNotIn("CallObjectMethod", jni.gil_policy)
+
+        # Another Python thread runs during a call releasing the GIL,
+        # and not during a call keeping it.
+
+        Thread = self.jenv.FindClass(b"java/lang/Thread")
+        Thread__sleep = self.jenv.GetStaticMethodID(Thread, b"sleep", b"(J)V")
+        jargs = jni.new_array(jni.jvalue, 1)
+        jargs[0].j = 300
+
+        def ticks_during(call):
+            ticks = []
+            running = True
+
+            def ticker():
+                while running:
+                    ticks.append(time.perf_counter())
+                    time.sleep(0)
+
+            thread = threading.Thread(target=ticker)
+            thread.start()
+            while not ticks: time.sleep(0.001)
+            try:
+                start = time.perf_counter()
+                call()
+                end = time.perf_counter()
+            finally:
+                running = False
+                thread.join()
+            # (the ticker may still run shortly after the start of the call
+            # and before its return until the GIL is switched)
+            return [tick for tick in ticks if start + 0.05 < tick < end - 0.05]
+
+        self.assertTrue(ticks_during(lambda: self.jenv.CallStaticVoidMethod(
+                                              Thread, Thread__sleep, jargs)))
+
+        if jni.BACKEND != "ctypes":
+            self.assertFalse(hasattr(self.jenv, "gil"))
+            self.assertFalse(hasattr(self.jenv, "gil_call"))
+            self.jenv.DeleteLocalRef(Thread)
+            return
+
+        self.assertFalse(ticks_during(lambda: self.jenv.gil_call(True,
+                             "CallStaticVoidMethod", Thread, Thread__sleep, jargs)))
+        self.assertTrue(ticks_during(lambda: self.jenv.gil_call(False,
+                            "CallStaticVoidMethod", Thread, Thread__sleep, jargs)))
+        with self.jenv.gil(True, "CallStaticVoidMethodA") as env:
+            self.assertIs(env, self.jenv)
+            self.assertFalse(ticks_during(lambda: env.CallStaticVoidMethod(
+                                                  Thread, Thread__sleep, jargs)))
+        self.assertTrue(ticks_during(lambda: self.jenv.CallStaticVoidMethod(
+                                             Thread, Thread__sleep, jargs)))
+        self.jenv.DeleteLocalRef(Thread)
+
+        array = self.jenv.to_java_array(array.array("i", range(5)), "I")
+        functions = dict(vars(self.jenv._JNIEnv__fun))
+        with self.jenv.gil(False, "GetArrayLength"):
+            self.assertEqual(self.jenv.GetArrayLength(array), 5)
+            with self.jenv.gil(True):
+                self.assertEqual(list(self.jenv.from_java_array(array)), list(range(5)))
+            self.assertEqual(self.jenv.gil_call(True, "GetArrayLength", array), 5)
+        self.assertEqual(self.jenv.gil_call(False, "GetArrayLength", array), 5)
+        self.assertEqual(vars(self.jenv._JNIEnv__fun), functions)  # restored
+        self.jenv.DeleteLocalRef(array)
+
+        with self.assertRaises(ValueError):
+            with self.jenv.gil(True, "GetArrayLength", "NoSuchFunction"):
+                pass
+        self.assertEqual(vars(self.jenv._JNIEnv__fun), functions)
+        with self.assertRaises(ValueError):
+            self.jenv.gil_call(True, "local_frame")
+
+    def test_owned_refs(self):
+        """Owned global references are deleted in batches once collected"""
+
+        import gc
+        import threading
+        import jni
+
+        jni.release_refs(self.jenv)
+        jstr = self.jenv.str_to_jstring("owned")
+
+        ref = jni.GlobalRef(self.jenv, jstr)
+        self.assertTrue(ref)
+        self.assertEqual(self.jenv.GetObjectRefType(ref.ref), jni.JNIGlobalRefType)
+        self.assertEqual(self.jenv.jstring_to_str(ref.ref), "owned")
+        ref.delete(self.jenv)
+        self.assertFalse(ref)
+        ref.delete(self.jenv)  # no-op
+
+        wref = jni.WeakGlobalRef(self.jenv, jstr)
+        self.assertEqual(self.jenv.GetObjectRefType(wref.ref), jni.JNIWeakGlobalRefType)
+        obj = wref.get(self.jenv)
+        self.assertTrue(self.jenv.IsSameObject(obj, jstr))
+        self.jenv.DeleteLocalRef(obj)
+
+        # Handles collected in a non-attached thread are deleted later.
+        refs = [jni.GlobalRef(self.jenv, jstr) for _ in range(100)]
+        thread = threading.Thread(target=refs.clear)
+        thread.start() ; thread.join()
+        del wref ; gc.collect()
+        self.assertEqual(len(jni.GlobalRef._queue), 100)
+        self.assertEqual(len(jni.WeakGlobalRef._queue), 1)
+        self.assertEqual(jni.release_refs(self.jenv, batch=16), 101)
+        self.assertEqual(len(jni.GlobalRef._queue), 0)
+        self.assertEqual(len(jni.WeakGlobalRef._queue), 0)
+        self.assertEqual(jni.release_refs(self.jenv), 0)
+
+        self.jenv.DeleteGlobalRefs([])
+        self.jenv.DeleteLocalRefs([jstr, None])
+
+    def test_ref_tracker(self):
+        """Live references can be accounted by call site"""
+
+        import sys
+        import jni
+
+        NewGlobalRef = jni.JNIEnv.NewGlobalRef
+        with jni.RefTracker() as tracker:
+            self.assertTrue(tracker.started)
+            with self.assertRaises(RuntimeError):
+                jni.RefTracker().start()
+            before = tracker.snapshot()
+            jstr = self.jenv.str_to_jstring("tracked") ; line = sys._getframe().f_lineno
+            grefs = []
+            for _ in range(3): grefs.append(self.jenv.NewGlobalRef(jstr))
+            wref = self.jenv.NewWeakGlobalRef(jstr)
+            with self.jenv.local_frame():
+                self.jenv.NewLocalRef(jstr)
+            after = tracker.snapshot()
+            self.assertEqual(after.counts(), {"local": 1, "global": 3, "weak": 1})
+            diff = dict(after.diff(before, "global"))
+            self.assertEqual(len(diff), 1)
+            (filename, lineno, function), count = next(iter(diff.items()))
+            self.assertEqual((filename, lineno, function, count),
+                             (__file__, line + 2, "test_ref_tracker", 3))
+            self.assertEqual(after.by_site("local")[0][0][1], line)
+
+            self.jenv.DeleteGlobalRef(grefs[0])
+            self.jenv.DeleteGlobalRefs(grefs[1:])
+            self.jenv.DeleteWeakGlobalRef(wref)
+            self.jenv.DeleteLocalRef(jstr)
+            self.assertEqual(len(tracker.snapshot()), 0)
+            self.assertEqual(tracker.snapshot().diff(before), [])
+        self.assertFalse(tracker.started)
+        self.assertIs(jni.JNIEnv.NewGlobalRef, NewGlobalRef)
+
+        # Only one of concurrently started trackers is started.
+        import threading
+        trackers = [jni.RefTracker() for _ in range(8)]
+        barrier = threading.Barrier(len(trackers))
+        errors = []
+
+        def start(tracker):
+            barrier.wait()
+            try:
+                tracker.start()
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=start, args=(tracker,)) for tracker in trackers]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertEqual(len(errors), len(trackers) - 1)
+        self.assertEqual(sum(tracker.started for tracker in trackers), 1)
+        for tracker in trackers: tracker.stop()
+        self.assertIs(jni.JNIEnv.NewGlobalRef, NewGlobalRef)
+
+        # The tracker can be started and stopped inside a local frame.
+        NewLocalRef = jni.JNIEnv.NewLocalRef
+        jstr = self.jenv.str_to_jstring("tracked")
+        tracker = jni.RefTracker()
+        with self.jenv.local_frame() as frame:
+            tracker.start()
+            self.jenv.DeleteLocalRef(self.jenv.NewLocalRef(jstr))
+            self.jenv.NewLocalRef(jstr)
+            self.assertEqual(len(tracker.snapshot()), 1)
+        self.assertEqual(frame.count, 1)
+        tracker.clear()
+        with self.jenv.local_frame():
+            tracker.stop()
+        self.assertIs(jni.JNIEnv.NewLocalRef, NewLocalRef)
+        self.jenv.DeleteLocalRef(jstr)
+
     def test_string_method(self):
         """A Java string can be created, and the content returned"""
 
@@ -1277,6 +2194,272 @@ class JNITestCase(unittest.TestCase):
         result = self.jenv.CallDoubleMethod(obj1, Example__area_of_circle, jargs)
         self.assertEqual(result, 0.25 * (math.pi * 2.25))
 
+    def test_compile_method(self):
+        """A Java method can be invoked through a compiled invoker"""
+
+        import jni
+
+        Example = self.jenv.FindClass(b"org/jt/jni/test/Example")
+        Example__init = self.jenv.GetMethodID(Example, b"<init>", b"()V")
+        obj1 = self.jenv.NewObject(Example, Example__init)
+
+        area_of_circle = self.jenv.compile_method(Example, "area_of_circle", "(D)D")
+        self.assertEqual(area_of_circle.__name__, "area_of_circle")
+        self.assertTrue(area_of_circle.methodID)
+        self.assertEqual(area_of_circle(obj1, 1.5), 0.25 * (math.pi * 2.25))
+        self.assertEqual(area_of_circle(obj1, 2.0), 0.25 * (math.pi * 4.0))
+
+        doubler = self.jenv.compile_method(Example, b"doubler", b"(I)I")
+        self.assertEqual(doubler(obj1, 21), 42)
+        doubler = self.jenv.compile_method(Example, b"doubler", b"(J)J")
+        self.assertEqual(doubler(obj1, 1 << 40), 1 << 41)
+        doubler = self.jenv.compile_method(Example, b"doubler",
+                                           b"(Ljava/lang/String;)Ljava/lang/String;")
+        result = doubler(obj1, self.jenv.NewStringUTF(b"Woop"))
+        self.assertEqual(self.jstring2str(jni.cast(result, jni.jstring)), "WoopWoop")
+
+        set_int_field = self.jenv.compile_method(Example, "set_int_field", "(I)V")
+        get_int_field = self.jenv.compile_method(Example, "get_int_field", "()I")
+        self.assertIsNone(set_int_field(obj1, 1234))
+        self.assertEqual(get_int_field(obj1), 1234)
+
+        tripler = self.jenv.compile_method(Example, "tripler", "(S)S", static=True)
+        self.assertEqual(tripler(7), 21)
+        tripler = self.jenv.compile_method(Example, "tripler", "(Z)B", static=True)
+        self.assertEqual(tripler(True), tripler(1))
+
+        with self.assertRaises(TypeError):
+            tripler()
+        with self.assertRaises(TypeError):
+            get_int_field(obj1, 1)
+        with self.assertRaises(jni.Throwable):
+            self.jenv.compile_method(Example, "non_existent", "()V")
+        with self.assertRaises(jni.JNIException):
+            self.jenv.compile_method(Example, "doubler", "I")
+
+    def test_string_cache(self):
+        """Java strings can be interned"""
+
+        import threading
+        import jni
+
+        strings = jni.StringCache(maxsize=2)
+        self.assertEqual(strings.hit_rate, 0.0)
+        key = strings.get(self.jenv, "key")
+        self.assertEqual(self.jenv.GetObjectRefType(key), jni.JNILocalRefType)
+        self.assertEqual(self.jenv.jstring_to_str(key), "key")
+        key2 = strings.get(self.jenv, "key")
+        self.assertTrue(self.jenv.IsSameObject(key2, key))
+        self.assertEqual((strings.hits, strings.misses), (1, 1))
+        self.assertEqual(strings.hit_rate, 0.5)
+        self.jenv.DeleteLocalRefs([key, key2])
+
+        with jni.RefTracker() as tracker:
+            for s in ("name", "key", "value"):  # "value" evicts "name"
+                self.jenv.DeleteLocalRef(strings.get(self.jenv, s))
+            self.assertEqual((len(strings), strings.evictions), (2, 1))
+            self.assertIn("key", strings)
+            self.assertNotIn("name", strings)
+            self.assertEqual(tracker.snapshot().counts(), {"global": 1})
+            strings.clear(self.jenv)
+            self.assertEqual(len(strings), 0)
+            self.assertEqual(len(tracker.snapshot()), 0)
+
+        # A string remains valid while it is used, even if its entry
+        # is evicted (and its global reference deleted) by another thread.
+
+        strings = jni.StringCache(maxsize=1)
+        name = strings.get(self.jenv, "name")
+
+        def worker():
+            jenv = jni.current_env(self.jnijvm)
+            jenv.DeleteLocalRef(strings.get(jenv, "value"))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(strings.evictions, 1)
+        self.assertNotIn("name", strings)
+        self.assertEqual(self.jenv.jstring_to_str(name), "name")
+        self.jenv.DeleteLocalRef(name)
+        strings.clear(self.jenv)
+
+        with self.assertRaises(ValueError):
+            jni.StringCache(maxsize=0)
+
+    def test_resolution_cache(self):
+        """Classes, method IDs and field IDs are resolved once"""
+
+        import jni
+
+        for pin in (True, False):
+            cache = jni.ResolutionCache(pin=pin)
+
+            Example = cache.FindClass(self.jenv, b"org/jt/jni/test/Example")
+            self.assertTrue(Example)
+            self.assertEqual(self.jenv.GetObjectRefType(Example),
+                             jni.JNIGlobalRefType if pin else jni.JNILocalRefType)
+            self.assertTrue(self.jenv.IsSameObject(
+                            cache.FindClass(self.jenv, "org/jt/jni/test/Example"), Example))
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            Example__init = self.jenv.GetMethodID(Example, b"<init>", b"()V")
+            obj1 = self.jenv.NewObject(Example, Example__init)
+
+            for _ in range(3):
+                get_int_field = cache.GetMethodID(self.jenv, b"org/jt/jni/test/Example",
+                                                  b"get_int_field", b"()I")
+                int_field = cache.GetFieldID(self.jenv, "org/jt/jni/test/Example",
+                                             "int_field", "I")
+                static_int_field = cache.GetStaticFieldID(self.jenv,
+                                                          "org/jt/jni/test/Example",
+                                                          "static_int_field", "I")
+                get_static_int_field = cache.GetStaticMethodID(self.jenv,
+                                                               "org/jt/jni/test/Example",
+                                                               "get_static_int_field", "()I")
+            self.assertEqual((cache.hits, cache.misses), (1 + 8, 1 + 4))
+            self.assertEqual(len(cache), 1 + 4)
+
+            self.assertEqual(get_int_field,
+                             self.jenv.GetMethodID(Example, b"get_int_field", b"()I"))
+            self.assertEqual(int_field,
+                             self.jenv.GetFieldID(Example, b"int_field", b"I"))
+            self.assertEqual(self.jenv.CallIntMethod(obj1, get_int_field),
+                             self.jenv.GetIntField(obj1, int_field))
+            self.assertEqual(self.jenv.CallStaticIntMethod(Example, get_static_int_field),
+                             self.jenv.GetStaticIntField(Example, static_int_field))
+
+            with self.assertRaises(jni.Throwable):
+                cache.GetMethodID(self.jenv, "org/jt/jni/test/Example", "non_existent", "()V")
+            with self.assertRaises(jni.Throwable):
+                cache.FindClass(self.jenv, "org/jt/jni/test/NonExistent")
+
+            cache.discard(self.jenv, "org/jt/jni/test/Example")
+            self.assertEqual(len(cache), 0)
+            cache.GetMethodID(self.jenv, b"org/jt/jni/test/Example",
+                              b"get_int_field", b"()I")
+            self.assertEqual(len(cache), 1 + 1)
+
+            cache.clear(self.jenv)
+            self.assertEqual(len(cache), 0)
+
+        # The statistics are consistent under concurrent lookups.
+        import threading
+        cache = jni.ResolutionCache()
+        cache.FindClass(self.jenv, b"java/lang/String")
+
+        def worker():
+            jenv = jni.current_env(self.jnijvm)
+            for _ in range(1000):
+                cache.GetMethodID(jenv, b"java/lang/String", b"length", b"()I")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertEqual(cache.hits + cache.misses, 1 + 4 * 1000)
+        cache.clear(self.jenv)
+
+    def test_array_view(self):
+        """The elements of a Java primitive array can be viewed as memoryview"""
+
+        import jni
+
+        int_array = self.jenv.NewIntArray(10)
+        with self.jenv.array_view(int_array, "I") as view:
+            self.assertEqual((view.format, view.itemsize, view.shape), ("i", 4, (10,)))
+            self.assertFalse(view.readonly)
+            self.assertEqual(view.tolist(), [0] * 10)
+            view[:] = memoryview(bytes(range(40))).cast("i")
+            view[9] = -1
+        self.assertRaises(ValueError, view.tolist)
+        with self.jenv.array_view(int_array, "I", mode=jni.JNI_ABORT) as view:
+            self.assertTrue(view.readonly)
+            self.assertEqual(view[0], 0x03020100)
+            self.assertEqual(view[9], -1)
+
+        double_array = self.jenv.NewDoubleArray(1000)
+        with self.jenv.array_view(double_array, "D", mode=jni.JNI_COMMIT) as view:
+            self.assertEqual((view.format, view.nbytes), ("d", 8000))
+            for i in range(len(view)): view[i] = i / 2
+        with self.jenv.array_view(double_array, "D", mode=jni.JNI_ABORT) as view:
+            self.assertEqual(view.tolist(), [i / 2 for i in range(1000)])
+            with self.assertRaises(TypeError):
+                view[0] = 1.0
+
+        char_array = self.jenv.NewCharArray(3)
+        with self.jenv.array_view(char_array, "C") as view:
+            self.assertEqual((view.format, view.itemsize), ("H", 2))
+            view[:] = memoryview("a\u0105\uffff".encode("utf-16-le")).cast("H")
+        with self.jenv.array_view(char_array, "C", mode=jni.JNI_ABORT) as view:
+            self.assertEqual(view.tobytes().decode("utf-16-le"), "a\u0105\uffff")
+        boolean_array = self.jenv.NewBooleanArray(2)
+        with self.jenv.array_view(boolean_array, "Z") as view:
+            view[1] = True
+        with self.jenv.array_view(boolean_array, "Z", mode=jni.JNI_ABORT) as view:
+            self.assertEqual(view.tolist(), [False, True])
+
+        with self.assertRaises(ValueError):
+            with self.jenv.array_view(int_array, "X"): pass
+
+    def test_bulk_arrays(self):
+        """Java primitive arrays can be converted from/to Python buffers"""
+
+        import array
+        import jni
+
+        data = array.array("i", range(-5, 10_000))
+        int_array = self.jenv.to_java_array(data, "I")
+        self.assertEqual(self.jenv.GetArrayLength(int_array), len(data))
+        self.assertEqual(self.jenv.from_java_array(int_array), data)
+        self.assertEqual(self.jenv.from_java_array(int_array, kind="I"), data)
+        out = bytearray(len(data) * 4 + 8)
+        self.assertIs(self.jenv.from_java_array(int_array, out, raw=True), out)
+        self.assertEqual(bytes(out[:-8]), data.tobytes())
+
+        data = array.array("d", [0.5, -1.25, 1e300])
+        double_array = self.jenv.to_java_array(memoryview(data), "D")
+        self.assertEqual(self.jenv.from_java_array(double_array), data)
+        long_array = self.jenv.to_java_array(data.tobytes(), "J", raw=True)
+        self.assertEqual(self.jenv.from_java_array(long_array).tobytes(), data.tobytes())
+
+        byte_array = self.jenv.to_java_array(b"\x00\x01\xff", "B")
+        self.assertEqual(self.jenv.from_java_array(byte_array).tolist(), [0, 1, -1])
+        byte_array = self.jenv.to_java_array(memoryview(b"\x00\x01\xff")[1:], "B")
+        self.assertEqual(self.jenv.from_java_array(byte_array).tolist(), [1, -1])
+        char_array = self.jenv.to_java_array("a\u0105".encode("utf-16-le"), "C", raw=True)
+        self.assertEqual(self.jenv.from_java_array(char_array).tobytes().decode("utf-16-le"),
+                         "a\u0105")
+        boolean_array = self.jenv.to_java_array(bytes([0, 1]), "Z")
+        self.assertEqual(self.jenv.from_java_array(boolean_array).tolist(), [0, 1])
+        empty_array = self.jenv.to_java_array(b"", "S", raw=True)
+        self.assertEqual(self.jenv.from_java_array(empty_array), array.array("h"))
+
+        with self.assertRaises(ValueError):
+            self.jenv.to_java_array(b"abc", "I", raw=True)
+        with self.assertRaises(ValueError):
+            self.jenv.to_java_array(b"abcd", "I")
+        with self.assertRaises(ValueError):
+            self.jenv.to_java_array(array.array("d", [1.0]), "I")
+        # Buffers of the same item size but of another type are rejected.
+        with self.assertRaises(ValueError):
+            self.jenv.to_java_array(array.array("f", [1.0]), "I")
+        with self.assertRaises(ValueError):
+            self.jenv.to_java_array(array.array("q", [1]), "D")
+        with self.assertRaises(ValueError):
+            self.jenv.from_java_array(double_array, array.array("q", [0] * 3))
+        with self.assertRaises(ValueError):
+            self.jenv.from_java_array(int_array, bytearray(len(data) * 4))
+        with self.assertRaises(ValueError):
+            self.jenv.to_java_array(memoryview(b"abcd")[::2], "B")
+        with self.assertRaises(ValueError):
+            self.jenv.to_java_array(b"", "X")
+        with self.assertRaises(ValueError):
+            self.jenv.from_java_array(int_array, bytes(len(data) * 4))
+        with self.assertRaises(ValueError):
+            self.jenv.from_java_array(int_array, bytearray(4))
+        with self.assertRaises(ValueError):
+            self.jenv.from_java_array(self.jenv.NewObjectArray(1, self.jenv.FindClass(b"java/lang/String")))
+
     def test_ClassStaticField(self):
 
         import jni